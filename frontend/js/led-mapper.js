@@ -20,9 +20,14 @@ const mapperConfig = {
     colorType: 'rgb',
     ledCount: 0,
     startAddress: 1,
-    cameraId: null
+    cameraId: null,
+    mode: 'sequential'
 };
 
+// Gray-code mode: time each pattern frame is shown, and camera settle time before capturing it
+const GRAY_CODE_FRAME_MS = 600;
+const GRAY_CODE_SETTLE_MS = 300;
+
 // ==================== LED MAPPER CLASS ====================
 
 class LEDMapper {
@@ -1128,9 +1133,12 @@ class MappingSession {
         this.isPaused = false;
         this.taskId = null;
         this.socket = null;
+        this.grayCaptures = [];
+        this.pendingCaptures = [];
         
         // Bind event handlers
         this.handleLedActive = this.handleLedActive.bind(this);
+        this.handlePatternFrame = this.handlePatternFrame.bind(this);
         this.handleSequenceComplete = this.handleSequenceComplete.bind(this);
         this.handleError = this.handleError.bind(this);
     }
@@ -1173,6 +1181,7 @@ class MappingSession {
             
             // Start backend sequence
             if (window.DEBUG) console.log('Starting backend sequence...');
+            const grayCode = this.config.mode === 'gray_code';
             const response = await fetch('/api/mapper/start-sequence', {
             method: 'POST',
             headers: {'Content-Type': 'application/json'},
@@ -1182,8 +1191,9 @@ class MappingSession {
                 color_type: this.config.colorType,
                 led_count: this.config.ledCount,
                 start_address: this.config.startAddress,
-                delay_ms: 800,
-                use_broadcast: this.config.useBroadcast || false
+                delay_ms: grayCode ? GRAY_CODE_FRAME_MS : 800,
+                use_broadcast: this.config.useBroadcast || false,
+                mode: this.config.mode || 'sequential'
             })
         });
         
@@ -1196,8 +1206,9 @@ class MappingSession {
         
         this.taskId = data.task_id;
         
-        // Listen for LED activation events
+        // Listen for LED activation events (pattern frames in Gray-code mode)
         this.socket.on('mapper:led_active', this.handleLedActive);
+        this.socket.on('mapper:pattern_frame', this.handlePatternFrame);
         this.socket.on('mapper:sequence_complete', this.handleSequenceComplete);
         this.socket.on('mapper:error', this.handleError);
         
@@ -1215,7 +1226,18 @@ class MappingSession {
         }
     }
     
-    handleSequenceComplete() {
+    async handlePatternFrame(eventData) {
+        if (eventData.task_id !== this.taskId) return;
+        const capture = this.capturePatternFrame(eventData.frame, eventData.total);
+        this.pendingCaptures.push(capture);
+        await capture;
+    }
+    
+    async handleSequenceComplete(eventData) {
+        if (eventData && eventData.mode === 'gray_code') {
+            await Promise.all(this.pendingCaptures);
+            await this.decodeGrayCode();
+        }
         this.finishMapping();
     }
     
@@ -1227,6 +1249,7 @@ class MappingSession {
         // Remove event listeners
         if (this.socket) {
             this.socket.off('mapper:led_active', this.handleLedActive);
+            this.socket.off('mapper:pattern_frame', this.handlePatternFrame);
             this.socket.off('mapper:sequence_complete', this.handleSequenceComplete);
             this.socket.off('mapper:error', this.handleError);
         }
@@ -1302,6 +1325,50 @@ class MappingSession {
         if (failedEl) failedEl.textContent = this.failedLEDs.length;
     }
     
+    async capturePatternFrame(frameIndex, total) {
+        const progressBar = document.getElementById('mappingProgressBar');
+        if (progressBar) {
+            progressBar.style.width = `${((frameIndex + 1) / total) * 100}%`;
+            progressBar.innerHTML = `<strong>Frame ${frameIndex + 1} / ${total}</strong>`;
+        }
+        
+        // Let the pattern settle on the LEDs and in the camera, then grab the full frame
+        await this._sleep(GRAY_CODE_SETTLE_MS);
+        const canvas = this.detector.detectionCanvas;
+        canvas.width = this.videoElement.videoWidth || canvas.width;
+        canvas.height = this.videoElement.videoHeight || canvas.height;
+        this.detector.ctx.drawImage(this.videoElement, 0, 0, canvas.width, canvas.height);
+        this.grayCaptures[frameIndex] = await new Promise(resolve => canvas.toBlob(resolve, 'image/png'));
+    }
+    
+    async decodeGrayCode() {
+        showToast('Decoding LED positions...', 'info');
+        const form = new FormData();
+        form.append('led_count', this.config.ledCount);
+        this.grayCaptures.forEach((blob, i) => form.append('frames', blob, `frame_${i}.png`));
+        
+        const response = await fetch('/api/mapper/decode-gray-code', {method: 'POST', body: form});
+        const data = await response.json();
+        if (!data.success) {
+            showToast('Gray-code decoding failed: ' + data.error, 'error');
+            return;
+        }
+        
+        const rect = this.calibration.calibrationRect;
+        data.positions.forEach(pos => {
+            // Only accept LEDs inside the calibrated area
+            if (rect && (pos.x < rect.x || pos.x > rect.x + rect.width ||
+                         pos.y < rect.y || pos.y > rect.y + rect.height)) {
+                this.failedLEDs.push(pos.led_index);
+                return;
+            }
+            const canvasPos = this.calibration.mapCameraToCanvas(pos.x, pos.y);
+            this.mappedPositions.set(pos.led_index, {x: canvasPos.x, y: canvasPos.y, confidence: 1.0});
+        });
+        this.failedLEDs.push(...data.missing);
+        console.log(`Gray-code mapping: ${this.mappedPositions.size}/${this.config.ledCount} LEDs decoded`);
+    }
+    
     finishMapping() {
         showToast('Mapping sequence complete!', 'success');
         
@@ -1546,7 +1613,16 @@ function buildMapperUI() {
                 <div class="mb-3">
                     <label class="form-label">Number of LEDs</label>
                     <input type="number" class="form-control" id="mapperLEDCount" 
-                           min="1" max="500" value="50">
+                           min="1" max="65536" value="50">
+                </div>
+                
+                <div class="mb-3">
+                    <label class="form-label">Mapping Mode</label>
+                    <select class="form-select" id="mapperMode">
+                        <option value="sequential">Sequential (one LED at a time, up to 500)</option>
+                        <option value="gray_code">Gray code (all LEDs at once, log2(N) frames)</option>
+                    </select>
+                    <div class="form-text">Gray code maps thousands of LEDs in about 30 frames; keep the camera and LEDs still</div>
                 </div>
                 
                 <div class="mb-3">
@@ -1756,14 +1832,15 @@ window.mapperPrevStep = function() {
 function validateMapperConfig() {
     const ip = document.getElementById('mapperArtnetIP').value;
     const ledCount = parseInt(document.getElementById('mapperLEDCount').value);
+    const maxLEDs = document.getElementById('mapperMode').value === 'gray_code' ? 65536 : 500;
     
     if (!ip || !/^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$/.test(ip)) {
         showToast('Invalid Art-Net IP address', 'error');
         return false;
     }
     
-    if (ledCount < 1 || ledCount > 500) {
-        showToast('LED count must be between 1 and 500', 'error');
+    if (ledCount < 1 || ledCount > maxLEDs) {
+        showToast(`LED count must be between 1 and ${maxLEDs}`, 'error');
         return false;
     }
     
@@ -1778,6 +1855,7 @@ function saveMapperConfig() {
     mapperConfig.startAddress = parseInt(document.getElementById('mapperStartAddress').value);
     mapperConfig.cameraId = document.getElementById('mapperCamera').value || null;
     mapperConfig.useBroadcast = document.getElementById('mapperUseBroadcast').checked;
+    mapperConfig.mode = document.getElementById('mapperMode').value;
     mapperConfig.normalizeGeometry = document.getElementById('mapperNormalizeGeometry').checked;
     
     // Save to session state asynchronously
@@ -1797,6 +1875,7 @@ async function loadMapperConfig() {
             if (data.config.ledCount) document.getElementById('mapperLEDCount').value = data.config.ledCount;
             if (data.config.startAddress) document.getElementById('mapperStartAddress').value = data.config.startAddress;
             if (data.config.useBroadcast !== undefined) document.getElementById('mapperUseBroadcast').checked = data.config.useBroadcast;
+            if (data.config.mode) document.getElementById('mapperMode').value = data.config.mode;
             if (data.config.normalizeGeometry !== undefined) document.getElementById('mapperNormalizeGeometry').checked = data.config.normalizeGeometry;
             // Camera ID will be populated after camera list loads
             if (data.config.cameraId) {
@@ -1817,7 +1896,7 @@ async function loadMapperConfig() {
     
     // Add auto-save listeners to all input fields
     ['mapperArtnetIP', 'mapperUniverse', 'mapperColorType', 'mapperLEDCount', 
-     'mapperStartAddress', 'mapperCamera', 'mapperUseBroadcast', 'mapperNormalizeGeometry'].forEach(id => {
+     'mapperStartAddress', 'mapperCamera', 'mapperUseBroadcast', 'mapperMode', 'mapperNormalizeGeometry'].forEach(id => {
         const element = document.getElementById(id);
         if (element) {
             element.addEventListener('change', () => {
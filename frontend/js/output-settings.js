@@ -6234,7 +6234,11 @@ app.addArtNetOutput = function() {
     document.getElementById('newOutputUniverse').value = '0';
     document.getElementById('newOutputFPS').value = '40';
     document.getElementById('newOutputDelay').value = '0';
+    document.getElementById('newOutputDelayInterpolation').checked = false;
     document.getElementById('newOutputArtSync').checked = true;
+    document.getElementById('newOutputProtocol').value = 'artnet';
+    document.getElementById('newOutputPriority').value = '100';
+    document.getElementById('newOutputMulticast').checked = true;
     
     // Show modal
     document.getElementById('addOutputModal').style.display = 'flex';
@@ -6270,7 +6274,11 @@ app.editArtNetOutput = function(outputId) {
     document.getElementById('newOutputUniverse').value = output.startUniverse || 0;
     document.getElementById('newOutputFPS').value = output.fps || 40;
     document.getElementById('newOutputDelay').value = output.delay || 0;
+    document.getElementById('newOutputDelayInterpolation').checked = !!output.delayInterpolation;
     document.getElementById('newOutputArtSync').checked = output.artsync !== undefined ? output.artsync : true;
+    document.getElementById('newOutputProtocol').value = output.protocol || 'artnet';
+    document.getElementById('newOutputPriority').value = output.sacnPriority !== undefined ? output.sacnPriority : 100;
+    document.getElementById('newOutputMulticast').checked = output.sacnMulticast !== undefined ? output.sacnMulticast : true;
     
     // Show modal
     document.getElementById('addOutputModal').style.display = 'flex';
@@ -6296,7 +6304,11 @@ app.saveNewArtNetOutput = async function() {
     const universe = parseInt(document.getElementById('newOutputUniverse').value);
     const fps = parseInt(document.getElementById('newOutputFPS').value);
     const delay = parseInt(document.getElementById('newOutputDelay').value);
+    const delayInterpolation = document.getElementById('newOutputDelayInterpolation').checked;
     const artsync = document.getElementById('newOutputArtSync').checked;
+    const protocol = document.getElementById('newOutputProtocol').value;
+    const sacnPriority = parseInt(document.getElementById('newOutputPriority').value);
+    const sacnMulticast = document.getElementById('newOutputMulticast').checked;
     
     // Validate inputs
     if (!name) {
@@ -6319,6 +6331,11 @@ app.saveNewArtNetOutput = async function() {
         return;
     }
     
+    if (protocol === 'sacn' && (isNaN(sacnPriority) || sacnPriority < 0 || sacnPriority > 200)) {
+        this.showToast('❌ sACN priority must be between 0 and 200', 'error');
+        return;
+    }
+    
     try {
         const outputData = {
             id: isEdit ? editId : `out-${Date.now()}`,
@@ -6328,7 +6345,11 @@ app.saveNewArtNetOutput = async function() {
             startUniverse: universe,
             fps: fps,
             delay: delay,
-            artsync: artsync
+            delayInterpolation: delayInterpolation,
+            artsync: artsync,
+            protocol: protocol,
+            sacnPriority: sacnPriority,
+            sacnMulticast: sacnMulticast
         };
         
         const url = isEdit ? `/api/artnet/routing/outputs/${editId}` : '/api/artnet/routing/outputs';
@@ -6669,10 +6690,10 @@ app.openDmxMonitor = function(output) {
     const modal = document.getElementById('dmxMonitorModal');
     modal.style.display = 'flex';
     
-    // Populate universe selector
-    const select = document.getElementById('dmxUniverseSelect');
-    const universes = [...new Set(this.artnetOutputs.map(out => out.startUniverse))].sort((a, b) => a - b);
-    select.innerHTML = universes.map(u => `<option value="${u}"${output && output.startUniverse === u ? ' selected' : ''}>Universe ${u}</option>`).join('');
+    // Monitored output (universe indices are relative to its start universe)
+    this.dmxOutput = output || (this.artnetOutputs && this.artnetOutputs[0]) || null;
+    this.dmxUniverseCount = 1;
+    this.updateDmxUniverseOptions(0);
     
     // Update modal title with output name if provided
     const modalTitle = modal.querySelector('h3');
@@ -6697,12 +6718,16 @@ app.openDmxMonitor = function(output) {
         grid.appendChild(channel);
     }
     
-    // Connect to Socket.IO for real-time DMX updates (better than polling)
+    // Binary DMX stream: only the selected universe, only when it changes
     if (!this.dmxSocket) {
-        this.dmxSocket = io('http://localhost:5000');
-        this.dmxSocket.on('status', (data) => {
-            this.updateDmxMonitorFromData(data);
-        });
+        this.dmxSocket = io('http://localhost:5000/dmx');
+        this.dmxSocket.on('connect', () => this.subscribeDmxUniverse());
+        this.dmxSocket.on('dmx_frame', (msg) => this.handleDmxFrame(msg));
+    } else {
+        this.subscribeDmxUniverse();
+    }
+    if (!this.dmxOutput) {
+        document.getElementById('dmxStats').textContent = `No Art-Net output configured`;
     }
 };
 
@@ -6711,7 +6736,7 @@ app.openDmxMonitor = function(output) {
  */
 app.closeDmxMonitor = function() {
     document.getElementById('dmxMonitorModal').style.display = 'none';
-    // Disconnect Socket.IO when closing monitor
+    // Disconnect Socket.IO when closing monitor (ends the subscription)
     if (this.dmxSocket) {
         this.dmxSocket.disconnect();
         this.dmxSocket = null;
@@ -6720,55 +6745,56 @@ app.closeDmxMonitor = function() {
 };
 
 /**
- * Update DMX monitor from Socket.IO data
+ * Fill the universe selector for the monitored output
  */
-app.updateDmxMonitorFromData = function(data) {
+app.updateDmxUniverseOptions = function(selectedIndex) {
+    const select = document.getElementById('dmxUniverseSelect');
+    const start = this.dmxOutput ? this.dmxOutput.startUniverse : 0;
+    let options = '';
+    for (let i = 0; i < this.dmxUniverseCount; i++) {
+        options += `<option value="${i}"${i === selectedIndex ? ' selected' : ''}>Universe ${start + i}</option>`;
+    }
+    select.innerHTML = options;
+};
+
+/**
+ * (Re)subscribe to the selected universe — the server answers with its current data
+ */
+app.subscribeDmxUniverse = function() {
+    if (!this.dmxSocket || !this.dmxOutput) return;
+    const index = parseInt(document.getElementById('dmxUniverseSelect').value) || 0;
+    this.dmxSocket.emit('subscribe', { outputId: this.dmxOutput.id, universes: [index], fps: 20 });
+};
+
+/**
+ * Render a 'dmx_frame' message (data: 512 bytes per listed universe)
+ */
+app.handleDmxFrame = function(msg) {
     try {
-        // Cache data for universe switching
-        this.lastDmxData = data;
-        
-        // Try routing_outputs first (new system), fallback to dmx_preview (old system)
-        let dmxData = null;
+        if (!this.dmxOutput || msg.outputId !== this.dmxOutput.id) return;
         
-        if (data.routing_outputs && Object.keys(data.routing_outputs).length > 0) {
-            // New routing system: Get first output's data
-            const outputIds = Object.keys(data.routing_outputs);
-            dmxData = data.routing_outputs[outputIds[0]];
-        } else if (data.dmx_preview && data.dmx_preview.length > 0) {
-            // Old ArtNet system
-            dmxData = data.dmx_preview;
-        }
-        
-        if (!dmxData || dmxData.length === 0) {
-            document.getElementById('dmxStats').textContent = `No DMX data available - Start playback to see output`;
-            return;
+        const select = document.getElementById('dmxUniverseSelect');
+        const selectedIndex = parseInt(select.value) || 0;
+        if (msg.universeCount !== this.dmxUniverseCount) {
+            this.dmxUniverseCount = msg.universeCount;
+            this.updateDmxUniverseOptions(selectedIndex);
         }
         
-        const selectedUniverse = parseInt(document.getElementById('dmxUniverseSelect').value);
-        
-        // DMX universes: Universe 0 = channels 0-511, Universe 1 = channels 512-1023, etc.
-        const channelsPerUniverse = 512;
-        const universeStartChannel = selectedUniverse * channelsPerUniverse;
-        const universeEndChannel = universeStartChannel + channelsPerUniverse;
-        
-        // Extract channels for this universe
-        const universeData = dmxData.slice(universeStartChannel, universeEndChannel);
-        
-        if (universeData.length === 0) {
-            document.getElementById('dmxStats').textContent = `Universe ${selectedUniverse}: No data (out of range)`;
-            return;
-        }
+        const slot = msg.universes.indexOf(selectedIndex);
+        if (slot < 0) return;
+        const universeData = new Uint8Array(msg.data, slot * 512, 512);
+        const universe = this.dmxOutput.startUniverse + selectedIndex;
         
         // Update stats
         const activeChannels = universeData.filter(v => v > 0).length;
-        document.getElementById('dmxStats').textContent = `Universe ${selectedUniverse} | ${activeChannels}/512 active channels | ${universeData.length} channels in use`;
+        document.getElementById('dmxStats').textContent = `Universe ${universe} | ${activeChannels}/512 active channels`;
         
         // Update channel display
         for (let i = 0; i < 512; i++) {
             const channel = document.getElementById(`dmx-ch-${i + 1}`);
             if (!channel) continue;
             
-            const value = universeData[i] || 0;
+            const value = universeData[i];
             channel.textContent = value;
             
             // Color-code based on value (0-255)
@@ -6784,7 +6810,7 @@ app.updateDmxMonitorFromData = function(data) {
         }
     } catch (error) {
         console.error('Failed to update DMX monitor:', error);
-        document.getElementById('dmxStats').textContent = `Error fetching DMX data`;
+        document.getElementById('dmxStats').textContent = `Error displaying DMX data`;
     }
 };
 
@@ -6792,12 +6818,8 @@ app.updateDmxMonitorFromData = function(data) {
  * Change DMX universe
  */
 app.changeDmxUniverse = function() {
-    // Universe change just triggers redisplay with current cached data
-    // Next Socket.IO update will refresh with new universe selection
-    // Store last received data for on-demand universe switching
-    if (this.lastDmxData) {
-        this.updateDmxMonitorFromData(this.lastDmxData);
-    }
+    // New subscription: the server sends the universe's current data right away
+    this.subscribeDmxUniverse();
 };
 
 /**
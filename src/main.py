@@ -466,6 +466,10 @@ def main():
     set_profiling_enabled(profiling_enabled)
     logger.debug(f"Performance profiling: {'enabled' if profiling_enabled else 'disabled (zero overhead)'}")
     
+    # CPU buffer pool leak detection (records acquire call sites)
+    from modules.core.buffer_pool import set_buffer_pool_debug
+    set_buffer_pool_debug(config.get('performance', {}).get('buffer_pool_debug', False))
+    
     logger.debug("Flux starting...")
     logger.debug("Configuration loaded")
     
@@ -612,6 +616,19 @@ def main():
     session_state.set_sequence_manager(sequence_manager)
     logger.debug("SequenceManager connected to SessionState")
     
+    # Initialize DMX Input (lighting console → parameters, applied by the render loops)
+    dmx_input_config = config.get('dmx_input', {})
+    dmx_input = None
+    if dmx_input_config.get('enabled', False):
+        from modules.artnet.dmx_input import DMXInput
+        dmx_input = DMXInput.from_config(player_manager, dmx_input_config)
+        if dmx_input.start():
+            player_manager.dmx_input = dmx_input
+            register_cleanup_resource('dmx_input', dmx_input.stop)
+            logger.debug(f"DMX Input initialized ({len(dmx_input.mappings)} mappings)")
+        else:
+            dmx_input = None
+    
     # Initialize ArtNet Routing Manager
     from modules.artnet.routing_manager import ArtNetRoutingManager
     artnet_routing_manager = ArtNetRoutingManager(session_state)
@@ -622,7 +639,9 @@ def main():
     routing_bridge = RoutingBridge(
         routing_manager=artnet_routing_manager,
         canvas_width=artnet_canvas_width,
-        canvas_height=artnet_canvas_height
+        canvas_height=artnet_canvas_height,
+        shard_workers=config.get('artnet', {}).get('shard_workers', 0),
+        dmx_input=dmx_input
     )
     logger.debug(f"ArtNet Routing Bridge initialized ({artnet_canvas_width}x{artnet_canvas_height})")
     
@@ -630,6 +649,18 @@ def main():
     artnet_player.routing_bridge = routing_bridge
     logger.debug("Routing bridge connected to Art-Net Player")
     
+    # DMX recording (fed with every frame the routing bridge sends) and replay
+    from modules.player import RecordingManager
+    from modules.player.recording.replay import ReplayManager
+    recording_manager = RecordingManager()
+    routing_bridge.recorder = recording_manager.recorder
+    player_manager.recording_manager = recording_manager
+    register_cleanup_resource('recording_manager', recording_manager.clear)
+    replay_manager = ReplayManager(routing_bridge, config, player=artnet_player,
+                                   records_dir=recording_manager.records_dir)
+    register_cleanup_resource('replay_manager', replay_manager.cleanup)
+    logger.debug("DMX recording and replay connected to routing bridge")
+    
     # Initialize Multi-Playlist System
     from modules.player.playlists.playlist_manager import MultiPlaylistSystem
     from modules.api.player.playlists import set_playlist_system
@@ -727,8 +758,7 @@ def main():
     logger.debug("Start with empty playlists (session state cleared)")
 
     # REST API initialisieren und automatisch starten
-    # Note: replay_manager=None - Recording system removed, will be reimplemented later
-    rest_api = RestAPI(player_manager, data_dir, video_dir, config, replay_manager=None)
+    rest_api = RestAPI(player_manager, data_dir, video_dir, config, replay_manager=replay_manager)
     
     # Register all routes that depend on objects created after RestAPI init
     # (playlist_system, artnet_routing_manager, audio_analyzer)
@@ -267,6 +267,10 @@ class RestAPI:
         from .midi import init_midi_api
         init_midi_api(self.app, self.socketio)
         logger.debug("MIDI API routes registered")
+
+        # DMX monitor stream (binary universes on /dmx, replaces the JSON lists in 'status')
+        from .output.dmx_monitor import init_dmx_monitor
+        self.dmx_monitor = init_dmx_monitor(self.socketio, self._get_routing_frames)
     
     def _register_socketio_events(self):
         """Registriert WebSocket Events."""
@@ -685,6 +689,17 @@ class RestAPI:
                     'error': str(e)
                 })
     
+    def _artnet_source(self):
+        """The player that drives Art-Net output (artnet_player if available)."""
+        if hasattr(self.player_manager, 'artnet_player') and self.player_manager.artnet_player:
+            return self.player_manager.artnet_player
+        return self.player
+
+    def _get_routing_frames(self):
+        """Last DMX data per routing output (source of the DMX monitor stream)."""
+        bridge = getattr(self._artnet_source(), 'routing_bridge', None)
+        return bridge.get_last_frames() if bridge else {}
+
     def _get_status_data(self):
         """Creates status data for WebSocket."""
         # Hole Media-Namen und Typ (Video oder Script)
@@ -702,39 +717,12 @@ class RestAPI:
             media_name = self.player.script_name
             is_script = True
         
-        # DMX preview data directly from Art-Net manager (= actual output)
-        dmx_preview = None
+        # DMX data itself is streamed on the /dmx namespace (see output/dmx_monitor.py)
         total_universes = 0
-        
-        # Check artnet_player first (if available) - it sends the data
-        artnet_source = None
-        if hasattr(self.player_manager, 'artnet_player') and self.player_manager.artnet_player:
-            artnet_source = self.player_manager.artnet_player
-        else:
-            artnet_source = self.player
-        
-        # Art-Net Routing is the source now (routing_bridge)
-        # OLD artnet_manager system removed
+        artnet_source = self._artnet_source()
         if hasattr(artnet_source, 'required_universes'):
             total_universes = artnet_source.required_universes
         
-        # ArtNet Routing Output Data (NEW - for routing system on ARTNET PLAYER)
-        routing_outputs = {}
-        if hasattr(artnet_source, 'routing_bridge') and artnet_source.routing_bridge:
-            try:
-                last_frames = artnet_source.routing_bridge.get_last_frames()
-                logger.debug(f"Routing outputs available: {list(last_frames.keys())}, lengths: {[len(d) for d in last_frames.values()]}")
-                for output_id, dmx_data in last_frames.items():
-                    if dmx_data and len(dmx_data) > 0:
-                        # Convert bytes to list for JSON serialization
-                        routing_outputs[output_id] = list(dmx_data)
-                logger.debug(f"Sending routing_outputs: {list(routing_outputs.keys())}")
-            except Exception as e:
-                logger.error(f"Error collecting routing outputs: {e}", exc_info=True)
-                pass    # Silently fail if routing bridge not available
-        else:
-            logger.debug("No routing_bridge available on Art-Net Player")
-        
         # Replay Status
         is_replaying = False
         if self.replay_manager:
@@ -755,11 +743,9 @@ class RestAPI:
             "hue_shift": self.player.hue_shift,
             "video": media_name,
             "is_script": is_script,
-            "dmx_preview": dmx_preview,
             "total_universes": total_universes,
             "is_replaying": is_replaying,
-            "active_mode": active_mode,
-            "routing_outputs": routing_outputs    # NEW: Routing system output data
+            "active_mode": active_mode
         }
     
     def _status_broadcast_loop(self):
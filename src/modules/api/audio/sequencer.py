@@ -175,7 +175,8 @@ def register_sequencer_routes(app, player_manager, config, session_state=None):
                 'audio_duration': engine.duration if engine.is_loaded else 0,
                 'splits': timeline.splits if engine.is_loaded else [],
                 'clip_mapping': clip_mapping_json,
-                'is_playing': engine.is_playing if engine.is_loaded else False
+                'is_playing': engine.is_playing if engine.is_loaded else False,
+                'switch_timing': player_manager.sequencer.get_switch_stats()
             }
             
             return jsonify(status)
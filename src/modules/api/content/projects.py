@@ -6,35 +6,41 @@ import json
 from flask import request, jsonify, send_file
 from pathlib import Path
 from datetime import datetime
+from ...core.catalogue import FileCatalogue
 from ...core.logger import debug_api
 
 
+def _project_summary(data, filename):
+    """Catalogue entry of a project (what the project list shows)."""
+    return {
+        'projectName': data.get('projectName', Path(filename).stem),
+        'savedAt': data.get('savedAt', ''),
+        'shapeCount': len(data.get('shapes', []))
+    }
+
+
+def _read_project_summary(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return _project_summary(json.load(f), path)
+
+
 def register_project_routes(app, logger):
     """Register all project-related API routes"""
     
     # Point to root/projects folder (4 levels up from src/modules/api/content/)
     PROJECTS_DIR = Path(__file__).resolve().parent.parent.parent.parent / 'projects'
     PROJECTS_DIR.mkdir(exist_ok=True)
+    # Project files are only parsed when new or modified (mtime/size)
+    catalogue = FileCatalogue(PROJECTS_DIR, '.json', _read_project_summary)
     
     @app.route('/api/projects', methods=['GET'])
     def list_projects():
         """List all saved projects"""
         try:
-            projects = []
-            for file in PROJECTS_DIR.glob('*.json'):
-                try:
-                    with open(file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        projects.append({
-                            'filename': file.name,
-                            'projectName': data.get('projectName', file.stem),
-                            'savedAt': data.get('savedAt', ''),
-                            'shapeCount': len(data.get('shapes', [])),
-                            'size': file.stat().st_size
-                        })
-                except Exception as e:
-                    logger.warning(f"Could not read project file {file.name}: {e}")
-                    continue
+            projects = [
+                {key: entry[key] for key in ('filename', 'projectName', 'savedAt', 'shapeCount', 'size')}
+                for entry in catalogue.list()
+            ]
             
             # Sort by savedAt descending (newest first)
             projects.sort(key=lambda x: x['savedAt'], reverse=True)
@@ -72,6 +78,7 @@ def register_project_routes(app, logger):
             # Save to file
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
+            catalogue.put(filename, _project_summary(data, filename))
             
             debug_api(logger, f"Project saved: {filename}")
             
@@ -0,0 +1,142 @@
+"""
+Gray-code structured light for the LED mapper.
+
+Instead of lighting one LED at a time, every LED shows its own index as a
+Gray code over a short sequence of frames, all LEDs at once:
+
+    frame 0         all on       (reference: where are LEDs at all)
+    frame 1         all off
+    frame 2 + 2b    bit b of the Gray code (most significant first)
+    frame 3 + 2b    the inverse of frame 2 + 2b
+
+A camera captures each frame; per pixel, comparing a bit frame with its
+inverse gives the bit independently of how bright that LED appears, and the
+bits give the LED index.  10,000 LEDs need 14 bits = 30 frames instead of
+10,000.  Gray codes change one bit between neighbouring indices, so a
+pixel blurred between two LEDs decodes to one of them rather than to an
+unrelated index.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+UNIVERSE_SIZE = 512
+MAX_LEDS = 65536
+
+
+def bit_count(led_count: int) -> int:
+    """Gray-code bits needed for *led_count* indices."""
+    return max(1, (led_count - 1).bit_length())
+
+
+def frame_count(led_count: int) -> int:
+    return 2 + 2 * bit_count(led_count)
+
+
+def gray_encode(values):
+    return values ^ (values >> 1)
+
+
+def gray_decode(codes, bits: int):
+    values = codes.copy()
+    shift = 1
+    while shift < bits:
+        values ^= values >> shift
+        shift <<= 1
+    return values
+
+
+def pattern_frames(led_count: int) -> np.ndarray:
+    """(frame_count, led_count) bool — which LEDs are lit in each frame."""
+    bits = bit_count(led_count)
+    codes = gray_encode(np.arange(led_count, dtype=np.int64))
+    frames = np.empty((2 + 2 * bits, led_count), dtype=bool)
+    frames[0] = True
+    frames[1] = False
+    for b in range(bits):
+        lit = ((codes >> (bits - 1 - b)) & 1).astype(bool)
+        frames[2 + 2 * b] = lit
+        frames[3 + 2 * b] = ~lit
+    return frames
+
+
+def frame_labels(led_count: int) -> List[str]:
+    """Display names for the frames of pattern_frames()."""
+    labels = ['on', 'off']
+    for b in range(bit_count(led_count)):
+        labels += [f'bit{b}', f'bit{b}_inverse']
+    return labels
+
+
+def dmx_universes(lit: np.ndarray, universes: np.ndarray, offsets: np.ndarray,
+                  channels_per_led: int) -> Dict[int, bytes]:
+    """
+    DMX data for one pattern frame.
+
+    Args:
+        lit: Bool per LED (a row of pattern_frames())
+        universes: Universe per LED
+        offsets: First DMX channel (0-based) per LED
+        channels_per_led: Channels set to full for a lit LED
+
+    Returns:
+        universe → 512 bytes, for every universe the LEDs occupy
+    """
+    ids = np.unique(universes)
+    data = np.zeros((len(ids), UNIVERSE_SIZE), dtype=np.uint8)
+    rows = np.searchsorted(ids, universes[lit])
+    channels = offsets[lit][:, None] + np.arange(channels_per_led)
+    inside = channels < UNIVERSE_SIZE
+    data[np.broadcast_to(rows[:, None], channels.shape)[inside], channels[inside]] = 255
+    return {int(u): data[i].tobytes() for i, u in enumerate(ids)}
+
+
+def _luma(image: np.ndarray) -> np.ndarray:
+    image = np.asarray(image, dtype=np.float32)
+    return image.mean(axis=2) if image.ndim == 3 else image
+
+
+def decode_captures(captures: Sequence[np.ndarray], led_count: int, threshold: float = 40.0,
+                    contrast: float = 0.5, min_pixels: int = 1) -> Dict[int, Tuple[float, float, int]]:
+    """
+    LED positions from camera captures of pattern_frames().
+
+    Args:
+        captures: One image per frame, in frame order (grayscale or colour, same size)
+        led_count: Number of LEDs in the sequence
+        threshold: Minimum brightness difference between the all-on and all-off frames
+        contrast: Minimum |bit - inverse| as a fraction of a pixel's on/off difference;
+                  weaker pixels are ambiguous and ignored
+        min_pixels: Decoded pixels an LED needs to be reported
+
+    Returns:
+        led_index → (x, y, pixels): brightness-weighted centroid in image coordinates
+    """
+    bits = bit_count(led_count)
+    if len(captures) != 2 + 2 * bits:
+        raise ValueError(f"Expected {2 + 2 * bits} captures for {led_count} LEDs, got {len(captures)}")
+
+    on, off = _luma(captures[0]), _luma(captures[1])
+    weight = on - off
+    valid = weight > threshold
+    codes = np.zeros(weight.shape, dtype=np.int64)
+    for b in range(bits):
+        diff = _luma(captures[2 + 2 * b]) - _luma(captures[3 + 2 * b])
+        valid &= np.abs(diff) >= contrast * weight
+        codes = (codes << 1) | (diff > 0)
+
+    ids = gray_decode(codes, bits)
+    valid &= ids < led_count
+    ys, xs = np.nonzero(valid)
+    ids = ids[valid]
+    w = weight[valid]
+    total = np.bincount(ids, weights=w, minlength=led_count)
+    sum_x = np.bincount(ids, weights=w * xs, minlength=led_count)
+    sum_y = np.bincount(ids, weights=w * ys, minlength=led_count)
+    pixels = np.bincount(ids, minlength=led_count)
+
+    return {
+        int(i): (float(sum_x[i] / total[i]), float(sum_y[i] / total[i]), int(pixels[i]))
+        for i in np.flatnonzero(pixels >= max(1, min_pixels))
+    }
@@ -1,9 +1,11 @@
 """
 LED Visual Mapper API Routes
-Sequential LED illumination for webcam-based position detection
+Sequential or Gray-code LED illumination for webcam-based position detection
 """
 from flask import jsonify, request, current_app
 from . import mapper_bp
+from . import gray_code
+import numpy as np
 import threading
 import time
 import logging
@@ -225,11 +227,14 @@ def start_mapping_sequence():
         led_count: int - Number of LEDs to map
         start_address: int - Starting DMX address (1-512)
         delay_ms: int - Delay between LEDs in milliseconds (optional, default 800)
+        mode: str - 'sequential' (one LED at a time, default) or 'gray_code'
+                    (all LEDs at once, log2(N) bit patterns; delay_ms per frame)
     
     Returns:
         success: bool
         task_id: str - Background task identifier
         led_count: int - Number of LEDs in sequence
+        frames: int - Number of pattern frames (gray_code mode)
     """
     data = request.get_json()
     
@@ -241,6 +246,7 @@ def start_mapping_sequence():
     start_address = data.get('start_address', 1)
     delay_ms = data.get('delay_ms', 800)
     use_broadcast = data.get('use_broadcast', False)  # Option to use broadcast mode for debugging
+    mode = data.get('mode', 'sequential')
     
     # Validate required parameters
     if not artnet_ip or not led_count:
@@ -257,11 +263,18 @@ def start_mapping_sequence():
             'error': 'Invalid IP address format'
         }), 400
     
+    if mode not in ('sequential', 'gray_code'):
+        return jsonify({
+            'success': False,
+            'error': "Mode must be 'sequential' or 'gray_code'"
+        }), 400
+    
     # Validate ranges
-    if not (1 <= led_count <= 500):
+    max_leds = gray_code.MAX_LEDS if mode == 'gray_code' else 500
+    if not (1 <= led_count <= max_leds):
         return jsonify({
             'success': False,
-            'error': 'LED count must be between 1 and 500'
+            'error': f'LED count must be between 1 and {max_leds}'
         }), 400
     
     if not (1 <= start_address <= 512):
@@ -280,19 +293,23 @@ def start_mapping_sequence():
             'start_address': start_address,
             'channels_per_led': get_channels_per_led(color_type),
             'delay_ms': delay_ms,
-            'use_broadcast': use_broadcast
+            'use_broadcast': use_broadcast,
+            'mode': mode
         }
         
         # Start background task
         task_id = _start_background_task(mapping_config)
         
-        logger.info(f"Started LED mapping sequence: {led_count} LEDs to {artnet_ip}:{universe}")
+        logger.info(f"Started LED mapping sequence ({mode}): {led_count} LEDs to {artnet_ip}:{universe}")
         
-        return jsonify({
+        response = {
             'success': True,
             'task_id': task_id,
             'led_count': led_count
-        })
+        }
+        if mode == 'gray_code':
+            response['frames'] = gray_code.frame_count(led_count)
+        return jsonify(response)
         
     except Exception as e:
         logger.error(f"Failed to start mapping sequence: {e}")
@@ -514,7 +531,7 @@ def _start_background_task(config):
     
     # Start thread with app context
     thread = threading.Thread(
-        target=_mapping_sequence_task,
+        target=_gray_code_sequence_task if config.get('mode') == 'gray_code' else _mapping_sequence_task,
         args=(task_id, config, app),
         daemon=True
     )
@@ -703,3 +720,158 @@ def _mapping_sequence_task(task_id, config, app):
             with _task_lock:
                 if task_id in _active_tasks:
                     del _active_tasks[task_id]
+
+
+def _gray_code_sequence_task(task_id, config, app):
+    """
+    Background task: show the Gray-code pattern frames on all LEDs at once.
+    Emits one 'mapper:pattern_frame' per frame; the frontend captures it and
+    posts the captures to /decode-gray-code.
+    """
+    from ...artnet.packet_builder import ARTNET_PORT, UDPBatchSocket, artdmx_header
+    
+    with app.app_context():
+        sock = None
+        try:
+            led_count = config['led_count']
+            channels_per_led = config['channels_per_led']
+            delay_ms = config['delay_ms']
+            
+            target_ip = config['artnet_ip']
+            if config.get('use_broadcast', False):
+                ip_parts = target_ip.split('.')
+                target_ip = f"{ip_parts[0]}.{ip_parts[1]}.{ip_parts[2]}.255"
+            
+            # DMX layout of every LED (same packing as the sequential mode)
+            layout = np.array([
+                calculate_universe_and_channel(i, config['start_address'], channels_per_led, config['universe'])[:2]
+                for i in range(led_count)
+            ], dtype=np.int64)
+            universes, offsets = layout[:, 0], layout[:, 1]
+            frames = gray_code.pattern_frames(led_count)
+            labels = gray_code.frame_labels(led_count)
+            
+            logger.info(f"Task {task_id}: Gray-code sequence - {led_count} LEDs in {len(frames)} frames "
+                        f"over {len(np.unique(universes))} universes to {target_ip}")
+            
+            # All universes of a frame go out together: one socket, one batch per frame
+            sock = UDPBatchSocket(('0.0.0.0', ARTNET_PORT))
+            sequence = 0
+            
+            def send(universe_data):
+                nonlocal sequence
+                sequence = sequence % 255 + 1
+                packets = [artdmx_header(u, gray_code.UNIVERSE_SIZE, sequence) + data
+                           for u, data in universe_data.items()]
+                sock.send(packets, (target_ip, ARTNET_PORT))
+            
+            completed = True
+            for index, lit in enumerate(frames):
+                with _task_lock:
+                    if _active_tasks.get(task_id, {}).get('stop'):
+                        logger.info(f"Task {task_id}: Stopped by user")
+                        completed = False
+                        break
+                
+                send(gray_code.dmx_universes(lit, universes, offsets, channels_per_led))
+                
+                socketio = current_app.extensions.get('socketio')
+                if socketio:
+                    socketio.emit('mapper:pattern_frame', {
+                        'frame': index,
+                        'total': len(frames),
+                        'label': labels[index],
+                        'task_id': task_id
+                    })
+                logger.debug(f"Task {task_id}: Frame {index + 1}/{len(frames)} ({labels[index]})")
+                
+                time.sleep(delay_ms / 1000.0)
+            
+            # Turn off all LEDs
+            send(gray_code.dmx_universes(np.zeros(led_count, dtype=bool), universes, offsets, channels_per_led))
+            
+            if completed:
+                socketio = current_app.extensions.get('socketio')
+                if socketio:
+                    socketio.emit('mapper:sequence_complete', {
+                        'total_leds': led_count,
+                        'frames': len(frames),
+                        'mode': 'gray_code',
+                        'task_id': task_id
+                    })
+                logger.info(f"Task {task_id}: ✓ Gray-code sequence complete - {len(frames)} frames")
+        
+        except Exception as e:
+            import traceback
+            logger.error(f"Task {task_id}: ❌ Error in Gray-code sequence: {e}")
+            logger.error(f"Task {task_id}: Traceback: {traceback.format_exc()}")
+            socketio = current_app.extensions.get('socketio')
+            if socketio:
+                socketio.emit('mapper:error', {
+                    'task_id': task_id,
+                    'error': str(e)
+                })
+        
+        finally:
+            if sock is not None:
+                sock.close()
+            with _task_lock:
+                _active_tasks.pop(task_id, None)
+
+
+@mapper_bp.route('/decode-gray-code', methods=['POST'])
+def decode_gray_code():
+    """
+    Decode LED positions from camera captures of a Gray-code sequence.
+    
+    Request (multipart/form-data):
+        frames: image files - One capture per 'mapper:pattern_frame', in frame order
+        led_count: int - Number of LEDs in the sequence
+        threshold: float - Min on/off brightness difference (optional, default 40)
+        min_pixels: int - Min decoded pixels per LED (optional, default 1)
+    
+    Returns:
+        success: bool
+        positions: list - [{led_index, x, y, pixels}] in camera pixel coordinates
+        missing: list - LED indices that were not found
+    """
+    import cv2
+    
+    try:
+        led_count = int(request.form.get('led_count', 0))
+        threshold = float(request.form.get('threshold', 40.0))
+        min_pixels = int(request.form.get('min_pixels', 1))
+    except ValueError:
+        return jsonify({'success': False, 'error': 'Invalid led_count, threshold or min_pixels'}), 400
+    
+    if not (1 <= led_count <= gray_code.MAX_LEDS):
+        return jsonify({
+            'success': False,
+            'error': f'LED count must be between 1 and {gray_code.MAX_LEDS}'
+        }), 400
+    
+    captures = []
+    for upload in request.files.getlist('frames'):
+        image = cv2.imdecode(np.frombuffer(upload.read(), dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+        if image is None:
+            return jsonify({'success': False, 'error': f'Could not decode image {upload.filename}'}), 400
+        captures.append(image)
+    
+    if len({c.shape for c in captures}) > 1:
+        return jsonify({'success': False, 'error': 'All captures must have the same size'}), 400
+    
+    try:
+        found = gray_code.decode_captures(captures, led_count, threshold=threshold, min_pixels=min_pixels)
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
+    logger.info(f"Gray-code decode: {len(found)}/{led_count} LEDs found in {len(captures)} captures")
+    
+    return jsonify({
+        'success': True,
+        'positions': [
+            {'led_index': i, 'x': x, 'y': y, 'pixels': pixels}
+            for i, (x, y, pixels) in sorted(found.items())
+        ],
+        'missing': [i for i in range(led_count) if i not in found]
+    })
@@ -1,3 +1,3 @@
 """Output configuration API endpoints"""
 
-__all__ = ['artnet', 'routing', 'points', 'artnet_effects']
+__all__ = ['artnet', 'routing', 'points', 'artnet_effects', 'dmx_monitor']
@@ -16,6 +16,7 @@ API Routes - Playback, Settings, Art-Net Endpoints
    Any new functionality should be added to the appropriate module above.
 """
 from flask import jsonify, request
+from ...artnet.packet_builder import CHANNELS_PER_UNIVERSE
 from ...core.logger import get_logger
 
 logger = get_logger(__name__)
@@ -173,16 +174,19 @@ def register_info_routes(app, player_manager, api=None, config=None):
         """Returns current status."""
         player = player_manager.player
         
-        # Collect routing outputs (NEW - for routing system DMX monitor)
+        # Routing outputs: sizes only; the DMX data itself is streamed on the
+        # /dmx namespace (see dmx_monitor.py)
         routing_outputs = {}
         artnet_source = player_manager.artnet_player if hasattr(player_manager, 'artnet_player') and player_manager.artnet_player else player
         if hasattr(artnet_source, 'routing_bridge') and artnet_source.routing_bridge:
             try:
                 last_frames = artnet_source.routing_bridge.get_last_frames()
                 for output_id, dmx_data in last_frames.items():
-                    if dmx_data and len(dmx_data) > 0:
-                        # Convert bytes to list for JSON serialization
-                        routing_outputs[output_id] = list(dmx_data)
+                    if dmx_data:
+                        routing_outputs[output_id] = {
+                            'channels': len(dmx_data),
+                            'universes': (len(dmx_data) + CHANNELS_PER_UNIVERSE - 1) // CHANNELS_PER_UNIVERSE,
+                        }
             except Exception:
                 pass  # Silently fail if routing bridge not available
         
@@ -491,6 +495,52 @@ def register_info_routes(app, player_manager, api=None, config=None):
         return Response(generate_frames(),
                        mimetype='multipart/x-mixed-replace; boundary=frame')
     
+    @app.route('/api/outputs/<player_id>/stream/preview_live')
+    def preview_live_stream(player_id):
+        """MJPEG stream of the preview player/session for a non-active playlist."""
+        from flask import Response
+        import time
+
+        cfg = config if config else {}
+        stream_fps = cfg.get('video', {}).get('preview_stream', {}).get(player_id, {}).get('fps', 25)
+        frame_delay = 1.0 / stream_fps
+        preview_id = f"{player_id}_preview"
+
+        def generate_frames():
+            _player = player_manager.players.get(preview_id)
+            # Lightweight sessions render only while subscribed — add_subscriber()
+            # wakes the shared preview worker.
+            if _player is not None and hasattr(_player, 'add_subscriber'):
+                _player.add_subscriber()
+            elif _player is not None and hasattr(_player, '_mjpeg_subscriber_count'):
+                _player._mjpeg_subscriber_count += 1
+            try:
+                while True:
+                    _p = player_manager.players.get(preview_id)
+                    if _p is not _player:
+                        break  # preview destroyed/recreated — client reconnects
+                    cond = getattr(_p, '_preview_frame_cond', None) if _p else None
+                    if cond is not None:
+                        with cond:
+                            cond.wait(timeout=frame_delay)
+                    else:
+                        time.sleep(frame_delay)
+                    frame_bytes = getattr(_p, 'last_preview_jpeg', None) if _p else None
+                    if frame_bytes is not None:
+                        if api is not None:
+                            api.stream_traffic['preview']['bytes'] += len(frame_bytes)
+                            api.stream_traffic['preview']['frames'] += 1
+                        yield (b'--frame\r\n'
+                               b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
+            finally:
+                if _player is not None and hasattr(_player, 'remove_subscriber'):
+                    _player.remove_subscriber()
+                elif _player is not None and hasattr(_player, '_mjpeg_subscriber_count'):
+                    _player._mjpeg_subscriber_count = max(0, _player._mjpeg_subscriber_count - 1)
+
+        return Response(generate_frames(),
+                       mimetype='multipart/x-mixed-replace; boundary=frame')
+
     @app.route('/api/fullscreen/stream')
     def fullscreen_stream():
         """MJPEG video stream at full player resolution (without scaling)."""
@@ -0,0 +1,181 @@
+"""
+DMX Monitor - binary WebSocket stream of the DMX output (namespace /dmx).
+
+The status broadcast used to carry every output's DMX data as JSON integer
+lists to every client.  Monitor clients now subscribe to the universes
+they display instead:
+
+    → 'subscribe'    {'outputId': id, 'universes': [0, 1] | null (all), 'fps': 10}
+    → 'unsubscribe'  {'outputId': id} | {} (everything)
+    ← 'dmx_frame'    {'outputId': id, 'universeCount': n, 'universes': [i, ...],
+                      'data': <binary, 512 bytes per listed universe>}
+
+Universe indices are relative to the output's start universe; each
+universe carries CHANNELS_PER_UNIVERSE channels of the output (the same
+split as the sent packets), zero-padded to 512 slots.  A client
+only receives universes whose data changed since it last got them, at
+most at its requested rate; a (re)subscription sends the current data.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ...artnet.packet_builder import CHANNELS_PER_UNIVERSE
+from ...core.logger import get_logger
+
+logger = get_logger(__name__)
+
+NAMESPACE = '/dmx'
+UNIVERSE_SIZE = 512
+MAX_FPS = 44.0      # DMX512 refresh rate
+DEFAULT_FPS = 10.0
+_IDLE_WAIT = 0.25
+
+
+class _Client:
+    __slots__ = ('interval', 'next_due', 'subscriptions')
+
+    def __init__(self):
+        self.interval = 1.0 / DEFAULT_FPS
+        self.next_due = 0.0
+        # output_id → {'universes': set | None, 'sent': {index: bytes}}
+        self.subscriptions: Dict[str, dict] = {}
+
+
+class DMXMonitor:
+    """Per-client universe subscriptions with change detection and rate limiting."""
+
+    def __init__(self, frames_source: Callable[[], Dict[str, bytes]]):
+        """
+        Args:
+            frames_source: Returns the last DMX data per output (output_id → bytes)
+        """
+        self.frames_source = frames_source
+        self._clients: Dict[str, _Client] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, sid: str, output_id: str, universes: Optional[List[int]] = None,
+                  fps: Optional[float] = None) -> None:
+        """
+        Watch *universes* of *output_id* (None = all); the next poll sends them in full.
+
+        Args:
+            sid: Client session id
+            output_id: Output identifier
+            universes: Universe indices relative to the output's start universe
+            fps: Max updates per second for this client (clamped to 1-44)
+        """
+        with self._lock:
+            client = self._clients.setdefault(sid, _Client())
+            if fps is not None:
+                client.interval = 1.0 / min(MAX_FPS, max(1.0, float(fps)))
+            client.subscriptions[output_id] = {
+                'universes': None if universes is None else {int(u) for u in universes},
+                'sent': {},
+            }
+            client.next_due = 0.0
+
+    def unsubscribe(self, sid: str, output_id: Optional[str] = None) -> None:
+        """Stop watching one output (None = all outputs and forget the client)."""
+        with self._lock:
+            client = self._clients.get(sid)
+            if client is None:
+                return
+            if output_id is None:
+                del self._clients[sid]
+            else:
+                client.subscriptions.pop(output_id, None)
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    def next_wait(self, now: Optional[float] = None) -> float:
+        """Seconds until the next client is due (idle wait without subscribers)."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            due = [c.next_due for c in self._clients.values() if c.subscriptions]
+        if not due:
+            return _IDLE_WAIT
+        return max(0.0, min(due) - now)
+
+    def poll(self, now: Optional[float] = None) -> List[Tuple[str, dict]]:
+        """
+        Messages for every client that is due.
+
+        Returns:
+            [(sid, 'dmx_frame' payload)] — only changed universes, one
+            message per client and output
+        """
+        now = time.monotonic() if now is None else now
+        messages = []
+        with self._lock:
+            due = [(sid, c) for sid, c in self._clients.items() if c.subscriptions and c.next_due <= now]
+            if not due:
+                return messages
+            frames = self.frames_source() or {}
+            for sid, client in due:
+                client.next_due = now + client.interval
+                for output_id, sub in client.subscriptions.items():
+                    payload = self._changed(frames.get(output_id), sub)
+                    if payload is not None:
+                        payload['outputId'] = output_id
+                        messages.append((sid, payload))
+        return messages
+
+    @staticmethod
+    def _changed(data: Optional[bytes], sub: dict) -> Optional[dict]:
+        if not data:
+            return None
+        count = (len(data) + CHANNELS_PER_UNIVERSE - 1) // CHANNELS_PER_UNIVERSE
+        wanted = range(count) if sub['universes'] is None else sorted(u for u in sub['universes'] if 0 <= u < count)
+        sent = sub['sent']
+        indices, parts = [], []
+        for index in wanted:
+            chunk = bytes(data[index * CHANNELS_PER_UNIVERSE:(index + 1) * CHANNELS_PER_UNIVERSE])
+            if sent.get(index) == chunk:
+                continue
+            sent[index] = chunk
+            indices.append(index)
+            parts.append(chunk.ljust(UNIVERSE_SIZE, b'\x00'))
+        if not indices:
+            return None
+        return {'universeCount': count, 'universes': indices, 'data': b''.join(parts)}
+
+
+def init_dmx_monitor(socketio_instance, frames_source: Callable[[], Dict[str, bytes]]) -> DMXMonitor:
+    """Register the /dmx namespace handlers and start the monitor broadcast thread."""
+    from flask import request
+
+    monitor = DMXMonitor(frames_source)
+
+    @socketio_instance.on('subscribe', namespace=NAMESPACE)
+    def handle_subscribe(data):
+        data = data or {}
+        output_id = data.get('outputId')
+        if not output_id:
+            return
+        monitor.subscribe(request.sid, output_id, data.get('universes'), data.get('fps'))
+
+    @socketio_instance.on('unsubscribe', namespace=NAMESPACE)
+    def handle_unsubscribe(data=None):
+        monitor.unsubscribe(request.sid, (data or {}).get('outputId'))
+
+    @socketio_instance.on('disconnect', namespace=NAMESPACE)
+    def handle_disconnect():
+        monitor.unsubscribe(request.sid)
+
+    def _loop():
+        while True:
+            try:
+                time.sleep(monitor.next_wait())
+                for sid, payload in monitor.poll():
+                    socketio_instance.emit('dmx_frame', payload, namespace=NAMESPACE, to=sid)
+            except Exception as e:
+                logger.error(f"DMX monitor broadcast error: {e}")
+                time.sleep(1)
+
+    threading.Thread(target=_loop, daemon=True, name="dmx-monitor-broadcast").start()
+    logger.debug("DMX monitor stream initialized")
+    return monitor
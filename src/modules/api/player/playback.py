@@ -2371,7 +2371,8 @@ def register_unified_routes(app, player_manager, config, socketio=None, playlist
                 "master_clip_index": 4,
                 "slave_clip_indices": {
                     "artnet": 4
-                }
+                },
+                "switch": {"switches": 12, "prearm_hits": 11, "last_skew_ms": 21.4, ...}
             }
         """
         try:
@@ -2399,7 +2400,8 @@ def register_unified_routes(app, player_manager, config, socketio=None, playlist
                 'master_playlist': master_playlist,
                 'slaves': slaves,
                 'master_clip_index': master_clip_index,
-                'slave_clip_indices': slave_clip_indices
+                'slave_clip_indices': slave_clip_indices,
+                'switch': player_manager.slave_switch.get_stats()
             })
             
         except Exception as e:
@@ -14,7 +14,22 @@ logger = get_logger(__name__)
 
 # Available GPU shader transitions (WGSL-based)
 _GPU_TRANSITIONS = [
-    {"id": "fade", "name": "Fade", "description": "Cross-fade blend"},
+    {"id": "fade", "name": "Fade", "description": "Cross-fade blend", "backends": ["gpu", "cpu"]},
+]
+
+# Transitions without a WGSL shader — only rendered by the CPU transition
+# renderer (players without a GPU transition renderer).
+_CPU_ONLY_TRANSITIONS = [
+    {"id": "linear_wipe", "name": "Linear Wipe", "description": "Straight wipe (params: angle, feather)", "backends": ["cpu"]},
+    {"id": "radial_wipe", "name": "Radial Wipe", "description": "Clock wipe (params: start_angle, clockwise, feather)", "backends": ["cpu"]},
+    {"id": "round_wipe", "name": "Round Wipe", "description": "Iris wipe (params: center_x, center_y, reverse, feather)", "backends": ["cpu"]},
+    {"id": "slide_wipe_up", "name": "Slide Wipe Up", "description": "New clip slides in from the bottom", "backends": ["cpu"]},
+    {"id": "slide_wipe_down", "name": "Slide Wipe Down", "description": "New clip slides in from the top", "backends": ["cpu"]},
+    {"id": "slide_wipe_left", "name": "Slide Wipe Left", "description": "New clip slides in from the right", "backends": ["cpu"]},
+    {"id": "slide_wipe_right", "name": "Slide Wipe Right", "description": "New clip slides in from the left", "backends": ["cpu"]},
+    {"id": "punch_zoom_in", "name": "Punch Zoom In", "description": "New clip zooms in from the centre (params: zoom_amount, center_x, center_y)", "backends": ["cpu"]},
+    {"id": "punch_zoom_out", "name": "Punch Zoom Out", "description": "Current clip zooms out into the new one (params: zoom_amount, center_x, center_y)", "backends": ["cpu"]},
+    {"id": "rgb_split", "name": "RGB Split", "description": "Cross-fade with red/blue channel separation (params: intensity)", "backends": ["cpu"]},
 ]
 
 
@@ -29,12 +44,13 @@ def register_transition_routes(app, player_manager, playlist_system=None):
     """
     @app.route('/api/transitions/list', methods=['GET'])
     def list_transitions():
-        """List available GPU shader transitions."""
+        """List available transitions (GPU shaders + CPU-only transitions)."""
         try:
+            transitions = _GPU_TRANSITIONS + _CPU_ONLY_TRANSITIONS
             return jsonify({
                 "success": True,
-                "transitions": _GPU_TRANSITIONS,
-                "count": len(_GPU_TRANSITIONS)
+                "transitions": transitions,
+                "count": len(transitions)
             })
         except Exception as e:
             logger.error(f"❌ Error listing transitions: {e}", exc_info=True)
@@ -59,6 +75,7 @@ def register_transition_routes(app, player_manager, playlist_system=None):
             effect = data.get('effect', 'fade')
             duration = data.get('duration', 1.0)
             easing = data.get('easing', 'ease_in_out')
+            params = data.get('params')  # optional CPU transition parameters
             
             # Debug: Log playlist state
             logger.debug(f"[TRANSITION CONFIG DEBUG] playlist_system exists: {playlist_system is not None}")
@@ -112,6 +129,8 @@ def register_transition_routes(app, player_manager, playlist_system=None):
                 'duration': duration,
                 'easing': easing,
             }
+            if isinstance(params, dict):
+                new_config['params'] = params
 
             # 1. Update the in-memory transition manager
             player.transition_manager.configure(**new_config)
@@ -9,6 +9,12 @@ from ...core.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _routing_bridge(player_manager):
+    """Routing bridge of the Art-Net player (None if not connected)."""
+    player = getattr(player_manager, 'artnet_player', None)
+    return getattr(player, 'routing_bridge', None)
+
+
 def register_performance_routes(app, player_manager):
     """Register performance monitoring API routes."""
     
@@ -26,11 +32,16 @@ def register_performance_routes(app, player_manager):
             for player_name, profiler in profilers.items():
                 metrics[player_name] = profiler.get_metrics()
             
+            bridge = _routing_bridge(player_manager)
+            dmx_input = getattr(player_manager, 'dmx_input', None)
+            
             return jsonify({
                 'success': True,
                 'metrics': metrics,
                 'players': list(metrics.keys()),
                 'system': get_system_memory_snapshot(),
+                'artnet': bridge.get_transmit_stats() if bridge else None,
+                'dmx_input': dmx_input.get_stats() if dmx_input else None,
             })
         except Exception as e:
             logger.error(f"Failed to get performance metrics: {e}", exc_info=True)
@@ -65,6 +76,9 @@ def register_performance_routes(app, player_manager):
                 # Reset all players
                 for profiler in profilers.values():
                     profiler.reset()
+                bridge = _routing_bridge(player_manager)
+                if bridge and bridge.transmitter:
+                    bridge.transmitter.reset_stats()
                 return jsonify({
                     'success': True,
                     'message': 'Reset metrics for all players'
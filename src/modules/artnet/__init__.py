@@ -6,6 +6,7 @@ and routing assignments for the Py_artnet video player.
 
 Core Components:
 - ArtNetPoint: Single LED coordinate (x, y)
+- PointArray: LED coordinates of an object as contiguous arrays
 - ArtNetObject: LED fixture with spatial positioning and rendering properties
 - ArtNetOutput: Network target with routing configuration
 - PointGenerator: Convert editor shapes to LED coordinates
@@ -16,11 +17,16 @@ Rendering Pipeline (NEW):
 - PixelSampler: Sample video frames at object coordinates
 - RGBFormatMapper: Handle LED channel orders (RGB, GRB, RGBW, etc.)
 - OutputManager: Complete frame rendering and DMX generation
-- ArtNetSender: Network transmission via stupidArtnet per output
+- ArtNetSender: Batched Art-Net transmission from preallocated packets (one socket)
 - RoutingBridge: Main integration point with player
+- ShardPool: Outputs rendered and sent by worker processes (large installations)
+
+DMX Input:
+- DMXReceiver: Art-Net/sACN input from lighting consoles (own thread)
+- DMXInput: Received channels applied to player/layer/effect parameters per frame
 """
 
-from .object import ArtNetPoint, ArtNetObject
+from .object import ArtNetPoint, PointArray, ArtNetObject
 from .output import ArtNetOutput
 from .point_generator import PointGenerator
 from .routing_manager import ArtNetRoutingManager
@@ -30,9 +36,13 @@ from .rgb_format_mapper import RGBFormatMapper
 from .output_manager import OutputManager
 from .sender import ArtNetSender
 from .routing_bridge import RoutingBridge
+from .shards import ShardPool
+from .receiver import DMXReceiver
+from .dmx_input import DMXInput, DMXInputMapping
 
 __all__ = [
     'ArtNetPoint',
+    'PointArray',
     'ArtNetObject',
     'ArtNetOutput',
     'PointGenerator',
@@ -43,4 +53,8 @@ __all__ = [
     'OutputManager',
     'ArtNetSender',
     'RoutingBridge',
+    'ShardPool',
+    'DMXReceiver',
+    'DMXInput',
+    'DMXInputMapping',
 ]
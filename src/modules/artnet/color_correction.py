@@ -8,6 +8,8 @@ Used for both per-object and per-output color correction.
 import numpy as np
 from typing import List, Tuple, Union
 
+from ..core.buffer_pool import get_buffer_pool
+
 
 class ColorCorrector:
     """Apply color correction to pixel arrays"""
@@ -37,19 +39,62 @@ class ColorCorrector:
         """
         # Convert to numpy array if needed
         if isinstance(pixels, list):
-            arr = np.array(pixels, dtype=np.float32)
-        else:
-            arr = pixels.astype(np.float32)
+            pixels = np.array(pixels, dtype=np.float32).reshape(-1, 3)
         
-        # Skip processing if no corrections needed
+        # Skip processing if no corrections needed (always a new array: callers
+        # pass rows of shared buffers such as the GPU sample buffer)
         if brightness == 0 and contrast == 0 and red == 0 and green == 0 and blue == 0:
-            return arr.astype(np.uint8)
+            return pixels.astype(np.uint8, copy=True)
+        
+        # Work in a pooled float32 temporary (no per-call allocation)
+        pool = get_buffer_pool()
+        arr = pool.acquire(pixels.shape, np.float32)
+        try:
+            np.copyto(arr, pixels, casting='unsafe')
+            return ColorCorrector._correct_inplace(arr, brightness, contrast, red, green, blue)
+        finally:
+            pool.release(arr)
+    
+    @staticmethod
+    def build_lut(
+        brightness: int = 0,
+        contrast: int = 0,
+        red: int = 0,
+        green: int = 0,
+        blue: int = 0,
+        channels: int = 3
+    ) -> np.ndarray:
+        """
+        Precompute the correction as per-channel lookup tables.
+        
+        Every stage of apply() is a per-channel function of one uint8 value,
+        so running it once over 0..255 gives tables that reproduce apply()
+        exactly: ``lut[c][v] == apply(...)[:, c]`` for input value v.
+        Channels beyond the third (white/amber) only get contrast and
+        brightness, as in apply().
+        
+        Args:
+            brightness, contrast, red, green, blue: Same as apply()
+            channels: Number of channels (3 for RGB, up to 6 for RGBCWW)
         
+        Returns:
+            uint8 array (channels, 256)
+        """
+        values = np.repeat(np.arange(256, dtype=np.uint8)[:, np.newaxis], channels, axis=1)
+        corrected = ColorCorrector.apply(values, brightness, contrast, red, green, blue)
+        return np.ascontiguousarray(corrected.T)
+    
+    @staticmethod
+    def _correct_inplace(arr: np.ndarray, brightness: int, contrast: int,
+                         red: int, green: int, blue: int) -> np.ndarray:
+        """Apply corrections to a float32 (N, 3) array in place; returns new uint8 array."""
         # Apply contrast (multiplicative around midpoint 128)
         if contrast != 0:
             # Normalize contrast: -255 to 255 → 0.0 to 2.0 multiplier
             contrast_factor = 1.0 + (contrast / 255.0)
-            arr = (arr - 128) * contrast_factor + 128
+            arr -= 128
+            arr *= contrast_factor
+            arr += 128
         
         # Apply brightness (additive)
         if brightness != 0:
@@ -64,7 +109,7 @@ class ColorCorrector:
             arr[:, 2] += blue
         
         # Clamp to valid range and convert to uint8
-        arr = np.clip(arr, 0, 255)
+        np.clip(arr, 0, 255, out=arr)
         return arr.astype(np.uint8)
     
     @staticmethod
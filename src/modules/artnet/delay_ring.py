@@ -0,0 +1,119 @@
+"""
+Delay Ring - time-based output delay.
+
+OutputManager used to delay an output with a deque of bytes, returning the
+frame pushed delay_ms × fps frames ago: the real delay drifted whenever the
+render rate differed from the output FPS, every frame allocated, and outputs
+running at different rates could not be aligned to audio in milliseconds.
+
+A DelayRing is a preallocated (capacity, channels) uint8 ring of DMX frames
+stamped with time.monotonic().  read(now) returns the newest frame that is
+at least the delay old, or — with interpolation — the blend of the two
+frames around now - delay, so the delay is the same in milliseconds at any
+frame rate.  The ring only reallocates when it is too short to reach back
+by the delay (delay raised, or frames arriving faster than expected).
+"""
+
+from typing import Optional, Union
+
+import numpy as np
+
+# Frames kept beyond delay × rate (timing jitter)
+_HEADROOM = 1.25
+
+
+class DelayRing:
+    """Circular buffer of timestamped DMX frames for one output."""
+
+    def __init__(self, channels: int, delay_s: float, rate_hint: float = 60.0):
+        """
+        Args:
+            channels: DMX bytes per frame
+            delay_s: Delay in seconds
+            rate_hint: Expected frames per second (initial capacity)
+        """
+        self.channels = channels
+        self.delay = delay_s
+        capacity = max(4, int(np.ceil(delay_s * max(rate_hint, 1.0) * _HEADROOM)) + 2)
+        self.frames = np.zeros((capacity, channels), dtype=np.uint8)
+        self.times = np.full(capacity, -np.inf, dtype=np.float64)
+        self._head = 0      # next slot to write
+        self._count = 0
+
+        # Interpolation scratch
+        self._mix = np.zeros(channels, dtype=np.uint16)
+        self._mix_b = np.zeros(channels, dtype=np.uint16)
+        self._out = np.zeros(channels, dtype=np.uint8)
+        self.black = np.zeros(channels, dtype=np.uint8)   # sent until read() has a frame
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        return len(self.times)
+
+    def _slot(self, i: int) -> int:
+        """Slot of the i-th oldest frame."""
+        return (self._head - self._count + i) % len(self.times)
+
+    def push(self, data: Union[bytes, np.ndarray], now: float) -> None:
+        """Store *data* (channels bytes) stamped with monotonic time *now*."""
+        if self._count == self.capacity and self.times[self._slot(0)] > now - self.delay:
+            self._grow()
+        self.frames[self._head] = np.frombuffer(data, dtype=np.uint8) if isinstance(data, bytes) else data
+        self.times[self._head] = now
+        self._head = (self._head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def _grow(self) -> None:
+        """Double the capacity, keeping frames in chronological order."""
+        order = [self._slot(i) for i in range(self._count)]
+        frames = np.zeros((self.capacity * 2, self.channels), dtype=np.uint8)
+        times = np.full(self.capacity * 2, -np.inf, dtype=np.float64)
+        frames[:self._count] = self.frames[order]
+        times[:self._count] = self.times[order]
+        self.frames, self.times = frames, times
+        self._head = self._count
+
+    def read(self, now: float, interpolate: bool = False) -> Optional[np.ndarray]:
+        """
+        Frame to output at *now* (a view into the ring or scratch buffer).
+
+        Returns None while no frame is old enough yet (caller sends black).
+        """
+        target = now - self.delay
+        # Binary search: newest frame stamped at or before target
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.times[self._slot(mid)] <= target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == 0:
+            return None
+        a = self._slot(lo - 1)
+        if not interpolate or lo == self._count:
+            return self.frames[a]
+
+        b = self._slot(lo)
+        t0, t1 = self.times[a], self.times[b]
+        weight = int((target - t0) / (t1 - t0) * 256 + 0.5) if t1 > t0 else 0
+        if weight <= 0:
+            return self.frames[a]
+        if weight >= 256:
+            return self.frames[b]
+        # (a × (256 - w) + b × w + 128) >> 8 in uint16
+        np.multiply(self.frames[a], 256 - weight, out=self._mix, dtype=np.uint16)
+        np.multiply(self.frames[b], weight, out=self._mix_b, dtype=np.uint16)
+        np.add(self._mix, self._mix_b, out=self._mix)
+        np.add(self._mix, 128, out=self._mix)
+        np.right_shift(self._mix, 8, out=self._mix)
+        np.copyto(self._out, self._mix, casting='unsafe')
+        return self._out
+
+    def clear(self) -> None:
+        self._head = 0
+        self._count = 0
+        self.times.fill(-np.inf)
@@ -0,0 +1,334 @@
+"""
+DMX Input - lighting-console control of player, layer and effect parameters.
+
+Mappings assign DMX channels (received by DMXReceiver) to parameters:
+
+    {"universe": 0, "channel": 1, "target": "player.video.brightness"}
+    {"protocol": "sacn", "universe": 1, "channel": 10, "fine": true,
+     "target": "player.artnet.layers[1].opacity"}
+    {"universe": 0, "channel": 20, "target": "param_clip_<id>_effect_0_strength"}
+
+Targets:
+    player.<player_id>.brightness | speed | hue_shift    player setters
+    player.<player_id>.layers[<index>].opacity            0-100
+    param_...                                             effect parameter UID
+                                                          (as used by sequences)
+
+min/max default to the target's range (effect parameters: their PARAMETERS
+min/max; select parameters step through their options).  "fine" reads a
+16-bit value from channel (coarse) and channel + 1 (fine).
+
+The mappings are compiled into one table per universe — channel offsets,
+coarse/fine flags and value ranges as arrays — and one setter per mapping,
+resolved once (effect UIDs again when a player's clip, layers or effect
+lists change, or after a setter failed).
+apply() runs on the render thread, once per frame: it takes the universes
+that changed since the last frame from the receiver, evaluates their
+channels in one vectorized step and calls only the setters whose value
+changed.
+"""
+
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .receiver import DMXReceiver, UNIVERSE_SLOTS
+from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# player attribute → (setter, min, max)
+_PLAYER_TARGETS = {
+    'brightness': ('set_brightness', 0.0, 100.0),
+    'speed': ('set_speed', 0.1, 4.0),
+    'hue_shift': ('set_hue_shift', 0.0, 360.0),
+}
+_PLAYER_TARGET = re.compile(r'^player\.(\w+)\.(\w+)$')
+_LAYER_TARGET = re.compile(r'^player\.(\w+)\.layers\[(\d+)\]\.opacity$')
+
+
+@dataclass
+class DMXInputMapping:
+    """One DMX channel (or coarse/fine pair) driving one parameter."""
+
+    target: str                  # see module docstring
+    universe: int = 0            # Art-Net port-address / sACN universe
+    channel: int = 1             # 1-512
+    protocol: str = 'artnet'     # 'artnet' or 'sacn'
+    fine: bool = False           # 16-bit: channel = coarse, channel + 1 = fine
+    min: Optional[float] = None  # None = target default
+    max: Optional[float] = None
+
+    def to_dict(self) -> dict:
+        """Serialize to JSON"""
+        return {
+            'target': self.target,
+            'universe': self.universe,
+            'channel': self.channel,
+            'protocol': self.protocol,
+            'fine': self.fine,
+            'min': self.min,
+            'max': self.max,
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> 'DMXInputMapping':
+        """Deserialize from JSON"""
+        return DMXInputMapping(
+            target=data['target'],
+            universe=int(data.get('universe', 0)),
+            channel=int(data.get('channel', 1)),
+            protocol=data.get('protocol', 'artnet'),
+            fine=bool(data.get('fine', False)),
+            min=data.get('min'),
+            max=data.get('max'),
+        )
+
+
+class _Binding:
+    """Resolved setter of one mapping (None while the target is unavailable)."""
+    __slots__ = ('mapping', 'setter', 'low', 'high', 'last')
+
+    def __init__(self, mapping: DMXInputMapping):
+        self.mapping = mapping
+        self.setter: Optional[Callable[[float], object]] = None
+        self.low = 0.0
+        self.high = 1.0
+        self.last = None
+
+
+class _UniverseTable:
+    """Compiled channels of one universe."""
+    __slots__ = ('coarse', 'fine', 'is_fine', 'bindings')
+
+    def __init__(self, bindings: List[Tuple[_Binding, DMXInputMapping]]):
+        self.coarse = np.array([m.channel - 1 for _, m in bindings], dtype=np.intp)
+        self.fine = np.minimum(self.coarse + 1, UNIVERSE_SLOTS - 1)
+        self.is_fine = np.array([m.fine for _, m in bindings], dtype=bool)
+        self.bindings = [b for b, _ in bindings]
+
+    def evaluate(self, data: bytes) -> np.ndarray:
+        """0.0-1.0 per mapping."""
+        dmx = np.frombuffer(data, dtype=np.uint8)
+        coarse = dmx[self.coarse].astype(np.float64)
+        return np.where(self.is_fine, (coarse * 256.0 + dmx[self.fine]) / 65535.0, coarse / 255.0)
+
+
+class DMXInput:
+    """Applies received DMX to parameters through a precompiled channel table."""
+
+    def __init__(self, player_manager, receiver: Optional[DMXReceiver] = None,
+                 mappings: Optional[List[DMXInputMapping]] = None):
+        """
+        Args:
+            player_manager: PlayerManager (players, sequence_manager for effect UIDs)
+            receiver: DMX source (default: DMXReceiver on the standard ports)
+            mappings: Channel → parameter mappings
+        """
+        self.player_manager = player_manager
+        self.receiver = receiver if receiver is not None else DMXReceiver()
+        self._apply_lock = threading.Lock()
+        self._tables: Dict[Tuple[str, int], _UniverseTable] = {}
+        self._bindings: List[_Binding] = []
+        self._context = None
+        self.frames_applied = 0
+        self.values_applied = 0
+        self._latencies = deque(maxlen=240)   # receive → applied, seconds
+        self.set_mappings(mappings or [])
+
+    @staticmethod
+    def from_config(player_manager, config: dict) -> 'DMXInput':
+        """DMXInput from the 'dmx_input' config section."""
+        receiver = DMXReceiver(
+            bind_ip=config.get('bind_ip', '0.0.0.0'),
+            artnet_port=config.get('artnet_port', 6454) if config.get('artnet', True) else None,
+            sacn_port=config.get('sacn_port', 5568) if config.get('sacn', True) else None,
+        )
+        mappings = [DMXInputMapping.from_dict(m) for m in config.get('mappings', [])]
+        return DMXInput(player_manager, receiver, mappings)
+
+    @property
+    def mappings(self) -> List[DMXInputMapping]:
+        return [b.mapping for b in self._bindings]
+
+    def set_mappings(self, mappings: List[DMXInputMapping]) -> None:
+        """Compile *mappings* into per-universe tables (setters are resolved on the next apply)."""
+        with self._apply_lock:
+            groups: Dict[Tuple[str, int], list] = {}
+            bindings = []
+            for mapping in mappings:
+                if not 1 <= mapping.channel <= UNIVERSE_SLOTS:
+                    logger.warning(f"⚠️ DMX input: channel {mapping.channel} out of range ({mapping.target})")
+                    continue
+                binding = _Binding(mapping)
+                bindings.append(binding)
+                groups.setdefault((mapping.protocol, mapping.universe), []).append((binding, mapping))
+            self._bindings = bindings
+            self._tables = {key: _UniverseTable(entries) for key, entries in groups.items()}
+            self._context = None
+        self.receiver.join_sacn(u for p, u in self._tables if p == 'sacn')
+
+    def start(self) -> bool:
+        return self.receiver.start()
+
+    def stop(self) -> None:
+        self.receiver.stop()
+
+    # -------------------------------------------------------------------------
+    # Render thread
+    # -------------------------------------------------------------------------
+
+    def apply(self) -> int:
+        """
+        Apply the universes that changed since the last call (render loop, once per frame).
+
+        Returns:
+            Number of parameters set
+        """
+        if not self._apply_lock.acquire(blocking=False):
+            return 0   # another player's render loop is applying this frame's input
+        try:
+            changes = self.receiver.take_changes()
+            if not changes:
+                return 0
+            context = self._player_context()
+            if context != self._context:
+                self._resolve_all()
+                self._context = context
+            applied = 0
+            for key, (data, received) in changes.items():
+                table = self._tables.get(key)
+                if table is None:
+                    continue
+                for binding, norm in zip(table.bindings, table.evaluate(data).tolist()):
+                    if binding.setter is None:
+                        continue
+                    value = binding.low + norm * (binding.high - binding.low)
+                    if value == binding.last:
+                        continue
+                    try:
+                        binding.setter(value)
+                        binding.last = value
+                        applied += 1
+                    except Exception as e:
+                        # Stale target (e.g. effect removed): look it up again next frame
+                        logger.warning(f"⚠️ DMX input: {binding.mapping.target} = {value}: {e}")
+                        self._context = None
+                self._latencies.append(time.perf_counter() - received)
+            self.frames_applied += 1
+            self.values_applied += applied
+            return applied
+        finally:
+            self._apply_lock.release()
+
+    def _player_context(self) -> tuple:
+        """Changes whenever a player, its clip, its layers or a layer's effects change."""
+        players = getattr(self.player_manager, 'players', {}) or {}
+        return tuple((pid, id(p), getattr(p, 'current_clip_id', None),
+                      tuple(_effect_ids(layer) for layer in getattr(p, 'layers', None) or ()))
+                     for pid, p in players.items() if p is not None)
+
+    def _resolve_all(self) -> None:
+        for binding in self._bindings:
+            binding.setter = None
+            binding.last = None
+            try:
+                resolved = self._resolve(binding.mapping.target)
+            except Exception as e:
+                logger.warning(f"⚠️ DMX input: cannot resolve {binding.mapping.target}: {e}")
+                resolved = None
+            if resolved is None:
+                continue
+            setter, low, high = resolved
+            mapping = binding.mapping
+            binding.setter = setter
+            binding.low = low if mapping.min is None else float(mapping.min)
+            binding.high = high if mapping.max is None else float(mapping.max)
+
+    def _resolve(self, target: str) -> Optional[Tuple[Callable[[float], object], float, float]]:
+        """target → (setter, default min, default max), None if not available now."""
+        pm = self.player_manager
+        match = _LAYER_TARGET.match(target)
+        if match:
+            player = pm.players.get(match.group(1))
+            if player is None:
+                return None
+            index = int(match.group(2))
+
+            def set_opacity(value, player=player, index=index):
+                layers = player.layers
+                if index < len(layers):
+                    layers[index].opacity = value
+            return set_opacity, 0.0, 100.0
+
+        match = _PLAYER_TARGET.match(target)
+        if match:
+            player = pm.players.get(match.group(1))
+            spec = _PLAYER_TARGETS.get(match.group(2))
+            if player is None or spec is None:
+                return None
+            setter_name, low, high = spec
+            return getattr(player, setter_name), low, high
+
+        if target.startswith('param_'):
+            sequence_manager = getattr(pm, 'sequence_manager', None)
+            resolved = sequence_manager.resolve_parameter(target, pm) if sequence_manager else None
+            if not resolved:
+                return None
+            _, effect, name = resolved
+            return _effect_setter(effect, name)
+
+        logger.warning(f"⚠️ DMX input: unknown target {target}")
+        return None
+
+    def get_stats(self) -> Dict:
+        latencies = sorted(self._latencies)
+        stats = self.receiver.get_stats()
+        stats.update({
+            'mappings': len(self._bindings),
+            'resolved': sum(1 for b in self._bindings if b.setter is not None),
+            'frames_applied': self.frames_applied,
+            'values_applied': self.values_applied,
+            'latency_ms': {
+                'avg': round(sum(latencies) / len(latencies) * 1000.0, 3) if latencies else None,
+                'p95': round(latencies[int((len(latencies) - 1) * 0.95)] * 1000.0, 3) if latencies else None,
+                'max': round(latencies[-1] * 1000.0, 3) if latencies else None,
+            },
+        })
+        return stats
+
+
+def _effect_ids(layer) -> tuple:
+    """Identity of a layer's effect list (added, removed, reordered or recreated effects)."""
+    return tuple(id(effect.get('instance')) if isinstance(effect, dict) else id(effect)
+                 for effect in getattr(layer, 'effects', None) or ())
+
+
+def _effect_setter(effect, name: str) -> Optional[Tuple[Callable[[float], object], float, float]]:
+    """Setter for an effect parameter, converting by its PARAMETERS type."""
+    param = next((p for p in getattr(effect, 'PARAMETERS', []) if p.get('name') == name), {})
+    kind = getattr(param.get('type'), 'value', param.get('type'))
+    update = getattr(effect, 'update_parameter', None)
+    if update is None:
+        return None
+    if kind == 'bool':
+        return (lambda value: update(name, value >= 0.5)), 0.0, 1.0
+    if kind == 'select':
+        options = param.get('options') or []
+        if not options:
+            return None
+        last = len(options) - 1
+        return (lambda value: update(name, options[min(last, max(0, int(value)))])), 0.0, float(last)
+    if kind == 'color':
+        logger.warning(f"⚠️ DMX input: colour parameter {name} is not supported")
+        return None
+    low = float(param.get('min', 0.0))
+    high = float(param.get('max', 1.0))
+    if kind == 'int':
+        return (lambda value: update(name, int(round(value)))), low, high
+    return (lambda value: update(name, value)), low, high
@@ -3,12 +3,17 @@ ArtNet Object Data Models
 
 Contains data models for LED fixtures and coordinate points:
 - ArtNetPoint: Single LED coordinate (x, y)
+- PointArray: All LED coordinates of an object as contiguous arrays
 - ArtNetObject: LED fixture with full configuration
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+import base64
 import math
+import struct
+
+import numpy as np
 
 
 @dataclass
@@ -36,6 +41,158 @@ class ArtNetPoint:
         )
 
 
+class PointArray:
+    """
+    LED coordinates of one object as contiguous arrays.
+
+    ids (int32, 1-based), xs and ys (float64 canvas coordinates).  Behaves
+    like the former List[ArtNetPoint] — len(), iteration and indexing yield
+    ArtNetPoint — while sampling, transforms and serialization work on the
+    arrays directly.
+    """
+
+    __slots__ = ('ids', 'xs', 'ys')
+
+    # Binary layout: magic, version, count, then ids int32[n], xs float32[n], ys float32[n]
+    BINARY_MAGIC = b'FXPT'
+    BINARY_VERSION = 1
+    _BINARY_HEADER = struct.Struct('<4sBxxxI')
+
+    def __init__(self, xs: Iterable[float] = (), ys: Iterable[float] = (), ids: Optional[Iterable[int]] = None):
+        self.xs = np.ascontiguousarray(xs, dtype=np.float64).reshape(-1)
+        self.ys = np.ascontiguousarray(ys, dtype=np.float64).reshape(-1)
+        if ids is None:
+            ids = np.arange(1, len(self.xs) + 1)
+        self.ids = np.ascontiguousarray(ids, dtype=np.int32).reshape(-1)
+        if not len(self.xs) == len(self.ys) == len(self.ids):
+            raise ValueError(
+                f"PointArray length mismatch: {len(self.ids)} ids, {len(self.xs)} x, {len(self.ys)} y"
+            )
+
+    # ── construction ─────────────────────────────────────────────────────────
+
+    @staticmethod
+    def coerce(value) -> 'PointArray':
+        """PointArray from a PointArray, (N, 2) array, or list of ArtNetPoint / point dicts."""
+        if isinstance(value, PointArray):
+            return value
+        if value is None:
+            return PointArray()
+        if isinstance(value, np.ndarray):
+            xy = value.reshape(-1, 2)
+            return PointArray(xy[:, 0], xy[:, 1])
+        value = list(value)
+        if value and isinstance(value[0], dict):
+            return PointArray.from_dicts(value)
+        n = len(value)
+        return PointArray(
+            np.fromiter((p.x for p in value), dtype=np.float64, count=n),
+            np.fromiter((p.y for p in value), dtype=np.float64, count=n),
+            np.fromiter((p.id for p in value), dtype=np.int32, count=n),
+        )
+
+    @staticmethod
+    def from_dicts(points: List[dict]) -> 'PointArray':
+        """Deserialize from JSON point dicts ({'id', 'x', 'y'})."""
+        n = len(points)
+        return PointArray(
+            np.fromiter((p['x'] for p in points), dtype=np.float64, count=n),
+            np.fromiter((p['y'] for p in points), dtype=np.float64, count=n),
+            np.fromiter((p['id'] for p in points), dtype=np.int32, count=n),
+        )
+
+    def to_dicts(self) -> List[dict]:
+        """Serialize to JSON point dicts."""
+        return [{'id': i, 'x': x, 'y': y}
+                for i, x, y in zip(self.ids.tolist(), self.xs.tolist(), self.ys.tolist())]
+
+    def to_bytes(self) -> bytes:
+        """Compact binary form (12 bytes per LED, float32 coordinates)."""
+        return b''.join((
+            self._BINARY_HEADER.pack(self.BINARY_MAGIC, self.BINARY_VERSION, len(self)),
+            self.ids.astype('<i4', copy=False).tobytes(),
+            self.xs.astype('<f4').tobytes(),
+            self.ys.astype('<f4').tobytes(),
+        ))
+
+    @staticmethod
+    def from_bytes(data: Union[bytes, memoryview]) -> 'PointArray':
+        """Inverse of to_bytes()."""
+        header = PointArray._BINARY_HEADER
+        magic, version, n = header.unpack_from(data, 0)
+        if magic != PointArray.BINARY_MAGIC or version != PointArray.BINARY_VERSION:
+            raise ValueError(f"Not a point array (magic={magic!r}, version={version})")
+        if len(data) != header.size + 12 * n:
+            raise ValueError(f"Point array truncated: {len(data)} bytes for {n} points")
+        body = np.frombuffer(data, dtype=np.uint8, offset=header.size)
+        return PointArray(
+            body[4 * n:8 * n].view('<f4'),
+            body[8 * n:].view('<f4'),
+            body[:4 * n].view('<i4').copy(),
+        )
+
+    # ── whole-array operations ───────────────────────────────────────────────
+
+    @property
+    def xy(self) -> np.ndarray:
+        """(N, 2) float64 copy of the coordinates."""
+        return np.column_stack((self.xs, self.ys))
+
+    def transformed(self, dx: float = 0.0, dy: float = 0.0, rotation: float = 0.0,
+                    scale_x: float = 1.0, scale_y: float = 1.0,
+                    origin: Tuple[float, float] = (0.0, 0.0)) -> 'PointArray':
+        """
+        Scale, then rotate (degrees) about *origin*, then translate by (dx, dy).
+
+        Returns a new PointArray with the same ids.
+        """
+        ox, oy = origin
+        x = (self.xs - ox) * scale_x
+        y = (self.ys - oy) * scale_y
+        if rotation:
+            r = math.radians(rotation)
+            cos_r, sin_r = math.cos(r), math.sin(r)
+            x, y = x * cos_r - y * sin_r, x * sin_r + y * cos_r
+        return PointArray(x + ox + dx, y + oy + dy, self.ids)
+
+    def bounds(self) -> Optional[Tuple[float, float, float, float]]:
+        """(min_x, min_y, max_x, max_y), None when empty."""
+        if not len(self):
+            return None
+        return (float(self.xs.min()), float(self.ys.min()), float(self.xs.max()), float(self.ys.max()))
+
+    # ── sequence compatibility ───────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __bool__(self) -> bool:
+        return len(self.ids) > 0
+
+    def __iter__(self) -> Iterator[ArtNetPoint]:
+        for i, x, y in zip(self.ids.tolist(), self.xs.tolist(), self.ys.tolist()):
+            yield ArtNetPoint(i, x, y)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return PointArray(self.xs[index], self.ys[index], self.ids[index])
+        return ArtNetPoint(int(self.ids[index]), float(self.xs[index]), float(self.ys[index]))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PointArray):
+            try:
+                other = PointArray.coerce(other)
+            except (TypeError, AttributeError, KeyError):
+                return NotImplemented
+        return (np.array_equal(self.ids, other.ids) and np.array_equal(self.xs, other.xs)
+                and np.array_equal(self.ys, other.ys))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"PointArray({len(self)} points)"
+
+
 @dataclass
 class ArtNetObject:
     """LED fixture with calculated coordinates"""
@@ -46,8 +203,8 @@ class ArtNetObject:
     source_shape_id: str         # Editor shape ID (reference)
     type: str                    # Shape type (matrix, circle, line, star, etc.)
     
-    # LED Coordinates
-    points: List[ArtNetPoint] = field(default_factory=list)
+    # LED Coordinates (any list of ArtNetPoint / point dicts is stored as PointArray)
+    points: PointArray = field(default_factory=PointArray)
     
     # LED Type Configuration
     led_type: str = 'RGB'        # RGB, RGBW, RGBAW, RGBWW, RGBCW, RGBCWW
@@ -72,6 +229,9 @@ class ArtNetObject:
     green: int = 0               # -255 to 255
     blue: int = 0                # -255 to 255
     
+    # Sampling
+    sample_size: float = 0.0     # Area footprint edge in canvas px (0 = single pixel)
+    
     # Timing
     delay: int = 0               # Delay in milliseconds
     
@@ -87,14 +247,30 @@ class ArtNetObject:
     scale_y: float = 1.0         # Scale Y factor
     visible: bool = True          # Canvas visibility
     
-    def to_dict(self) -> dict:
-        """Serialize to JSON"""
+    def __setattr__(self, name, value):
+        if name == 'points':
+            value = PointArray.coerce(value)
+        object.__setattr__(self, name, value)
+    
+    def to_dict(self, binary_points: bool = False) -> dict:
+        """
+        Serialize to JSON.
+        
+        Args:
+            binary_points: Store points as base64 PointArray.to_bytes()
+                           ('pointsBinary') instead of a list of dicts —
+                           about a fifth of the size for large objects
+        """
+        if binary_points:
+            points = {'pointsBinary': base64.b64encode(self.points.to_bytes()).decode('ascii')}
+        else:
+            points = {'points': self.points.to_dicts()}
         return {
             'id': self.id,
             'name': self.name,
             'sourceShapeId': self.source_shape_id,
             'type': self.type,
-            'points': [p.to_dict() for p in self.points],
+            **points,
             'ledType': self.led_type,
             'channelsPerPixel': self.channels_per_pixel,
             'channelOrder': self.channel_order,
@@ -110,6 +286,7 @@ class ArtNetObject:
             'red': self.red,
             'green': self.green,
             'blue': self.blue,
+            'sampleSize': self.sample_size,
             'delay': self.delay,
             'inputLayer': self.input_layer,
             'masterId': self.master_id,
@@ -121,13 +298,17 @@ class ArtNetObject:
     
     @staticmethod
     def from_dict(data: dict) -> 'ArtNetObject':
-        """Deserialize from JSON"""
+        """Deserialize from JSON (list of point dicts or 'pointsBinary')"""
+        if 'pointsBinary' in data:
+            points = PointArray.from_bytes(base64.b64decode(data['pointsBinary']))
+        else:
+            points = PointArray.from_dicts(data.get('points', []))
         return ArtNetObject(
             id=data['id'],
             name=data['name'],
             source_shape_id=data['sourceShapeId'],
             type=data['type'],
-            points=[ArtNetPoint.from_dict(p) for p in data.get('points', [])],
+            points=points,
             led_type=data.get('ledType', 'RGB'),
             channels_per_pixel=data.get('channelsPerPixel', 3),
             channel_order=data.get('channelOrder', 'RGB'),
@@ -143,6 +324,7 @@ class ArtNetObject:
             red=data.get('red', 0),
             green=data.get('green', 0),
             blue=data.get('blue', 0),
+            sample_size=data.get('sampleSize', 0.0),
             delay=data.get('delay', 0),
             input_layer=data.get('inputLayer', 'player'),
             master_id=data.get('masterId'),
@@ -3,6 +3,7 @@ ArtNet Output Data Model
 
 Network target configuration for ArtNet routing:
 - IP address and subnet
+- Protocol (Art-Net or sACN/E1.31)
 - Universe configuration
 - FPS and timing
 - Color correction (applied to all assigned objects)
@@ -30,8 +31,15 @@ class ArtNetOutput:
     # Protocol Settings
     fps: int = 30              # Frames per second
     delay: int = 0             # Delay in milliseconds
+    delay_interpolation: bool = False  # Blend neighbouring frames at the exact delay
     active: bool = True        # Enable/disable output
-    artsync: bool = True       # Enable ArtSync packets for timing synchronization
+    artsync: bool = True       # Enable ArtSync (sACN: universe sync) for timing synchronization
+    protocol: str = 'artnet'   # 'artnet' or 'sacn' (E1.31)
+    
+    # sACN (E1.31) Settings
+    sacn_priority: int = 100         # 0-200
+    sacn_multicast: bool = True      # Multicast per universe (False = unicast to target_ip)
+    sacn_sync_universe: int = 0      # Sync address (0 = start universe)
     
     # Color Correction (applied to ALL objects on this output)
     brightness: int = 0        # -255 to 255
@@ -58,8 +66,13 @@ class ArtNetOutput:
             'startUniverse': self.start_universe,
             'fps': self.fps,
             'delay': self.delay,
+            'delayInterpolation': self.delay_interpolation,
             'active': self.active,
             'artsync': self.artsync,
+            'protocol': self.protocol,
+            'sacnPriority': self.sacn_priority,
+            'sacnMulticast': self.sacn_multicast,
+            'sacnSyncUniverse': self.sacn_sync_universe,
             'brightness': self.brightness,
             'contrast': self.contrast,
             'red': self.red,
@@ -82,8 +95,13 @@ class ArtNetOutput:
             start_universe=data['startUniverse'],
             fps=data.get('fps', 30),
             delay=data.get('delay', 0),
+            delay_interpolation=data.get('delayInterpolation', False),
             active=data.get('active', True),
             artsync=data.get('artsync', True),
+            protocol=data.get('protocol', 'artnet'),
+            sacn_priority=data.get('sacnPriority', 100),
+            sacn_multicast=data.get('sacnMulticast', True),
+            sacn_sync_universe=data.get('sacnSyncUniverse', 0),
             brightness=data.get('brightness', 0),
             contrast=data.get('contrast', 0),
             red=data.get('red', 0),
@@ -2,6 +2,8 @@
 ArtNet Output Manager
 
 Main rendering pipeline that processes video frames and sends to ArtNet outputs.
+Each output is rendered through a precompiled OutputPlan (output_plan.py),
+rebuilt only when the routing changes.
 Handles:
 - Pixel sampling from video frames
 - Per-object color correction
@@ -9,18 +11,23 @@ Handles:
 - RGB format mapping
 - DMX buffer generation per output
 - Frame timing and delay
+
+A plan renders into its own preallocated buffer and the delay ring hands
+out views of its slots, so the only per-frame copy of an output's DMX data
+is the final one into the output's frame buffer (see _frame_buffer).
 """
 
 import numpy as np
 import time
-from typing import Dict, List, Optional, Tuple
-from collections import deque
+from typing import Dict, List, Optional, Tuple, Union
 
 from .object import ArtNetObject
 from .output import ArtNetOutput
 from .pixel_sampler import PixelSampler
 from .color_correction import ColorCorrector
+from .delay_ring import DelayRing
 from .rgb_format_mapper import RGBFormatMapper
+from .output_plan import PLAYER_INPUT, OutputPlan, plan_signature
 
 
 class OutputManager:
@@ -44,11 +51,18 @@ class OutputManager:
         
         # Output state tracking
         self.last_frame_time: Dict[str, float] = {}  # output_id → timestamp
-        self.delay_buffers: Dict[str, deque] = {}    # output_id → deque of frames
+        self.delay_buffers: Dict[str, DelayRing] = {}  # output_id → timestamped frame ring
         self.frame_counters: Dict[str, int] = {}     # output_id → frame count
         
         # Last frame storage for DMX monitor
         self.last_frames: Dict[str, bytes] = {}      # output_id → DMX data
+
+        # output_id → two frame buffers, used alternately (see _frame_buffer)
+        self._frame_buffers: Dict[str, List[bytearray]] = {}
+        
+        # Compiled rendering plans (rebuilt when routing/canvas changes)
+        self._plans: Dict[str, OutputPlan] = {}      # output_id → plan
+        self.plan_compiles = 0
         
     def render_frame(
         self,
@@ -56,6 +70,8 @@ class OutputManager:
         objects: Dict[str, ArtNetObject],
         outputs: Dict[str, ArtNetOutput],
         gpu_pixel_buffer: Optional[Dict[str, np.ndarray]] = None,
+        routing_version: Optional[int] = None,
+        layer_frames: Optional[Dict[str, np.ndarray]] = None,
     ) -> Dict[str, bytes]:
         """
         Render a single video frame to all active outputs.
@@ -67,15 +83,22 @@ class OutputManager:
             gpu_pixel_buffer: Optional pre-sampled pixel data from GPU compute
                               shader {obj_id: (N,3) uint8 RGB}.  When present,
                               skips per-object numpy frame sampling.
+            routing_version: ArtNetRoutingManager.version — plans are reused
+                             while it is unchanged.  When None, a structural
+                             signature of the routing is compared instead.
+            layer_frames: RGB frames of the isolated layers objects sample
+                          from (ArtNetObject.input_layer → frame)
         
         Returns:
-            Dictionary of output_id → DMX bytes ready for transmission
+            Dictionary of output_id → DMX data ready for transmission
+            (bytearray, valid until the output's render after next)
         """
         # FAST PATH: No objects configured = no work to do
         if not objects:
             return {}
         
         rendered_outputs = {}
+        self.sampler.clear_integrals()
         
         for output_id, output in outputs.items():
             # Skip inactive outputs
@@ -87,10 +110,15 @@ class OutputManager:
                 continue
             
             # Render DMX data for this output
-            dmx_data = self._render_output(frame, output, objects, gpu_pixel_buffer)
+            dmx_data = self._render_output(frame, output, objects, gpu_pixel_buffer,
+                                           routing_version, layer_frames)
             
             # Apply delay buffer
-            dmx_data = self._apply_delay(output_id, output.delay, output.fps, dmx_data)
+            dmx_data = self._apply_delay(output_id, output.delay, output.fps, dmx_data,
+                                         output.delay_interpolation)
+            
+            # Copy out of the plan/delay buffers, which the next frame reuses
+            dmx_data = self._frame_buffer(output_id, dmx_data)
             
             # Store for DMX monitor
             self.last_frames[output_id] = dmx_data
@@ -105,15 +133,71 @@ class OutputManager:
         output: ArtNetOutput,
         objects: Dict[str, ArtNetObject],
         gpu_pixel_buffer: Optional[Dict[str, np.ndarray]] = None,
+        routing_version: Optional[int] = None,
+        layer_frames: Optional[Dict[str, np.ndarray]] = None,
+    ) -> Union[bytes, np.ndarray]:
+        """
+        Render DMX data for a single output through its compiled plan.
+
+        Falls back to the per-object path when the LEDs of one output come
+        from a mix of GPU-sampled rows and the CPU frame.
+
+        Args:
+            frame: Video frame RGB array (fallback if gpu_pixel_buffer absent)
+            output: Target output configuration
+            objects: All available objects
+            gpu_pixel_buffer: Optional pre-sampled {obj_id: (N,3) uint8 RGB}
+            routing_version: Routing version for plan reuse (None = compare signature)
+            layer_frames: Optional {input_layer: RGB frame} for layer-sampling objects
+
+        Returns:
+            DMX data for this output — the plan's uint8 buffer, overwritten
+            by the plan's next render
+        """
+        plan = self.get_plan(output, objects, routing_version)
+        if plan.n_points == 0:
+            return bytes()
+
+        rgb = plan.sample(frame, gpu_pixel_buffer, self.sampler, layer_frames)
+        if rgb is None:
+            return self._render_output_objects(frame, output, objects, gpu_pixel_buffer, layer_frames)
+        return plan.render(rgb)
+
+    def get_plan(
+        self,
+        output: ArtNetOutput,
+        objects: Dict[str, ArtNetObject],
+        routing_version: Optional[int] = None,
+    ) -> OutputPlan:
+        """Compiled plan for *output*, rebuilt when routing or canvas size changed."""
+        if routing_version is not None:
+            key = (routing_version, self.canvas_width, self.canvas_height)
+        else:
+            key = (plan_signature(output, objects), self.canvas_width, self.canvas_height)
+        plan = self._plans.get(output.id)
+        if plan is None or plan.key != key:
+            plan = OutputPlan(output, objects, self.canvas_width, self.canvas_height, key)
+            self._plans[output.id] = plan
+            self.plan_compiles += 1
+        return plan
+
+    def _render_output_objects(
+        self,
+        frame: np.ndarray,
+        output: ArtNetOutput,
+        objects: Dict[str, ArtNetObject],
+        gpu_pixel_buffer: Optional[Dict[str, np.ndarray]] = None,
+        layer_frames: Optional[Dict[str, np.ndarray]] = None,
     ) -> bytes:
         """
-        Render DMX data for a single output.
+        Render DMX data for a single output object by object (reference path).
 
         Args:
             frame: Video frame RGB array (fallback if gpu_pixel_buffer absent)
             output: Target output configuration
             objects: All available objects
             gpu_pixel_buffer: Optional pre-sampled {obj_id: (N,3) uint8 RGB}
+            layer_frames: Optional {input_layer: RGB frame} for layer-sampling objects
 
         Returns:
             DMX bytes for this output
@@ -139,6 +223,13 @@ class OutputManager:
             obj_id = str(obj.id) if hasattr(obj, 'id') else None
             if gpu_pixel_buffer and obj_id and obj_id in gpu_pixel_buffer:
                 rgb_pixels = gpu_pixel_buffer[obj_id]
+            elif (obj.input_layer or PLAYER_INPUT) != PLAYER_INPUT:
+                # Isolated layer — black while the layer renders nothing
+                layer_frame = (layer_frames or {}).get(obj.input_layer)
+                if layer_frame is None:
+                    rgb_pixels = np.zeros((len(obj.points), 3), dtype=np.uint8)
+                else:
+                    rgb_pixels = self.sampler.sample_object(obj, layer_frame)
             elif frame is None:
                 # No CPU frame and no GPU buffer for this object — skip (blackout)
                 continue
@@ -188,6 +279,23 @@ class OutputManager:
         else:
             return bytes()
     
+    def _frame_buffer(self, output_id: str, dmx_data: Union[bytes, np.ndarray]) -> bytearray:
+        """
+        Copy *dmx_data* into one of the output's two preallocated buffers.
+
+        The buffers alternate, so the data handed out stays intact while the
+        next frame is rendered — long enough for the ArtNetTx thread, which
+        takes a published frame well within one frame interval.
+        """
+        size = len(dmx_data)
+        buffers = self._frame_buffers.get(output_id)
+        if buffers is None or len(buffers[0]) != size:
+            buffers = self._frame_buffers[output_id] = [bytearray(size), bytearray(size)]
+        buffers.reverse()
+        buf = buffers[0]
+        memoryview(buf)[:] = dmx_data
+        return buf
+    
     def _should_send_frame(self, output_id: str, fps: int) -> bool:
         """
         Check if enough time has passed based on FPS.
@@ -215,41 +323,40 @@ class OutputManager:
         output_id: str, 
         delay_ms: int, 
         fps: int,
-        dmx_data: bytes
-    ) -> bytes:
+        dmx_data: Union[bytes, np.ndarray],
+        interpolate: bool = False,
+        now: Optional[float] = None
+    ) -> Union[bytes, np.ndarray]:
         """
-        Apply delay buffer to output.
+        Apply time-based delay to output (see delay_ring.py).
         
         Args:
             output_id: Output identifier
             delay_ms: Delay in milliseconds
-            fps: Frames per second
+            fps: Frames per second (initial ring size only)
             dmx_data: Current frame DMX data
+            interpolate: Blend the two frames around the delayed timestamp
+            now: Monotonic timestamp of this frame (default: time.monotonic())
         
         Returns:
-            Delayed DMX data (or black if buffer not full)
+            Delayed DMX data (or black until a frame is old enough) — a view
+            into the output's delay ring, valid until its next push; the
+            undelayed *dmx_data* itself when delay_ms is 0
         """
-        if delay_ms == 0:
+        if delay_ms <= 0:
+            self.delay_buffers.pop(output_id, None)
             return dmx_data
         
-        # Initialize buffer if needed
-        if output_id not in self.delay_buffers:
-            self.delay_buffers[output_id] = deque()
+        now = time.monotonic() if now is None else now
+        ring = self.delay_buffers.get(output_id)
+        if ring is None or ring.channels != len(dmx_data):
+            ring = DelayRing(len(dmx_data), delay_ms / 1000.0, rate_hint=fps or 60)
+            self.delay_buffers[output_id] = ring
+        ring.delay = delay_ms / 1000.0
         
-        buffer = self.delay_buffers[output_id]
-        
-        # Add current frame
-        buffer.append(dmx_data)
-        
-        # Calculate required buffer size
-        delay_frames = int((delay_ms / 1000.0) * fps)
-        
-        # Return delayed frame if buffer is full
-        if len(buffer) > delay_frames:
-            return buffer.popleft()
-        else:
-            # Buffer not full yet, return black
-            return bytes(len(dmx_data))
+        ring.push(dmx_data, now)
+        delayed = ring.read(now, interpolate)
+        return ring.black if delayed is None else delayed
     
     def get_last_frame(self, output_id: str) -> Optional[bytes]:
         """
@@ -278,6 +385,7 @@ class OutputManager:
         self.canvas_width = width
         self.canvas_height = height
         self.sampler.update_canvas_size(width, height)
+        self._plans.clear()
     
     def reset_output(self, output_id: str):
         """
@@ -290,6 +398,8 @@ class OutputManager:
         self.delay_buffers.pop(output_id, None)
         self.frame_counters.pop(output_id, None)
         self.last_frames.pop(output_id, None)
+        self._frame_buffers.pop(output_id, None)
+        self._plans.pop(output_id, None)
     
     def reset_all(self):
         """Reset all output state"""
@@ -297,6 +407,8 @@ class OutputManager:
         self.delay_buffers.clear()
         self.frame_counters.clear()
         self.last_frames.clear()
+        self._frame_buffers.clear()
+        self._plans.clear()
     
     def get_stats(self, output_id: str) -> Dict:
         """
@@ -311,6 +423,9 @@ class OutputManager:
         return {
             'last_frame_time': self.last_frame_time.get(output_id, 0),
             'buffer_size': len(self.delay_buffers.get(output_id, [])),
+            'buffer_capacity': self.delay_buffers[output_id].capacity if output_id in self.delay_buffers else 0,
             'frame_count': self.frame_counters.get(output_id, 0),
-            'has_data': output_id in self.last_frames
+            'has_data': output_id in self.last_frames,
+            'plan_points': self._plans[output_id].n_points if output_id in self._plans else 0,
+            'plan_compiles': self.plan_compiles
         }
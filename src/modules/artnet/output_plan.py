@@ -0,0 +1,309 @@
+"""
+Output Plan - precompiled per-output sampling and DMX layout.
+
+OutputManager used to walk every assigned object on every frame: sample the
+pixels, apply object colour correction, white channel, output colour
+correction, channel order and flatten — five calls and several small arrays
+per object, then a bytes join.  With a few hundred objects that is thousands
+of Python calls per frame.
+
+An OutputPlan is compiled once per output whenever the routing changes
+(ArtNetRoutingManager.version) and turns a frame into a handful of
+vectorized operations over all of the output's LEDs:
+
+    1. gather      frame[ys, xs] for every LED (indices cached per frame size),
+                   footprint averages from the frame's integral image for
+                   area-sampled objects (ArtNetObject.sample_size), or the GPU
+                   sampler rows concatenated in plan order.  LEDs are grouped
+                   by ArtNetObject.input_layer; each group is gathered in one
+                   pass from its own frame (composite or isolated layer)
+    2. white       RGBW+ objects only: object correction through its lookup
+                   table, then one ColorCorrector.apply_white_channel call per
+                   distinct white configuration into a (N, 6) channel matrix
+    3. layout      one np.take through a byte table that encodes channel
+                   order, channels-per-pixel and object order at once
+    4. correction  one np.take through stacked 256-entry lookup tables
+                   (ColorCorrector.build_lut) into the preallocated DMX buffer
+
+Object and output colour correction are per-channel functions of a uint8
+value, so for RGB objects both are composed into one table per channel
+(output[object[v]]); RGBW+ objects need the object stage before the white
+channel is derived, so they only get the output table in step 4.
+
+The result is byte-identical to the per-object pipeline (the tables are
+built by running ColorCorrector itself over 0..255), see
+OutputManager._render_output_objects.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .color_correction import ColorCorrector
+from .object import ArtNetObject
+from .output import ArtNetOutput
+from .pixel_sampler import PixelSampler
+from .rgb_format_mapper import RGBFormatMapper
+
+# Input layer of objects that sample the final composite
+PLAYER_INPUT = 'player'
+
+# Width of the per-LED channel matrix (RGB + up to three white/amber channels)
+MAX_CHANNELS = 6
+
+# LED type → channels produced by ColorCorrector.apply_white_channel
+_WHITE_CHANNELS = {'RGBW': 4, 'RGBAW': 5, 'RGBWW': 5, 'RGBCW': 5, 'RGBCWW': 6}
+
+
+def plan_signature(output: ArtNetOutput, objects: Dict[str, ArtNetObject]) -> tuple:
+    """
+    Structural key of everything a plan depends on.
+
+    Only used when the caller cannot supply a routing version; walks the
+    assigned objects, so it is O(objects) — still far cheaper than rendering.
+    """
+    assigned = set(output.assigned_objects)
+    return (
+        output.brightness, output.contrast, output.red, output.green, output.blue,
+        tuple(
+            (oid, id(obj.points), len(obj.points), obj.sample_size, obj.input_layer,
+             obj.led_type, obj.channel_order,
+             obj.white_mode, obj.white_threshold, obj.white_behavior, obj.color_temp,
+             obj.brightness, obj.contrast, obj.red, obj.green, obj.blue)
+            for oid, obj in objects.items() if oid in assigned
+        ),
+    )
+
+
+class OutputPlan:
+    """Flat rendering plan for one output (see module docstring)."""
+
+    def __init__(self, output: ArtNetOutput, objects: Dict[str, ArtNetObject],
+                 canvas_width: int, canvas_height: int, key=None):
+        self.key = key
+        self.canvas_width = canvas_width
+        self.canvas_height = canvas_height
+
+        # Same object order as the per-object renderer: objects dict order,
+        # filtered by assignment, empty objects skipped.
+        assigned = set(output.assigned_objects)
+        objs = [obj for oid, obj in objects.items() if oid in assigned and len(obj.points) > 0]
+        self.obj_ids: List[str] = [str(obj.id) for obj in objs]
+        counts = np.array([len(obj.points) for obj in objs], dtype=np.int64)
+        self.n_points = int(counts.sum()) if len(objs) else 0
+        n = self.n_points
+
+        # Canvas coordinates of every LED in plan order
+        self._xs = np.concatenate([obj.points.xs for obj in objs]) if objs else np.zeros(0)
+        self._ys = np.concatenate([obj.points.ys for obj in objs]) if objs else np.zeros(0)
+        self._gather: Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray]] = {}
+
+        # Area-sampled LEDs (footprint edge in canvas px per LED)
+        self._sizes = np.repeat(np.array([float(o.sample_size) for o in objs], dtype=np.float64), counts)
+
+        # Input layer groups: (input_layer, plan rows or None = all LEDs)
+        bounds = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        layer_rows: Dict[str, List[np.ndarray]] = {}
+        for i, obj in enumerate(objs):
+            layer_rows.setdefault(obj.input_layer or PLAYER_INPUT, []).append(
+                np.arange(bounds[i], bounds[i + 1], dtype=np.int64))
+        self.input_layers: List[str] = list(layer_rows)
+        self._sources: List[Tuple[str, Optional[np.ndarray]]] = [
+            (layer, np.concatenate(rows) if len(layer_rows) > 1 else None)
+            for layer, rows in layer_rows.items()
+        ]
+        self._source_cache: Dict[tuple, tuple] = {}
+
+        # ── correction lookup tables ─────────────────────────────────────────
+        # Stacked (T, 256) uint8 tables, deduplicated by what they encode.
+        out_lut = ColorCorrector.build_lut(output.brightness, output.contrast,
+                                           output.red, output.green, output.blue,
+                                           channels=MAX_CHANNELS)
+        tables: List[np.ndarray] = []
+        table_ids: Dict[tuple, int] = {}
+
+        def table(key: tuple, make) -> int:
+            tid = table_ids.get(key)
+            if tid is None:
+                tid = table_ids[key] = len(tables)
+                tables.append(make())
+            return tid
+
+        # ── white channel groups + DMX byte layout ───────────────────────────
+        groups: Dict[tuple, List[Tuple[np.ndarray, Optional[np.ndarray]]]] = {}
+        rgb_rows: List[np.ndarray] = []
+        src_index: List[np.ndarray] = []
+        lut_base: List[np.ndarray] = []
+        self._all_rgb = all(obj.led_type == 'RGB' for obj in objs)
+        width = 3 if self._all_rgb else MAX_CHANNELS
+        start = 0
+        for obj, count in zip(objs, counts):
+            rows = np.arange(start, start + count, dtype=np.int64)
+            start += int(count)
+            cc = (obj.brightness, obj.contrast, obj.red, obj.green, obj.blue)
+            obj_lut = ColorCorrector.build_lut(*cc) if any(cc) else None
+            if obj.led_type != 'RGB':
+                channels = _WHITE_CHANNELS.get(obj.led_type, 3)
+                # Object stage runs before the white channel is derived
+                obj_base = None
+                if obj_lut is not None:
+                    ids = [table(('object', cc, c), lambda c=c: obj_lut[c]) for c in range(3)]
+                    obj_base = np.broadcast_to(np.array(ids, dtype=np.int64) * 256, (count, 3))
+                key_w = (obj.led_type, obj.white_mode, obj.white_threshold,
+                         obj.white_behavior, obj.color_temp)
+                groups.setdefault(key_w, []).append((rows, obj_base))
+                luts = [table(('output', c), lambda c=c: out_lut[c]) for c in range(channels)]
+            else:
+                channels = 3
+                rgb_rows.append(rows)
+                if obj_lut is None:
+                    luts = [table(('output', c), lambda c=c: out_lut[c]) for c in range(3)]
+                else:
+                    luts = [table(('composed', cc, c), lambda c=c: out_lut[c][obj_lut[c]])
+                            for c in range(3)]
+            order = RGBFormatMapper.CHANNEL_MAPS.get(obj.channel_order)
+            if order is None or len(order) != channels:
+                order = list(range(channels))   # unknown / mismatched order → unchanged
+            order = np.asarray(order, dtype=np.int64)
+            src_index.append((rows[:, None] * width + order).ravel())
+            lut_base.append(np.tile(np.asarray(luts, dtype=np.int64)[order] * 256, int(count)))
+
+        self._white_groups = []
+        for k, parts in groups.items():
+            rows = np.concatenate([r for r, _ in parts])
+            if any(b is not None for _, b in parts):
+                identity = table(('identity',), lambda: np.arange(256, dtype=np.uint8))
+                base = np.concatenate([
+                    b if b is not None else np.full((len(r), 3), identity * 256, dtype=np.int64)
+                    for r, b in parts
+                ])
+            else:
+                base = None
+            self._white_groups.append((k, rows, base))
+        self._rgb_rows = np.concatenate(rgb_rows) if rgb_rows else None
+        self._src_index = np.concatenate(src_index) if src_index else np.zeros(0, dtype=np.int64)
+        self._lut_base = np.concatenate(lut_base) if lut_base else np.zeros(0, dtype=np.int64)
+        self._luts = (np.concatenate(tables) if tables else np.zeros(0, dtype=np.uint8))
+
+        # Preallocated buffers
+        self._channels = np.zeros((0 if self._all_rgb else n, MAX_CHANNELS), dtype=np.uint8)
+        self._values = np.zeros(len(self._src_index), dtype=np.uint8)
+        self._lut_index = np.zeros(len(self._src_index), dtype=np.int64)
+        self.dmx = np.zeros(len(self._src_index), dtype=np.uint8)
+
+    # ── sources ──────────────────────────────────────────────────────────────
+
+    def gather_indices(self, frame_width: int, frame_height: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(ys, xs) pixel indices of every LED for a frame of the given size (cached)."""
+        key = (frame_width, frame_height)
+        idx = self._gather.get(key)
+        if idx is None:
+            # Same mapping as PixelSampler.sample_object: truncate, then clamp
+            xs = np.clip((self._xs / self.canvas_width * frame_width).astype(np.int64), 0, frame_width - 1)
+            ys = np.clip((self._ys / self.canvas_height * frame_height).astype(np.int64), 0, frame_height - 1)
+            idx = (ys, xs)
+            self._gather[key] = idx
+        return idx
+
+    def _source_indices(self, layer: str, rows: Optional[np.ndarray],
+                        frame_width: int, frame_height: int) -> tuple:
+        """(ys, xs, area positions, AreaRects) of one input layer group (cached per frame size)."""
+        key = (layer, frame_width, frame_height)
+        entry = self._source_cache.get(key)
+        if entry is None:
+            ys, xs = self.gather_indices(frame_width, frame_height)
+            px, py, sizes = self._xs, self._ys, self._sizes
+            if rows is not None:
+                ys, xs, px, py, sizes = ys[rows], xs[rows], px[rows], py[rows], sizes[rows]
+            area = np.flatnonzero(sizes > 0)
+            if len(area):
+                rects = PixelSampler.footprint_rects(
+                    px[area], py[area], sizes[area],
+                    self.canvas_width, self.canvas_height, frame_width, frame_height
+                )
+                entry = (ys, xs, area, rects)
+            else:
+                entry = (ys, xs, None, None)
+            self._source_cache[key] = entry
+        return entry
+
+    def _sample_source(self, frame: np.ndarray, layer: str, rows: Optional[np.ndarray],
+                       sampler: PixelSampler) -> np.ndarray:
+        """RGB of one input layer group sampled from *frame* in one pass."""
+        ys, xs, area, rects = self._source_indices(layer, rows, frame.shape[1], frame.shape[0])
+        if area is None:
+            return frame[ys, xs]
+        averaged = sampler.area_average(frame, rects)
+        if len(area) == len(ys):
+            return averaged
+        rgb = frame[ys, xs]
+        rgb[area] = averaged
+        return rgb
+
+    def sample(self, frame: Optional[np.ndarray],
+               gpu_pixel_buffer: Optional[Dict[str, np.ndarray]],
+               sampler: Optional[PixelSampler] = None,
+               layer_frames: Optional[Dict[str, np.ndarray]] = None) -> Optional[np.ndarray]:
+        """
+        RGB (N, 3) uint8 of every LED in plan order.
+
+        LEDs of objects with an input layer other than 'player' are sampled
+        from *layer_frames* (input_layer → RGB frame); a layer without a frame
+        this tick renders black.  Area-sampled LEDs are averaged through
+        *sampler*'s integral image (shared by all plans for the same frame).
+
+        Returns None when the LEDs come from a mix of GPU rows and CPU frame
+        (or some are missing) — the caller then uses the per-object path.
+        """
+        if gpu_pixel_buffer:
+            try:
+                rows = [gpu_pixel_buffer[oid] for oid in self.obj_ids]
+            except KeyError:
+                rows = None
+            if rows is not None:
+                return np.concatenate(rows) if rows else np.zeros((0, 3), np.uint8)
+            if frame is None or any(oid in gpu_pixel_buffer for oid in self.obj_ids):
+                return None
+        if frame is None and PLAYER_INPUT in self.input_layers:
+            return None
+        sampler = sampler or PixelSampler(self.canvas_width, self.canvas_height)
+        if len(self._sources) == 1 and self._sources[0][0] == PLAYER_INPUT:
+            return self._sample_source(frame, PLAYER_INPUT, None, sampler)
+
+        layer_frames = layer_frames or {}
+        rgb = np.zeros((self.n_points, 3), dtype=np.uint8)
+        for layer, rows in self._sources:
+            source = frame if layer == PLAYER_INPUT else layer_frames.get(layer)
+            if source is None:
+                continue   # layer not rendered this tick → black
+            if rows is None:
+                rgb = self._sample_source(source, layer, None, sampler)
+            else:
+                rgb[rows] = self._sample_source(source, layer, rows, sampler)
+        return rgb
+
+    # ── rendering ────────────────────────────────────────────────────────────
+
+    def render(self, rgb: np.ndarray) -> np.ndarray:
+        """Sampled RGB (N, 3) → DMX bytes in the plan's buffer (uint8 view)."""
+        if self._all_rgb:
+            src = np.ascontiguousarray(rgb).reshape(-1)
+        else:
+            channels = self._channels
+            if self._rgb_rows is not None:
+                channels[self._rgb_rows, :3] = rgb[self._rgb_rows]
+            for (led_type, mode, threshold, behavior, temp), rows, obj_base in self._white_groups:
+                group = rgb[rows]
+                if obj_base is not None:
+                    group = np.take(self._luts, obj_base + group)
+                white = ColorCorrector.apply_white_channel(
+                    group, white_mode=mode, white_threshold=threshold,
+                    white_behavior=behavior, color_temp=temp, led_type=led_type
+                )
+                channels[rows, :white.shape[1]] = white
+            src = channels.reshape(-1)
+
+        np.take(src, self._src_index, out=self._values)
+        np.add(self._lut_base, self._values, out=self._lut_index)
+        np.take(self._luts, self._lut_index, out=self.dmx)
+        return self.dmx
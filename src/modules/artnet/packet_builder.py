@@ -0,0 +1,339 @@
+"""
+Art-Net Packet Builder - preallocated DMX packets and batched UDP sends.
+
+Every universe of an output owns a fixed slot in one contiguous bytearray:
+
+    [ 18-byte ArtDmx header | 510 DMX channels ] × universes
+
+(or a 126-byte E1.31 header for sACN outputs, see sacn.py).  Headers (ID,
+OpCode, protocol version, Port-Address, length) are written once when the
+universe count changes; per frame only the DMX payload and
+the sequence byte are written, through a NumPy view of the same memory —
+no per-universe lists, padding loops or header rebuilds.  Each packet is
+handed to the socket as a memoryview slice of that buffer.
+
+Delta encoding (ArtNetOutput.delta_enabled) works per universe: a packet is
+only sent when one of its channels moved by more than delta_threshold since
+the last *transmitted* value (so slow fades still go out once they add up),
+every full_frame_interval frames, and when the universe has not been sent
+for the keepalive period — nodes drop to their failsafe state otherwise.
+
+UDPBatchSocket sends a whole output (all of its universes) with one
+sendmmsg() call per 1024 packets on Linux (via ctypes), or falls back to a
+sendto() per packet elsewhere.  All outputs share the same socket.
+"""
+
+import ctypes
+import ctypes.util
+import socket
+import struct
+import sys
+from typing import List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+ARTNET_PORT = 6454
+ARTDMX_HEADER_SIZE = 18
+# Usable DMX channels per universe (even, matches the previous stupidArtnet setup)
+CHANNELS_PER_UNIVERSE = 510
+ARTDMX_PACKET_SIZE = ARTDMX_HEADER_SIZE + CHANNELS_PER_UNIVERSE
+
+# ArtSync: ID, OpCode 0x5200 (low byte first), protocol 14, Aux1/Aux2
+ARTSYNC_PACKET = b'Art-Net\x00' + bytes((0x00, 0x52, 0x00, 14, 0x00, 0x00))
+
+# Kernel limit for one sendmmsg() call (UIO_MAXIOV)
+_SENDMMSG_MAX = 1024
+
+
+def artdmx_header(universe: int, length: int = CHANNELS_PER_UNIVERSE, sequence: int = 0) -> bytes:
+    """ArtDmx header for a 15-bit Port-Address *universe* and *length* channels."""
+    return (b'Art-Net\x00'
+            + bytes((0x00, 0x50, 0x00, 14, sequence & 0xFF, 0x00))
+            + struct.pack('<H', universe & 0x7FFF)
+            + struct.pack('>H', length))
+
+
+class PacketLayout:
+    """Header layout of one protocol's DMX packet (Art-Net ArtDmx, sACN E1.31)."""
+
+    __slots__ = ('header_size', 'sequence_offset', 'header', 'skip_zero_sequence')
+
+    def __init__(self, header_size: int, sequence_offset: int, header, skip_zero_sequence: bool):
+        self.header_size = header_size
+        self.sequence_offset = sequence_offset
+        self.header = header                          # universe → header bytes
+        self.skip_zero_sequence = skip_zero_sequence  # Art-Net: 0 disables sequencing
+
+
+ARTDMX_LAYOUT = PacketLayout(ARTDMX_HEADER_SIZE, 12, artdmx_header, skip_zero_sequence=True)
+
+
+class UniversePackets:
+    """Preallocated DMX packets for a run of consecutive universes."""
+
+    def __init__(self, start_universe: int, count: int, layout: PacketLayout = ARTDMX_LAYOUT):
+        self.start_universe = start_universe
+        self.count = count
+        self.layout = layout
+        self.packet_size = layout.header_size + CHANNELS_PER_UNIVERSE
+        self.buffer = bytearray(self.packet_size * count)
+        self._packets = np.frombuffer(self.buffer, dtype=np.uint8).reshape(count, self.packet_size)
+        for i in range(count):
+            self._packets[i, :layout.header_size] = np.frombuffer(
+                layout.header(start_universe + i), dtype=np.uint8)
+        self._payload = self._packets[:, layout.header_size:]
+        mv = memoryview(self.buffer)
+        self.views: List[memoryview] = [
+            mv[i * self.packet_size:(i + 1) * self.packet_size] for i in range(count)
+        ]
+        self.sequence = 0
+
+        # Delta encoding state (allocated on first use)
+        self._last_sent: Optional[np.ndarray] = None
+        self._last_sent_t = np.zeros(count, dtype=np.float64)
+        self._frames = 0
+
+    @staticmethod
+    def universes_for(length: int) -> int:
+        return (length + CHANNELS_PER_UNIVERSE - 1) // CHANNELS_PER_UNIVERSE
+
+    def write(self, dmx_data) -> None:
+        """Copy *dmx_data* (bytes-like) into the payloads, zero-padding the tail."""
+        data = np.frombuffer(dmx_data, dtype=np.uint8)
+        full, rest = divmod(min(len(data), self.count * CHANNELS_PER_UNIVERSE), CHANNELS_PER_UNIVERSE)
+        if full:
+            self._payload[:full] = data[:full * CHANNELS_PER_UNIVERSE].reshape(full, CHANNELS_PER_UNIVERSE)
+        if full < self.count:
+            row = self._payload[full]
+            row[:rest] = data[full * CHANNELS_PER_UNIVERSE:full * CHANNELS_PER_UNIVERSE + rest]
+            row[rest:] = 0
+            self._payload[full + 1:] = 0
+        # Art-Net: 1..255 (0 would tell receivers sequencing is disabled)
+        if self.layout.skip_zero_sequence:
+            self.sequence = self.sequence % 255 + 1
+        else:
+            self.sequence = (self.sequence + 1) & 0xFF
+        self._packets[:, self.layout.sequence_offset] = self.sequence
+
+    def clear(self) -> None:
+        """Zero every payload (blackout) as a new sequence step."""
+        self.write(b'')
+        self._last_sent = None   # next frame goes out in full
+
+    def set_header_byte(self, offset: int, value: int) -> None:
+        """Set one header byte in every packet (e.g. sACN options)."""
+        self._packets[:, offset] = value
+
+    def select_changed(self, threshold: int, full_frame_interval: int, keepalive_s: float,
+                       now: float) -> Optional[np.ndarray]:
+        """
+        Universes to send for the payload just written (delta encoding).
+
+        Returns None when every universe goes out (first frame, periodic full
+        frame), otherwise the indices of changed or keepalive-due universes.
+        Either way the selection is recorded as sent.
+        """
+        self._frames += 1
+        if (self._last_sent is None
+                or (full_frame_interval > 0 and self._frames % full_frame_interval == 0)):
+            self._last_sent = self._payload.copy()
+            self._last_sent_t[:] = now
+            return None
+
+        changed = cv2.absdiff(self._payload, self._last_sent).max(axis=1) > threshold
+        changed |= (now - self._last_sent_t) >= keepalive_s
+        idx = np.flatnonzero(changed)
+        if len(idx) == self.count:
+            self._last_sent[:] = self._payload
+            self._last_sent_t[:] = now
+            return None
+        if len(idx):
+            self._last_sent[idx] = self._payload[idx]
+            self._last_sent_t[idx] = now
+        return idx
+
+
+# ---------------------------------------------------------------------------
+# sendmmsg (Linux) via ctypes
+# ---------------------------------------------------------------------------
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [('iov_base', ctypes.c_void_p), ('iov_len', ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_name', ctypes.c_void_p),
+        ('msg_namelen', ctypes.c_uint32),
+        ('msg_iov', ctypes.POINTER(_IOVec)),
+        ('msg_iovlen', ctypes.c_size_t),
+        ('msg_control', ctypes.c_void_p),
+        ('msg_controllen', ctypes.c_size_t),
+        ('msg_flags', ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [('msg_hdr', _MsgHdr), ('msg_len', ctypes.c_uint)]
+
+
+def _load_sendmmsg():
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or None, use_errno=True)
+        fn = libc.sendmmsg
+    except (OSError, AttributeError):
+        return None
+    fn.argtypes = [ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint, ctypes.c_int]
+    fn.restype = ctypes.c_int
+    return fn
+
+
+_sendmmsg = _load_sendmmsg()
+HAVE_SENDMMSG = _sendmmsg is not None
+
+
+def _addresses(address, count: int) -> List[Tuple[str, int]]:
+    """One (ip, port) per message: *address* is a single tuple or a list."""
+    return [address] * count if isinstance(address, tuple) else list(address)
+
+
+class _MessageBatch:
+    """Prebuilt mmsghdr array pointing at fixed packet buffers."""
+
+    def __init__(self, buffers: Sequence, address):
+        n = len(buffers)
+        self.count = n
+        self._keep = []   # ctypes views must outlive the batch
+        sockaddrs = {}
+        for addr in set(_addresses(address, n)):
+            ip = socket.inet_aton(socket.gethostbyname(addr[0]))
+            sockaddrs[addr] = ctypes.create_string_buffer(
+                struct.pack('=H', socket.AF_INET) + struct.pack('!H', addr[1]) + ip + b'\x00' * 8, 16)
+        self._sockaddrs = sockaddrs
+        self._iov = (_IOVec * n)()
+        self._msgs = (_MMsgHdr * n)()
+        # Scratch array for sending a subset (delta encoding)
+        self._subset = (_MMsgHdr * n)()
+        self._msgs_np = np.frombuffer(self._msgs, dtype=np.uint8).reshape(n, ctypes.sizeof(_MMsgHdr))
+        self._subset_np = np.frombuffer(self._subset, dtype=np.uint8).reshape(n, ctypes.sizeof(_MMsgHdr))
+        for i, (buf, addr) in enumerate(zip(buffers, _addresses(address, n))):
+            if isinstance(buf, bytes):
+                cbuf = ctypes.create_string_buffer(buf, len(buf))
+            else:
+                cbuf = (ctypes.c_char * len(buf)).from_buffer(buf)
+            self._keep.append(cbuf)
+            self._iov[i].iov_base = ctypes.addressof(cbuf)
+            self._iov[i].iov_len = len(buf)
+            hdr = self._msgs[i].msg_hdr
+            hdr.msg_name = ctypes.addressof(sockaddrs[addr])
+            hdr.msg_namelen = 16
+            hdr.msg_iov = ctypes.pointer(self._iov[i])
+            hdr.msg_iovlen = 1
+
+    def send(self, fd: int, indices: Optional[np.ndarray] = None) -> Tuple[int, int]:
+        """
+        Send all messages, or only *indices*; returns (sent, errno).
+
+        Stops at the first error.
+        """
+        if indices is None:
+            count, base = self.count, ctypes.addressof(self._msgs)
+        else:
+            count = len(indices)
+            # Gather the selected headers (they keep pointing at the fixed iovecs)
+            self._subset_np[:count] = self._msgs_np[indices]
+            base = ctypes.addressof(self._subset)
+        sent = 0
+        size = ctypes.sizeof(_MMsgHdr)
+        while sent < count:
+            chunk = min(count - sent, _SENDMMSG_MAX)
+            ptr = ctypes.cast(base + sent * size, ctypes.POINTER(_MMsgHdr))
+            n = _sendmmsg(fd, ptr, chunk, 0)
+            if n <= 0:
+                return sent, ctypes.get_errno()
+            sent += n
+        return sent, 0
+
+
+class UDPBatchSocket:
+    """One UDP socket for every output, with batched sends where supported."""
+
+    def __init__(self, source_address: Optional[Tuple[str, int]] = ('0.0.0.0', ARTNET_PORT),
+                 use_sendmmsg: bool = True):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        if source_address:
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                self.sock.bind(source_address)
+            except OSError as e:
+                # Another Art-Net application owns the port: send from an ephemeral one
+                logger.warning(f"⚠️ Art-Net source bind {source_address} failed ({e}), using ephemeral port")
+        self.use_sendmmsg = use_sendmmsg and HAVE_SENDMMSG
+        self.packets_sent = 0
+        self.syscalls = 0
+        self.send_errors = 0
+
+    @property
+    def method(self) -> str:
+        return 'sendmmsg' if self.use_sendmmsg else 'sendto'
+
+    def batch(self, buffers: Sequence, address) -> Optional[_MessageBatch]:
+        """
+        Prebuilt message batch for *buffers* (None without sendmmsg).
+
+        *address* is one (ip, port) for all buffers or a list with one per buffer.
+        """
+        if not self.use_sendmmsg:
+            return None
+        try:
+            return _MessageBatch(buffers, address)
+        except OSError as e:
+            logger.warning(f"⚠️ Cannot prepare batched send: {e}")
+            return None
+
+    def send(self, buffers: Sequence, address,
+             batch: Optional[_MessageBatch] = None,
+             indices: Optional[np.ndarray] = None) -> int:
+        """
+        Send every buffer (or only *indices*) to *address* (tuple or list, see batch()).
+
+        Uses *batch* — built by batch() for the same buffers — when available.
+        """
+        addresses = _addresses(address, len(buffers))
+        sent = 0
+        if batch is not None:
+            sent, err = batch.send(self.sock.fileno(), indices)
+            self.syscalls += (sent + _SENDMMSG_MAX - 1) // _SENDMMSG_MAX + (1 if err else 0)
+            if not err:
+                self.packets_sent += sent
+                return sent
+            self.send_errors += 1
+            logger.debug(f"sendmmsg failed (errno {err}), falling back to sendto")
+            # The failed packet is dropped, not retried
+            indices = indices[sent + 1:] if indices is not None else range(sent + 1, len(buffers))
+        if indices is None:
+            indices = range(len(buffers))
+        for i in indices:
+            try:
+                self.sock.sendto(buffers[i], addresses[i])
+                sent += 1
+            except OSError as e:
+                self.send_errors += 1
+                logger.debug(f"sendto {addresses[i][0]} failed: {e}")
+        self.syscalls += len(indices)
+        self.packets_sent += sent
+        return sent
+
+    def close(self) -> None:
+        try:
+            self.sock.close()
+        except OSError:
+            pass
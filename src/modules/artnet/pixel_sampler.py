@@ -3,11 +3,27 @@ Pixel Sampler Module
 
 Samples colors from video frames at specific coordinates.
 Handles coordinate normalization and bounds checking.
+
+Objects with a sample_size > 0 are area-sampled: each LED gets the average
+of a square footprint around its position instead of a single pixel, which
+stops downscaled content from aliasing on sparse layouts.  Averages come
+from one summed-area table (integral image) per frame — four gathers per
+LED regardless of footprint size.
 """
 
+import cv2
 import numpy as np
-from typing import List, Tuple
-from .object import ArtNetObject, ArtNetPoint
+from typing import Dict, List, NamedTuple, Tuple, Union
+from .object import ArtNetObject, ArtNetPoint, PointArray
+
+
+class AreaRects(NamedTuple):
+    """Footprints of N LEDs as flat indices into a (H+1, W+1) integral image."""
+    top_left: np.ndarray
+    top_right: np.ndarray
+    bottom_left: np.ndarray
+    bottom_right: np.ndarray
+    area: np.ndarray          # pixels per footprint (int64, >= 1)
 
 
 class PixelSampler:
@@ -23,6 +39,11 @@ class PixelSampler:
         """
         self.canvas_width = canvas_width
         self.canvas_height = canvas_height
+        
+        # Integral images of this tick's frames (composite + sampled layers),
+        # shared by all objects/outputs: id(frame) → (frame, integral).
+        # Emptied by clear_integrals() at the start of every tick.
+        self._integrals: Dict[int, Tuple[np.ndarray, Tuple[np.ndarray, bool]]] = {}
     
     def sample_object(
         self, 
@@ -44,33 +65,118 @@ class PixelSampler:
         
         frame_height, frame_width = frame.shape[:2]
         
-        # Normalize coordinates from canvas space to frame space
-        colors = []
-        for point in obj.points:
-            # Convert canvas coordinates to frame coordinates
-            x = int((point.x / self.canvas_width) * frame_width)
-            y = int((point.y / self.canvas_height) * frame_height)
-            
-            # Clamp to frame bounds
-            x = max(0, min(x, frame_width - 1))
-            y = max(0, min(y, frame_height - 1))
-            
-            # Sample pixel (frame is RGB)
-            color = frame[y, x]
-            colors.append(color)
-        
-        return np.array(colors, dtype=np.uint8)
+        xs, ys = obj.points.xs, obj.points.ys
+        
+        if obj.sample_size > 0:
+            rects = self.footprint_rects(xs, ys, obj.sample_size, self.canvas_width,
+                                         self.canvas_height, frame_width, frame_height)
+            return self.area_average(frame, rects)
+        
+        # Convert canvas coordinates to frame coordinates, clamp to frame bounds
+        xs = np.clip((xs / self.canvas_width * frame_width).astype(np.int64), 0, frame_width - 1)
+        ys = np.clip((ys / self.canvas_height * frame_height).astype(np.int64), 0, frame_height - 1)
+        
+        # Sample pixels (frame is RGB)
+        return frame[ys, xs].astype(np.uint8, copy=False)
+    
+    # ── area sampling ────────────────────────────────────────────────────────
+    
+    @staticmethod
+    def footprint_rects(
+        xs: np.ndarray,
+        ys: np.ndarray,
+        sizes,
+        canvas_width: int,
+        canvas_height: int,
+        frame_width: int,
+        frame_height: int
+    ) -> AreaRects:
+        """
+        Integral-image corners of each LED's footprint.
+        
+        The footprint is centred on the pixel point sampling would read, with
+        a half-size of round(size / 2) frame pixels, clipped to the frame — a
+        footprint below one frame pixel is exactly the point sample.
+        
+        Args:
+            xs, ys: LED coordinates in canvas space
+            sizes: Footprint edge in canvas pixels (scalar or per LED)
+            canvas_width, canvas_height: Canvas size (coordinate space)
+            frame_width, frame_height: Size of the sampled frame
+        
+        Returns:
+            AreaRects for PixelSampler.area_average
+        """
+        sizes = np.asarray(sizes, dtype=np.float64)
+        cx = np.clip((xs / canvas_width * frame_width).astype(np.int64), 0, frame_width - 1)
+        cy = np.clip((ys / canvas_height * frame_height).astype(np.int64), 0, frame_height - 1)
+        rx = np.floor(sizes / 2 * (frame_width / canvas_width) + 0.5).astype(np.int64)
+        ry = np.floor(sizes / 2 * (frame_height / canvas_height) + 0.5).astype(np.int64)
+        x0 = np.maximum(cx - rx, 0)
+        x1 = np.minimum(cx + rx + 1, frame_width)
+        y0 = np.maximum(cy - ry, 0)
+        y1 = np.minimum(cy + ry + 1, frame_height)
+        stride = frame_width + 1
+        return AreaRects(
+            top_left=y0 * stride + x0,
+            top_right=y0 * stride + x1,
+            bottom_left=y1 * stride + x0,
+            bottom_right=y1 * stride + x1,
+            area=(x1 - x0) * (y1 - y0),
+        )
+    
+    def integral_image(self, frame: np.ndarray) -> Tuple[np.ndarray, bool]:
+        """
+        Summed-area table of *frame* as ((H+1)*(W+1), 3), cached per frame object
+        until clear_integrals() (the composite and each layer frame of a tick
+        are integrated once).
+        
+        A channel-reversed view (the BGR → RGB view from RoutingBridge) is
+        integrated on its contiguous base; the returned flag tells the caller
+        to reverse the channels of the result.
+        """
+        cached = self._integrals.get(id(frame))
+        if cached is not None and cached[0] is frame:
+            return cached[1]
+        
+        src, reversed_channels = frame, False
+        if frame.ndim == 3 and frame.strides[2] < 0:
+            src, reversed_channels = frame[:, :, ::-1], True
+        if src.strides[1:] != (src.shape[2] * src.itemsize, src.itemsize):
+            src = np.ascontiguousarray(src)   # cv2 needs contiguous pixels within a row
+        # int32 holds sums up to 8.4 Mpx of 8-bit data; beyond that use float64
+        depth = cv2.CV_32S if src.shape[0] * src.shape[1] * 255 < 2 ** 31 else cv2.CV_64F
+        integral = cv2.integral(src, sdepth=depth)
+        
+        result = (integral.reshape(-1, integral.shape[2]), reversed_channels)
+        self._integrals[id(frame)] = (frame, result)
+        return result
+    
+    def clear_integrals(self):
+        """Drop the integral images of the previous tick."""
+        self._integrals.clear()
+    
+    def area_average(self, frame: np.ndarray, rects: AreaRects) -> np.ndarray:
+        """
+        Mean colour of every footprint in *rects* (rounded), as (N, 3) uint8.
+        """
+        integral, reversed_channels = self.integral_image(frame)
+        tl, tr, bl, br = (integral[idx].astype(np.int64) for idx in rects[:4])
+        total = br - tr - bl + tl
+        area = rects.area[:, None]
+        colors = ((total + area // 2) // area).astype(np.uint8)
+        return colors[:, ::-1] if reversed_channels else colors
     
     def sample_points(
         self, 
-        points: List[ArtNetPoint], 
+        points: Union[PointArray, List[ArtNetPoint]], 
         frame: np.ndarray
     ) -> np.ndarray:
         """
         Sample pixel colors for a list of points.
         
         Args:
-            points: List of ArtNetPoint coordinates
+            points: PointArray or list of ArtNetPoint coordinates
             frame: Video frame as numpy array (H, W, 3) RGB uint8
         
         Returns:
@@ -81,9 +187,8 @@ class PixelSampler:
         
         frame_height, frame_width = frame.shape[:2]
         
-        # Vectorized coordinate conversion
-        xs = np.array([p.x for p in points])
-        ys = np.array([p.y for p in points])
+        points = PointArray.coerce(points)
+        xs, ys = points.xs, points.ys
         
         # Normalize and convert to frame coordinates
         xs = ((xs / self.canvas_width) * frame_width).astype(int)
@@ -3,149 +3,115 @@ Point Generation Engine
 
 Converts editor shape parameters to LED coordinates.
 Python port of frontend/js/editor.js shape generation logic.
+
+Every shape is generated as whole NumPy arrays (no per-LED Python loop) and
+returned as a PointArray, so 100k-LED mappings build in milliseconds.
 """
 
 import math
-from typing import List, Tuple
-from .object import ArtNetPoint
+
+import numpy as np
+
+from .object import PointArray
 
 
 class PointGenerator:
     """Generate LED coordinates from shape parameters"""
-    
+
     @staticmethod
-    def generate_points(shape: dict) -> List[ArtNetPoint]:
+    def generate_points(shape: dict) -> PointArray:
         """
         Generate LED points from editor shape parameters
-        
+
         Args:
             shape: Dictionary from editor.shapes[] (session state)
-        
+
         Returns:
-            List of ArtNetPoint with calculated coordinates
+            PointArray with calculated coordinates (ids 1..N)
         """
         shape_type = shape['type']
-        
+
         if shape_type == 'matrix':
-            return PointGenerator._generate_matrix(shape)
+            local = PointGenerator._generate_matrix(shape)
         elif shape_type == 'circle':
-            return PointGenerator._generate_circle(shape)
+            local = PointGenerator._generate_circle(shape)
         elif shape_type == 'line':
-            return PointGenerator._generate_line(shape)
+            local = PointGenerator._generate_line(shape)
         elif shape_type == 'star':
-            return PointGenerator._generate_star(shape)
+            local = PointGenerator._generate_star(shape)
         elif shape_type == 'rect':
-            return PointGenerator._generate_rect(shape)
+            local = PointGenerator._generate_rect(shape)
         elif shape_type == 'triangle':
-            return PointGenerator._generate_triangle(shape)
+            local = PointGenerator._generate_triangle(shape)
         elif shape_type == 'polygon':
-            return PointGenerator._generate_polygon(shape)
+            local = PointGenerator._generate_polygon(shape)
         elif shape_type == 'arc':
-            return PointGenerator._generate_arc(shape)
+            local = PointGenerator._generate_arc(shape)
         else:
             raise ValueError(f"Unknown shape type: {shape_type}")
-    
+
+        return PointGenerator._to_world(shape, local)
+
     @staticmethod
-    def _generate_matrix(shape: dict) -> List[ArtNetPoint]:
+    def _to_world(shape: dict, local: np.ndarray) -> PointArray:
+        """Rotate (N, 2) local coordinates about the shape centre and translate to canvas."""
+        x, y = local[:, 0], local[:, 1]
+        rotation = math.radians(shape.get('rotation', 0))
+        if rotation != 0:
+            cos_r = math.cos(rotation)
+            sin_r = math.sin(rotation)
+            x, y = x * cos_r - y * sin_r, x * sin_r + y * cos_r
+        return PointArray(shape.get('x', 0) + x, shape.get('y', 0) + y)
+
+    @staticmethod
+    def matrix_order(rows: int, cols: int, pattern: str) -> np.ndarray:
+        """
+        Wiring order of a rows × cols grid as flat row-major indices.
+
+        Args:
+            rows, cols: Grid size
+            pattern: zigzag-left, zigzag-right, zigzag-top, zigzag-bottom
+                     (anything else = raster, left to right, top to bottom)
+
+        Returns:
+            int64 array of length rows * cols
+        """
+        grid = np.arange(rows * cols, dtype=np.int64).reshape(rows, cols)
+        if pattern == 'zigzag-left':
+            # Row by row, odd rows right to left
+            grid[1::2] = grid[1::2, ::-1]
+        elif pattern == 'zigzag-right':
+            # Row by row, even rows right to left
+            grid[0::2] = grid[0::2, ::-1]
+        elif pattern == 'zigzag-top':
+            # Column by column, odd columns bottom to top
+            grid = grid.T.copy()
+            grid[1::2] = grid[1::2, ::-1]
+        elif pattern == 'zigzag-bottom':
+            # Column by column, even columns bottom to top
+            grid = grid.T.copy()
+            grid[0::2] = grid[0::2, ::-1]
+        return grid.ravel()
+
+    @staticmethod
+    def _generate_matrix(shape: dict) -> np.ndarray:
         """Generate LED points for matrix (grid) shape"""
         rows = max(1, shape.get('rows', 4))
         cols = max(1, shape.get('cols', 4))
         pattern = shape.get('pattern', 'zigzag-left')
         size = shape.get('size', 100)
         half = size / 2
-        
-        # Generate all points in a 2D array
-        temp_pts = []
-        for r in range(rows):
-            row_pts = []
-            ty = 0.5 if rows == 1 else (r / (rows - 1))
-            y = -half + ty * size
-            
-            for c in range(cols):
-                tx = 0.5 if cols == 1 else (c / (cols - 1))
-                x = -half + tx * size
-                row_pts.append([x, y])
-            
-            temp_pts.append(row_pts)
-        
-        # Apply the selected pattern
-        pts = []
-        if pattern == 'zigzag-left':
-            # Zigzag starting from left: row by row, alternating direction
-            for r in range(rows):
-                if r % 2 == 0:
-                    # Even rows: left to right
-                    pts.extend(temp_pts[r])
-                else:
-                    # Odd rows: right to left
-                    pts.extend(reversed(temp_pts[r]))
-        
-        elif pattern == 'zigzag-right':
-            # Zigzag starting from right: row by row, alternating direction
-            for r in range(rows):
-                if r % 2 == 0:
-                    # Even rows: right to left
-                    pts.extend(reversed(temp_pts[r]))
-                else:
-                    # Odd rows: left to right
-                    pts.extend(temp_pts[r])
-        
-        elif pattern == 'zigzag-top':
-            # Zigzag starting from top: column by column, alternating direction
-            for c in range(cols):
-                if c % 2 == 0:
-                    # Even columns: top to bottom
-                    for r in range(rows):
-                        pts.append(temp_pts[r][c])
-                else:
-                    # Odd columns: bottom to top
-                    for r in range(rows - 1, -1, -1):
-                        pts.append(temp_pts[r][c])
-        
-        elif pattern == 'zigzag-bottom':
-            # Zigzag starting from bottom: column by column, alternating direction
-            for c in range(cols):
-                if c % 2 == 0:
-                    # Even columns: bottom to top
-                    for r in range(rows - 1, -1, -1):
-                        pts.append(temp_pts[r][c])
-                else:
-                    # Odd columns: top to bottom
-                    for r in range(rows):
-                        pts.append(temp_pts[r][c])
-        
-        else:
-            # Default: raster pattern (left to right, top to bottom)
-            for r in range(rows):
-                pts.extend(temp_pts[r])
-        
-        # Convert to ArtNetPoint with world coordinates
-        points = []
-        x_center = shape.get('x', 0)
-        y_center = shape.get('y', 0)
-        rotation = math.radians(shape.get('rotation', 0))
-        
-        for i, (local_x, local_y) in enumerate(pts):
-            # Apply rotation
-            if rotation != 0:
-                cos_r = math.cos(rotation)
-                sin_r = math.sin(rotation)
-                rotated_x = local_x * cos_r - local_y * sin_r
-                rotated_y = local_x * sin_r + local_y * cos_r
-            else:
-                rotated_x = local_x
-                rotated_y = local_y
-            
-            # Translate to world coordinates
-            world_x = x_center + rotated_x
-            world_y = y_center + rotated_y
-            
-            points.append(ArtNetPoint(id=i + 1, x=world_x, y=world_y))
-        
-        return points
-    
+
+        ty = np.full(1, 0.5) if rows == 1 else np.arange(rows) / (rows - 1)
+        tx = np.full(1, 0.5) if cols == 1 else np.arange(cols) / (cols - 1)
+        xs = np.broadcast_to(-half + tx * size, (rows, cols)).ravel()
+        ys = np.broadcast_to((-half + ty * size)[:, None], (rows, cols)).ravel()
+
+        order = PointGenerator.matrix_order(rows, cols, pattern)
+        return np.column_stack((xs[order], ys[order]))
+
     @staticmethod
-    def _generate_circle(shape: dict) -> List[ArtNetPoint]:
+    def _generate_circle(shape: dict) -> np.ndarray:
         """Generate LED points for circle shape with perimeter-based distribution"""
         count = max(1, shape.get('pointCount', 60))
         size = shape.get('size', 100)
@@ -153,384 +119,151 @@ class PointGenerator:
         ry = size / 2
         scale_x = shape.get('scaleX', 1)
         scale_y = shape.get('scaleY', 1)
-        
+
         # Sample the circle with high resolution for accurate perimeter calculation
         sample_n = max(128, count * 6)
-        samples = []
-        for i in range(sample_n + 1):
-            a = (i / sample_n) * math.pi * 2
-            samples.append([math.cos(a) * rx, math.sin(a) * ry])
-        
-        # Calculate cumulative perimeter lengths
-        cum = [0]
-        for i in range(1, len(samples)):
-            dx = (samples[i][0] - samples[i-1][0]) * scale_x
-            dy = (samples[i][1] - samples[i-1][1]) * scale_y
-            length = math.hypot(dx, dy)
-            cum.append(cum[-1] + length)
-        
+        a = (np.arange(sample_n + 1) / sample_n) * math.pi * 2
+        samples = np.column_stack((np.cos(a) * rx, np.sin(a) * ry))
+
+        # Cumulative perimeter lengths
+        seg = np.hypot(np.diff(samples[:, 0]) * scale_x, np.diff(samples[:, 1]) * scale_y)
+        cum = np.concatenate(([0.0], np.cumsum(seg)))
         total = cum[-1]
         if total == 0:
-            # Degenerate case: return first point multiple times
-            x_center = shape.get('x', 0)
-            y_center = shape.get('y', 0)
-            return [ArtNetPoint(id=i + 1, x=x_center, y=y_center) for i in range(count)]
-        
+            # Degenerate case: every LED at the centre
+            return np.zeros((count, 2))
+
         # Distribute points evenly along perimeter
-        pts = []
-        for i in range(count):
-            target = (i / count) * total
-            
-            # Find segment
-            idx = 0
-            while idx < len(cum) - 1 and cum[idx + 1] < target:
-                idx += 1
-            
-            # Interpolate within segment
-            seg_len = cum[idx + 1] - cum[idx]
-            t = 0 if seg_len == 0 else ((target - cum[idx]) / seg_len)
-            
-            a = samples[idx]
-            b = samples[idx + 1] if idx + 1 < len(samples) else samples[idx]
-            
-            local_x = a[0] + t * (b[0] - a[0])
-            local_y = a[1] + t * (b[1] - a[1])
-            
-            pts.append([local_x, local_y])
-        
-        # Convert to ArtNetPoint with world coordinates
-        points = []
-        x_center = shape.get('x', 0)
-        y_center = shape.get('y', 0)
-        rotation = math.radians(shape.get('rotation', 0))
-        
-        for i, (local_x, local_y) in enumerate(pts):
-            # Apply rotation
-            if rotation != 0:
-                cos_r = math.cos(rotation)
-                sin_r = math.sin(rotation)
-                rotated_x = local_x * cos_r - local_y * sin_r
-                rotated_y = local_x * sin_r + local_y * cos_r
-            else:
-                rotated_x = local_x
-                rotated_y = local_y
-            
-            # Translate to world coordinates
-            world_x = x_center + rotated_x
-            world_y = y_center + rotated_y
-            
-            points.append(ArtNetPoint(id=i + 1, x=world_x, y=world_y))
-        
-        return points
-    
+        return PointGenerator._interpolate_polyline(samples, cum, (np.arange(count) / count) * total)
+
     @staticmethod
-    def _generate_line(shape: dict) -> List[ArtNetPoint]:
+    def _generate_line(shape: dict) -> np.ndarray:
         """Generate LED points for line shape"""
         count = max(2, shape.get('pointCount', 50))
         size = shape.get('size', 100)
-        x_center = shape.get('x', 0)
-        y_center = shape.get('y', 0)
-        rotation = math.radians(shape.get('rotation', 0))
-        
+
         # Simple line from -size/2 to +size/2
-        points = []
-        for i in range(count):
-            t = i / (count - 1) if count > 1 else 0
-            local_x = -size / 2 + t * size
-            local_y = 0
-            
-            # Apply rotation
-            if rotation != 0:
-                cos_r = math.cos(rotation)
-                sin_r = math.sin(rotation)
-                rotated_x = local_x * cos_r - local_y * sin_r
-                rotated_y = local_x * sin_r + local_y * cos_r
-            else:
-                rotated_x = local_x
-                rotated_y = local_y
-            
-            # Translate to world coordinates
-            world_x = x_center + rotated_x
-            world_y = y_center + rotated_y
-            
-            points.append(ArtNetPoint(id=i + 1, x=world_x, y=world_y))
-        
-        return points
-    
+        t = np.arange(count) / (count - 1)
+        return np.column_stack((-size / 2 + t * size, np.zeros(count)))
+
     @staticmethod
-    def _generate_star(shape: dict) -> List[ArtNetPoint]:
+    def _generate_star(shape: dict) -> np.ndarray:
         """Generate LED points for star shape"""
         count = max(1, shape.get('pointCount', 50))
         spikes = max(2, shape.get('spikes', 5))
         size = shape.get('size', 100)
         outer = size / 2
         inner = outer * shape.get('innerRatio', 0.5)
-        
-        # Generate star vertices
-        verts = []
-        rot = -math.pi / 2  # Start at top
-        step = math.pi / spikes
-        
-        for i in range(spikes):
-            # Outer point
-            verts.append([math.cos(rot) * outer, math.sin(rot) * outer])
-            rot += step
-            # Inner point
-            verts.append([math.cos(rot) * inner, math.sin(rot) * inner])
-            rot += step
-        
-        # Create edges
-        edges = []
-        for i in range(len(verts)):
-            edges.append([verts[i], verts[(i + 1) % len(verts)]])
-        
-        # Distribute points along edges
-        pts = PointGenerator._distribute_along_edges(shape, edges, count)
-        
-        # Convert to ArtNetPoint
-        points = []
-        x_center = shape.get('x', 0)
-        y_center = shape.get('y', 0)
-        rotation = math.radians(shape.get('rotation', 0))
-        
-        for i, (local_x, local_y) in enumerate(pts):
-            # Apply rotation
-            if rotation != 0:
-                cos_r = math.cos(rotation)
-                sin_r = math.sin(rotation)
-                rotated_x = local_x * cos_r - local_y * sin_r
-                rotated_y = local_x * sin_r + local_y * cos_r
-            else:
-                rotated_x = local_x
-                rotated_y = local_y
-            
-            # Translate to world coordinates
-            world_x = x_center + rotated_x
-            world_y = y_center + rotated_y
-            
-            points.append(ArtNetPoint(id=i + 1, x=world_x, y=world_y))
-        
-        return points
-    
+
+        # Alternating outer/inner vertices, starting at the top
+        angles = -math.pi / 2 + np.arange(2 * spikes) * (math.pi / spikes)
+        radius = np.where(np.arange(2 * spikes) % 2 == 0, outer, inner)
+        verts = np.column_stack((np.cos(angles) * radius, np.sin(angles) * radius))
+
+        return PointGenerator._distribute_along_edges(shape, PointGenerator._closed(verts), count)
+
     @staticmethod
-    def _generate_rect(shape: dict) -> List[ArtNetPoint]:
+    def _generate_rect(shape: dict) -> np.ndarray:
         """Generate LED points for rectangle shape"""
         count = max(1, shape.get('pointCount', 40))
         size = shape.get('size', 100)
         half = size / 2
-        
-        # Rectangle vertices
-        verts = [[-half, -half], [half, -half], [half, half], [-half, half]]
-        edges = [[verts[0], verts[1]], [verts[1], verts[2]], [verts[2], verts[3]], [verts[3], verts[0]]]
-        
-        # Distribute points along edges
-        pts = PointGenerator._distribute_along_edges(shape, edges, count)
-        
-        # Convert to ArtNetPoint
-        points = []
-        x_center = shape.get('x', 0)
-        y_center = shape.get('y', 0)
-        rotation = math.radians(shape.get('rotation', 0))
-        
-        for i, (local_x, local_y) in enumerate(pts):
-            # Apply rotation
-            if rotation != 0:
-                cos_r = math.cos(rotation)
-                sin_r = math.sin(rotation)
-                rotated_x = local_x * cos_r - local_y * sin_r
-                rotated_y = local_x * sin_r + local_y * cos_r
-            else:
-                rotated_x = local_x
-                rotated_y = local_y
-            
-            # Translate to world coordinates
-            world_x = x_center + rotated_x
-            world_y = y_center + rotated_y
-            
-            points.append(ArtNetPoint(id=i + 1, x=world_x, y=world_y))
-        
-        return points
-    
+
+        verts = np.array([[-half, -half], [half, -half], [half, half], [-half, half]], dtype=np.float64)
+        return PointGenerator._distribute_along_edges(shape, PointGenerator._closed(verts), count)
+
     @staticmethod
-    def _generate_triangle(shape: dict) -> List[ArtNetPoint]:
+    def _generate_triangle(shape: dict) -> np.ndarray:
         """Generate LED points for triangle shape"""
         count = max(1, shape.get('pointCount', 30))
         size = shape.get('size', 100)
         half = size / 2
-        
-        # Triangle vertices
-        verts = [[-half, half], [half, half], [0, -half]]
-        edges = [[verts[0], verts[1]], [verts[1], verts[2]], [verts[2], verts[0]]]
-        
-        # Distribute points along edges
-        pts = PointGenerator._distribute_along_edges(shape, edges, count)
-        
-        # Convert to ArtNetPoint
-        points = []
-        x_center = shape.get('x', 0)
-        y_center = shape.get('y', 0)
-        rotation = math.radians(shape.get('rotation', 0))
-        
-        for i, (local_x, local_y) in enumerate(pts):
-            # Apply rotation
-            if rotation != 0:
-                cos_r = math.cos(rotation)
-                sin_r = math.sin(rotation)
-                rotated_x = local_x * cos_r - local_y * sin_r
-                rotated_y = local_x * sin_r + local_y * cos_r
-            else:
-                rotated_x = local_x
-                rotated_y = local_y
-            
-            # Translate to world coordinates
-            world_x = x_center + rotated_x
-            world_y = y_center + rotated_y
-            
-            points.append(ArtNetPoint(id=i + 1, x=world_x, y=world_y))
-        
-        return points
-    
+
+        verts = np.array([[-half, half], [half, half], [0, -half]], dtype=np.float64)
+        return PointGenerator._distribute_along_edges(shape, PointGenerator._closed(verts), count)
+
     @staticmethod
-    def _generate_polygon(shape: dict) -> List[ArtNetPoint]:
+    def _generate_polygon(shape: dict) -> np.ndarray:
         """Generate LED points for polygon shape"""
         count = max(1, shape.get('pointCount', 40))
         sides = max(3, shape.get('sides', 6))
         size = shape.get('size', 100)
         radius = size / 2
-        
-        # Generate polygon vertices
-        verts = []
-        angle_step = (math.pi * 2) / sides
-        rot = -math.pi / 2  # Start at top
-        
-        for i in range(sides):
-            verts.append([math.cos(rot) * radius, math.sin(rot) * radius])
-            rot += angle_step
-        
-        # Create edges
-        edges = []
-        for i in range(len(verts)):
-            edges.append([verts[i], verts[(i + 1) % len(verts)]])
-        
-        # Distribute points along edges
-        pts = PointGenerator._distribute_along_edges(shape, edges, count)
-        
-        # Convert to ArtNetPoint
-        points = []
-        x_center = shape.get('x', 0)
-        y_center = shape.get('y', 0)
-        rotation = math.radians(shape.get('rotation', 0))
-        
-        for i, (local_x, local_y) in enumerate(pts):
-            # Apply rotation
-            if rotation != 0:
-                cos_r = math.cos(rotation)
-                sin_r = math.sin(rotation)
-                rotated_x = local_x * cos_r - local_y * sin_r
-                rotated_y = local_x * sin_r + local_y * cos_r
-            else:
-                rotated_x = local_x
-                rotated_y = local_y
-            
-            # Translate to world coordinates
-            world_x = x_center + rotated_x
-            world_y = y_center + rotated_y
-            
-            points.append(ArtNetPoint(id=i + 1, x=world_x, y=world_y))
-        
-        return points
-    
+
+        # Regular polygon vertices, starting at the top
+        angles = -math.pi / 2 + np.arange(sides) * ((math.pi * 2) / sides)
+        verts = np.column_stack((np.cos(angles) * radius, np.sin(angles) * radius))
+
+        return PointGenerator._distribute_along_edges(shape, PointGenerator._closed(verts), count)
+
     @staticmethod
-    def _generate_arc(shape: dict) -> List[ArtNetPoint]:
+    def _generate_arc(shape: dict) -> np.ndarray:
         """
         Generate LED points for arc shape (Bezier curves)
-        
+
         Note: This is a simplified implementation. Full implementation would
         require handling control points from the shape data.
         """
         count = max(2, shape.get('pointCount', 50))
         size = shape.get('size', 100)
-        
+
         # For now, generate a simple arc (quarter circle)
         # TODO: Implement full Bezier curve support with control points
-        points = []
-        x_center = shape.get('x', 0)
-        y_center = shape.get('y', 0)
-        rotation = math.radians(shape.get('rotation', 0))
-        
-        for i in range(count):
-            t = i / (count - 1) if count > 1 else 0
-            angle = t * (math.pi / 2)  # Quarter circle
-            
-            local_x = math.cos(angle) * size / 2
-            local_y = math.sin(angle) * size / 2
-            
-            # Apply rotation
-            if rotation != 0:
-                cos_r = math.cos(rotation)
-                sin_r = math.sin(rotation)
-                rotated_x = local_x * cos_r - local_y * sin_r
-                rotated_y = local_x * sin_r + local_y * cos_r
-            else:
-                rotated_x = local_x
-                rotated_y = local_y
-            
-            # Translate to world coordinates
-            world_x = x_center + rotated_x
-            world_y = y_center + rotated_y
-            
-            points.append(ArtNetPoint(id=i + 1, x=world_x, y=world_y))
-        
-        return points
-    
+        angle = (np.arange(count) / (count - 1)) * (math.pi / 2)
+        return np.column_stack((np.cos(angle) * size / 2, np.sin(angle) * size / 2))
+
+    @staticmethod
+    def _closed(verts: np.ndarray) -> np.ndarray:
+        """Polyline through *verts* back to the first vertex."""
+        return np.vstack((verts, verts[:1]))
+
+    @staticmethod
+    def _interpolate_polyline(polyline: np.ndarray, cum: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        """
+        Points at arc lengths *targets* along *polyline*.
+
+        Args:
+            polyline: (M, 2) vertices
+            cum: (M,) cumulative (scaled) length at each vertex
+            targets: Arc lengths to place points at
+
+        Returns:
+            (len(targets), 2) coordinates
+        """
+        # Segment: first one whose end reaches the target
+        idx = np.clip(np.searchsorted(cum[1:], targets, side='left'), 0, len(cum) - 2)
+        seg_len = cum[idx + 1] - cum[idx]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = np.where(seg_len == 0, 0.0, (targets - cum[idx]) / seg_len)
+        t = np.clip(t, 0.0, 1.0)[:, None]
+        a = polyline[idx]
+        b = polyline[idx + 1]
+        return a + t * (b - a)
+
     @staticmethod
-    def _distribute_along_edges(shape: dict, edges: List[Tuple], count: int) -> List[List[float]]:
+    def _distribute_along_edges(shape: dict, polyline: np.ndarray, count: int) -> np.ndarray:
         """
-        Distribute points evenly along a series of edges
-        
+        Distribute points evenly along a closed polyline
+
         Args:
             shape: Shape dictionary (for scale information)
-            edges: List of edge pairs [[x1,y1], [x2,y2]]
+            polyline: (M, 2) vertices, last equal to first
             count: Number of points to distribute
-        
+
         Returns:
-            List of [x, y] coordinate pairs
+            (count, 2) coordinates
         """
         scale_x = shape.get('scaleX', 1)
         scale_y = shape.get('scaleY', 1)
-        
-        # Calculate edge lengths
-        lengths = []
-        for a, b in edges:
-            dx = (b[0] - a[0]) * scale_x
-            dy = (b[1] - a[1]) * scale_y
-            lengths.append(math.hypot(dx, dy))
-        
-        perimeter = sum(lengths)
-        
+
+        # Edge lengths in scaled space
+        d = np.diff(polyline, axis=0)
+        lengths = np.hypot(d[:, 0] * scale_x, d[:, 1] * scale_y)
+        perimeter = lengths.sum()
+
         if perimeter == 0:
-            # Degenerate case: return first point multiple times
-            return [edges[0][0][:] for _ in range(count)]
-        
-        step = perimeter / count
-        points = []
-        dist = 0
-        
-        for i in range(count):
-            remaining = dist
-            
-            for ei, (a, b) in enumerate(edges):
-                length = lengths[ei]
-                
-                if remaining <= length:
-                    t = 0 if length == 0 else (remaining / length)
-                    x = a[0] + t * (b[0] - a[0])
-                    y = a[1] + t * (b[1] - a[1])
-                    points.append([x, y])
-                    break
-                
-                remaining -= length
-            
-            dist += step
-        
-        return points
+            # Degenerate case: every LED on the first vertex
+            return np.repeat(polyline[:1], count, axis=0)
+
+        cum = np.concatenate(([0.0], np.cumsum(lengths)))
+        return PointGenerator._interpolate_polyline(polyline, cum, np.arange(count) * (perimeter / count))
@@ -0,0 +1,250 @@
+"""
+ArtNet Receiver Module
+
+DMX input from lighting consoles over Art-Net (ArtDmx) and sACN (E1.31
+data packets).  One thread (DMXInput) waits on non-blocking sockets,
+drains every datagram that is ready and keeps only the latest data per
+universe; out-of-order packets (sequence numbers) are dropped.  Consumers
+pick up the universes that changed since their last call with
+take_changes(), once per render frame — together with the time the first
+unconsumed change arrived, for input-to-output latency metrics.
+
+Universes are keyed by protocol: ('artnet', port-address 0-32767) and
+('sacn', universe 1-63999).  sACN universes are received by unicast and
+by joining their multicast groups (join_sacn()).
+"""
+
+import selectors
+import socket
+import struct
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from .packet_builder import ARTNET_PORT
+from . import sacn
+from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+UNIVERSE_SLOTS = 512
+
+_ARTNET_ID = b'Art-Net\x00'
+_OP_DMX = 0x5000
+_ACN_PREAMBLE = b'\x00\x10\x00\x00ASC-E1.17\x00\x00\x00'
+_E131_DATA_START = sacn.E131_HEADER_SIZE      # first DMX slot after the start code
+_OPTION_PREVIEW = 0x80
+_RECV_SIZE = 1024
+
+UniverseKey = Tuple[str, int]
+
+
+def parse_artdmx(packet: bytes) -> Optional[Tuple[int, int, bytes]]:
+    """ArtDmx packet → (port-address, sequence, DMX data); None for anything else."""
+    if len(packet) < 18 or packet[:8] != _ARTNET_ID:
+        return None
+    if int.from_bytes(packet[8:10], 'little') != _OP_DMX:
+        return None
+    universe = ((packet[15] & 0x7F) << 8) | packet[14]
+    length = min(int.from_bytes(packet[16:18], 'big'), UNIVERSE_SLOTS, len(packet) - 18)
+    return universe, packet[12], packet[18:18 + length]
+
+
+def parse_e131(packet: bytes) -> Optional[Tuple[int, int, bytes]]:
+    """E1.31 data packet → (universe, sequence, DMX data); None for sync,
+    discovery, preview, stream-terminated or non-zero start code packets."""
+    if len(packet) < _E131_DATA_START or packet[:16] != _ACN_PREAMBLE:
+        return None
+    root_vector, framing_vector = struct.unpack_from('>I', packet, 18)[0], struct.unpack_from('>I', packet, 40)[0]
+    if root_vector != 0x00000004 or framing_vector != 0x00000002:
+        return None
+    options = packet[sacn.E131_OPTIONS_OFFSET]
+    if options & (_OPTION_PREVIEW | sacn.OPTION_STREAM_TERMINATED) or packet[125] != 0x00:
+        return None
+    universe = int.from_bytes(packet[113:115], 'big')
+    slots = min(int.from_bytes(packet[123:125], 'big') - 1, UNIVERSE_SLOTS, len(packet) - _E131_DATA_START)
+    return universe, packet[sacn.E131_SEQUENCE_OFFSET], packet[_E131_DATA_START:_E131_DATA_START + max(0, slots)]
+
+
+def _in_order(last: Optional[int], sequence: int, protocol: str) -> bool:
+    """E1.31 6.7.2: drop packets 1-20 behind the last one (Art-Net: 0 = sequencing off)."""
+    if last is None or (protocol == 'artnet' and sequence == 0):
+        return True
+    diff = (sequence - last) & 0xFF
+    if diff >= 0x80:
+        diff -= 0x100
+    return not -20 < diff <= 0
+
+
+class DMXReceiver:
+    """Latest DMX data per universe from Art-Net and sACN, received on the DMXInput thread."""
+
+    def __init__(self, bind_ip: str = '0.0.0.0', artnet_port: Optional[int] = ARTNET_PORT,
+                 sacn_port: Optional[int] = sacn.SACN_PORT):
+        """
+        Initialize receiver
+
+        Args:
+            bind_ip: Local address to listen on (the RoutingBridge sends from
+                     an ephemeral port while Art-Net input is received)
+            artnet_port: Art-Net UDP port (None = no Art-Net input)
+            sacn_port: sACN UDP port (None = no sACN input)
+        """
+        self.bind_ip = bind_ip
+        self.artnet_port = artnet_port
+        self.sacn_port = sacn_port
+        self._sockets: Dict[str, socket.socket] = {}
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._lock = threading.Lock()
+
+        self._data: Dict[UniverseKey, bytearray] = {}
+        self._sequence: Dict[UniverseKey, int] = {}
+        self._changed: Dict[UniverseKey, float] = {}     # universe → first unconsumed change (perf_counter)
+        self._groups: set = set()
+        self.packets_received = 0
+        self.packets_ignored = 0
+        self.packets_out_of_order = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def ports(self) -> Dict[str, int]:
+        """Bound port per protocol (useful with port 0)."""
+        return {protocol: sock.getsockname()[1] for protocol, sock in self._sockets.items()}
+
+    def start(self) -> bool:
+        """Open the sockets and start the DMXInput thread (False if none could be bound)."""
+        if self._running:
+            return True
+        self._selector = selectors.DefaultSelector()
+        for protocol, port in (('artnet', self.artnet_port), ('sacn', self.sacn_port)):
+            if port is None:
+                continue
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                sock.bind((self.bind_ip, port))
+            except OSError as e:
+                logger.error(f"❌ DMX input: cannot listen on {self.bind_ip}:{port} ({protocol}): {e}")
+                sock.close()
+                continue
+            sock.setblocking(False)
+            self._sockets[protocol] = sock
+            self._selector.register(sock, selectors.EVENT_READ, protocol)
+        if not self._sockets:
+            self._selector.close()
+            self._selector = None
+            return False
+        for universe in list(self._groups):
+            self._join(universe)
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name='DMXInput', daemon=True)
+        self._thread.start()
+        logger.info(f"🎛️ DMX input listening on {self.bind_ip} ({', '.join(f'{p}:{n}' for p, n in self.ports.items())})")
+        return True
+
+    def stop(self) -> None:
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        for sock in self._sockets.values():
+            sock.close()
+        self._sockets = {}
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+
+    def join_sacn(self, universes: Iterable[int]) -> None:
+        """Receive these sACN universes by multicast as well."""
+        for universe in universes:
+            universe = sacn.clamp_universe(universe)
+            if universe not in self._groups:
+                self._groups.add(universe)
+                self._join(universe)
+
+    def _join(self, universe: int) -> None:
+        sock = self._sockets.get('sacn')
+        if sock is None:
+            return
+        interface = '0.0.0.0' if self.bind_ip in ('', '0.0.0.0') else self.bind_ip
+        mreq = socket.inet_aton(sacn.multicast_address(universe)) + socket.inet_aton(interface)
+        try:
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+        except OSError as e:
+            logger.warning(f"⚠️ DMX input: cannot join sACN universe {universe} multicast: {e}")
+
+    def _run(self) -> None:
+        parsers = {'artnet': parse_artdmx, 'sacn': parse_e131}
+        while self._running:
+            try:
+                events = self._selector.select(timeout=0.25)
+            except (OSError, ValueError):
+                break   # selector closed by stop()
+            for key, _ in events:
+                protocol = key.data
+                parse = parsers[protocol]
+                sock = key.fileobj
+                while True:
+                    try:
+                        packet = sock.recv(_RECV_SIZE)
+                    except OSError:
+                        break   # drained (BlockingIOError) or closed
+                    self._handle(protocol, parse(packet))
+
+    def _handle(self, protocol: str, parsed: Optional[Tuple[int, int, bytes]]) -> None:
+        if parsed is None:
+            self.packets_ignored += 1
+            return
+        universe, sequence, data = parsed
+        key = (protocol, universe)
+        with self._lock:
+            if not _in_order(self._sequence.get(key), sequence, protocol):
+                self.packets_out_of_order += 1
+                return
+            self._sequence[key] = sequence
+            self.packets_received += 1
+            buffer = self._data.get(key)
+            if buffer is None:
+                buffer = self._data[key] = bytearray(UNIVERSE_SLOTS)
+            if buffer[:len(data)] != data:
+                buffer[:len(data)] = data
+                self._changed.setdefault(key, time.perf_counter())
+
+    def feed(self, protocol: str, packet: bytes) -> None:
+        """Handle one datagram as if it had been received (protocol 'artnet' or 'sacn')."""
+        self._handle(protocol, parse_artdmx(packet) if protocol == 'artnet' else parse_e131(packet))
+
+    def take_changes(self) -> Dict[UniverseKey, Tuple[bytes, float]]:
+        """
+        Universes that changed since the last call.
+
+        Returns:
+            (protocol, universe) → (512 DMX slots, perf_counter of the first
+            change not yet taken)
+        """
+        with self._lock:
+            if not self._changed:
+                return {}
+            changes = {key: (bytes(self._data[key]), t) for key, t in self._changed.items()}
+            self._changed = {}
+        return changes
+
+    def get_universe(self, protocol: str, universe: int) -> Optional[bytes]:
+        with self._lock:
+            data = self._data.get((protocol, universe))
+            return bytes(data) if data is not None else None
+
+    def get_stats(self) -> Dict:
+        return {
+            'running': self._running,
+            'ports': self.ports,
+            'universes': sorted(f'{p}:{u}' for p, u in self._data),
+            'packets': self.packets_received,
+            'ignored': self.packets_ignored,
+            'out_of_order': self.packets_out_of_order,
+        }
@@ -3,12 +3,29 @@ ArtNet Routing Bridge
 
 Bridges the routing system (OutputManager + ArtNetSender) with the player.
 Processes video frames and sends to configured ArtNet outputs.
+
+Objects sample the final composite ('player') or one isolated layer
+('layerN', ArtNetObject.input_layer).  Objects are grouped by input layer
+once per routing change; for every sampled layer the compositor keeps a
+LayerProcessed tap, and each group is sampled in one pass from its own
+texture (GPU compute sampler) or, without compute support, from one CPU
+download of the layer per tick.  Layers no object samples get no tap and
+are never downloaded.
+
+With shard_workers > 0 the outputs are rendered and sent by a ShardPool
+(see shards.py) from the CPU composite instead; the bridge only sends the
+sync packets once all workers are done.
 """
 
 import numpy as np
 from typing import Optional, Dict
+from .object import ArtNetObject
+from .output import ArtNetOutput
 from .output_manager import OutputManager
+from .output_plan import PLAYER_INPUT
+from .packet_builder import ARTNET_PORT
 from .sender import ArtNetSender
+from .transmitter import ArtNetTransmitter
 from .routing_manager import ArtNetRoutingManager
 from ..core.logger import get_logger
 
@@ -28,6 +45,16 @@ def _get_gpu_sampler_class():
     return _ArtNetGPUSampler
 
 
+def _layer_id(input_layer: str) -> Optional[int]:
+    """'layerN' → N (None for 'player' or anything unparseable)."""
+    if not input_layer or not input_layer.startswith('layer'):
+        return None
+    try:
+        return int(input_layer[5:])
+    except ValueError:
+        return None
+
+
 class RoutingBridge:
     """Bridges routing system with player and network"""
     
@@ -35,7 +62,10 @@ class RoutingBridge:
         self,
         routing_manager: ArtNetRoutingManager,
         canvas_width: int = 1920,
-        canvas_height: int = 1080
+        canvas_height: int = 1080,
+        threaded_send: bool = True,
+        shard_workers: int = 0,
+        dmx_input=None
     ):
         """
         Initialize routing bridge.
@@ -44,22 +74,57 @@ class RoutingBridge:
             routing_manager: ArtNet routing manager instance
             canvas_width: Canvas width in pixels
             canvas_height: Canvas height in pixels
+            threaded_send: Send on the ArtNetTx thread (False = on the caller's thread)
+            shard_workers: Render and send the outputs on this many worker
+                           processes (0 = in this process)
+            dmx_input: Running DMXInput; if it listens on the Art-Net port the
+                       sender uses an ephemeral source port (Linux delivers
+                       unicast to the socket bound last, so a send socket on
+                       port 6454 would swallow the console's packets)
         """
         self.routing_manager = routing_manager
         self.output_manager = OutputManager(canvas_width, canvas_height)
-        self.sender = ArtNetSender()
+        receiving = dmx_input is not None and dmx_input.receiver.ports.get('artnet') == ARTNET_PORT
+        self.sender = ArtNetSender(source_address=None if receiving else ('0.0.0.0', ARTNET_PORT))
+        self.transmitter = ArtNetTransmitter(self.sender) if threaded_send else None
+        self.shards = None
+        if shard_workers > 0:
+            from .shards import ShardPool
+            self.shards = ShardPool(shard_workers, canvas_width, canvas_height,
+                                    sender_options={'cid': self.sender.cid})
         
         self.enabled = False
         self.initialized = False
 
-        # GPU compute shader sampler (optional — lazy init on first GPU hook call)
-        self._gpu_sampler = None
+        # GPU compute shader samplers, one per input layer (lazy init on GPU hook)
+        self._gpu_samplers: dict = {}      # input_layer → ArtNetGPUSampler
         self._gpu_pixel_buffer: dict = {}  # {obj_id: (N,3) uint8 RGB}, updated each frame
+
+        # Sampling groups: input_layer → {obj_id: object} of active outputs
+        self._groups: Dict[str, Dict[str, ArtNetObject]] = {}
+        self._groups_version = None
+        # Point-sampled part of each group (GPU sampler) and the layers with
+        # area-sampled objects (sample_size > 0), which are averaged on the CPU
+        self._gpu_groups: Dict[str, Dict[str, ArtNetObject]] = {}
+        self._area_layers: set = set()
+        # Isolated layer sources (LayerProcessed taps on the player's LayerManager)
+        self._layer_manager = None
+        self._layer_taps: Dict[str, str] = {}            # input_layer → tap_id
+        self._layer_frames: Dict[str, np.ndarray] = {}   # input_layer → RGB (CPU fallback)
+
+        # Optional DMXRecorder fed with every frame that is sent
+        self.recorder = None
+        # While a recording is replayed (send_replay_frame) video output is muted
+        self.replay_active = False
         
     def initialize(self):
         """Initialize ArtNet senders from routing configuration"""
         if self.initialized:
             return
+        if self.shards is not None:
+            # Workers configure their own outputs from the topology
+            self.initialized = True
+            return
         
         # Configure all active outputs
         outputs = self.routing_manager.get_all_outputs()
@@ -84,17 +149,15 @@ class RoutingBridge:
                    _gpu_pixel_buffer (frame download was skipped to avoid the
                    ~43-111 ms AMD pipeline drain stall).
         """
-        if not self.enabled or not self.initialized:
+        if not self.enabled or not self.initialized or self.replay_active:
             return
         
-        # FAST PATH: Skip if no outputs configured (saves CPU on pixel sampling)
-        outputs = self.routing_manager.get_all_outputs()
-        if not outputs:
-            return
+        # Topology is only re-read when the routing version moves
+        topology = self.routing_manager.topology()
+        outputs = topology.outputs
         
-        # FAST PATH: Check if any outputs are actually active
-        active_outputs = [o for o in outputs.values() if o.active]
-        if not active_outputs:
+        # FAST PATH: Skip if no outputs are active (saves CPU on pixel sampling)
+        if not topology.active_outputs:
             return
         
         # Debug logging (throttled)
@@ -107,9 +170,12 @@ class RoutingBridge:
             else:
                 logger.debug("🎬 [RoutingBridge] frame=None (GPU sampler active)")
 
+        if self.shards is not None:
+            self._process_sharded(frame, topology)
+            return
+
         try:
-            # Get current objects from routing manager
-            objects = self.routing_manager.get_all_objects()
+            objects = topology.objects
 
             # Convert BGR (OpenCV native) → RGB (expected by pixel sampler)
             # frame may be None when GPU sampler covered all LED reads.
@@ -121,73 +187,246 @@ class RoutingBridge:
                 objects=objects,
                 outputs=outputs,
                 gpu_pixel_buffer=self._gpu_pixel_buffer,
+                routing_version=topology.version,
+                layer_frames=self._layer_frames,
             )
             
-            # Send each output's DMX data via ArtNet
-            for output_id, dmx_data in rendered_outputs.items():
-                if len(dmx_data) > 0:
-                    try:
-                        # Check if output is configured in sender, if not configure it
-                        if output_id not in self.sender.senders:
-                            output = outputs.get(output_id)
-                            if output and output.active:
-                                self.sender.configure_output(output)
-                                logger.debug(f"Auto-configured new output: {output.name}")
-                        
-                        self.sender.send(output_id, dmx_data)
-                    except Exception as e:
-                        logger.error(f"Failed to send data to output {output_id}: {e}")
+            # Send all outputs' DMX data via ArtNet (ArtSync after the last packet)
+            frames = self._send(rendered_outputs, outputs)
+            if frames and self.recorder is not None and self.recorder.is_recording:
+                self.recorder.record(frames)
         
         except Exception as e:
             logger.error(f"Frame processing error in routing bridge: {e}", exc_info=True)
 
+    def _process_sharded(self, frame: Optional[np.ndarray], topology) -> None:
+        """Render and send on the shard workers, then sync all their targets at once."""
+        if frame is None:
+            return   # needs_cpu_frame makes the player download the composite
+        try:
+            frames, sync_ids = self.shards.process(frame[:, :, ::-1], topology)
+            outputs = topology.outputs
+            if sync_ids:
+                self.sender.send_sync(outputs[oid] for oid in sync_ids if oid in outputs)
+            self.output_manager.last_frames.update(frames)
+            if frames and self.recorder is not None and self.recorder.is_recording:
+                self.recorder.record(frames)
+        except Exception as e:
+            logger.error(f"Sharded frame processing error in routing bridge: {e}", exc_info=True)
+
+    @property
+    def needs_cpu_frame(self) -> bool:
+        """
+        True when the outputs are sampled from a CPU frame: sharded mode, or
+        area-sampled objects on the composite (the GPU sampler reads points only).
+        """
+        return self.shards is not None or (self.enabled and PLAYER_INPUT in self._area_layers)
+
+    def _send(self, rendered_outputs: Dict[str, bytes], outputs: Dict[str, ArtNetOutput]) -> Dict[str, bytes]:
+        """
+        Send one frame of DMX data (output_id → bytes) to the configured outputs.
+
+        Returns:
+            The frames that were handed to the sender/transmitter
+        """
+        frames = {}
+        for output_id, dmx_data in rendered_outputs.items():
+            if len(dmx_data) > 0:
+                # Check if output is configured in sender, if not configure it
+                if output_id not in self.sender.senders:
+                    output = outputs.get(output_id)
+                    if output and output.active:
+                        self.sender.configure_output(output)
+                        logger.debug(f"Auto-configured new output: {output.name}")
+                if output_id in self.sender.senders:
+                    frames[output_id] = dmx_data
+        if frames:
+            if self.transmitter is not None and self.transmitter.is_running:
+                # Publish and return; ArtNetTx sends the newest frame
+                self.transmitter.publish(frames)
+            else:
+                try:
+                    self.sender.send_frame(frames)
+                except Exception as e:
+                    logger.error(f"Failed to send ArtNet frame: {e}")
+        return frames
+
+    def send_replay_frame(self, frames: Dict[str, bytes]) -> Dict[str, bytes]:
+        """
+        Send pre-rendered DMX data (e.g. a replayed recording) to the active outputs.
+
+        Frames of unknown or inactive outputs are ignored.  The data is stored
+        as the outputs' last frame for the DMX monitor.
+
+        Args:
+            frames: output_id → DMX bytes
+
+        Returns:
+            The frames that were sent
+        """
+        if not self.enabled or not self.initialized:
+            return {}
+        active = self.routing_manager.topology().active_outputs
+        frames = {output_id: data for output_id, data in frames.items() if output_id in active}
+        self.output_manager.last_frames.update(frames)
+        return self._send(frames, active)
+
+    def set_layer_manager(self, layer_manager) -> None:
+        """
+        Attach the player's LayerManager as source of isolated layer frames
+        (None detaches and removes the taps).
+
+        Args:
+            layer_manager: LayerManager with register_tap/unregister_tap/tap_registry
+        """
+        if layer_manager is self._layer_manager:
+            return
+        self._set_layer_taps(set())
+        self._layer_manager = layer_manager
+        self._layer_frames = {}
+        self._groups_version = None   # re-register taps on the next frame
+
+    def _sampling_groups(self, objects: Dict[str, ArtNetObject]) -> Dict[str, Dict[str, ArtNetObject]]:
+        """Objects of active outputs grouped by input layer (rebuilt per routing version)."""
+        topology = self.routing_manager.topology()
+        version = topology.version
+        if version == self._groups_version:
+            return self._groups
+        sampled = {
+            oid for output in topology.active_outputs.values()
+            for oid in output.assigned_objects
+        }
+        groups: Dict[str, Dict[str, ArtNetObject]] = {}
+        for obj_id, obj in objects.items():
+            if obj_id in sampled and obj.points:
+                groups.setdefault(obj.input_layer or PLAYER_INPUT, {})[obj_id] = obj
+        self._groups = groups
+        self._groups_version = version
+        self._gpu_groups = {}
+        self._area_layers = set()
+        for layer, group in groups.items():
+            points = {oid: obj for oid, obj in group.items() if obj.sample_size <= 0}
+            if points:
+                self._gpu_groups[layer] = points
+            if len(points) < len(group):
+                self._area_layers.add(layer)
+
+        self._set_layer_taps({layer for layer in groups if _layer_id(layer) is not None})
+        for layer in list(self._gpu_samplers):
+            if layer not in self._gpu_groups:
+                self._release_gpu_sampler(layer)
+        return groups
+
+    def _set_layer_taps(self, layers: set) -> None:
+        """Keep exactly one LayerProcessed tap per sampled isolated layer."""
+        manager = self._layer_manager
+        if manager is None:
+            self._layer_taps = {}
+            return
+        from ..player.taps import TapConfig, TapStage
+        for layer in [l for l in self._layer_taps if l not in layers]:
+            try:
+                manager.unregister_tap(self._layer_taps.pop(layer))
+            except Exception as e:
+                logger.error(f"Failed to remove layer tap for {layer}: {e}")
+        for layer in layers - set(self._layer_taps):
+            tap_id = f"artnet:{layer}"
+            try:
+                manager.register_tap(TapConfig(tap_id=tap_id, stage=TapStage.LAYER_PROCESSED,
+                                               layer_selector=_layer_id(layer)))
+                self._layer_taps[layer] = tap_id
+            except Exception as e:
+                logger.error(f"Failed to add layer tap for {layer}: {e}")
+
+    def _layer_textures(self) -> Dict[str, object]:
+        """This frame's GPUFrame of every tapped layer (layers that rendered nothing are absent)."""
+        if self._layer_manager is None or not self._layer_taps:
+            return {}
+        registry = self._layer_manager.tap_registry
+        textures = {}
+        for layer, tap_id in self._layer_taps.items():
+            tex = registry.get(tap_id)
+            if tex is not None and not isinstance(tex, list):
+                textures[layer] = tex
+        return textures
+
     def on_gpu_composite(self, gpu_frame) -> None:
         """
         GPU hook: called inside composite_layers() while the final composite
         GPUFrame is still resident on the GPU.
 
-        Lazily creates ArtNetGPUSampler on first call, then dispatches the
-        compute shader to sample all LED pixel positions without a full frame
+        Lazily creates one ArtNetGPUSampler per input layer, then dispatches
+        the compute shader to sample each layer's LED positions from its own
+        texture (the composite or the layer's tap) without a full frame
         download.  Results land in self._gpu_pixel_buffer for use by the next
-        process_frame() call.
+        process_frame() call.  Area-sampled objects are left to the CPU
+        integral-image path: their isolated layers are downloaded into
+        self._layer_frames, the composite via needs_cpu_frame.  Without compute
+        support, each sampled layer is downloaded once into self._layer_frames
+        instead.
 
         Args:
             gpu_frame: GPUFrame containing the final composite texture.
         """
-        if not self.enabled:
+        if not self.enabled or self.shards is not None:
             return
 
-        cls = _get_gpu_sampler_class()
-        if cls is None:
+        objects = self.routing_manager.topology().objects
+        if not objects:
             return
+        groups = self._sampling_groups(objects)
+        layer_textures = self._layer_textures()
 
-        # Lazy initialise sampler (needs GL context — must run on GL thread)
-        if self._gpu_sampler is None:
-            try:
-                from ..gpu import get_context
-                ctx = get_context()
-                self._gpu_sampler = cls(ctx)
-                logger.info("ArtNetGPUSampler: initialised")
-            except Exception as e:
-                logger.error(f"ArtNetGPUSampler: could not initialise: {e}")
-                return
-
-        objects = self.routing_manager.get_all_objects()
-        if not objects:
+        cls = _get_gpu_sampler_class()
+        if cls is None:
+            # CPU fallback: one download per sampled layer (BGR → RGB view)
+            self._layer_frames = {layer: tex.download()[:, :, ::-1]
+                                  for layer, tex in layer_textures.items()}
             return
 
         canvas_w = self.output_manager.canvas_width
         canvas_h = self.output_manager.canvas_height
 
-        self._gpu_sampler.build_positions(objects, canvas_w, canvas_h)
-        self._gpu_sampler.sample(gpu_frame)
-        self._gpu_pixel_buffer = self._gpu_sampler.get_pixel_buffer()
+        self._layer_frames = {layer: layer_textures[layer].download()[:, :, ::-1]
+                              for layer in self._area_layers if layer in layer_textures}
+
+        pixel_buffer = {}
+        for layer, group in self._gpu_groups.items():
+            texture = gpu_frame if layer == PLAYER_INPUT else layer_textures.get(layer)
+            if texture is None:
+                continue   # layer not rendered this frame → black
+            sampler = self._gpu_samplers.get(layer)
+            if sampler is None:
+                # Lazy initialise sampler (needs GL context — must run on GL thread)
+                try:
+                    from ..gpu import get_context
+                    sampler = self._gpu_samplers[layer] = cls(get_context())
+                    logger.info(f"ArtNetGPUSampler: initialised ({layer})")
+                except Exception as e:
+                    logger.error(f"ArtNetGPUSampler: could not initialise: {e}")
+                    return
+            sampler.build_positions(group, canvas_w, canvas_h)
+            sampler.sample(texture)
+            pixel_buffer.update(sampler.get_pixel_buffer())
+        self._gpu_pixel_buffer = pixel_buffer
+
+    def _release_gpu_sampler(self, layer: str) -> None:
+        sampler = self._gpu_samplers.pop(layer, None)
+        if sampler is not None:
+            try:
+                sampler.release()
+            except Exception:
+                pass
 
     def start(self):
         """Enable routing system"""
         if not self.initialized:
             self.initialize()
         
+        if self.transmitter is not None:
+            self.transmitter.start()
+        if self.shards is not None:
+            self.shards.start()
         self.enabled = True
         logger.debug("Routing bridge started")
     
@@ -195,8 +434,14 @@ class RoutingBridge:
         """Disable routing system and send blackout"""
         self.enabled = False
         
+        # Stop sending queued frames before the blackout goes out
+        if self.transmitter is not None:
+            self.transmitter.stop()
+        
         try:
             self.sender.blackout_all()
+            if self.shards is not None:
+                self.shards.blackout()
         except Exception as e:
             logger.error(f"Error during blackout: {e}")
         
@@ -204,7 +449,11 @@ class RoutingBridge:
     
     def blackout(self):
         """Send blackout to all outputs"""
+        if self.transmitter is not None:
+            self.transmitter.mailbox.clear()
         self.sender.blackout_all()
+        if self.shards is not None:
+            self.shards.blackout()
     
     def update_canvas_size(self, width: int, height: int):
         """
@@ -215,6 +464,8 @@ class RoutingBridge:
             height: New canvas height
         """
         self.output_manager.update_canvas_size(width, height)
+        if self.shards is not None:
+            self.shards.update_canvas_size(width, height)
     
     def reconfigure_output(self, output_id: str):
         """
@@ -262,15 +513,26 @@ class RoutingBridge:
         
         return stats
     
+    def get_transmit_stats(self) -> Dict:
+        """Queue-to-wire latency, drops and per-output send counters."""
+        if self.transmitter is None:
+            stats = {'running': False, 'threaded': False}
+        else:
+            stats = self.transmitter.get_stats()
+            stats['threaded'] = True
+            stats['send_method'] = self.sender.socket.method
+        if self.shards is not None:
+            stats['shards'] = self.shards.get_stats()
+        return stats
+    
     def cleanup(self):
         """Cleanup all resources"""
         self.stop()
+        if self.shards is not None:
+            self.shards.stop()
         self.sender.cleanup()
         self.output_manager.reset_all()
-        if self._gpu_sampler is not None:
-            try:
-                self._gpu_sampler.release()
-            except Exception:
-                pass
-            self._gpu_sampler = None
+        for layer in list(self._gpu_samplers):
+            self._release_gpu_sampler(layer)
+        self.set_layer_manager(None)
         logger.debug("Routing bridge cleaned up")
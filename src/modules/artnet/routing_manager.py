@@ -5,7 +5,7 @@ Central manager for ArtNet objects, outputs, and routing assignments.
 Handles synchronization with editor shapes, CRUD operations, and session state persistence.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional
 import uuid
 
 from .object import ArtNetObject
@@ -16,6 +16,19 @@ from ..core.logger import get_logger
 logger = get_logger(__name__)
 
 
+class RoutingTopology(NamedTuple):
+    """
+    Routing as seen by per-frame consumers at one version.
+
+    The dicts are shared between callers and rebuilt only when the version
+    moves — read them, never mutate them.
+    """
+    version: int
+    objects: Dict[str, ArtNetObject]
+    outputs: Dict[str, ArtNetOutput]
+    active_outputs: Dict[str, ArtNetOutput]
+
+
 class ArtNetRoutingManager:
     """Manages ArtNet objects, outputs, and routing assignments"""
     
@@ -30,8 +43,95 @@ class ArtNetRoutingManager:
         self.objects: Dict[str, ArtNetObject] = {}
         self.outputs: Dict[str, ArtNetOutput] = {}
         
+        # Incremented on every routing change; OutputManager recompiles its
+        # per-output plans only when this moves.
+        self.version = 0
+        
+        # Assignment indexes (kept in step with output.assigned_objects):
+        # out_id → {obj_id} and obj_id → {out_id: None} (insertion ordered)
+        self._output_objects: Dict[str, set] = {}
+        self._object_outputs: Dict[str, Dict[str, None]] = {}
+        # source_shape_id → {obj_id: None} (first = object created for the shape)
+        self._shape_index: Dict[str, Dict[str, None]] = {}
+        self._topology: Optional[RoutingTopology] = None
+        
         logger.debug("ArtNetRoutingManager initialized")
     
+    def _changed(self):
+        """Mark the routing as modified (invalidates compiled output plans)."""
+        self.version += 1
+    
+    def topology(self) -> RoutingTopology:
+        """
+        Objects and outputs for per-frame consumers.
+
+        Rebuilt only when the routing version changes, so a render loop can
+        call this every frame instead of copying both dicts each time.
+        """
+        topo = self._topology
+        if topo is None or topo.version != self.version:
+            outputs = dict(self.outputs)
+            topo = RoutingTopology(
+                version=self.version,
+                objects=dict(self.objects),
+                outputs=outputs,
+                active_outputs={out_id: out for out_id, out in outputs.items() if out.active}
+            )
+            self._topology = topo
+        return topo
+    
+    # =============================================================================
+    # Assignment Indexes
+    # =============================================================================
+    
+    def _rebuild_indexes(self):
+        """Rebuild all indexes from self.objects / self.outputs (after bulk changes)."""
+        self._shape_index = {}
+        for obj_id, obj in self.objects.items():
+            self._index_object(obj)
+        self._output_objects = {}
+        self._object_outputs = {}
+        for output in self.outputs.values():
+            self._index_output(output)
+    
+    def _index_object(self, obj: ArtNetObject):
+        if obj.source_shape_id:
+            self._shape_index.setdefault(obj.source_shape_id, {})[obj.id] = None
+    
+    def _unindex_shape(self, obj_id: str, shape_id: Optional[str]):
+        ids = self._shape_index.get(shape_id)
+        if ids is not None:
+            ids.pop(obj_id, None)
+            if not ids:
+                del self._shape_index[shape_id]
+    
+    def _unindex_object(self, obj: ArtNetObject):
+        self._unindex_shape(obj.id, obj.source_shape_id)
+        self._object_outputs.pop(obj.id, None)
+    
+    def _index_output(self, output: ArtNetOutput):
+        """(Re-)index the assignments of *output* from its assigned_objects list."""
+        self._unindex_output(output.id)
+        self._output_objects[output.id] = set(output.assigned_objects)
+        for obj_id in output.assigned_objects:
+            self._object_outputs.setdefault(obj_id, {})[output.id] = None
+    
+    def _unindex_output(self, out_id: str):
+        for obj_id in self._output_objects.pop(out_id, ()):
+            outs = self._object_outputs.get(obj_id)
+            if outs is not None:
+                outs.pop(out_id, None)
+                if not outs:
+                    del self._object_outputs[obj_id]
+    
+    def _unassign_everywhere(self, obj_id: str):
+        """Remove *obj_id* from every output it is assigned to (via the reverse index)."""
+        for out_id in self._object_outputs.pop(obj_id, {}):
+            output = self.outputs.get(out_id)
+            if output is not None and obj_id in self._output_objects.get(out_id, ()):
+                output.assigned_objects.remove(obj_id)
+                self._output_objects[out_id].discard(obj_id)
+    
     # =============================================================================
     # Sync from Editor
     # =============================================================================
@@ -93,12 +193,15 @@ class ArtNetRoutingManager:
                 # Create new object
                 obj = self._create_object_from_shape(shape)
                 self.objects[obj.id] = obj
+                self._index_object(obj)
                 created_objects.append(obj)
         
         # Remove orphaned objects (whose shapes were deleted in editor)
         removed_ids = []
         if remove_orphaned:
             removed_ids = self._remove_orphaned_objects(editor_shape_ids)
+        if created_objects or removed_ids:
+            self._changed()
         
         logger.debug(
             f"✅ Sync complete: {len(created_objects)} created, "
@@ -124,14 +227,15 @@ class ArtNetRoutingManager:
         removed_ids = []
         
         # Find objects with missing source shapes
-        for obj_id, obj in list(self.objects.items()):
-            if obj.source_shape_id and obj.source_shape_id not in valid_shape_ids:
+        orphaned_shapes = [shape_id for shape_id in self._shape_index if shape_id not in valid_shape_ids]
+        for shape_id in orphaned_shapes:
+            for obj_id in list(self._shape_index[shape_id]):
+                obj = self.objects[obj_id]
                 # Remove from all outputs first
-                for output in self.outputs.values():
-                    if obj_id in output.assigned_objects:
-                        output.assigned_objects.remove(obj_id)
+                self._unassign_everywhere(obj_id)
                 
                 # Remove object
+                self._unindex_object(obj)
                 del self.objects[obj_id]
                 removed_ids.append(obj_id)
                 logger.debug(f"Removed orphaned object {obj_id} (shape {obj.source_shape_id} deleted)")
@@ -148,9 +252,8 @@ class ArtNetRoutingManager:
         Returns:
             ArtNetObject if found, None otherwise
         """
-        for obj in self.objects.values():
-            if obj.source_shape_id == shape_id:
-                return obj
+        for obj_id in self._shape_index.get(shape_id, ()):
+            return self.objects[obj_id]
         return None
     
     def _create_object_from_shape(self, shape: dict) -> ArtNetObject:
@@ -212,6 +315,7 @@ class ArtNetRoutingManager:
         
         # Recalculate universe range (point count may have changed)
         obj.universe_start, obj.universe_end = obj.calculate_universe_range()
+        self._changed()
         
         logger.debug(f"Updated object {obj.id}: {len(obj.points)} points")
         
@@ -245,10 +349,7 @@ class ArtNetRoutingManager:
         for obj_id, obj in self.objects.items():
             obj_dict = obj.to_dict()
             # Find all outputs this object is assigned to
-            obj_dict['outputIds'] = [
-                out_id for out_id, out in self.outputs.items()
-                if obj_id in out.assigned_objects
-            ]
+            obj_dict['outputIds'] = list(self._object_outputs.get(obj_id, ()))
             objects_with_outputs[obj_id] = obj_dict
         
         return {
@@ -279,6 +380,8 @@ class ArtNetRoutingManager:
             except Exception as e:
                 logger.error(f"Failed to restore output {out_id}: {e}")
         
+        self._rebuild_indexes()
+        self._changed()
         logger.debug(f"✅ Restored state: {len(self.objects)} objects, {len(self.outputs)} outputs")
     
     # =============================================================================
@@ -292,7 +395,13 @@ class ArtNetRoutingManager:
         Args:
             obj: ArtNetObject to add
         """
+        if obj.id in self.objects:
+            # Replacing keeps the assignments, only the shape link may move
+            old = self.objects[obj.id]
+            self._unindex_shape(old.id, old.source_shape_id)
         self.objects[obj.id] = obj
+        self._index_object(obj)
+        self._changed()
         logger.debug(f"Created object {obj.id}")
     
     def get_object(self, obj_id: str) -> Optional[ArtNetObject]:
@@ -331,9 +440,11 @@ class ArtNetRoutingManager:
             raise ValueError(f"Object {obj_id} not found")
         
         obj = self.objects[obj_id]
+        shape_id = obj.source_shape_id
         
         # Map camelCase to snake_case for common properties
         property_map = {
+            'sourceShapeId': 'source_shape_id',
             'ledType': 'led_type',
             'channelsPerPixel': 'channels_per_pixel',
             'channelOrder': 'channel_order',
@@ -344,6 +455,7 @@ class ArtNetRoutingManager:
             'whiteThreshold': 'white_threshold',
             'whiteBehavior': 'white_behavior',
             'colorTemp': 'color_temp',
+            'sampleSize': 'sample_size',
             'inputLayer': 'input_layer',
             'masterId': 'master_id',
             'scaleX': 'scale_x',
@@ -356,17 +468,18 @@ class ArtNetRoutingManager:
             prop_name = property_map.get(key, key)
             
             if hasattr(obj, prop_name):
-                # Special handling for points - convert dicts to ArtNetPoint objects
-                if prop_name == 'points' and isinstance(value, list):
-                    from .object import ArtNetPoint
-                    value = [ArtNetPoint.from_dict(p) if isinstance(p, dict) else p for p in value]
-                
+                # points (list of dicts) are stored as PointArray by ArtNetObject
                 setattr(obj, prop_name, value)
         
         # Recalculate universe range if LED config changed
         if any(k in updates for k in ['ledType', 'led_type', 'channelsPerPixel', 'channels_per_pixel', 'points']):
             obj.universe_start, obj.universe_end = obj.calculate_universe_range()
         
+        if obj.source_shape_id != shape_id:
+            self._unindex_shape(obj_id, shape_id)
+            self._index_object(obj)
+        
+        self._changed()
         logger.debug(f"Updated object {obj_id}")
     
     def delete_object(self, obj_id: str):
@@ -385,11 +498,11 @@ class ArtNetRoutingManager:
             raise ValueError(f"Object {obj_id} not found")
         
         # Remove from all outputs
-        for output in self.outputs.values():
-            if obj_id in output.assigned_objects:
-                output.assigned_objects.remove(obj_id)
+        self._unassign_everywhere(obj_id)
         
+        self._unindex_object(self.objects[obj_id])
         del self.objects[obj_id]
+        self._changed()
         logger.debug(f"Deleted object {obj_id}")
     
     # =============================================================================
@@ -404,6 +517,8 @@ class ArtNetRoutingManager:
             output: ArtNetOutput to add
         """
         self.outputs[output.id] = output
+        self._index_output(output)
+        self._changed()
         logger.debug(f"Created output {output.id}")
     
     def get_output(self, out_id: str) -> Optional[ArtNetOutput]:
@@ -450,6 +565,10 @@ class ArtNetRoutingManager:
             'deltaEnabled': 'delta_enabled',
             'deltaThreshold': 'delta_threshold',
             'fullFrameInterval': 'full_frame_interval',
+            'delayInterpolation': 'delay_interpolation',
+            'sacnPriority': 'sacn_priority',
+            'sacnMulticast': 'sacn_multicast',
+            'sacnSyncUniverse': 'sacn_sync_universe',
             'assignedObjects': 'assigned_objects'
         }
         
@@ -461,6 +580,9 @@ class ArtNetRoutingManager:
             if hasattr(output, prop_name):
                 setattr(output, prop_name, value)
         
+        if 'assignedObjects' in updates or 'assigned_objects' in updates:
+            self._index_output(output)
+        self._changed()
         logger.debug(f"Updated output {out_id}")
     
     def delete_output(self, out_id: str):
@@ -476,7 +598,9 @@ class ArtNetRoutingManager:
         if out_id not in self.outputs:
             raise ValueError(f"Output {out_id} not found")
         
+        self._unindex_output(out_id)
         del self.outputs[out_id]
+        self._changed()
         logger.debug(f"Deleted output {out_id}")
     
     # =============================================================================
@@ -500,8 +624,12 @@ class ArtNetRoutingManager:
             raise ValueError(f"Output {out_id} not found")
         
         output = self.outputs[out_id]
-        if obj_id not in output.assigned_objects:
+        assigned = self._output_objects.setdefault(out_id, set())
+        if obj_id not in assigned:
             output.assigned_objects.append(obj_id)
+            assigned.add(obj_id)
+            self._object_outputs.setdefault(obj_id, {})[out_id] = None
+            self._changed()
             logger.debug(f"Assigned object {obj_id} to output {out_id}")
         else:
             logger.debug(f"Object {obj_id} already assigned to output {out_id}")
@@ -521,8 +649,16 @@ class ArtNetRoutingManager:
             raise ValueError(f"Output {out_id} not found")
         
         output = self.outputs[out_id]
-        if obj_id in output.assigned_objects:
+        assigned = self._output_objects.get(out_id, set())
+        if obj_id in assigned:
             output.assigned_objects.remove(obj_id)
+            assigned.discard(obj_id)
+            outs = self._object_outputs.get(obj_id)
+            if outs is not None:
+                outs.pop(out_id, None)
+                if not outs:
+                    del self._object_outputs[obj_id]
+            self._changed()
             logger.debug(f"Removed object {obj_id} from output {out_id}")
         else:
             logger.debug(f"Object {obj_id} not assigned to output {out_id}")
@@ -563,11 +699,6 @@ class ArtNetRoutingManager:
         
         Returns:
             List of ArtNetOutput instances that have the object assigned
+            (in assignment order)
         """
-        outputs = []
-        
-        for output in self.outputs.values():
-            if obj_id in output.assigned_objects:
-                outputs.append(output)
-        
-        return outputs
+        return [self.outputs[out_id] for out_id in self._object_outputs.get(obj_id, ())]
@@ -0,0 +1,96 @@
+"""
+sACN (ANSI E1.31) packet layout.
+
+Outputs with ``protocol='sacn'`` use the same preallocated per-universe
+buffers as Art-Net (UniversePackets) with an E1.31 data header instead of
+an ArtDmx one:
+
+    root layer      preamble, ACN packet identifier, vector DATA, CID
+    framing layer   source name, priority, sync address, sequence, universe
+    DMP layer       property value count, start code 0x00
+    → 510 DMX slots (same universe split as Art-Net)
+
+Universes are multicast to 239.255.<hi>.<lo>:5568 by default, or unicast to
+the output's target IP.  When synchronization is enabled the data packets
+carry a sync address and an E1.31 synchronization packet is sent after
+each frame (the sACN counterpart of ArtSync).
+"""
+
+import struct
+import uuid
+from functools import partial
+from typing import Tuple
+
+from .packet_builder import CHANNELS_PER_UNIVERSE, PacketLayout
+
+SACN_PORT = 5568
+E131_HEADER_SIZE = 126
+E131_SEQUENCE_OFFSET = 111
+E131_OPTIONS_OFFSET = 112
+OPTION_STREAM_TERMINATED = 0x40
+E131_SYNC_PACKET_SIZE = 49
+
+DEFAULT_PRIORITY = 100
+MAX_PRIORITY = 200
+MIN_UNIVERSE = 1
+MAX_UNIVERSE = 63999
+
+_ACN_PID = b'ASC-E1.17\x00\x00\x00'
+_VECTOR_ROOT_DATA = 0x00000004
+_VECTOR_ROOT_EXTENDED = 0x00000008
+_VECTOR_FRAMING_DATA = 0x00000002
+_VECTOR_EXTENDED_SYNC = 0x00000001
+
+SOURCE_NAME = 'Flux'
+
+
+def clamp_universe(universe: int) -> int:
+    """sACN universes are 1..63999 (0 is reserved)."""
+    return min(MAX_UNIVERSE, max(MIN_UNIVERSE, int(universe)))
+
+
+def multicast_address(universe: int) -> str:
+    """Multicast group of *universe* (239.255.<hi>.<lo>)."""
+    universe = clamp_universe(universe)
+    return f"239.255.{universe >> 8}.{universe & 0xFF}"
+
+
+def _root_layer(vector: int, length: int, cid: bytes) -> bytes:
+    return (struct.pack('>HH', 0x0010, 0x0000) + _ACN_PID
+            + struct.pack('>HI', 0x7000 | (length - 16), vector) + cid)
+
+
+def e131_data_header(universe: int, cid: bytes, priority: int = DEFAULT_PRIORITY,
+                     sync_universe: int = 0, source_name: str = SOURCE_NAME,
+                     slots: int = CHANNELS_PER_UNIVERSE) -> bytes:
+    """E1.31 data packet header for *universe* (sequence byte left at 0)."""
+    length = E131_HEADER_SIZE + slots
+    name = source_name.encode('utf-8')[:63].ljust(64, b'\x00')
+    framing = (struct.pack('>HI', 0x7000 | (length - 38), _VECTOR_FRAMING_DATA) + name
+               + struct.pack('>BHBBH', max(0, min(MAX_PRIORITY, priority)), sync_universe,
+                             0, 0, clamp_universe(universe)))
+    dmp = struct.pack('>HBBHHHB', 0x7000 | (length - 115), 0x02, 0xA1, 0x0000, 0x0001, slots + 1, 0x00)
+    return _root_layer(_VECTOR_ROOT_DATA, length, cid) + framing + dmp
+
+
+def e131_sync_packet(sync_universe: int, sequence: int, cid: bytes) -> bytes:
+    """E1.31 universe synchronization packet."""
+    framing = struct.pack('>HIBHH', 0x7000 | (E131_SYNC_PACKET_SIZE - 38), _VECTOR_EXTENDED_SYNC,
+                          sequence & 0xFF, sync_universe, 0)
+    return _root_layer(_VECTOR_ROOT_EXTENDED, E131_SYNC_PACKET_SIZE, cid) + framing
+
+
+def e131_layout(cid: bytes, priority: int = DEFAULT_PRIORITY, sync_universe: int = 0) -> PacketLayout:
+    """UniversePackets layout for an sACN output."""
+    header = partial(e131_data_header, cid=cid, priority=priority, sync_universe=sync_universe)
+    return PacketLayout(E131_HEADER_SIZE, E131_SEQUENCE_OFFSET, header, skip_zero_sequence=False)
+
+
+def new_cid() -> bytes:
+    """Component identifier of this sender (stable for the process lifetime)."""
+    return uuid.uuid4().bytes
+
+
+def sync_destination(sync_universe: int, target_ip: str, multicast: bool,
+                     port: int = SACN_PORT) -> Tuple[str, int]:
+    return (multicast_address(sync_universe) if multicast else target_ip, port)
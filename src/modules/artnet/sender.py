@@ -1,127 +1,203 @@
 """
 ArtNet Sender Module
 
-Creates and manages stupidArtnet instances for each configured output.
-Handles multi-universe DMX packetization and network transmission.
+Sends rendered DMX data to the configured outputs over Art-Net or sACN
+(E1.31, per ArtNetOutput.protocol).  Every universe is a preallocated
+packet (see packet_builder.py, sacn.py); all outputs share one UDP socket
+and are transmitted with batched sends.
 """
 
+import threading
 import time
-from typing import Dict, Optional
-from stupidArtnet import StupidArtnet
+from typing import Dict, Iterable, List, Optional
 from .output import ArtNetOutput
+from .packet_builder import ARTNET_PORT, ARTSYNC_PACKET, UDPBatchSocket, UniversePackets
+from . import sacn
 from ..core.logger import get_logger
 
 logger = get_logger(__name__)
 
 
 class ArtNetSender:
-    """Manages stupidArtnet instances per output"""
+    """Manages preallocated universe packets per output and one shared socket"""
     
-    def __init__(self):
-        """Initialize ArtNet sender"""
-        self.senders: Dict[str, Dict] = {}  # output_id → {'universes': [...], 'config': {...}}
+    def __init__(self, source_address=('0.0.0.0', ARTNET_PORT), port: int = ARTNET_PORT,
+                 use_sendmmsg: bool = True, keepalive_seconds: float = 1.0,
+                 sacn_port: int = sacn.SACN_PORT):
+        """
+        Initialize ArtNet sender
+        
+        Args:
+            source_address: Local (ip, port) to send from (None = ephemeral)
+            port: Destination UDP port on Art-Net nodes
+            use_sendmmsg: Batch packets with sendmmsg() where the OS supports it
+            keepalive_seconds: Max time a universe goes unsent with delta encoding
+            sacn_port: Destination UDP port for sACN outputs
+        """
+        self.senders: Dict[str, Dict] = {}  # output_id → {'packets': UniversePackets, 'config': ...}
+        self.port = port
+        self.socket = UDPBatchSocket(source_address, use_sendmmsg=use_sendmmsg)
+        self.keepalive_seconds = keepalive_seconds
+        self.sacn_port = sacn_port
+        self.cid = sacn.new_cid()
+        self._sync_sequence: Dict[int, int] = {}  # sACN sync universe → sequence
+        # Sends run on the ArtNetTx thread, configuration/blackout on others
+        self._lock = threading.RLock()
         
     def configure_output(self, output: ArtNetOutput):
         """
-        Configure stupidArtnet instances for an output.
+        Configure an output (universe packets are allocated on first send).
         
         Args:
             output: Output configuration
         """
-        output_id = output.id
-        
-        # Remove existing if present
-        if output_id in self.senders:
-            self.remove_output(output_id)
-        
-        # Calculate required universes (will be determined by actual DMX data size)
-        # For now, prepare configuration
-        self.senders[output_id] = {
-            'config': output,
-            'universes': [],  # Will be created on first send
-            'last_send_time': 0.0
-        }
-        
-        logger.debug(f"ArtNet output configured: {output.name} → {output.target_ip} (universe {output.start_universe})")
+        with self._lock:
+            output_id = output.id
+            
+            # Remove existing if present
+            if output_id in self.senders:
+                self.remove_output(output_id)
+            
+            self.senders[output_id] = {
+                'config': output,
+                'packets': None,    # UniversePackets, sized by the first frame
+                'addresses': None,  # destination per universe
+                'batch': None,      # prebuilt sendmmsg batch for the packets
+                'last_send_time': 0.0,
+                'frames_sent': 0,
+                'packets_sent': 0,
+                'packets_saved': 0
+            }
+            
+            logger.debug(f"ArtNet output configured: {output.name} → {output.target_ip} (universe {output.start_universe})")
     
     def send(self, output_id: str, dmx_data: bytes):
         """
-        Send DMX data to an output.
+        Send DMX data to an output (all universes, then ArtSync if enabled).
         
         Args:
             output_id: Output identifier
             dmx_data: DMX bytes to send
         """
-        if output_id not in self.senders:
-            logger.warning(f"Cannot send to unknown output: {output_id}")
-            return
-        
-        sender_info = self.senders[output_id]
-        output_config = sender_info['config']
-        
-        # Check if output is active
-        if not output_config.active:
-            return
+        self.send_frame({output_id: dmx_data})
+    
+    def send_frame(self, frames: Dict[str, bytes], sync: bool = True) -> List[ArtNetOutput]:
+        """
+        Send one frame to several outputs.
         
-        # Calculate required universes (512 channels per universe)
-        channels_needed = len(dmx_data)
-        universes_needed = (channels_needed + 509) // 510  # 510 usable channels per universe
+        All ArtDmx packets go out first; ArtSync is sent once per target
+        afterwards, so a node fed by several outputs latches them together.
         
-        # Create stupidArtnet instances if needed
-        if len(sender_info['universes']) != universes_needed:
-            self._create_universes(output_id, universes_needed, output_config)
+        Args:
+            frames: output_id → DMX bytes
+            sync: Send the sync packets (False = leave them to the caller,
+                  e.g. when several processes share one frame)
         
-        # Split data into universe chunks and send
-        universes = sender_info['universes']
-        for i, universe in enumerate(universes):
-            start_idx = i * 510
-            end_idx = min(start_idx + 510, channels_needed)
+        Returns:
+            One output config per sync target that is due a sync packet
+        """
+        with self._lock:
+            sync_targets = {}
+            now = time.time()
+            monotonic_now = time.monotonic()
+            for output_id, dmx_data in frames.items():
+                sender_info = self.senders.get(output_id)
+                if sender_info is None:
+                    logger.warning(f"Cannot send to unknown output: {output_id}")
+                    continue
             
-            # Extract chunk for this universe
-            chunk = list(dmx_data[start_idx:end_idx])
+                # Check if output is active
+                config = sender_info['config']
+                if not config.active:
+                    continue
             
-            # Pad to 510 channels
-            while len(chunk) < 510:
-                chunk.append(0)
+                packets = self._ensure_packets(sender_info, UniversePackets.universes_for(len(dmx_data)))
+                packets.write(dmx_data)
             
-            # Send via stupidArtnet
-            universe.set(chunk)
-            universe.show()
-        
-        sender_info['last_send_time'] = time.time()
-    
-    def _create_universes(self, output_id: str, count: int, config: ArtNetOutput):
-        """
-        Create stupidArtnet universe instances.
-        
-        Args:
-            output_id: Output identifier
-            count: Number of universes needed
-            config: Output configuration
-        """
-        sender_info = self.senders[output_id]
-        
-        # Clear existing universes
-        sender_info['universes'].clear()
-        
-        # Create new universes
-        for i in range(count):
-            universe_num = config.start_universe + i
+                # Delta encoding: only universes that changed (or are due a refresh)
+                indices = None
+                if config.delta_enabled:
+                    indices = packets.select_changed(config.delta_threshold, config.full_frame_interval,
+                                                     self.keepalive_seconds, monotonic_now)
+                count = packets.count if indices is None else len(indices)
+                sender_info['packets_sent'] += count
+                sender_info['packets_saved'] += packets.count - count
+                if count:
+                    self._transmit(sender_info, indices)
+                    if config.artsync:
+                        sync_targets.setdefault(self._sync_key(config), config)
             
-            universe = StupidArtnet(
-                target_ip=config.target_ip,
-                universe=universe_num,
-                packet_size=510,  # Usable DMX channels
-                fps=config.fps,
-                even_packet_size=True,  # Even packet size for compatibility
-                broadcast=False,  # Direct IP transmission
-                source_address=('0.0.0.0', 6454),  # Bind to source port 6454
-                artsync=config.artsync  # Enable ArtSync for timing synchronization
-            )
+                sender_info['last_send_time'] = now
+                sender_info['frames_sent'] += 1
             
-            sender_info['universes'].append(universe)
+            if sync:
+                for config in sync_targets.values():
+                    self._send_sync(config)
+            return list(sync_targets.values())
+    
+    def send_sync(self, configs: Iterable[ArtNetOutput]):
+        """Send one sync packet per distinct target of *configs*."""
+        with self._lock:
+            targets = {}
+            for config in configs:
+                targets.setdefault(self._sync_key(config), config)
+            for config in targets.values():
+                self._send_sync(config)
+    
+    def _ensure_packets(self, sender_info: Dict, count: int) -> UniversePackets:
+        """Allocate universe packets (and their send batch) when the universe count changes."""
+        packets = sender_info['packets']
+        if packets is not None and packets.count == count:
+            return packets
         
-        logger.debug(f"Created {count} ArtNet universe(s) for {config.name} starting at universe {config.start_universe}")
+        config = sender_info['config']
+        if config.protocol == 'sacn':
+            start = sacn.clamp_universe(config.start_universe)
+            sync_universe = self._sacn_sync_universe(config) if config.artsync else 0
+            layout = sacn.e131_layout(self.cid, config.sacn_priority, sync_universe)
+            packets = UniversePackets(start, count, layout)
+            if config.sacn_multicast:
+                addresses = [(sacn.multicast_address(start + i), self.sacn_port) for i in range(count)]
+            else:
+                addresses = (config.target_ip, self.sacn_port)
+        else:
+            packets = UniversePackets(config.start_universe, count)
+            addresses = (config.target_ip, self.port)
+        sender_info['packets'] = packets
+        sender_info['addresses'] = addresses
+        sender_info['batch'] = self.socket.batch(packets.views, addresses)
+        
+        logger.debug(f"Created {count} {config.protocol} universe(s) for {config.name} starting at universe {packets.start_universe}")
+        return packets
+    
+    def _transmit(self, sender_info: Dict, indices=None):
+        """Send the output's current packets (or only the universes in *indices*)."""
+        self.socket.send(sender_info['packets'].views, sender_info['addresses'],
+                         sender_info['batch'], indices)
+    
+    @staticmethod
+    def _sacn_sync_universe(config: ArtNetOutput) -> int:
+        return sacn.clamp_universe(config.sacn_sync_universe or config.start_universe)
+    
+    def _sync_key(self, config: ArtNetOutput) -> tuple:
+        """Outputs sharing a key share one sync packet per frame."""
+        if config.protocol == 'sacn':
+            target = None if config.sacn_multicast else config.target_ip
+            return ('sacn', self._sacn_sync_universe(config), target)
+        return ('artnet', config.target_ip)
+    
+    def _send_sync(self, config: ArtNetOutput):
+        """ArtSync, or an E1.31 synchronization packet for sACN outputs."""
+        if config.protocol == 'sacn':
+            universe = self._sacn_sync_universe(config)
+            sequence = (self._sync_sequence.get(universe, 0) + 1) & 0xFF
+            self._sync_sequence[universe] = sequence
+            packet = sacn.e131_sync_packet(universe, sequence, self.cid)
+            destination = sacn.sync_destination(universe, config.target_ip,
+                                                config.sacn_multicast, self.sacn_port)
+            self.socket.send((packet,), destination)
+        else:
+            self.socket.send((ARTSYNC_PACKET,), (config.target_ip, self.port))
     
     def remove_output(self, output_id: str):
         """
@@ -130,22 +206,26 @@ class ArtNetSender:
         Args:
             output_id: Output identifier
         """
-        if output_id not in self.senders:
-            return
-        
-        sender_info = self.senders[output_id]
-        
-        # Send blackout to all universes
-        for universe in sender_info['universes']:
+        with self._lock:
+            if output_id not in self.senders:
+                return
+            
+            # Send blackout to all universes
             try:
-                universe.set([0] * 510)
-                universe.show()
+                self.blackout_output(output_id)
+                sender_info = self.senders[output_id]
+                if sender_info['config'].protocol == 'sacn' and sender_info['packets'] is not None:
+                    # E1.31: announce the end of the stream (three packets)
+                    sender_info['packets'].set_header_byte(sacn.E131_OPTIONS_OFFSET,
+                                                           sacn.OPTION_STREAM_TERMINATED)
+                    for _ in range(3):
+                        self._transmit(sender_info)
             except Exception as e:
-                logger.warning(f"Error sending blackout to universe: {e}")
-        
-        # Remove from registry
-        del self.senders[output_id]
-        logger.debug(f"Removed ArtNet output: {output_id}")
+                logger.warning(f"Error sending blackout to output {output_id}: {e}")
+            
+            # Remove from registry
+            del self.senders[output_id]
+            logger.debug(f"Removed ArtNet output: {output_id}")
     
     def blackout_output(self, output_id: str):
         """
@@ -154,14 +234,19 @@ class ArtNetSender:
         Args:
             output_id: Output identifier
         """
-        if output_id not in self.senders:
-            return
-        
-        sender_info = self.senders[output_id]
-        
-        for universe in sender_info['universes']:
-            universe.set([0] * 510)
-            universe.show()
+        with self._lock:
+            if output_id not in self.senders:
+                return
+            
+            sender_info = self.senders[output_id]
+            packets = sender_info['packets']
+            if packets is None:
+                return
+            
+            packets.clear()
+            self._transmit(sender_info)
+            if sender_info['config'].artsync:
+                self._send_sync(sender_info['config'])
     
     def blackout_all(self):
         """Send blackout to all outputs"""
@@ -192,10 +277,18 @@ class ArtNetSender:
             return None
         
         sender_info = self.senders[output_id]
+        packets = sender_info['packets']
         
         return {
-            'universes': len(sender_info['universes']),
+            'universes': packets.count if packets is not None else 0,
             'last_send_time': sender_info['last_send_time'],
+            'frames_sent': sender_info['frames_sent'],
+            'send_method': self.socket.method,
+            'protocol': sender_info['config'].protocol,
+            'delta_enabled': sender_info['config'].delta_enabled,
+            'packets_sent': sender_info['packets_sent'],
+            'packets_saved': sender_info['packets_saved'],
+            'bytes_saved': sender_info['packets_saved'] * (packets.packet_size if packets is not None else 0),
             'target_ip': sender_info['config'].target_ip,
             'start_universe': sender_info['config'].start_universe,
             'active': sender_info['config'].active
@@ -206,5 +299,6 @@ class ArtNetSender:
         output_ids = list(self.senders.keys())
         for output_id in output_ids:
             self.remove_output(output_id)
+        self.socket.close()
         
         logger.debug("ArtNet sender cleaned up")
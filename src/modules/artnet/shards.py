@@ -0,0 +1,398 @@
+"""
+ArtNet Shards - Art-Net output split across worker processes.
+
+With tens of thousands of LEDs spread over hundreds of universes, the
+per-frame sampling, colour correction, DMX mapping and packet sends of
+RoutingBridge outgrow one core.  A ShardPool splits the active outputs
+over N worker processes:
+
+    main      copies the composite frame (RGB) into one of two shared-memory
+              buffers and sends a 'frame' message naming it to every worker
+              with outputs
+    worker    renders its outputs from the buffer with its own
+              OutputManager (plans, delay buffers, FPS throttling stay in
+              the worker) and sends their universes from its own socket,
+              without sync packets
+    main      waits for all workers, then sends ArtSync / E1.31 sync once
+              per target, so nodes still latch the whole frame at once
+
+Outputs are assigned whole (an output's universes never span workers) and
+balanced by channel count; an output keeps its worker while it exists.
+The topology is pushed to the workers only when the routing version moves.
+A worker that misses the deadline keeps reading its buffer while the next
+frame goes into the other one; a frame with neither buffer free is dropped.
+Workers sample the composite: objects bound to an isolated input layer
+render black while sharding is on.
+"""
+
+import multiprocessing
+import time
+from multiprocessing import connection, shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .object import ArtNetObject
+from .output import ArtNetOutput
+from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Output fields that shape the universe packets (changing one re-creates them)
+_PACKET_FIELDS = ('target_ip', 'start_universe', 'protocol', 'artsync',
+                  'sacn_priority', 'sacn_multicast', 'sacn_sync_universe')
+
+
+def _output_cost(output: ArtNetOutput, objects: Dict[str, ArtNetObject]) -> int:
+    """DMX channels the output renders per frame."""
+    return sum(len(objects[oid].points) * objects[oid].channels_per_pixel
+               for oid in output.assigned_objects if oid in objects)
+
+
+def assign_shards(outputs: Dict[str, ArtNetOutput], objects: Dict[str, ArtNetObject],
+                  workers: int, previous: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+    """
+    Assign outputs to shards, balanced by channel count.
+
+    Outputs already in *previous* keep their shard (moving one would black
+    it out on the old worker); new outputs go, largest first, to the
+    least loaded shard.
+
+    Returns:
+        output_id → shard index (0 … workers-1)
+    """
+    loads = [0] * workers
+    assignment = {}
+    for output_id, shard in (previous or {}).items():
+        if output_id in outputs and 0 <= shard < workers:
+            assignment[output_id] = shard
+            loads[shard] += _output_cost(outputs[output_id], objects) or 1
+    new = [o for o in outputs.values() if o.id not in assignment]
+    for output in sorted(new, key=lambda o: (-_output_cost(o, objects), o.id)):
+        shard = loads.index(min(loads))
+        assignment[output.id] = shard
+        loads[shard] += _output_cost(output, objects) or 1
+    return assignment
+
+
+# -----------------------------------------------------------------------------
+# Worker process
+# -----------------------------------------------------------------------------
+
+def _apply_topology(sender, output_manager, current: Dict[str, ArtNetOutput],
+                    outputs: Dict[str, ArtNetOutput]) -> None:
+    for output_id in [oid for oid in current if oid not in outputs]:
+        sender.remove_output(output_id)
+        output_manager.reset_output(output_id)
+    for output_id, output in outputs.items():
+        old = current.get(output_id)
+        info = sender.senders.get(output_id)
+        if old is None or info is None or any(getattr(old, f) != getattr(output, f) for f in _PACKET_FIELDS):
+            sender.configure_output(output)
+        else:
+            info['config'] = output
+
+
+def _shard_worker(conn, canvas_width: int, canvas_height: int, sender_options: dict) -> None:
+    """
+    Worker loop.  Messages (tuples) from the pool:
+
+        ('topology', version, objects, outputs)
+        ('frame', seq, shm_name, shape, collect)  → ('done', seq, frames|None, sync_ids)
+        ('canvas', width, height)
+        ('blackout',)
+        ('stop',)
+    """
+    from .output_manager import OutputManager
+    from .sender import ArtNetSender
+
+    options = dict(sender_options)
+    cid = options.pop('cid', None)
+    sender = ArtNetSender(**options)
+    if cid is not None:
+        sender.cid = cid   # sync packets come from the pool's sender
+    output_manager = OutputManager(canvas_width, canvas_height)
+    objects: Dict[str, ArtNetObject] = {}
+    outputs: Dict[str, ArtNetOutput] = {}
+    version = None
+    segments: Dict[str, shared_memory.SharedMemory] = {}   # the pool's two frame buffers
+    try:
+        while True:
+            msg = conn.recv()
+            kind = msg[0]
+            if kind == 'frame':
+                _, seq, name, shape, collect = msg
+                shm = segments.get(name)
+                if shm is None:
+                    while len(segments) >= 2:   # a buffer replaced after a canvas resize
+                        segments.pop(next(iter(segments))).close()
+                    try:
+                        # Spawned workers share the pool's resource tracker: the
+                        # pool's unlink() also drops this registration
+                        shm = segments[name] = shared_memory.SharedMemory(name=name)
+                    except FileNotFoundError:
+                        conn.send(('done', seq, None, []))   # released by a resize meanwhile
+                        continue
+                frame = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+                try:
+                    rendered = output_manager.render_frame(frame, objects, outputs, routing_version=version)
+                finally:
+                    del frame   # release the buffer export before the next close()
+                frames = {oid: data for oid, data in rendered.items() if len(data) > 0}
+                sync_ids = [c.id for c in sender.send_frame(frames, sync=False)] if frames else []
+                conn.send(('done', seq, frames if collect else None, sync_ids))
+            elif kind == 'topology':
+                _, version, objects, new_outputs = msg
+                _apply_topology(sender, output_manager, outputs, new_outputs)
+                outputs = new_outputs
+            elif kind == 'canvas':
+                output_manager.update_canvas_size(msg[1], msg[2])
+            elif kind == 'blackout':
+                sender.blackout_all()
+            elif kind == 'stop':
+                break
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        sender.cleanup()
+        for shm in segments.values():
+            shm.close()
+
+
+# -----------------------------------------------------------------------------
+# Pool
+# -----------------------------------------------------------------------------
+
+class ShardPool:
+    """Worker processes rendering and sending disjoint sets of outputs."""
+
+    def __init__(self, workers: int, canvas_width: int = 1920, canvas_height: int = 1080,
+                 sender_options: Optional[dict] = None, timeout: float = 0.5,
+                 collect_frames: bool = True):
+        """
+        Args:
+            workers: Number of worker processes
+            canvas_width: Canvas width in pixels
+            canvas_height: Canvas height in pixels
+            sender_options: ArtNetSender keyword arguments for the workers
+                            (plus 'cid' to share the sACN source id); workers
+                            send from an ephemeral port by default
+            timeout: Max seconds process() waits for a worker's frame
+            collect_frames: Return the rendered DMX data to the main process
+                            (DMX monitor, recorder)
+        """
+        self.workers = max(1, int(workers))
+        self.canvas_width = canvas_width
+        self.canvas_height = canvas_height
+        self.sender_options = {'source_address': None}
+        self.sender_options.update(sender_options or {})
+        self.timeout = timeout
+        self.collect_frames = collect_frames
+
+        self._ctx = multiprocessing.get_context('spawn')
+        self._procs: List[Optional[multiprocessing.Process]] = [None] * self.workers
+        self._conns: List[Optional[connection.Connection]] = [None] * self.workers
+        self._busy: List[Optional[int]] = [None] * self.workers   # seq in flight
+        self._reading: List[int] = [0] * self.workers              # buffer of that seq
+        self._version = None
+        self._assignment: Dict[str, int] = {}
+        self._shms: List[Optional[shared_memory.SharedMemory]] = [None, None]
+        self._shape: Optional[Tuple[int, int, int]] = None
+        self._next_shm = 0
+        self._seq = 0
+        self.frames_processed = 0
+        self.frames_dropped = [0] * self.workers
+        self.restarts = 0
+        self.last_wait_ms = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        return any(proc is not None for proc in self._procs)
+
+    def start(self) -> None:
+        """Spawn the worker processes (no-op while running)."""
+        for i in range(self.workers):
+            if self._procs[i] is None:
+                self._spawn(i)
+        logger.info(f"🧩 Art-Net sharding: {self.workers} worker process(es)")
+
+    def _spawn(self, i: int) -> None:
+        parent, child = self._ctx.Pipe()
+        proc = self._ctx.Process(target=_shard_worker, name=f'ArtNetShard-{i}', daemon=True,
+                                 args=(child, self.canvas_width, self.canvas_height, self.sender_options))
+        proc.start()
+        child.close()
+        self._procs[i] = proc
+        self._conns[i] = parent
+        self._busy[i] = None
+        self._version = None   # new worker needs the topology
+
+    def stop(self) -> None:
+        """Stop the workers (they black out their outputs) and free the frame buffer."""
+        for i, conn in enumerate(self._conns):
+            if conn is None:
+                continue
+            try:
+                conn.send(('stop',))
+            except (OSError, BrokenPipeError):
+                pass
+        for i, proc in enumerate(self._procs):
+            if proc is not None:
+                proc.join(timeout=2.0)
+                if proc.is_alive():
+                    proc.terminate()
+                    proc.join()
+            if self._conns[i] is not None:
+                self._conns[i].close()
+            self._procs[i] = None
+            self._conns[i] = None
+        self._version = None
+        self._assignment = {}
+        self._release_buffer()
+
+    def _release_buffer(self) -> None:
+        for i, shm in enumerate(self._shms):
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+                self._shms[i] = None
+        self._shape = None
+
+    def _broadcast(self, msg: tuple) -> None:
+        for conn in self._conns:
+            if conn is not None:
+                try:
+                    conn.send(msg)
+                except (OSError, BrokenPipeError):
+                    pass
+
+    def blackout(self) -> None:
+        self._broadcast(('blackout',))
+
+    def update_canvas_size(self, width: int, height: int) -> None:
+        self.canvas_width = width
+        self.canvas_height = height
+        self._broadcast(('canvas', width, height))
+
+    def _check_workers(self) -> None:
+        for i, proc in enumerate(self._procs):
+            if proc is not None and not proc.is_alive():
+                logger.error(f"❌ Art-Net shard worker {i} died (exit code {proc.exitcode}), restarting")
+                self._conns[i].close()
+                self.restarts += 1
+                self._spawn(i)
+
+    def _push_topology(self, topology) -> None:
+        outputs = topology.active_outputs
+        objects = topology.objects
+        self._assignment = assign_shards(outputs, objects, self.workers, self._assignment)
+        for i, conn in enumerate(self._conns):
+            shard_outputs = {oid: outputs[oid] for oid, shard in self._assignment.items() if shard == i}
+            shard_objects = {oid: objects[oid] for output in shard_outputs.values()
+                             for oid in output.assigned_objects if oid in objects}
+            conn.send(('topology', topology.version, shard_objects, shard_outputs))
+        self._version = topology.version
+        logger.debug(f"Art-Net shards: {len(outputs)} output(s) over {self.workers} worker(s) "
+                     f"(routing version {topology.version})")
+
+    def _publish(self, frame: np.ndarray) -> Optional[int]:
+        """
+        Copy *frame* (H, W, 3, any strides) into a shared buffer no busy
+        worker is reading.
+
+        Returns:
+            Index of the buffer in self._shms, or None if both are in use
+        """
+        shape = tuple(frame.shape)
+        if shape != self._shape:
+            self._release_buffer()
+            self._shape = shape
+        in_use = {self._reading[i] for i, seq in enumerate(self._busy) if seq is not None}
+        for index in (self._next_shm, 1 - self._next_shm):
+            if index not in in_use:
+                break
+        else:
+            return None
+        self._next_shm = 1 - index
+        if self._shms[index] is None:
+            self._shms[index] = shared_memory.SharedMemory(create=True, size=max(1, frame.nbytes))
+        np.copyto(np.ndarray(shape, dtype=np.uint8, buffer=self._shms[index].buf), frame)
+        return index
+
+    def process(self, frame: np.ndarray, topology) -> Tuple[Dict[str, bytes], List[str]]:
+        """
+        Render and send one frame on the workers.
+
+        Args:
+            frame: RGB frame (H, W, 3) uint8
+            topology: RoutingTopology of the routing manager
+
+        Returns:
+            (output_id → DMX bytes sent (empty unless collect_frames),
+             one sent output id per worker and sync target)
+        """
+        if not self.is_running:
+            return {}, []
+        self._check_workers()
+        if topology.version != self._version:
+            self._push_topology(topology)
+        for i, conn in enumerate(self._conns):
+            if self._busy[i] is not None and conn.poll():
+                self._receive(i)   # late reply to a frame that timed out
+        index = self._publish(frame)
+
+        self._seq += 1
+        seq = self._seq
+        pending = set()
+        for i in set(self._assignment.values()):
+            if self._busy[i] is not None or index is None:
+                self.frames_dropped[i] += 1   # busy with an older frame, or no free buffer
+                continue
+            self._conns[i].send(('frame', seq, self._shms[index].name, self._shape, self.collect_frames))
+            self._busy[i] = seq
+            self._reading[i] = index
+            pending.add(i)
+
+        frames: Dict[str, bytes] = {}
+        sync_ids: List[str] = []
+        start = time.perf_counter()
+        deadline = start + self.timeout
+        while pending:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            for conn in connection.wait([self._conns[i] for i in pending], remaining):
+                i = self._conns.index(conn)
+                pending.discard(i)
+                reply = self._receive(i)
+                if reply is not None and reply[1] == seq:
+                    if reply[2]:
+                        frames.update(reply[2])
+                    sync_ids.extend(reply[3])
+        for i in pending:
+            logger.warning(f"⚠️ Art-Net shard worker {i} missed the frame deadline")
+        self.last_wait_ms = (time.perf_counter() - start) * 1000.0
+        self.frames_processed += 1
+        return frames, sync_ids
+
+    def _receive(self, i: int) -> Optional[tuple]:
+        """Read worker *i*'s reply ('done', seq, frames, sync_ids); None if it died."""
+        self._busy[i] = None
+        try:
+            return self._conns[i].recv()
+        except (EOFError, OSError):
+            return None   # restarted by _check_workers on the next frame
+
+    def get_stats(self) -> dict:
+        shards = [0] * self.workers
+        for shard in self._assignment.values():
+            shards[shard] += 1
+        return {
+            'workers': self.workers,
+            'running': self.is_running,
+            'outputs_per_worker': shards,
+            'frames': self.frames_processed,
+            'dropped': list(self.frames_dropped),
+            'restarts': self.restarts,
+            'last_wait_ms': round(self.last_wait_ms, 3),
+        }
@@ -0,0 +1,180 @@
+"""
+Art-Net Transmitter - network sends off the render thread.
+
+RoutingBridge.process_frame used to call ArtNetSender synchronously, so a
+slow NIC, a full socket buffer or a burst of several hundred universes
+lengthened the video frame.  Now the render thread only publishes the
+rendered DMX buffers into a latest-frame mailbox and returns; the ArtNetTx
+thread takes whatever is newest and sends it.
+
+The mailbox holds at most one frame per output.  Publishing while the
+previous frame of an output is still unsent replaces it (counted as a drop)
+— the wire always gets the newest completed frame, never a backlog of
+stale ones.  All outputs of one take are sent together through
+ArtNetSender.send_frame, so ArtSync still follows the whole frame.
+
+Queue-to-wire latency (publish → packets handed to the socket) and drop
+counts are reported by get_stats() (/api/performance/metrics → 'artnet').
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional, Tuple
+
+from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class LatestFrameMailbox:
+    """Latest-wins slot per output: put() never blocks, take() waits."""
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._pending: Dict[str, Tuple[bytes, float]] = {}
+        self._closed = False
+        self.dropped: Dict[str, int] = {}
+
+    def put(self, frames: Dict[str, bytes]) -> None:
+        """Publish *frames* (output_id → DMX bytes), replacing unsent ones."""
+        now = time.perf_counter()
+        with self._cond:
+            for output_id, data in frames.items():
+                if output_id in self._pending:
+                    self.dropped[output_id] = self.dropped.get(output_id, 0) + 1
+                self._pending[output_id] = (data, now)
+            self._cond.notify()
+
+    def take(self, timeout: Optional[float] = None) -> Dict[str, Tuple[bytes, float]]:
+        """Everything published since the last take ({} on timeout/close)."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._pending or self._closed, timeout):
+                return {}
+            pending, self._pending = self._pending, {}
+            return pending
+
+    def clear(self) -> None:
+        """Discard unsent frames (e.g. before a blackout)."""
+        with self._cond:
+            self._pending = {}
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def reopen(self) -> None:
+        with self._cond:
+            self._closed = False
+
+
+class ArtNetTransmitter:
+    """ArtNetTx thread sending the newest published frame through an ArtNetSender."""
+
+    def __init__(self, sender):
+        self.sender = sender
+        self.mailbox = LatestFrameMailbox()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        self._stats_lock = threading.Lock()
+        self._latency_ms: deque = deque(maxlen=100)
+        self._send_ms: deque = deque(maxlen=100)
+        self.published = 0
+        self.sent: Dict[str, int] = {}
+        self.send_errors = 0
+
+    # ── lifecycle ────────────────────────────────────────────────────────────
+
+    @property
+    def is_running(self) -> bool:
+        return self._running and self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self.mailbox.reopen()
+        self._running = True
+        self._thread = threading.Thread(target=self._loop, name="ArtNetTx", daemon=True)
+        self._thread.start()
+        logger.debug("ArtNet transmit thread started")
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Stop the thread; unsent frames are discarded."""
+        self._running = False
+        self.mailbox.close()
+        self.mailbox.clear()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    # ── render thread side ───────────────────────────────────────────────────
+
+    def publish(self, frames: Dict[str, bytes]) -> None:
+        """Hand *frames* to the transmit thread and return immediately."""
+        if not frames:
+            return
+        self.published += 1
+        self.mailbox.put(frames)
+
+    # ── transmit thread ──────────────────────────────────────────────────────
+
+    def _loop(self):
+        while self._running:
+            pending = self.mailbox.take(timeout=0.5)
+            if not pending or not self._running:
+                continue
+            t0 = time.perf_counter()
+            try:
+                self.sender.send_frame({oid: data for oid, (data, _) in pending.items()})
+            except Exception as e:
+                self.send_errors += 1
+                logger.error(f"ArtNet transmit error: {e}")
+                continue
+            t1 = time.perf_counter()
+            with self._stats_lock:
+                self._send_ms.append((t1 - t0) * 1000.0)
+                self._latency_ms.append((t1 - min(t for _, t in pending.values())) * 1000.0)
+                for output_id in pending:
+                    self.sent[output_id] = self.sent.get(output_id, 0) + 1
+
+    # ── metrics ──────────────────────────────────────────────────────────────
+
+    def get_stats(self) -> dict:
+        """Queue-to-wire latency and send time (ms, last 100 frames), per-output counters."""
+        with self._stats_lock:
+            latency = list(self._latency_ms)
+            send = list(self._send_ms)
+            sent = dict(self.sent)
+        dropped = dict(self.mailbox.dropped)
+        return {
+            'running': self.is_running,
+            'frames_published': self.published,
+            'send_errors': self.send_errors,
+            'latency_ms': _summary(latency),
+            'send_ms': _summary(send),
+            'outputs': {
+                oid: {'sent': sent.get(oid, 0), 'dropped': dropped.get(oid, 0)}
+                for oid in sorted(set(sent) | set(dropped))
+            },
+        }
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self._latency_ms.clear()
+            self._send_ms.clear()
+            self.sent.clear()
+            self.published = 0
+            self.send_errors = 0
+        self.mailbox.dropped.clear()
+
+
+def _summary(values) -> dict:
+    if not values:
+        return {'last': None, 'avg': None, 'max': None}
+    return {
+        'last': round(values[-1], 3),
+        'avg': round(sum(values) / len(values), 3),
+        'max': round(max(values), 3),
+    }
@@ -30,7 +30,7 @@ except ImportError:
 try:
     import sounddevice as sd
     SOUNDDEVICE_AVAILABLE = True
-except ImportError:
+except (ImportError, OSError):  # OSError: PortAudio library not found
     SOUNDDEVICE_AVAILABLE = False
 
 AUDIO_AVAILABLE = AV_AVAILABLE and SOUNDDEVICE_AVAILABLE
@@ -64,6 +64,10 @@ class AudioEngine:
         self._audio_queue = queue.Queue(maxsize=10) if AUDIO_AVAILABLE else None
         self._seek_requested = False
         self._seek_position = 0.0
+        # Samples handed to the output queue / taken by the audio callback
+        # (one writer each, so the callback never waits for _lock)
+        self._samples_queued = 0
+        self._samples_played = 0
         
     def load(self, file_path: str) -> Dict:
         """Load audio file and return metadata
@@ -181,6 +185,7 @@ class AudioEngine:
                         self._audio_queue.get_nowait()
                     except queue.Empty:
                         break
+            self._samples_queued = self._samples_played = 0
             
             logger.debug("⏹️ Playback stopped")
     
@@ -210,6 +215,7 @@ class AudioEngine:
                         self._audio_queue.get_nowait()
                     except queue.Empty:
                         break
+            self._samples_queued = self._samples_played = 0
             
             logger.debug(f"⏩ Seek to {position:.2f}s")
     
@@ -222,6 +228,26 @@ class AudioEngine:
         with self._lock:
             return self.current_position
     
+    def get_audible_position(self) -> float:
+        """Get the position currently leaving the speakers, in seconds
+        
+        get_position() is the decode position, which runs ahead of the
+        output by the queued audio and the output stream latency.
+        
+        Returns:
+            Position in seconds
+        """
+        with self._lock:
+            position = self.current_position
+            if not self.is_playing:
+                return position
+        pending = max(0, self._samples_queued - self._samples_played) / self.sample_rate
+        try:
+            latency = float(self.stream.latency) if self.stream is not None else 0.0
+        except Exception:
+            latency = 0.0
+        return max(0.0, position - pending - latency)
+    
     def get_duration(self) -> float:
         """Get total duration in seconds
         
@@ -246,6 +272,7 @@ class AudioEngine:
         try:
             # Get audio data from queue (non-blocking)
             data = self._audio_queue.get_nowait()
+            self._samples_played += data.shape[0]
             
             # Ensure correct shape (frames, channels)
             if data.shape[0] < frames:
@@ -340,6 +367,7 @@ class AudioEngine:
                 # Queue audio data (blocking if queue full)
                 try:
                     self._audio_queue.put(audio_data, timeout=1.0)
+                    self._samples_queued += audio_data.shape[0]
                 except queue.Full:
                     if self._stop_playback:
                         break
@@ -2,15 +2,28 @@
 Audio Sequencer - Main controller for audio-driven timeline
 
 Coordinates AudioEngine and AudioTimeline to:
-- Monitor playback position (50ms loop)
+- Monitor playback position (100ms loop)
+- Schedule slot switches ahead of the next split (frame-accurate)
 - Detect slot boundary crossings
 - Trigger master/slave playlist advances
 - Provide callbacks for UI updates
+
+Slot switches are predicted from the timeline instead of reacting to a
+crossing seen up to one monitor interval late: PREARM_SECONDS before a
+split the players prepare the next slot's clips, SCHEDULE_SECONDS before
+it the monitor (which wakes up for exactly that) hands them over together
+with the split's perf_counter timestamp, and every play loop swaps its
+clip in on the render frame nearest to it.  The timestamp is taken from
+the audible position (decode position minus queued audio and output
+latency).  The difference between each player's swap and the split is
+reported by get_switch_stats().
 """
 
+import bisect
 import threading
 import time
-from typing import Optional, Callable, Dict
+from collections import deque
+from typing import Optional, Callable, Dict, Tuple
 from .engine import AudioEngine
 from .timeline import AudioTimeline
 from ..core.logger import get_logger
@@ -30,6 +43,11 @@ class AudioSequencer:
     # Monitoring interval (seconds)
     MONITOR_INTERVAL = 0.1  # 100ms = 10 updates/sec (reduced from 50ms for performance)
     
+    # Prepare the next slot's clips this long before its split (seconds)
+    PREARM_SECONDS = 2.0
+    # Hand the prepared clips to the players this long before the split (seconds)
+    SCHEDULE_SECONDS = 0.25
+    
     def __init__(self, player_manager=None):
         self.engine = AudioEngine()
         self.timeline = AudioTimeline()
@@ -44,6 +62,16 @@ class AudioSequencer:
         self.on_slot_change: Optional[Callable[[int], None]] = None
         self.on_position_update: Optional[Callable[[float, Optional[int]], None]] = None
         
+        # Predictive switching: (position, perf_counter) of the last position change,
+        # the slot whose clips are being prepared and the switch handed to the players
+        self._clock: Optional[Tuple[float, float]] = None
+        self._armed_slot: Optional[int] = None
+        self._scheduled: Optional[Dict] = None   # {'slot', 'at', 'players'}
+        self._switch_lock = threading.Lock()
+        self._switch_errors_ms: deque = deque(maxlen=100)   # player swap - split
+        self.scheduled_switches = 0
+        self.unscheduled_switches = 0
+        
         logger.info("🎵 AudioSequencer initialized")
     
     def load_audio(self, file_path: str) -> Dict:
@@ -99,12 +127,14 @@ class AudioSequencer:
     def pause(self):
         """Pause playback (monitoring continues)"""
         self.engine.pause()
+        self._cancel_scheduled()
         logger.info("⏸️ Sequencer playback paused")
     
     def stop(self):
         """Stop playback and reset"""
         self.engine.stop()
         self._stop_monitoring()
+        self._cancel_scheduled()
         self.current_slot_index = None
         logger.info("⏹️ Sequencer playback stopped")
     
@@ -115,6 +145,7 @@ class AudioSequencer:
             position: Target position in seconds
         """
         self.engine.seek(position)
+        self._cancel_scheduled()
         
         # Update current slot immediately
         new_slot = self.timeline.get_current_slot(position)
@@ -144,6 +175,7 @@ class AudioSequencer:
         """
         success = self.timeline.add_split(time)
         if success:
+            self._cancel_scheduled()
             # Recalculate current slot
             position = self.get_position()
             self.current_slot_index = self.timeline.get_current_slot(position)
@@ -160,6 +192,7 @@ class AudioSequencer:
         """
         success = self.timeline.remove_split(time)
         if success:
+            self._cancel_scheduled()
             # Recalculate current slot
             position = self.get_position()
             self.current_slot_index = self.timeline.get_current_slot(position)
@@ -183,7 +216,7 @@ class AudioSequencer:
         self.timeline.set_clip_mapping(slot_index, clip_name)
     
     def _start_monitoring(self):
-        """Start monitoring thread (50ms interval)"""
+        """Start monitoring thread (100ms interval)"""
         if self.monitor_active:
             return
         
@@ -210,8 +243,13 @@ class AudioSequencer:
         logger.debug("🔄 Monitor loop started")
         
         while self.monitor_active:
+            wait = self.MONITOR_INTERVAL
             try:
-                position = self.engine.get_position()
+                position, now = self._audio_clock()
+                
+                # Prepare / schedule the next split ahead of time
+                if self.engine.is_playing and self.player_manager:
+                    wait = self._schedule_next_split(position, now)
                 
                 # Check for slot change
                 current_slot = self.timeline.get_current_slot(position)
@@ -238,7 +276,7 @@ class AudioSequencer:
             except Exception as e:
                 logger.error(f"❌ Monitor loop error: {e}", exc_info=True)
             
-            time.sleep(self.MONITOR_INTERVAL)
+            time.sleep(wait)
         
         logger.debug("🔄 Monitor loop finished")
     
@@ -255,10 +293,20 @@ class AudioSequencer:
         """
         logger.info(f"🎬 Slot change: {new_slot_index}")
         
-        # Trigger master/slave advance via player_manager
+        with self._switch_lock:
+            scheduled, self._scheduled = self._scheduled, None
+        if scheduled is not None and scheduled['slot'] != new_slot_index:
+            scheduled = None
+        if scheduled is None:
+            self.unscheduled_switches += 1
+        
+        # Trigger master/slave advance via player_manager (players with a
+        # scheduled switch have already been handed their clip)
         if self.player_manager:
             try:
-                self.player_manager.sequencer_advance_slaves(new_slot_index)
+                self.player_manager.sequencer_advance_slaves(
+                    new_slot_index, skip=scheduled['players'] if scheduled else None
+                )
             except Exception as e:
                 logger.error(f"❌ Failed to advance slaves: {e}", exc_info=True)
         else:
@@ -271,6 +319,95 @@ class AudioSequencer:
             except Exception as e:
                 logger.error(f"❌ Slot change callback error: {e}")
     
+    # ─── Predictive switching ─────────────────────────────────────────────────
+    
+    def _audio_clock(self) -> Tuple[float, float]:
+        """Audible position and the perf_counter time it applies to
+        
+        The engine's position advances in steps (one decoded frame or audio
+        callback at a time); in between it is extrapolated from the last step.
+        """
+        now = time.perf_counter()
+        position = self.engine.get_audible_position()
+        if not self.engine.is_playing:
+            self._clock = None
+            return position, now
+        if self._clock is None or position != self._clock[0]:
+            self._clock = (position, now)
+            return position, now
+        anchor, anchor_time = self._clock
+        return anchor + min(now - anchor_time, self.MONITOR_INTERVAL), now
+    
+    def _schedule_next_split(self, position: float, now: float) -> float:
+        """Pre-arm and schedule the upcoming split
+        
+        Returns:
+            Seconds until the monitor loop should run again
+        """
+        splits = self.timeline.splits
+        i = bisect.bisect_right(splits, position)
+        if i >= len(splits):
+            return self.MONITOR_INTERVAL
+        split = splits[i]
+        slot = i + 1
+        remaining = split - position
+        
+        if remaining <= self.PREARM_SECONDS and self._armed_slot != slot:
+            self._armed_slot = slot
+            self.player_manager.sequencer_prearm_slot(slot)
+        
+        with self._switch_lock:
+            already = self._scheduled is not None and self._scheduled['slot'] == slot
+        if already:
+            return self.MONITOR_INTERVAL
+        if remaining <= self.SCHEDULE_SECONDS:
+            at = now + remaining
+            players = self.player_manager.sequencer_schedule_slot(
+                slot, at, on_commit=lambda pid, t, at=at: self._record_switch(pid, t, at)
+            )
+            with self._switch_lock:
+                self._scheduled = {'slot': slot, 'at': at, 'players': players}
+            self.scheduled_switches += 1
+            logger.debug(f"⏱️ Slot {slot} scheduled for split {split:.3f}s "
+                         f"(in {remaining * 1000:.0f} ms, {len(players)} players)")
+            return self.MONITOR_INTERVAL
+        # Wake up in time to schedule it
+        return max(0.001, min(self.MONITOR_INTERVAL, remaining - self.SCHEDULE_SECONDS))
+    
+    def _record_switch(self, player_id: str, committed_at: float, split_at: float):
+        error_ms = (committed_at - split_at) * 1000.0
+        with self._switch_lock:
+            self._switch_errors_ms.append(error_ms)
+        logger.debug(f"🎯 {player_id} switched {error_ms:+.1f} ms from the split")
+    
+    def _cancel_scheduled(self):
+        """Drop prepared and scheduled clips (seek, pause, stop, timeline edit)"""
+        with self._switch_lock:
+            scheduled, self._scheduled = self._scheduled, None
+        self._armed_slot = None
+        self._clock = None
+        if not self.player_manager:
+            return
+        slave_switch = getattr(self.player_manager, 'slave_switch', None)
+        if slave_switch is not None:
+            slave_switch.cancel()
+        for player_id in (scheduled['players'] if scheduled else ()):
+            player = self.player_manager.players.get(player_id)
+            if player is not None and hasattr(player, 'cancel_clip_switch'):
+                player.cancel_clip_switch()
+    
+    def get_switch_stats(self) -> Dict:
+        """Audio-to-video switch error (player swap minus split time, ms) over the last 100 swaps"""
+        with self._switch_lock:
+            errors = list(self._switch_errors_ms)
+        return {
+            'scheduled_switches': self.scheduled_switches,
+            'unscheduled_switches': self.unscheduled_switches,
+            'last_error_ms': round(errors[-1], 3) if errors else None,
+            'avg_error_ms': round(sum(errors) / len(errors), 3) if errors else None,
+            'max_abs_error_ms': round(max(abs(e) for e in errors), 3) if errors else None,
+        }
+    
     def cleanup(self):
         """Cleanup resources"""
         self.stop()
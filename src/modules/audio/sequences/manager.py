@@ -495,6 +495,15 @@ class SequenceManager:
                 if self._update_counter % 120 == 0 and value is not None:  # Log less frequently
                     logger.debug(f"📡 Emitted parameter_update: {param_uid[:50]}... = {value:.2f}")
     
+    def resolve_parameter(self, uid: str, player_manager):
+        """
+        Live location of a parameter UID (for other modulation sources, e.g. DMX input).
+
+        Returns:
+            Tuple of (player, effect_instance, param_name) or None if not found
+        """
+        return self._resolve_uid_to_path(uid, player_manager)
+    
     def _resolve_uid_to_path(self, uid: str, player_manager):
         """
         Resolve UID to actual parameter location (player, effect instance, param name)
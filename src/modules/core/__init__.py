@@ -1,3 +1,3 @@
 """Core Utilities - Constants, logging, config, validation"""
 
-__all__ = ['constants', 'logger', 'config', 'utils', 'validator']
+__all__ = ['constants', 'logger', 'config', 'utils', 'validator', 'catalogue']
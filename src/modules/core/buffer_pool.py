@@ -0,0 +1,263 @@
+"""
+BufferPool — reusable NumPy buffer allocation for the CPU frame path.
+
+CPU-side counterpart of gpu/texture_pool.py.  Buffers are bucketed by byte
+size (rounded up to a power of two, min 4 KiB) so crops and slices of
+varying size can share backing memory.  Acquire before use, release after —
+zero allocator churn / page faults per frame after warmup.
+
+    pool = get_buffer_pool()
+    tmp = pool.acquire((h, w, 3), np.uint16)
+    ...
+    pool.release(tmp)
+
+Per-frame results that leave the function (composited or converted frames
+that the caller keeps as last_video_frame, queues for outputs, ...) cannot
+be released by the producer.  FrameRing covers those: a ring of
+destination frames, each reused one wrap-around later.  By default a ring
+has one slot more than the frames that can still be read after they were
+produced (pipeline hand-offs, zero-copy output queues); producers of such
+references declare them with set_frames_in_flight() and the rings grow to
+match.
+
+Debug mode (performance.buffer_pool_debug) records the acquiring call site
+and time of every buffer so check_leaks() can report buffers that were never
+released.  Allocation counters feed the profiler's allocation-rate metric.
+Thread-safe via internal lock.
+"""
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+_MIN_BUCKET_BYTES = 4096
+
+
+def _bucket_size(nbytes: int) -> int:
+    """Round *nbytes* up to the next power-of-two bucket (>= 4 KiB)."""
+    if nbytes <= _MIN_BUCKET_BYTES:
+        return _MIN_BUCKET_BYTES
+    return 1 << (int(nbytes) - 1).bit_length()
+
+
+class BufferPool:
+    # Maximum idle backing buffers kept per size bucket.  Extra buffers
+    # released beyond this are dropped so a burst never pins memory forever.
+    MAX_IDLE_PER_BUCKET = 8
+    # Window (seconds) over which the allocation rate is reported.
+    RATE_WINDOW_S = 5.0
+
+    def __init__(self, debug: bool = False):
+        # bucket_bytes → list of idle 1-D uint8 backing arrays
+        self._idle: Dict[int, List[np.ndarray]] = {}
+        # id(view) → (bucket_bytes, backing, acquired_at, call_site)
+        self._in_use: Dict[int, Tuple[int, np.ndarray, float, Optional[str]]] = {}
+        self._lock = threading.Lock()
+        self.debug = debug
+
+        # Counters
+        self.allocations = 0          # fresh backing buffers created (pool misses)
+        self.allocated_bytes = 0
+        self.reuses = 0               # acquires served from the idle list
+        self.releases = 0
+        self._alloc_events: deque = deque(maxlen=4096)  # (monotonic, nbytes)
+
+    def acquire(self, shape, dtype=np.uint8, zero: bool = False) -> np.ndarray:
+        """
+        Get a C-contiguous array of *shape*/*dtype* backed by pooled memory.
+
+        Contents are undefined unless *zero* is True.  The array must be
+        handed back with release() once the caller no longer references it.
+        """
+        dtype = np.dtype(dtype)
+        shape = tuple(int(s) for s in (shape if isinstance(shape, (tuple, list)) else (shape,)))
+        nbytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+        bucket = _bucket_size(nbytes)
+
+        with self._lock:
+            idle = self._idle.get(bucket)
+            if idle:
+                backing = idle.pop()
+                self.reuses += 1
+            else:
+                backing = np.empty(bucket, dtype=np.uint8)
+                self.allocations += 1
+                self.allocated_bytes += bucket
+                self._alloc_events.append((time.monotonic(), bucket))
+
+            arr = backing[:nbytes].view(dtype).reshape(shape)
+            site = None
+            if self.debug:
+                site = ''.join(traceback.format_stack(limit=4)[:-1])
+            self._in_use[id(arr)] = (bucket, backing, time.monotonic(), site)
+
+        if zero:
+            arr.fill(0)
+        return arr
+
+    def release(self, arr: Optional[np.ndarray]) -> None:
+        """Return an array obtained from acquire() to the pool."""
+        if arr is None:
+            return
+        with self._lock:
+            entry = self._in_use.pop(id(arr), None)
+            if entry is None:
+                if self.debug:
+                    logger.warning(
+                        f"BufferPool: release() of unknown or already released buffer "
+                        f"shape={getattr(arr, 'shape', None)}\n"
+                        + ''.join(traceback.format_stack(limit=4)[:-1])
+                    )
+                return
+            bucket, backing, _, _ = entry
+            idle = self._idle.setdefault(bucket, [])
+            if len(idle) < self.MAX_IDLE_PER_BUCKET:
+                idle.append(backing)
+            self.releases += 1
+
+    def check_leaks(self, max_age_s: float = 5.0) -> List[dict]:
+        """
+        Report buffers held longer than *max_age_s* (likely missing release()).
+
+        Call sites are only available when debug mode is enabled.
+        """
+        now = time.monotonic()
+        with self._lock:
+            leaks = [
+                {'bytes': bucket, 'age_s': round(now - acquired, 2), 'site': site}
+                for bucket, _, acquired, site in self._in_use.values()
+                if now - acquired > max_age_s
+            ]
+        if leaks and self.debug:
+            for leak in leaks:
+                logger.warning(
+                    f"BufferPool: buffer of {leak['bytes']} B held for {leak['age_s']} s, "
+                    f"acquired at:\n{leak['site']}"
+                )
+        return leaks
+
+    def allocation_rate(self) -> Tuple[float, float]:
+        """Fresh allocations per second and bytes per second over RATE_WINDOW_S."""
+        cutoff = time.monotonic() - self.RATE_WINDOW_S
+        with self._lock:
+            recent = [n for t, n in self._alloc_events if t >= cutoff]
+        return len(recent) / self.RATE_WINDOW_S, sum(recent) / self.RATE_WINDOW_S
+
+    def get_stats(self) -> dict:
+        """Pool counters for the performance API (runs leak check in debug mode)."""
+        allocs_per_s, bytes_per_s = self.allocation_rate()
+        leaks = len(self.check_leaks()) if self.debug else None
+        with self._lock:
+            idle_bytes = sum(b * len(lst) for b, lst in self._idle.items())
+            in_use_bytes = sum(entry[0] for entry in self._in_use.values())
+            return {
+                'allocations': self.allocations,
+                'allocated_mb': round(self.allocated_bytes / 1048576, 2),
+                'reuses': self.reuses,
+                'releases': self.releases,
+                'in_use': len(self._in_use),
+                'in_use_mb': round(in_use_bytes / 1048576, 2),
+                'idle_mb': round(idle_bytes / 1048576, 2),
+                'allocs_per_s': round(allocs_per_s, 2),
+                'alloc_mb_per_s': round(bytes_per_s / 1048576, 2),
+                'debug': self.debug,
+                'leaks': leaks,
+            }
+
+    def clear(self) -> None:
+        """Drop all idle buffers (in-use buffers stay valid)."""
+        with self._lock:
+            self._idle.clear()
+
+
+# Frames still referenced after they were produced, per owner (player name)
+_frames_in_flight: Dict[str, int] = {}
+_frames_in_flight_max = 0
+_frames_in_flight_lock = threading.Lock()
+_MIN_RING_SIZE = 4
+
+
+def set_frames_in_flight(owner: str, count: int) -> None:
+    """Declare how many produced frames *owner* may still be reading (0 = none)."""
+    global _frames_in_flight_max
+    with _frames_in_flight_lock:
+        if count > 0:
+            _frames_in_flight[owner] = int(count)
+        else:
+            _frames_in_flight.pop(owner, None)
+        _frames_in_flight_max = max(_frames_in_flight.values(), default=0)
+
+
+def frames_in_flight() -> int:
+    """Largest number of frames any owner may still be reading."""
+    return _frames_in_flight_max
+
+
+class FrameRing:
+    """
+    Ring of destination frames for per-frame results.
+
+    next() returns the slot after the previous one; a returned frame stays
+    valid until the ring wraps around.  With a fixed *size* that is *size*
+    calls later; without, the ring keeps frames_in_flight() + 1 slots (at
+    least 4) and grows when more frames are declared in flight.  Slots are
+    reallocated only when the requested shape or dtype changes.
+    """
+
+    def __init__(self, size: Optional[int] = None):
+        self._fixed = max(1, int(size)) if size is not None else None
+        self._slots: List[Optional[np.ndarray]] = [None] * (self._fixed or _MIN_RING_SIZE)
+        self._index = 0
+        self.allocations = 0
+
+    @property
+    def size(self) -> int:
+        return len(self._slots)
+
+    def next(self, shape, dtype=np.uint8) -> np.ndarray:
+        """Destination frame of *shape*/*dtype* (contents undefined)."""
+        dtype = np.dtype(dtype)
+        shape = tuple(int(s) for s in shape)
+        i = self._index
+        if self._fixed is None:
+            grow = frames_in_flight() + 1 - len(self._slots)
+            if grow > 0:
+                # New slots go in front of the oldest frame, so every frame
+                # handed out so far lives one full (larger) wrap-around
+                self._slots[i:i] = [None] * grow
+        self._index = (i + 1) % len(self._slots)
+        frame = self._slots[i]
+        if frame is None or frame.shape != shape or frame.dtype != dtype:
+            frame = np.empty(shape, dtype=dtype)
+            self._slots[i] = frame
+            self.allocations += 1
+        return frame
+
+
+# ---------------------------------------------------------------------------
+# Module-level singleton
+# ---------------------------------------------------------------------------
+
+_pool: BufferPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_buffer_pool() -> BufferPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = BufferPool()
+    return _pool
+
+
+def set_buffer_pool_debug(enabled: bool) -> None:
+    """Enable/disable call-site tracking for leak detection (typically from config)."""
+    get_buffer_pool().debug = enabled
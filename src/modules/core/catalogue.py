@@ -0,0 +1,138 @@
+"""
+File Catalogue - cached metadata listings of content directories.
+
+Dialogs that list recordings or projects used to open and parse every file
+just to show a name, a duration and a date.  A FileCatalogue keeps the
+extracted metadata per file together with the file's mtime and size, in
+memory and in a small JSON cache file inside the directory.  Listing then
+costs one stat per file; only new or modified files are read again.
+"""
+
+import json
+import os
+import threading
+from typing import Callable, Dict, List, Optional
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_FILENAME = '.catalogue.json'
+_CACHE_VERSION = 1
+
+
+class FileCatalogue:
+    """Metadata of all files with a given suffix in one directory, invalidated by mtime."""
+
+    def __init__(self, directory: str, suffix: str, reader: Callable[[str], dict],
+                 cache_file: Optional[str] = CACHE_FILENAME):
+        """
+        Args:
+            directory: Directory to list
+            suffix: File suffix to include (e.g. '.json')
+            reader: path → metadata dict (only called for new/modified files)
+            cache_file: Cache file name inside *directory* (None = memory only)
+        """
+        self.directory = str(directory)
+        self.suffix = suffix
+        self.reader = reader
+        self.cache_path = os.path.join(self.directory, cache_file) if cache_file else None
+        self._entries: Dict[str, dict] = {}   # filename → {'mtime_ns', 'size', 'meta'}
+        self._lock = threading.Lock()
+        self._loaded = False
+        self.reads = 0   # reader calls (files actually opened)
+
+    def _load(self) -> None:
+        self._loaded = True
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == _CACHE_VERSION and data.get('suffix') == self.suffix:
+                self._entries = data.get('entries', {})
+        except Exception as e:
+            logger.warning(f"Ignoring catalogue cache {self.cache_path}: {e}")
+
+    def _save(self) -> None:
+        if not self.cache_path:
+            return
+        tmp = self.cache_path + '.tmp'
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'version': _CACHE_VERSION, 'suffix': self.suffix, 'entries': self._entries}, f)
+            os.replace(tmp, self.cache_path)
+        except Exception as e:
+            logger.warning(f"Could not write catalogue cache {self.cache_path}: {e}")
+
+    def list(self) -> List[dict]:
+        """
+        Metadata of every file (unordered), refreshed where mtime or size changed.
+
+        Returns:
+            List of reader dicts extended with 'filename', 'size' and 'modified'
+            (files the reader fails on are skipped)
+        """
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            changed = False
+            seen = set()
+            result = []
+            try:
+                scan = list(os.scandir(self.directory))
+            except FileNotFoundError:
+                scan = []
+            for entry in scan:
+                name = entry.name
+                if not name.endswith(self.suffix) or name == os.path.basename(self.cache_path or ''):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                if not entry.is_file():
+                    continue
+                seen.add(name)
+                cached = self._entries.get(name)
+                if cached is None or cached['mtime_ns'] != st.st_mtime_ns or cached['size'] != st.st_size:
+                    cached = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'meta': self._read(entry.path)}
+                    self._entries[name] = cached
+                    changed = True
+                if cached['meta'] is not None:
+                    item = dict(cached['meta'])
+                    item.update(filename=name, size=st.st_size, modified=st.st_mtime)
+                    result.append(item)
+            for name in [name for name in self._entries if name not in seen]:
+                del self._entries[name]
+                changed = True
+            if changed:
+                self._save()
+            return result
+
+    def _read(self, path: str) -> Optional[dict]:
+        self.reads += 1
+        try:
+            return self.reader(path)
+        except Exception as e:
+            # Cached as unreadable until the file changes again
+            logger.warning(f"Could not read {os.path.basename(path)}: {e}")
+            return None
+
+    def put(self, filename: str, meta: dict) -> None:
+        """Record metadata of a file just written (saves re-reading it on the next list)."""
+        path = os.path.join(self.directory, filename)
+        st = os.stat(path)
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            self._entries[filename] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'meta': dict(meta)}
+            self._save()
+
+    def invalidate(self, filename: Optional[str] = None) -> None:
+        """Forget one file (or everything) so it is read again on the next list."""
+        with self._lock:
+            if filename is None:
+                self._entries = {}
+            else:
+                self._entries.pop(filename, None)
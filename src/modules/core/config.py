@@ -36,6 +36,54 @@ CONFIG_SCHEMA = {
                 "broadcast": {
                     "type": "boolean",
                     "description": "Art-Net Broadcast Mode"
+                },
+                "shard_workers": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "maximum": 64,
+                    "description": "Worker processes rendering/sending Art-Net outputs (0 = off)"
+                }
+            }
+        },
+        "dmx_input": {
+            "type": "object",
+            "properties": {
+                "enabled": {
+                    "type": "boolean",
+                    "description": "Receive Art-Net/sACN from a lighting console"
+                },
+                "bind_ip": {
+                    "type": "string",
+                    "description": "Local address to listen on"
+                },
+                "artnet_port": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "maximum": 65535,
+                    "description": "Art-Net input port"
+                },
+                "sacn_port": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "maximum": 65535,
+                    "description": "sACN (E1.31) input port"
+                },
+                "mappings": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "required": ["target"],
+                        "properties": {
+                            "target": {"type": "string"},
+                            "protocol": {"type": "string", "enum": ["artnet", "sacn"]},
+                            "universe": {"type": "integer", "minimum": 0},
+                            "channel": {"type": "integer", "minimum": 1, "maximum": 512},
+                            "fine": {"type": "boolean"},
+                            "min": {"type": ["number", "null"]},
+                            "max": {"type": ["number", "null"]}
+                        }
+                    },
+                    "description": "DMX channel → parameter mappings"
                 }
             }
         },
@@ -396,7 +444,15 @@ class ConfigValidator:
                 "target_ip": "127.0.0.1",
                 "start_universe": 0,
                 "fps": 60,
-                "broadcast": True
+                "broadcast": True,
+                "shard_workers": 0
+            },
+            "dmx_input": {
+                "enabled": False,
+                "bind_ip": "0.0.0.0",
+                "artnet_port": 6454,
+                "sacn_port": 5568,
+                "mappings": []
             },
             "video": {
                 "extensions": [".mp4", ".avi", ".mov", ".mkv", ".wmv"],
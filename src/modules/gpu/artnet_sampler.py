@@ -38,6 +38,10 @@ class ArtNetGPUSampler:
         2. sample(gpu_frame)                              — call after each composite
         3. get_pixel_buffer()                             — {obj_id: (N,3) uint8 RGB}
 
+    Each LED is point-sampled.  Area-sampled objects (sample_size > 0) must
+    not be passed to build_positions(); RoutingBridge averages them on the CPU
+    through PixelSampler's integral image.
+
     Triple-buffer readback ring
     ---------------------------
     On AMD Vulkan, map_sync on the *current* staging buffer stalls the GPU
@@ -78,22 +82,22 @@ class ArtNetGPUSampler:
             return
         self._last_build_key = build_key
 
-        all_uvs: list[tuple[float, float]] = []
+        uv_parts: list[np.ndarray] = []
         offsets: dict[str, tuple[int, int]] = {}
+        start = 0
 
         for obj_id, obj in objects.items():
             if not obj.points:
                 continue
-            start = len(all_uvs)
-            for p in obj.points:
-                all_uvs.append((p.x / canvas_w, p.y / canvas_h))
+            uv_parts.append(np.column_stack((obj.points.xs / canvas_w, obj.points.ys / canvas_h)))
             offsets[obj_id] = (start, len(obj.points))
+            start += len(obj.points)
 
-        if not all_uvs:
+        if not uv_parts:
             self._ready = False
             return
 
-        self._n_leds = len(all_uvs)
+        self._n_leds = start
         self._obj_offsets = offsets
 
         device = get_device()
@@ -122,7 +126,7 @@ class ArtNetGPUSampler:
         self._ring_submitted = [False] * _RING
         self._all_rgb = np.empty((self._n_leds, 3), dtype=np.uint8)
 
-        pos_data = np.array(all_uvs, dtype=np.float32)
+        pos_data = np.concatenate(uv_parts).astype(np.float32)
         self._pos_buf = device.create_buffer_with_data(
             data=pos_data.tobytes(),
             usage=wgpu.BufferUsage.STORAGE,
@@ -204,8 +208,10 @@ class ArtNetGPUSampler:
         self._all_rgb[:, 1] = ((packed >> 8) & 0xFF).astype(np.uint8)
         self._all_rgb[:, 2] = ((packed >> 16) & 0xFF).astype(np.uint8)
 
+        # One copy per frame; per-object entries are views into it.
+        rgb = self._all_rgb.copy()
         self._pixel_buffer = {
-            obj_id: self._all_rgb[start:start + count].copy()
+            obj_id: rgb[start:start + count]
             for obj_id, (start, count) in self._obj_offsets.items()
         }
 
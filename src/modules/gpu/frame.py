@@ -14,6 +14,7 @@ import cv2
 import numpy as np
 import wgpu
 from .context import get_device
+from ..core.buffer_pool import FrameRing
 from ..core.logger import get_logger
 
 logger = get_logger(__name__)
@@ -86,6 +87,8 @@ class GPUFrame:
         # by wgpu-native waiting for ALL previously-submitted GPU work (not just
         # the buffer copy) before releasing the write lock.
         self._rgba_buf: np.ndarray = np.empty((height, width, _BPP), dtype=np.uint8)
+        # BGR destinations for download(); allocated on first use.
+        self._bgr_ring: FrameRing | None = None
 
     # ------------------------------------------------------------------
     # Upload
@@ -130,6 +133,9 @@ class GPUFrame:
         read on the just-submitted slot.
         The ring is lazy-initialised on the first call (extra staging buffers
         only allocated when download() is actually used).
+        The returned array comes from a FrameRing and is overwritten one
+        wrap-around later (see buffer_pool.set_frames_in_flight) — copy it
+        if it must live longer.
         """
         device = get_device()
         w, h = self.width, self.height
@@ -171,8 +177,10 @@ class GPUFrame:
 
         # Strip D3D12 row padding, then convert RGBA → BGR via cv2 (SIMD).
         padded = np.frombuffer(raw, dtype=np.uint8).reshape(h, self._staging_bpr)
-        rgba = np.ascontiguousarray(padded[:, : w * _BPP].reshape(h, w, _BPP))
-        return cv2.cvtColor(rgba, cv2.COLOR_RGBA2BGR)
+        rgba = padded[:, : w * _BPP].reshape(h, w, _BPP)
+        if self._bgr_ring is None:
+            self._bgr_ring = FrameRing()
+        return cv2.cvtColor(rgba, cv2.COLOR_RGBA2BGR, dst=self._bgr_ring.next((h, w, 3)))
 
     # ------------------------------------------------------------------
     # Pixel sampling (Art-Net)
@@ -22,6 +22,8 @@ from typing import Dict, List, Optional
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
+from ..core.buffer_pool import get_buffer_pool
+
 @dataclass
 class StageMetrics:
     """Metrics for a single processing stage."""
@@ -54,6 +56,7 @@ class PerformanceProfiler:
         'preview_encode',       # MJPEG thumbnail encode (PIL resize + simplejpeg)
         'player_effects',       # Player-level effects
         'audio_sequences',      # Audio-driven parameter modulation
+        'dmx_input',            # Lighting-console DMX applied to parameters
         'transitions',          # Crossfade/transition effects
         'background_composite', # Background image overlay
         'autosize_scale',       # GPU scale pass when source res ≠ canvas (scale_mode.wgsl)
@@ -136,7 +139,27 @@ class PerformanceProfiler:
             # GIL-atomic writes — no lock needed for known stages
             timings.append(elapsed_ms)
             self._current_frame_times[stage_name] = elapsed_ms
-    
+
+    def record_stage(self, stage_name: str, elapsed_ms: float):
+        """
+        Record an externally measured duration for a stage.
+
+        Used for timings that cannot be wrapped in profile_stage(), e.g. the
+        time a frame spent waiting in a pipeline hand-off slot before a worker
+        thread picked it up.
+        """
+        if not self.enabled:
+            return
+        timings = self._timings.get(stage_name)
+        if timings is None:
+            with self._lock:
+                if stage_name not in self._timings:
+                    self._timings[stage_name] = deque(maxlen=self.history_size)
+                    self._current_frame_times[stage_name] = 0.0
+            timings = self._timings[stage_name]
+        timings.append(elapsed_ms)
+        self._current_frame_times[stage_name] = elapsed_ms
+
     def record_frame_complete(self, frame_start_perf: float = None, source_fps: float = None):
         """Mark end of frame processing and record total time.
 
@@ -226,6 +249,9 @@ class PerformanceProfiler:
                     'performance_ratio': round((1000.0 / self._source_fps / total_avg) if (self._source_fps > 0 and total_avg > 0) else 0, 2),
                 },
                 'stages': stages_data,
+                # CPU buffer pool (shared by all players): allocation rate shows
+                # remaining per-frame allocator churn on the CPU path.
+                'buffer_pool': get_buffer_pool().get_stats(),
                 'unaccounted_ms': round(
                     max(0.0, total_avg - sum(
                         s['avg_ms'] for s in stages_data if s['avg_ms'] > 0
@@ -0,0 +1,318 @@
+"""
+Clip Switch - pre-armed, parallel master/slave clip switching.
+
+Previously a master clip change called load_clip_by_index() on every slave,
+one after another, from the master's render thread: each slave stopped its
+play loop, built and initialized its sources, then restarted — so the last
+slave switched visibly later than the first and the master stalled for the
+sum of all loads.
+
+Now the switch is split into two phases:
+
+    prepare  Player.prepare_clip(index) builds and initializes the slave's
+             next layer stack on a SlaveSwitch worker while the current one
+             keeps rendering.  The master triggers this shortly before its
+             clip ends (performance.slave_prearm_seconds), so by the time it
+             switches, every slave's next clip is already armed.
+
+    commit   On the master clip change all prepared clips are handed to the
+             slaves in one step (Player.request_clip_switch) together with a
+             shared target time one frame ahead (of the slowest slave); every
+             play loop swaps its stack in on the frame nearest to that
+             instant — a pointer swap, no thread restart.  The players keep
+             independent frame clocks, so the slaves agree to within half a
+             frame instead of each switching whenever its clip arrived.
+
+If a switch was not pre-armed (manual clip change, very short clip) the
+slaves are still prepared in parallel, off the master's thread.
+
+The audio sequencer schedules its switches ahead of a split instead: the
+commit carries the split's perf_counter timestamp and each play loop swaps
+the clip in on the frame nearest to it (Player.request_clip_switch(at=...)).
+
+The time between the master's switch and the last slave adopting it is
+recorded as the inter-player skew (get_stats(), /api/player/sync_status).
+"""
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Max time to wait for a slave's clip to be prepared before giving up.
+PREPARE_TIMEOUT_S = 30.0
+
+# Upper bound for the shared commit lead (slow or unthrottled slaves).
+MAX_COMMIT_LEAD_S = 0.1
+
+
+class PreparedClip:
+    """A slave's next clip, fully initialized and ready to be swapped in."""
+
+    __slots__ = ('index', 'clip_item', 'clip_id', 'source', 'layers', 'transition', 'prepared_at')
+
+    def __init__(self, index: int, clip_item: str, clip_id: Optional[str], source,
+                 layers=None, transition: Optional[dict] = None):
+        self.index = index
+        self.clip_item = clip_item
+        self.clip_id = clip_id
+        self.source = source          # base source (layer 0)
+        self.layers = layers          # PreparedLayers, or None without a clip registry
+        self.transition = transition  # transition_manager.configure() kwargs or None
+        self.prepared_at = time.perf_counter()
+
+    def release(self) -> None:
+        """Free the sources of a clip that was never committed."""
+        if self.layers is not None:
+            for layer in self.layers.layers:
+                try:
+                    layer.cleanup()
+                except Exception as e:
+                    logger.warning(f"⚠️ Error releasing prepared layer: {e}")
+        elif self.source is not None:
+            self.source.cleanup()
+        self.layers = None
+        self.source = None
+
+
+class SlaveSwitchCoordinator:
+    """Pre-arms slave clips and commits master clip changes to all slaves."""
+
+    def __init__(self, player_manager, max_workers: int = 4):
+        self._pm = player_manager
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='SlaveSwitch')
+        self._lock = threading.Lock()
+        # player_id → (clip index, Future[PreparedClip])
+        self._armed: Dict[str, Tuple[int, Future]] = {}
+
+        # Skew measurement for the switch in flight
+        self._switch_id = 0
+        self._switch_t0 = 0.0
+        self._switch_pending: set = set()
+        self._switch_last_t = 0.0
+
+        # Stats
+        self.switches = 0
+        self.prearm_hits = 0
+        self.prearm_misses = 0
+        self._skews_ms: deque = deque(maxlen=100)
+
+    # ── slaves ───────────────────────────────────────────────────────────────
+
+    def _slaves(self) -> List[Tuple[str, object]]:
+        # Preview players/sessions show the viewed playlist, not the active one.
+        master = self._pm.master_playlist
+        return [(pid, p) for pid, p in self._pm.players.items()
+                if pid != master and p is not None and 'preview' not in pid]
+
+    @staticmethod
+    def _can_prepare(player, index: int) -> bool:
+        return (hasattr(player, 'prepare_clip')
+                and player.playlist is not None and index < len(player.playlist))
+
+    # ── phase 1: pre-arm ─────────────────────────────────────────────────────
+
+    def prearm(self, clip_index: int) -> None:
+        """
+        Prepare every slave's clip at *clip_index* in the background.
+
+        Idempotent: slaves already armed (or arming) for that index are skipped,
+        so the master may call this on every frame near its clip end.
+        """
+        with self._lock:
+            for pid, player in self._slaves():
+                armed = self._armed.get(pid)
+                if armed is not None and armed[0] == clip_index:
+                    continue
+                if not self._can_prepare(player, clip_index):
+                    continue
+                if armed is not None:
+                    self._discard(armed[1])
+                self._armed[pid] = (clip_index, self._pool.submit(player.prepare_clip, clip_index))
+                logger.debug(f"🎯 Pre-arming slave {pid} for clip index {clip_index}")
+
+    def cancel(self) -> None:
+        """Drop all armed clips (master changed, sequencer took over, ...)."""
+        with self._lock:
+            armed, self._armed = self._armed, {}
+        for _, future in armed.values():
+            self._discard(future)
+
+    @staticmethod
+    def _discard(future: Future) -> None:
+        def _release(f):
+            try:
+                prepared = f.result()
+            except Exception:
+                return
+            if prepared is not None:
+                prepared.release()
+        future.add_done_callback(_release)
+
+    # ── phase 2: commit ──────────────────────────────────────────────────────
+
+    def switch(self, clip_index: int, sync_fallback: Callable, at: Optional[float] = None,
+               on_commit: Optional[Callable[[str, float], None]] = None,
+               on_prepare_failed: Optional[Callable] = None) -> set:
+        """
+        Switch all slaves to *clip_index* after the master changed clip.
+
+        Slaves that cannot take a prepared clip (stopped, out of range, no
+        prepare_clip) go through *sync_fallback(player, index)* — the old
+        load_clip_by_index path.  Never blocks on a slave that is still
+        loading: those commits are finished on a worker thread.
+
+        Args:
+            at: perf_counter time to switch at (None = one frame after the
+                slaves are prepared); skew is then measured from *at*
+            on_commit: Called with (player_id, perf_counter) as each slave swaps
+            on_prepare_failed: Called with (player, index) for a slave whose
+                prepare failed or timed out (default: *sync_fallback*)
+
+        Returns:
+            Ids of the slaves switched with prepared clips.  A slave whose
+            prepare fails is removed from this set when the commit runs and
+            handed to *on_prepare_failed* instead.
+        """
+        t0 = time.perf_counter() if at is None else at
+        futures: Dict[str, Future] = {}
+        fallback = []
+        with self._lock:
+            armed, self._armed = self._armed, {}
+            for pid, player in self._slaves():
+                entry = armed.pop(pid, None)
+                if not (self._can_prepare(player, clip_index) and player.is_playing
+                        and not getattr(player, '_auto_stopped_by_master', False)):
+                    if entry is not None:
+                        self._discard(entry[1])
+                    fallback.append(player)
+                    continue
+                if entry is not None and entry[0] == clip_index:
+                    futures[pid] = entry[1]
+                    self.prearm_hits += 1
+                else:
+                    if entry is not None:
+                        self._discard(entry[1])
+                    futures[pid] = self._pool.submit(player.prepare_clip, clip_index)
+                    self.prearm_misses += 1
+        for _, future in armed.values():
+            self._discard(future)
+
+        for player in fallback:
+            sync_fallback(player, clip_index)
+        if not futures:
+            return set()
+
+        switched = set(futures)
+        failed = on_prepare_failed or sync_fallback
+        if all(f.done() for f in futures.values()):
+            self._commit(clip_index, futures, t0, at, on_commit, failed, switched)
+        else:
+            self._pool.submit(self._commit, clip_index, futures, t0, at, on_commit, failed, switched)
+        return switched
+
+    def _commit(self, clip_index: int, futures: Dict[str, Future], t0: float,
+                at: Optional[float] = None, on_commit: Optional[Callable[[str, float], None]] = None,
+                on_prepare_failed: Optional[Callable] = None, switched: Optional[set] = None) -> None:
+        prepared: Dict[str, object] = {}
+        for pid, future in futures.items():
+            try:
+                clip = future.result(timeout=PREPARE_TIMEOUT_S)
+            except Exception as e:
+                logger.error(f"❌ Preparing slave {pid} for clip {clip_index} failed: {e}")
+                clip = None
+            if clip is not None:
+                prepared[pid] = clip
+                continue
+            # Not switched by us after all: let the caller's sync path take it
+            logger.warning(f"Failed to sync slave {pid} to index {clip_index}, falling back to a direct load")
+            if switched is not None:
+                switched.discard(pid)
+            player = self._pm.players.get(pid)
+            if player is not None and on_prepare_failed is not None:
+                try:
+                    on_prepare_failed(player, clip_index)
+                except Exception as e:
+                    logger.error(f"❌ Fallback load of slave {pid} to index {clip_index} failed: {e}")
+        if not prepared:
+            return
+
+        if at is None:
+            at = time.perf_counter() + self._commit_lead(prepared)
+
+        with self._lock:
+            self._switch_id += 1
+            switch_id = self._switch_id
+            self._switch_t0 = t0
+            self._switch_pending = set(prepared)
+            self._switch_last_t = t0
+            self.switches += 1
+
+        # Publish every slave's clip against the same target time; the
+        # playlist events go out afterwards so they cannot delay a publish.
+        published = []
+        for pid, clip in prepared.items():
+            player = self._pm.players.get(pid)
+            if player is None:
+                clip.release()
+                self._on_slave_committed(switch_id, pid)
+                continue
+            player.request_clip_switch(
+                clip, on_commit=lambda pid=pid: self._on_slave_committed(switch_id, pid, on_commit), at=at
+            )
+            published.append(pid)
+        for pid in published:
+            self._pm._emit_playlist_changed(pid, clip_index)
+
+    def _commit_lead(self, player_ids) -> float:
+        """One frame of the slowest slave: every play loop reaches a frame boundary within it."""
+        lead = 0.0
+        for pid in player_ids:
+            get_interval = getattr(self._pm.players.get(pid), 'get_frame_interval', None)
+            if get_interval is not None:
+                lead = max(lead, get_interval())
+        return min(lead, MAX_COMMIT_LEAD_S)
+
+    def _on_slave_committed(self, switch_id: int, player_id: str,
+                            on_commit: Optional[Callable[[str, float], None]] = None) -> None:
+        now = time.perf_counter()
+        if on_commit is not None:
+            try:
+                on_commit(player_id, now)
+            except Exception as e:
+                logger.error(f"❌ Switch commit callback failed: {e}")
+        with self._lock:
+            if switch_id != self._switch_id or player_id not in self._switch_pending:
+                return
+            self._switch_pending.discard(player_id)
+            self._switch_last_t = max(self._switch_last_t, now)
+            if self._switch_pending:
+                return
+            skew_ms = (self._switch_last_t - self._switch_t0) * 1000.0
+            self._skews_ms.append(skew_ms)
+        logger.debug(f"🔄 Slaves switched (switch #{switch_id}), skew {skew_ms:.1f} ms")
+
+    # ── metrics ──────────────────────────────────────────────────────────────
+
+    def get_stats(self) -> dict:
+        """Switch counters and master→last-slave skew (ms) over the last 100 switches."""
+        with self._lock:
+            skews = list(self._skews_ms)
+            armed = sorted(pid for pid, (_, f) in self._armed.items() if f.done())
+            return {
+                'switches': self.switches,
+                'prearm_hits': self.prearm_hits,
+                'prearm_misses': self.prearm_misses,
+                'armed': armed,
+                'last_skew_ms': round(skews[-1], 3) if skews else None,
+                'avg_skew_ms': round(sum(skews) / len(skews), 3) if skews else None,
+                'max_skew_ms': round(max(skews), 3) if skews else None,
+            }
+
+    def shutdown(self) -> None:
+        self.cancel()
+        self._pool.shutdown(wait=False)
@@ -16,6 +16,7 @@ from .transitions.manager import TransitionManager
 from .effects.processor import EffectProcessor
 from .playlists.manager import PlaylistManager
 from ..performance.profiler import get_profiler
+from ..core.buffer_pool import FrameRing, get_buffer_pool, set_frames_in_flight
 from ..core.constants import (
     DEFAULT_SPEED,
     UNLIMITED_LOOPS,
@@ -147,6 +148,7 @@ class Player:
         
         # Preview Frames
         self.last_video_frame = None  # Last complete frame for preview
+        self._composite_ring = FrameRing()  # _alpha_composite_to_black destinations
         
         # Transition Manager
         self.transition_manager = TransitionManager()
@@ -157,6 +159,11 @@ class Player:
         # FPS regardless of the compositor tick rate.
         self._transition_a_last_time: float = 0.0
         self._transition_a_frame_delay: float = 1.0 / 25.0  # updated on first pull
+
+        # Pre-armed slave clip switch handed over by PlayerManager
+        # (clip_switch.py): (PreparedClip, on_commit) adopted by the play loop.
+        self._pending_clip_switch = None
+        self._clip_switch_lock = threading.Lock()
         
         # Transition Config (default settings for inter-clip transitions)
         self.transition_config = {
@@ -221,6 +228,10 @@ class Player:
         # ArtNet Routing Bridge (NEW - for routing system output)
         self.routing_bridge = None
 
+        # Frame pipeline — created per play loop when performance.pipeline_enabled
+        self._frame_pipeline = None
+        self._frames_in_flight = 0   # declared to the FrameRings, see _declare_frames_in_flight()
+
         # Clip Recording — captures rendered frames to a .npy export
         self._recording: bool = False
         self._record_frames: list = []
@@ -423,11 +434,15 @@ class Player:
           downscaler) set needs_cpu_frame=False on their OutputBase instance so
           they are excluded here automatically.
         - Active clip recording — forces download so frames can be written to disk.
+        - Art-Net sharding — the shard workers sample the CPU composite.
 
         When False, composite_layers() skips the SSBO download.
         """
         if self._recording:
             return True
+        if self.routing_bridge is not None and self.enable_artnet and self.routing_bridge.needs_cpu_frame:
+            self._log_needs_cpu_once('artnet_shards')
+            return True
         if self._fullscreen_subscriber_count > 0 and self._fullscreen_downscaler is None:
             self._log_needs_cpu_once('fullscreen_subscriber')
             return True
@@ -635,23 +650,9 @@ class Player:
         """
         if self.transition_manager.active:
             # ── Update A-buffer with a live frame at the outgoing clip's native FPS ─
-            if self._transition_outgoing_source is not None:
-                try:
-                    now = time.monotonic()
-                    if now - self._transition_a_last_time >= self._transition_a_frame_delay:
-                        a_frame, delay = self._transition_outgoing_source.get_next_frame()
-                        if delay > 0:
-                            self._transition_a_frame_delay = delay
-                        self._transition_a_last_time = now
-                        if a_frame is None:
-                            # Outgoing clip ended — loop it so it keeps playing
-                            self._transition_outgoing_source.reset()
-                            a_frame, _ = self._transition_outgoing_source.get_next_frame()
-                        if a_frame is not None and isinstance(a_frame, np.ndarray) \
-                                and self.transition_manager._gpu_renderer is not None:
-                            self.transition_manager._gpu_renderer.store_cpu_frame(a_frame)
-                except Exception as e:
-                    logger.debug('Transition outgoing source error: %s', e)
+            a_frame = self._pull_outgoing_transition_frame()
+            if a_frame is not None and self.transition_manager._gpu_renderer is not None:
+                self.transition_manager._gpu_renderer.store_cpu_frame(a_frame)
             try:
                 from ..gpu.glfw_display import get_glfw_display
                 _profiler = getattr(self, 'profiler', None)
@@ -676,14 +677,69 @@ class Player:
                 logger.debug('Transition GPU blend error: %s', e)
         else:
             # Transition not active — release any lingering outgoing source.
-            if self._transition_outgoing_source is not None:
-                try:
-                    self._transition_outgoing_source.cleanup()
-                except Exception:
-                    pass
-                self._transition_outgoing_source = None
+            self._release_outgoing_transition_source()
             self.transition_manager.store_gpu_frame(gpu_frame)
 
+    def _apply_cpu_transition(self, frame: np.ndarray) -> np.ndarray:
+        """CPU transition for players without a GPU transition renderer.
+
+        Mirrors _on_transition_gpu_frame on the CPU frame the play loop
+        already has: blends while active (A-buffer kept live from the outgoing
+        source), otherwise stores the frame as the next A-buffer.
+        """
+        tm = self.transition_manager
+        if tm.active:
+            a_frame = self._pull_outgoing_transition_frame()
+            if a_frame is not None:
+                tm.store_cpu_frame(a_frame)
+            with self.profiler.profile_stage('transitions'):
+                blended = tm.apply_cpu(frame)
+            if blended is not None:
+                # _on_preview_gpu_frame skips encoding while a transition is
+                # active — encode the blended result here (same as the GPU path).
+                if self._preview_downscaler is not None:
+                    result = self._preview_downscaler.encode_numpy(blended)
+                    if self._mjpeg_subscriber_count > 0 and result is not None:
+                        self.last_preview_jpeg = result
+                if self._fullscreen_downscaler is not None:
+                    fs_result = self._fullscreen_downscaler.encode_numpy(blended)
+                    if self._fullscreen_subscriber_count > 0 and fs_result is not None:
+                        self.last_fullscreen_jpeg = fs_result
+                return blended
+        self._release_outgoing_transition_source()
+        tm.store_cpu_frame(frame)
+        return frame
+
+    def _pull_outgoing_transition_frame(self):
+        """Next frame of the outgoing clip at its native FPS (None between frames)."""
+        if self._transition_outgoing_source is None:
+            return None
+        try:
+            now = time.monotonic()
+            if now - self._transition_a_last_time < self._transition_a_frame_delay:
+                return None
+            a_frame, delay = self._transition_outgoing_source.get_next_frame()
+            if delay > 0:
+                self._transition_a_frame_delay = delay
+            self._transition_a_last_time = now
+            if a_frame is None:
+                # Outgoing clip ended — loop it so it keeps playing
+                self._transition_outgoing_source.reset()
+                a_frame, _ = self._transition_outgoing_source.get_next_frame()
+            if isinstance(a_frame, np.ndarray):
+                return a_frame
+        except Exception as e:
+            logger.debug('Transition outgoing source error: %s', e)
+        return None
+
+    def _release_outgoing_transition_source(self) -> None:
+        if self._transition_outgoing_source is not None:
+            try:
+                self._transition_outgoing_source.cleanup()
+            except Exception:
+                pass
+            self._transition_outgoing_source = None
+
 
     def update_resolution(self, new_width: int, new_height: int, autosize_mode: str = None):
         """Update player canvas resolution dynamically
@@ -1068,6 +1124,12 @@ class Player:
             logger.warning(f"[{self.player_name}] Invalid clip index: {index}")
             return False
         
+        # An explicit load supersedes a slave switch that was not adopted yet
+        with self._clip_switch_lock:
+            pending, self._pending_clip_switch = self._pending_clip_switch, None
+        if pending is not None:
+            pending[0].release()
+        
         self.current_clip_index = index
         self.playlist_manager.set_index(index)
         
@@ -1233,6 +1295,7 @@ class Player:
                             self.layer_manager.set_artnet_gpu_hook(
                                 self.routing_bridge.on_gpu_composite
                             )
+                            self.routing_bridge.set_layer_manager(self.layer_manager)
                         logger.debug(f"[{self.player_name}] ArtNet routing bridge restarted for clip switch")
                     except Exception as e:
                         logger.error(f"[{self.player_name}] Failed to restart routing bridge: {e}")
@@ -1257,6 +1320,194 @@ class Player:
             logger.error(f"❌ [{self.player_name}] Error loading clip at index {index}: {e}")
             return False
     
+    # ========== PRE-ARMED CLIP SWITCH (Master/Slave) ==========
+    
+    def prepare_clip(self, index: int):
+        """
+        Build and initialize the clip at *index* without touching playback.
+        
+        Runs on a SlaveSwitch worker while the current clip keeps rendering;
+        the result is installed with request_clip_switch().
+        
+        Returns:
+            PreparedClip, or None if the clip could not be loaded
+        """
+        from .clip_switch import PreparedClip
+        
+        clip_item, clip_id = self.playlist_manager.get_item_at(index)
+        if clip_item is None:
+            return None
+        transition = self._clip_transition_config(clip_id)
+        
+        try:
+            if self.clip_registry and clip_id:
+                clip_id = self._ensure_clip_registered(clip_item, clip_id)
+                video_dir = self.config.get('paths', {}).get('video_dir', 'video')
+                layers = self.layer_manager.prepare_clip_layers(clip_id, video_dir, self.player_name)
+                if layers is None:
+                    return None
+                return PreparedClip(index, clip_item, clip_id, layers.layers[0].source, layers, transition)
+            
+            # No clip registry: single source, looping like any slave source
+            from .sources import VideoSource, GeneratorSource
+            if clip_item.startswith('generator:'):
+                generator_id = clip_item.replace('generator:', '')
+                parameters = self.playlist_manager.get_generator_parameters(
+                    generator_id, plugin_manager=self.plugin_manager, clip_registry=self.clip_registry
+                )
+                parameters.setdefault('playback_mode', 'repeat')
+                source = GeneratorSource(generator_id, parameters, self.canvas_width, self.canvas_height, self.config)
+            else:
+                source = VideoSource(clip_item, self.canvas_width, self.canvas_height, self.config,
+                                     clip_id=clip_id, player_name=self.player_name)
+            if not source.initialize():
+                return None
+            return PreparedClip(index, clip_item, clip_id, source, None, transition)
+        except Exception as e:
+            logger.error(f"❌ [{self.player_name}] Error preparing clip at index {index}: {e}")
+            return None
+    
+    def get_frame_interval(self):
+        """Seconds between two rendered frames (0 = unthrottled)."""
+        source = self.layers[0].source if self.layers else self.source
+        fps = self.fps_limit if self.fps_limit else getattr(source, 'fps', 0)
+        return 1.0 / fps if fps and fps > 0 else 0.0
+    
+    def request_clip_switch(self, prepared, on_commit=None, at=None):
+        """
+        Hand a prepared clip to the play loop, which swaps it in at its next
+        frame boundary.  Without a running play loop it is installed at once.
+        
+        Args:
+            prepared: PreparedClip from prepare_clip()
+            on_commit: Optional callback invoked right after the swap
+            at: Optional perf_counter time: swap on the frame nearest to it
+                instead of the next one
+        """
+        if self.is_playing and self.thread is not None and self.thread.is_alive():
+            with self._clip_switch_lock:
+                previous, self._pending_clip_switch = self._pending_clip_switch, (prepared, on_commit, at)
+            if previous is not None:
+                previous[0].release()
+            return
+        self._commit_prepared_clip(prepared)
+        if on_commit:
+            on_commit()
+    
+    def _take_due_clip_switch(self, frame_time):
+        """
+        Pop the requested clip switch if it is due on this frame, else None.
+        
+        The entry is read, checked and popped under one lock, so a newer
+        request with a later target time that replaces it meanwhile is never
+        committed early.
+        """
+        if self._pending_clip_switch is None:   # lock-free check on every frame
+            return None
+        with self._clip_switch_lock:
+            pending = self._pending_clip_switch
+            if pending is None or (pending[2] is not None
+                                   and time.perf_counter() < pending[2] - frame_time * 0.5):
+                return None
+            self._pending_clip_switch = None
+            return pending
+    
+    def cancel_clip_switch(self):
+        """Drop a clip switch that was requested but not swapped in yet."""
+        with self._clip_switch_lock:
+            pending, self._pending_clip_switch = self._pending_clip_switch, None
+        if pending is not None:
+            pending[0].release()
+    
+    def _commit_prepared_clip(self, prepared):
+        """Swap a prepared clip in (play-loop thread, between two frames)."""
+        if prepared.transition and self.transition_manager:
+            self.transition_manager.configure(**prepared.transition)
+        
+        # Start transition BEFORE the swap so the A-buffer still holds the
+        # outgoing clip; keep the outgoing source alive for live A frames.
+        _outgoing = self.source
+        if self.is_playing:
+            self.transition_manager.start(self.player_name)
+        keep_outgoing = self.transition_manager.active and _outgoing is not None
+        if keep_outgoing:
+            if self._transition_outgoing_source is not None:
+                self._transition_outgoing_source.cleanup()
+            self._transition_outgoing_source = _outgoing
+            self._transition_a_last_time = 0.0  # force immediate first frame pull
+        
+        prepared.source.reset()
+        if prepared.layers is not None:
+            if keep_outgoing and self.layers:
+                self.layers[0].source = None  # detach: the layer swap must not clean it up
+            sequence_manager = getattr(self.player_manager, 'sequence_manager', None) if self.player_manager else None
+            self.layer_manager.commit_clip_layers(prepared.layers, self.player_name, sequence_manager)
+        else:
+            self.source = prepared.source
+            if _outgoing is not None and not keep_outgoing:
+                _outgoing.cleanup()
+        
+        self.current_clip_index = prepared.index
+        self.playlist_manager.set_index(prepared.index)
+        self._loaded_clip_id = prepared.clip_id
+        self.current_clip_id = prepared.clip_id
+        self.current_loop = 0
+        
+        # Reset transport effect completely (clean start for new clip)
+        for layer in self.layers:
+            for effect in layer.effects:
+                if effect.get('id') == 'transport' and effect.get('instance'):
+                    transport = effect['instance']
+                    transport._current_loop_iteration = 0
+                    transport.current_position = 0
+                    transport._virtual_frame = 0.0
+                    transport.loop_completed = False
+                    transport._has_played_once = False
+                    transport._frame_source = None  # Force re-initialization
+        
+        latency_ms = (time.perf_counter() - prepared.prepared_at) * 1000
+        logger.debug(f"🔄 [{self.player_name}] Switched to prepared clip {prepared.index} "
+                     f"(armed {latency_ms:.0f} ms before commit)")
+    
+    def _clip_transition_config(self, clip_id):
+        """Custom transition of a clip as transition_manager.configure() kwargs, or None."""
+        clip_data = self._find_clip_by_id(clip_id)
+        if not clip_data:
+            return None
+        transition_config = self._extract_transition_from_effects(clip_data.get('effects', []))
+        if not transition_config:
+            return None
+        duration = transition_config.get('duration', 1.0)
+        if isinstance(duration, dict) and '_value' in duration:
+            duration = duration['_value']
+        easing = transition_config.get('easing', 'ease_in_out')
+        if isinstance(easing, dict) and '_value' in easing:
+            easing = easing['_value']
+        return {
+            'effect': transition_config.get('plugin', transition_config.get('effect', 'fade')),
+            'duration': duration,
+            'easing': easing,
+        }
+    
+    def _maybe_prearm_slaves(self, fps: float, prearm_seconds: float):
+        """Master only: pre-arm the slaves' next clip once this clip is about to end."""
+        pm = self.player_manager
+        if pm is None or pm.master_playlist != self.player_id or pm.sequencer_mode_active:
+            return
+        if not self.playlist_manager.should_autoplay(False):
+            return
+        if self.max_loops > 0 and self.current_loop < self.max_loops - 1:
+            return  # not the last loop of this clip yet
+        source = self.source
+        total = getattr(source, 'total_frames', 0) or 0
+        if source is None or total <= 0 or source.is_infinite or fps <= 0:
+            return
+        if (total - source.current_frame) / fps > prearm_seconds:
+            return
+        next_index = self.playlist_manager.get_next_index()
+        if next_index is not None:
+            pm.prearm_slaves(next_index)
+    
     def play(self):
         """Intelligente Play-Funktion: startet oder setzt fort je nach Status."""
         if self.is_playing and not self.is_paused:
@@ -1313,6 +1564,8 @@ class Player:
                     self.layer_manager.set_artnet_gpu_hook(
                         self.routing_bridge.on_gpu_composite
                     )
+                    # Source of isolated layers sampled by objects (input_layer)
+                    self.routing_bridge.set_layer_manager(self.layer_manager)
                     logger.debug("ArtNet GPU compute sampler hook registered")
             except Exception as e:
                 logger.error(f"Failed to start routing bridge: {e}")
@@ -1350,6 +1603,7 @@ class Player:
             if hasattr(self, 'layer_manager') and self.layer_manager is not None:
                 try:
                     self.layer_manager.set_artnet_gpu_hook(None)
+                    self.routing_bridge.set_layer_manager(None)
                 except Exception:
                     pass
         
@@ -1638,10 +1892,16 @@ class Player:
         next_frame_time = time.time()
         
         frame_wait_delay = self.config.get('video', {}).get('frame_wait_delay', 0.1)
+        # Master: seconds before clip end at which the slaves' next clip is pre-armed
+        prearm_seconds = self.config.get('performance', {}).get('slave_prearm_seconds', 1.0)
         
         source_name = self.layers[0].source.get_source_name() if self.layers else self.source.get_source_name()
         debug_playback(logger, f"Play-Loop gestartet: FPS={fps}, Source={source_name}")
 
+        # Optional pipelined mode (performance.pipeline_enabled): CPU output
+        # stages overlap with decoding/compositing of the next frame.
+        pipeline = self._create_frame_pipeline()
+
         # Cache per-player constants that never change during a play loop.
         # player_id is set once in __init__ and never mutated; avoid re-evaluating
         # the ternary and attribute lookups on every frame iteration.
@@ -1656,6 +1916,24 @@ class Player:
                 logger.debug(f"🎵 [SEQUENCE CHECK] sequence count: {len(self.player_manager.sequence_manager.sequences)}")
         
         while self.is_running and self.is_playing:
+            # Slave: adopt a clip switch published by the master (frame boundary);
+            # a scheduled one waits for the frame nearest to its timestamp
+            pending = self._take_due_clip_switch(frame_time)
+            if pending is not None:
+                prepared, on_commit, _ = pending
+                try:
+                    self._commit_prepared_clip(prepared)
+                except Exception as e:
+                    logger.error(f"❌ [{self.player_name}] Clip switch failed: {e}", exc_info=True)
+                if on_commit:
+                    on_commit()
+                if not self.fps_limit:
+                    _new_fps = (self.layers[0].source.fps if self.layers else self.source.fps) or fps
+                    if _new_fps != fps:
+                        fps = _new_fps
+                        frame_time = 1.0 / fps if fps > 0 else 0
+                        next_frame_time = time.time()  # reset drift accumulator
+            
             # Pause handling (event-based for low latency)
             if self.is_paused:
                 # Warte auf resume (pause_event.set()) - keine CPU-Last, immediate wake
@@ -1678,6 +1956,12 @@ class Player:
                 logger.warning(f"⚠️ No sequence_manager on player_manager!")
                 self._no_sequence_manager_logged = True
             
+            # Apply DMX input received since the last frame (lighting console)
+            _dmx_input = getattr(self.player_manager, 'dmx_input', None) if self.player_manager else None
+            if _dmx_input is not None:
+                with self.profiler.profile_stage('dmx_input'):
+                    _dmx_input.apply()
+            
             # DEBUG: Log every 100 frames to monitor playback
             if self.current_frame % 100 == 0 and self.current_frame > 0:
                 debug_playback(logger, f"[{self.player_name}] Playing: frame {self.current_frame}, max_loops={self.max_loops}, current_loop={self.current_loop}")
@@ -1740,18 +2024,22 @@ class Player:
                     get_texture_pool().release(frame)
                     frame = _cpu
             
+            # Master: pre-arm the slaves' next clip shortly before this one ends
+            if prearm_seconds > 0 and frame is not None:
+                self._maybe_prearm_slaves(fps, prearm_seconds)
+
             # ========== REST IS UNCHANGED ==========
 
             # GPU-only path: composite_layers processed the frame on GPU but
             # skipped the CPU download (needs_download=False).  This is NOT a
             # source EOF — treat it as a successfully rendered frame.
             if frame is _GPU_PROCESSED:
-                if self.routing_bridge and self.enable_artnet and self.is_running:
-                    try:
-                        with self.profiler.profile_stage('output_routing'):
-                            self.routing_bridge.process_frame(None)
-                    except Exception as e:
-                        logger.error(f"Routing bridge error: {e}", exc_info=True)
+                # The GPU sampler buffer is reused in place, so this path stays
+                # synchronous; drain the pipeline first so the routing bridge is
+                # never driven from two threads at once.
+                if pipeline is not None:
+                    pipeline.flush()
+                self._route_frame(None)
                 self.profiler.record_frame_complete(loop_start_perf, source_fps=fps)
                 if not self.is_running:
                     break
@@ -2069,16 +2357,21 @@ class Player:
             
             # CPU-dependent post-processing -- skipped when frame is None
             if frame is not None:
-                # (Transitions are GPU-only; handled by _on_transition_gpu_frame hook)
                 # (Clip effects are GPU-only; applied by composite_layers → apply_layer_effects)
                 # (Player-global effects are GPU-only; applied by composite_layers → _apply_chain_gpu)
 
                 # Alpha-Compositing (wenn RGBA vorhanden)
                 if frame is not None and isinstance(frame, np.ndarray) and frame.shape[2] == 4:
                     frame = self._alpha_composite_to_black(frame)
+
+                # Transitions run on the GPU (_on_transition_gpu_frame hook); the
+                # CPU renderer only covers players without a GPU transition renderer.
+                if isinstance(frame, np.ndarray) and not self.transition_manager.has_gpu_renderer:
+                    frame = self._apply_cpu_transition(frame)
             
             # Frame is already in BGR format (native OpenCV), no conversion needed
             # frame may be None when GPU sampler covers ArtNet and no preview is active
+            self._declare_frames_in_flight(pipeline)
             if frame is not None:
                 self.last_video_frame = frame
                 # Capture rendered frame for active clip recording
@@ -2102,26 +2395,18 @@ class Player:
                             daemon=True,
                         ).start()
 
-            # Distribute frame to output routing system.
-            if self.output_manager and frame is not None:
-                try:
-                    with self.profiler.profile_stage('frame_delivery'):
-                        self.output_manager.update_frame(
-                            composite_frame=frame,
-                            layer_manager=self.layer_manager,
-                            current_clip_id=self.current_clip_id
-                        )
-                except Exception as e:
-                    logger.error(f"[OUTPUT] Frame update error: {e}", exc_info=True)
-            
-            # ArtNet Routing System — frame may be None when ArtNet player GPU sampler
-            # covers all outputs directly (enable_artnet=True + sampler ready).
-            if self.routing_bridge and self.enable_artnet and self.is_running:
-                try:
-                    with self.profiler.profile_stage('output_routing'):
-                        self.routing_bridge.process_frame(frame)
-                except Exception as e:
-                    logger.error(f"Routing bridge error: {e}", exc_info=True)
+            if pipeline is not None and frame is not None:
+                # Pipelined mode: output delivery and Art-Net routing for this
+                # frame run on the pipeline workers while we render the next one.
+                pipeline.submit(frame)
+            else:
+                # Distribute frame to output routing system.
+                if frame is not None:
+                    self._deliver_frame(frame)
+
+                # ArtNet Routing System — frame may be None when ArtNet player GPU sampler
+                # covers all outputs directly (enable_artnet=True + sampler ready).
+                self._route_frame(frame)
             
             # Mark frame processing complete for profiler
             # Pass loop_start_perf so total_frame_time reflects actual wall-clock
@@ -2154,6 +2439,13 @@ class Player:
             elif sleep_time < -delay:  # More than one frame behind — reset to avoid catch-up burst
                 next_frame_time = current_time + delay
         
+        if pipeline is not None:
+            pipeline.stop()
+            if self._frame_pipeline is pipeline:
+                self._frame_pipeline = None
+        set_frames_in_flight(self.player_name, 0)
+        self._frames_in_flight = 0
+
         # Release GPU ownership so the next play-loop thread (on clip change,
         # stop/restart, or new player) can claim it and create a fresh context.
         try:
@@ -2193,6 +2485,82 @@ class Player:
                          f"(new thread already started)")
         debug_playback(logger, "Play-Loop beendet")
     
+    def _declare_frames_in_flight(self, pipeline):
+        """
+        Tell the FrameRings how many produced frames may still be read.
+
+        Ring frames (downloads, composites, transitions) are handed on by
+        reference, so a ring must not wrap before the last reader is done:
+        the frame being rendered, last_video_frame, one frame per pipeline
+        worker and hand-off, and the queues of zero-copy outputs.
+        """
+        count = 2
+        if pipeline is not None:
+            count += 2 * pipeline.depth
+        if self.output_manager:
+            count += self.output_manager.frames_held
+        if count != self._frames_in_flight:
+            self._frames_in_flight = count
+            set_frames_in_flight(self.player_name, count)
+
+    def _deliver_frame(self, frame):
+        """Distribute a CPU frame to the video output routing system."""
+        if not self.output_manager:
+            return
+        try:
+            with self.profiler.profile_stage('frame_delivery'):
+                self.output_manager.update_frame(
+                    composite_frame=frame,
+                    layer_manager=self.layer_manager,
+                    current_clip_id=self.current_clip_id
+                )
+        except Exception as e:
+            logger.error(f"[OUTPUT] Frame update error: {e}", exc_info=True)
+
+    def _route_frame(self, frame):
+        """Sample a frame for Art-Net and send it (frame may be None on the GPU sampler path)."""
+        if not (self.routing_bridge and self.enable_artnet and self.is_running):
+            return
+        try:
+            with self.profiler.profile_stage('output_routing'):
+                self.routing_bridge.process_frame(frame)
+        except Exception as e:
+            logger.error(f"Routing bridge error: {e}", exc_info=True)
+
+    def _create_frame_pipeline(self):
+        """
+        Create and start the frame pipeline if enabled in config.
+
+        Config (performance section):
+            pipeline_enabled: run output delivery / Art-Net routing on worker threads
+            pipeline_depth: number of worker threads the output stages are split across
+
+        Returns:
+            Running FramePipeline or None when pipelining is disabled.
+        """
+        perf_cfg = self.config.get('performance', {})
+        if not perf_cfg.get('pipeline_enabled', False):
+            return None
+        from .pipeline import FramePipeline
+        pipeline = FramePipeline(
+            stages=[
+                ('frame_delivery', self._deliver_frame),
+                ('output_routing', self._route_frame),
+            ],
+            depth=perf_cfg.get('pipeline_depth', 1),
+            player_name=self.player_name,
+            profiler=self.profiler,
+        )
+        pipeline.start()
+        self._frame_pipeline = pipeline
+        debug_playback(logger, f"[{self.player_name}] Pipelined play loop: depth={pipeline.depth}")
+        return pipeline
+
+    def get_pipeline_stats(self):
+        """Stats of the active frame pipeline, or None when running unpipelined."""
+        pipeline = self._frame_pipeline
+        return pipeline.get_stats() if pipeline is not None else None
+
     def status(self):
         """Returns status string."""
         if self.is_playing:
@@ -2229,7 +2597,8 @@ class Player:
             'frames': self.frames_processed,
             'current_frame': self.source.current_frame,
             'total_frames': self.source.total_frames if not self.source.is_infinite else -1,
-            'runtime': f"{int(runtime // 60):02d}:{int(runtime % 60):02d}"
+            'runtime': f"{int(runtime // 60):02d}:{int(runtime % 60):02d}",
+            'pipeline': self.get_pipeline_stats()
         }
     
     # Art-Net Methoden
@@ -2367,8 +2736,16 @@ class Player:
         rgb = rgba_frame[:, :, :3]
         alpha = rgba_frame[:, :, 3:]
         
-        # Composite using integer math (avoid float conversion)
-        composited = (rgb.astype(np.uint16) * alpha.astype(np.uint16) / 255).astype(np.uint8)
+        # Composite using integer math in a pooled uint16 temporary
+        # (avoids float conversion and per-frame allocator churn)
+        pool = get_buffer_pool()
+        tmp = pool.acquire(rgb.shape, np.uint16)
+        try:
+            np.multiply(rgb, alpha, out=tmp, dtype=np.uint16)
+            composited = self._composite_ring.next(rgb.shape, np.uint8)
+            np.floor_divide(tmp, 255, out=composited, casting='unsafe')
+        finally:
+            pool.release(tmp)
         
         return composited
 
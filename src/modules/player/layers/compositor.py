@@ -123,8 +123,8 @@ def download_composite_ring(mgr, composite, w: int, h: int) -> np.ndarray:
             raw = read_buf.read_mapped()
             read_buf.unmap()
             padded = np.frombuffer(raw, dtype=np.uint8).reshape(h, read_bpr)
-            rgba = np.ascontiguousarray(padded[:, : w * 4].reshape(h, w, 4))
-            result = cv2.cvtColor(rgba, cv2.COLOR_RGBA2BGR)
+            rgba = padded[:, : w * 4].reshape(h, w, 4)
+            result = cv2.cvtColor(rgba, cv2.COLOR_RGBA2BGR, dst=mgr._comp_bgr.next((h, w, 3)))
         except Exception as exc:
             logger.warning('Composite DL ring readback error (slot %d): %s', read_i, exc)
         finally:
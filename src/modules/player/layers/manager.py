@@ -19,7 +19,9 @@ continue to use the same API:::
 import os
 import threading
 from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
 from ...core.logger import get_logger, debug_layers, debug_transport
+from ...core.buffer_pool import FrameRing
 from ..sources import VideoSource, GeneratorSource
 import numpy as np
 from ...gpu import get_texture_pool, probe_gpu_readback
@@ -30,6 +32,15 @@ from .compositor import composite_layers as _composite_layers, _GPU_PROCESSED
 
 logger = get_logger(__name__)
 
+
+class PreparedLayers(NamedTuple):
+    """Initialized layer stack of a clip, ready to be swapped in."""
+    clip_id: str
+    player_name: str
+    layers: list
+    layer_counter: int
+
+
 class LayerManager:
     """Manages layer stack, blending, and layer effects."""
     
@@ -149,6 +160,7 @@ class LayerManager:
         self._comp_ring_w: int = 0
         self._comp_ring_h: int = 0
         self._COMP_RING: int = _COMP_RING
+        self._comp_bgr = FrameRing()                    # BGR readback destinations
 
         
     def _set_websocket_context_on_transport(self, clip_id, player_name=""):
@@ -200,15 +212,29 @@ class LayerManager:
         Returns:
             bool: True on success
         """
-        # Unload sequences for old clip if we had one
-        if sequence_manager and hasattr(self, '_current_clip_id') and self._current_clip_id:
-            sequence_manager.unload_sequences_for_clip(self._current_clip_id)
-        
+        prepared = self.prepare_clip_layers(clip_id, video_dir, player_name)
+        if prepared is None:
+            return False
+        self.commit_clip_layers(prepared, player_name, sequence_manager)
+        return True
+
+    def prepare_clip_layers(self, clip_id, video_dir=None, player_name=""):
+        """
+        Create and initialize the layer stack of a clip without installing it.
+
+        Safe to run on a background thread while the current stack keeps
+        rendering (used to pre-arm slave clip switches).  Install the result
+        with commit_clip_layers(); an uncommitted stack is freed through
+        PreparedClip.release().
+
+        Returns:
+            PreparedLayers, or None if the clip or its base source failed to load
+        """
         # Get clip data
         clip_data = self.clip_registry.get_clip(clip_id)
         if not clip_data:
             logger.error(f"❌ [{player_name}] Clip {clip_id} not found")
-            return False
+            return None
         
         # Get layer definitions
         layer_defs = clip_data.get('layers', [])
@@ -301,7 +327,7 @@ class LayerManager:
             if kind == 'base':
                 if not ok:
                     logger.error(f"❌ [{resolved_player_name}] Failed to create base layer for clip {clip_id}")
-                    return False
+                    return None
                 base_layer = Layer(layer_counter, source, 'normal', 100.0, clip_id)
                 new_layers.append(base_layer)
                 layer_counter += 1
@@ -354,11 +380,26 @@ class LayerManager:
 
                 layer_counter = layer_id + 1
 
+        return PreparedLayers(clip_id, resolved_player_name, new_layers, layer_counter)
+
+    def commit_clip_layers(self, prepared, player_name="", sequence_manager=None):
+        """
+        Install a layer stack built by prepare_clip_layers().
+
+        The swap itself is a pointer exchange under the render lock; the old
+        layers (and their sources) are cleaned up afterwards.
+        """
+        clip_id = prepared.clip_id
+
+        # Unload sequences for old clip if we had one
+        if sequence_manager and hasattr(self, '_current_clip_id') and self._current_clip_id:
+            sequence_manager.unload_sequences_for_clip(self._current_clip_id)
+
         # Atomically swap layer stack (protected by render lock)
         with self._render_lock:
             old_layers = self.layers
-            self.layers = new_layers
-            self.layer_counter = layer_counter
+            self.layers = prepared.layers
+            self.layer_counter = prepared.layer_counter
 
         # Cleanup old layers after swap
         for layer in old_layers:
@@ -368,7 +409,7 @@ class LayerManager:
                 logger.warning(f"⚠️ Error cleaning up old layer: {e}")
 
         # Update player_name for downstream calls (match original behaviour)
-        player_name = resolved_player_name
+        player_name = prepared.player_name
         
         # Set WebSocket context on transport effects (needs player reference)
         self._set_websocket_context_on_transport(clip_id, player_name)
@@ -382,8 +423,7 @@ class LayerManager:
             logger.debug(f"📊 [{player_name}] Loaded {loaded_seq_count} sequences for clip {clip_id[:8]}...")
         
         logger.debug(f"✅ [{player_name}] Loaded {len(self.layers)} layers from clip {clip_id}")
-        return True
-    
+
     def add_layer(self, source, clip_id=None, blend_mode='normal', opacity=100.0, player_name=""):
         """
         Add new layer to stack.
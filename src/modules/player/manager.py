@@ -6,6 +6,7 @@ import os
 import json
 from ..core.logger import get_logger, debug_playback
 from . import sequencer_integration as _seq
+from .clip_switch import SlaveSwitchCoordinator
 
 logger = get_logger(__name__)
 
@@ -60,6 +61,8 @@ class PlayerManager:
         
         # Master/Slave Synchronization
         self.master_playlist = None  # 'video' or 'artnet' or None
+        # Pre-armed, parallel slave clip switching (see clip_switch.py)
+        self.slave_switch = SlaveSwitchCoordinator(self)
         
         # Sequencer (audio-driven master control)
         self.sequencer = None  # AudioSequencer instance
@@ -185,6 +188,11 @@ class PlayerManager:
         Create preview player instances on-demand.
         Preview players run viewed (non-active) playlists without affecting output.
         
+        By default (video.preview_player.mode = "lightweight") these are
+        PreviewSession objects rendered by one shared worker at reduced
+        resolution/FPS and only while a client watches the preview stream.
+        mode = "full" restores complete Player instances.
+        
         Returns:
             bool: True if created or already exist, False on error
         """
@@ -200,6 +208,7 @@ class PlayerManager:
             # Load global config for preview_fps_limit setting
             config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "config.json")
             preview_fps = None  # Default: use source FPS
+            global_config = {}
             try:
                 with open(config_path, 'r', encoding='utf-8') as f:
                     global_config = json.load(f)
@@ -209,6 +218,10 @@ class PlayerManager:
             except Exception as e:
                 logger.warning(f"Could not load preview_fps_limit from config: {e}")
             
+            preview_cfg = global_config.get('video', {}).get('preview_player', {})
+            if preview_cfg.get('mode', 'lightweight') != 'full':
+                return self._create_preview_sessions(preview_cfg, preview_fps)
+            
             # Create video preview player (clone video player config)
             if self.video_player:
                 logger.debug("Creating video preview player...")
@@ -272,6 +285,39 @@ class PlayerManager:
             logger.error(f"Failed to create preview players: {e}", exc_info=True)
             return False
     
+    def _create_preview_sessions(self, preview_cfg: dict, preview_fps=None) -> bool:
+        """Create lightweight PreviewSessions in place of full preview Players."""
+        from .preview import PreviewSession
+
+        width = preview_cfg.get('preview_width', 480)
+        height = preview_cfg.get('preview_height', 270)
+        fps = preview_cfg.get('fps') or preview_fps or 15
+        quality = preview_cfg.get('jpeg_quality', 75)
+
+        for key, live, name in (('video_preview', self.video_player, 'VideoPreview'),
+                                ('artnet_preview', self.artnet_player, 'ArtNetPreview')):
+            if live is None:
+                continue
+            session = PreviewSession(
+                player_name=name,
+                width=width,
+                height=height,
+                fps=fps,
+                config=live.config,
+                clip_registry=live.clip_registry,
+                quality=quality,
+            )
+            self.players[key] = session
+            if key == 'video_preview':
+                self.video_preview_player = session
+            else:
+                self.artnet_preview_player = session
+
+        self._preview_players_created = True
+        self._preview_last_used = time.time()
+        logger.debug(f"🎭 Lightweight preview sessions initialized ({width}x{height} @ {fps} fps)")
+        return True
+    
     def destroy_preview_players(self):
         """
         Clean up preview players to free resources.
@@ -357,6 +403,8 @@ class PlayerManager:
         
         old_master = self.master_playlist
         self.master_playlist = player_id
+        if old_master != player_id:
+            self.slave_switch.cancel()  # armed clips belong to the old master's playlist
         
         # Update all players' slave cache when master changes
         self._update_all_slave_caches()
@@ -444,14 +492,19 @@ class PlayerManager:
         
         logger.debug(f"🔄 Syncing slaves to master index {master_clip_index}")
         
-        # Synchronize all Slaves
-        for player_id in self.get_all_player_ids():
-            if player_id == self.master_playlist:
-                continue
-            
-            slave_player = self.get_player(player_id)
-            if slave_player:
-                self._sync_slave_to_index(slave_player, master_clip_index)
+        # Synchronize all Slaves (prepared in parallel, committed together)
+        self.slave_switch.switch(master_clip_index, self._sync_slave_to_index)
+    
+    def prearm_slaves(self, clip_index: int):
+        """
+        Prepare all slaves' clip at *clip_index* ahead of the master's switch.
+
+        Called by the master's play loop shortly before its clip ends, so the
+        following on_clip_changed() only has to hand over ready clips.
+        """
+        if self.sequencer_mode_active or not self.master_playlist:
+            return
+        self.slave_switch.prearm(clip_index)
     
     def _sync_slave_to_index(self, slave_player, clip_index: int):
         """
@@ -513,14 +566,7 @@ class PlayerManager:
             logger.debug(f"🔄 Slave {slave_player.player_name} synced to index {clip_index}")
             
             # Emit WebSocket event for slave clip change (for active border update)
-            if self.socketio:
-                try:
-                    self.socketio.emit('playlist.changed', {
-                        'player_id': slave_player.player_id,
-                        'current_index': clip_index
-                    }, namespace='/player')
-                except Exception as e:
-                    logger.error(f"❌ Error emitting slave playlist.changed WebSocket event: {e}")
+            self._emit_playlist_changed(slave_player.player_id, clip_index)
         else:
             logger.warning(f"Failed to sync slave {slave_player.player_name} to index {clip_index}")
     
@@ -554,14 +600,20 @@ class PlayerManager:
         
         logger.debug(f"👑 Master {player_id} clip changed to index {clip_index}")
         
-        # Synchronize all Slaves
-        for slave_id in self.get_all_player_ids():
-            if slave_id == self.master_playlist:
-                continue
-            
-            slave_player = self.get_player(slave_id)
-            if slave_player:
-                self._sync_slave_to_index(slave_player, clip_index)
+        # Synchronize all Slaves — pre-armed clips are handed over without
+        # blocking the master; the rest are prepared in parallel.
+        self.slave_switch.switch(clip_index, self._sync_slave_to_index)
+    
+    def _emit_playlist_changed(self, player_id: str, clip_index: int):
+        """Emit playlist.changed for a slave (active border update in the UI)."""
+        if self.socketio:
+            try:
+                self.socketio.emit('playlist.changed', {
+                    'player_id': player_id,
+                    'current_index': clip_index
+                }, namespace='/player')
+            except Exception as e:
+                logger.error(f"❌ Error emitting slave playlist.changed WebSocket event: {e}")
     
     # ========== SEQUENCER INTEGRATION ==========
     # Heavy logic lives in sequencer_integration.py; thin delegates here.
@@ -572,11 +624,21 @@ class PlayerManager:
     
     def set_sequencer_mode(self, enabled: bool):
         """Enable/disable sequencer mode.  See sequencer_integration.py."""
+        if enabled:
+            self.slave_switch.cancel()
         _seq.set_sequencer_mode(self, enabled)
     
-    def sequencer_advance_slaves(self, slot_index: int, force_reload: bool = False):
+    def sequencer_advance_slaves(self, slot_index: int, force_reload: bool = False, skip=None):
         """Advance all players to clip *slot_index*.  See sequencer_integration.py."""
-        _seq.sequencer_advance_slaves(self, slot_index, force_reload)
+        _seq.sequencer_advance_slaves(self, slot_index, force_reload, skip)
+    
+    def sequencer_prearm_slot(self, slot_index: int):
+        """Prepare the clips of the next slot.  See sequencer_integration.py."""
+        _seq.sequencer_prearm_slot(self, slot_index)
+    
+    def sequencer_schedule_slot(self, slot_index: int, at: float, on_commit=None) -> set:
+        """Switch to *slot_index* on the frame nearest *at*.  See sequencer_integration.py."""
+        return _seq.sequencer_schedule_slot(self, slot_index, at, on_commit)
     
     def _on_sequencer_slot_change(self, slot_index: int):
         """Kept for backward compat — wired by sequencer_integration.init_sequencer."""
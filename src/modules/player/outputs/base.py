@@ -11,6 +11,8 @@ from queue import Queue, Full
 import numpy as np
 from typing import Optional, Dict
 
+from ...core.buffer_pool import get_buffer_pool
+
 logger = logging.getLogger(__name__)
 
 
@@ -85,7 +87,10 @@ class OutputBase(ABC):
         Send a single frame to the output
         
         Args:
-            frame: Frame to send (numpy array, BGR format)
+            frame: Frame to send (numpy array, BGR format). When the output
+                copies frames (needs_frame_copy), this is a pooled buffer that
+                is recycled as soon as send_frame() returns — copy it if it
+                must outlive the call.
             
         Returns:
             bool: True if frame sent successfully
@@ -136,6 +141,7 @@ class OutputBase(ABC):
         if self.output_thread:
             self.output_thread.join(timeout=2.0)
             self.output_thread = None
+        self._drain_queue()
         
         # Cleanup
         try:
@@ -156,18 +162,40 @@ class OutputBase(ABC):
         if not self.enabled:
             return
         
+        pooled = False
         try:
             # OPTIMIZATION: Only copy if output requires it (e.g., multiprocessing)
             # VirtualOutput overrides this to use direct reference
             # Default to True for safety (backwards compatibility)
             if getattr(self, 'needs_frame_copy', True):
-                frame = frame.copy()
+                if self.frame_queue.full():
+                    raise Full
+                # Copy into a pooled buffer — released by _output_loop after
+                # send_frame() returns, so no per-frame allocation at 4K.
+                copy = get_buffer_pool().acquire(frame.shape, frame.dtype)
+                np.copyto(copy, frame)
+                frame = copy
+                pooled = True
             
             # Non-blocking put (drop frame if queue full)
-            self.frame_queue.put_nowait(frame)
+            self.frame_queue.put_nowait((frame, pooled))
         except Full:
+            if pooled:
+                get_buffer_pool().release(frame)
             with self.stats_lock:
                 self.frames_dropped += 1
+
+    def _drain_queue(self):
+        """Discard queued frames, returning pooled copies to the buffer pool."""
+        from queue import Empty
+        pool = get_buffer_pool()
+        while True:
+            try:
+                frame, pooled = self.frame_queue.get_nowait()
+            except Empty:
+                return
+            if pooled:
+                pool.release(frame)
     
     def _output_loop(self):
         """Output thread loop - processes frames from queue"""
@@ -180,36 +208,47 @@ class OutputBase(ABC):
         while self.running:
             try:
                 # Get frame from queue (blocking with timeout)
-                frame = self.frame_queue.get(timeout=0.1)
+                frame, pooled = self.frame_queue.get(timeout=0.1)
                 
-                # Debug: Log first few frames
-                frame_count += 1
-                if frame_count <= 5:
-                    logger.debug(f"[{self.output_id}] Received frame #{frame_count} from queue (shape: {frame.shape})")
+                try:
+                    # Debug: Log first few frames
+                    frame_count += 1
+                    if frame_count <= 5:
+                        logger.debug(f"[{self.output_id}] Received frame #{frame_count} from queue (shape: {frame.shape})")
                 
-                # Capture frame for streaming if enabled
-                if self.enable_capture:
-                    with self.frame_capture_lock:
-                        self.latest_frame = frame.copy()
+                    # Capture frame for streaming if enabled (reuse the capture
+                    # buffer in place; get_latest_frame() copies under the lock)
+                    if self.enable_capture:
+                        with self.frame_capture_lock:
+                            if (self.latest_frame is not None and self.latest_frame.shape == frame.shape
+                                    and self.latest_frame.dtype == frame.dtype):
+                                np.copyto(self.latest_frame, frame)
+                            else:
+                                self.latest_frame = frame.copy()
                 
-                # FPS throttling
-                if self.frame_interval > 0:
-                    elapsed = time.time() - self.last_frame_time
-                    if elapsed < self.frame_interval:
-                        time.sleep(self.frame_interval - elapsed)
+                    # FPS throttling
+                    if self.frame_interval > 0:
+                        elapsed = time.time() - self.last_frame_time
+                        if elapsed < self.frame_interval:
+                            time.sleep(self.frame_interval - elapsed)
                 
-                # Send frame
-                if self.send_frame(frame):
-                    with self.stats_lock:
-                        self.frames_sent += 1
-                        self.last_frame_time = time.time()
-                    if frame_count <= 5:
-                        logger.debug(f"[{self.output_id}] Frame #{frame_count} sent successfully")
-                else:
-                    with self.stats_lock:
-                        self.frames_dropped += 1
-                    if frame_count <= 5:
-                        logger.warning(f"[{self.output_id}] Frame #{frame_count} send failed")
+                    # Send frame
+                    if self.send_frame(frame):
+                        with self.stats_lock:
+                            self.frames_sent += 1
+                            self.last_frame_time = time.time()
+                        if frame_count <= 5:
+                            logger.debug(f"[{self.output_id}] Frame #{frame_count} sent successfully")
+                    else:
+                        with self.stats_lock:
+                            self.frames_dropped += 1
+                        if frame_count <= 5:
+                            logger.warning(f"[{self.output_id}] Frame #{frame_count} send failed")
+            
+                finally:
+                    # Pooled copies are only valid until send_frame() returns
+                    if pooled:
+                        get_buffer_pool().release(frame)
             
             except Empty:
                 # Queue empty - process window events if this is a display output
@@ -72,6 +72,12 @@ class OutputManager:
     # GPU output path
     # ------------------------------------------------------------------
 
+    @property
+    def frames_held(self) -> int:
+        """Frames the enabled zero-copy outputs may still read after update_frame() (queue + one being sent)."""
+        return sum(out.frame_queue.maxsize + 1 for out in list(self.outputs.values())
+                   if out.enabled and not getattr(out, 'needs_frame_copy', True))
+
     @property
     def needs_cpu_frame(self) -> bool:
         """True if any enabled output still requires a full-resolution CPU frame."""
@@ -588,12 +594,15 @@ class OutputManager:
                 x2 = max(0, min(x + width, w))
                 y2 = max(0, min(y + height, h))
                 
-                # Extract region
-                sliced = frame[y1:y2, x1:x2].copy()
+                # Extract region (resize reads the view directly — only copy
+                # when the crop is used as-is)
+                sliced = frame[y1:y2, x1:x2]
                 
                 # Resize to target dimensions if needed
                 if sliced.shape[1] != width or sliced.shape[0] != height:
                     sliced = cv2.resize(sliced, (width, height))
+                else:
+                    sliced = sliced.copy()
                 
                 # Apply rotation if specified
                 if rotation != 0:
@@ -619,10 +628,12 @@ class OutputManager:
                 y1 = max(0, min(y, h))
                 x2 = max(0, min(x + width, w))
                 y2 = max(0, min(y + height, h))
-                sliced = frame[y1:y2, x1:x2].copy()
+                sliced = frame[y1:y2, x1:x2]
                 
                 if sliced.shape[1] != width or sliced.shape[0] != height:
                     sliced = cv2.resize(sliced, (width, height))
+                else:
+                    sliced = sliced.copy()
                 
                 return sliced
                 
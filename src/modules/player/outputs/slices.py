@@ -9,6 +9,8 @@ import numpy as np
 from typing import Dict, Optional, List, Tuple, Union
 from dataclasses import dataclass
 
+from ...core.buffer_pool import get_buffer_pool
+
 logger = logging.getLogger(__name__)
 
 
@@ -261,14 +263,13 @@ class SliceManager:
         x2 = max(0, min(slice_def.x + slice_def.width, w))
         y2 = max(0, min(slice_def.y + slice_def.height, h))
         
-        # Extract region
-        sliced = frame[y1:y2, x1:x2].copy()
-        
-        # Resize to target dimensions if needed
-        if sliced.shape[1] != slice_def.width or sliced.shape[0] != slice_def.height:
-            sliced = cv2.resize(sliced, (slice_def.width, slice_def.height))
+        # Extract region — resize reads the view directly, so only copy when
+        # the crop is returned as-is
+        region = frame[y1:y2, x1:x2]
+        if region.shape[1] != slice_def.width or region.shape[0] != slice_def.height:
+            return cv2.resize(region, (slice_def.width, slice_def.height))
         
-        return sliced
+        return region.copy()
     
     def _extract_polygon(self, frame: np.ndarray, slice_def: SliceDefinition) -> np.ndarray:
         """Extract polygonal region with mask"""
@@ -278,23 +279,28 @@ class SliceManager:
         
         h, w = frame.shape[:2]
         
-        # Create mask
-        mask = np.zeros((h, w), dtype=np.uint8)
-        points = np.array(slice_def.points, dtype=np.int32)
-        cv2.fillPoly(mask, [points], 255)
-        
-        # Apply mask
-        masked = cv2.bitwise_and(frame, frame, mask=mask)
-        
-        # Extract bounding box
-        x, y, w_box, h_box = cv2.boundingRect(points)
-        cropped = masked[y:y+h_box, x:x+w_box].copy()
-        
-        # Resize to target dimensions
-        if cropped.shape[1] != slice_def.width or cropped.shape[0] != slice_def.height:
-            cropped = cv2.resize(cropped, (slice_def.width, slice_def.height))
-        
-        return cropped
+        # Create mask (pooled full-frame temporaries, released below)
+        pool = get_buffer_pool()
+        mask = pool.acquire((h, w), np.uint8, zero=True)
+        masked = pool.acquire(frame.shape, frame.dtype, zero=True)
+        try:
+            points = np.array(slice_def.points, dtype=np.int32)
+            cv2.fillPoly(mask, [points], 255)
+            
+            # Apply mask
+            cv2.bitwise_and(frame, frame, dst=masked, mask=mask)
+            
+            # Extract bounding box
+            x, y, w_box, h_box = cv2.boundingRect(points)
+            region = masked[y:y+h_box, x:x+w_box]
+            
+            # Resize to target dimensions
+            if region.shape[1] != slice_def.width or region.shape[0] != slice_def.height:
+                return cv2.resize(region, (slice_def.width, slice_def.height))
+            return region.copy()
+        finally:
+            pool.release(masked)
+            pool.release(mask)
     
     def _extract_circle(self, frame: np.ndarray, slice_def: SliceDefinition) -> np.ndarray:
         """Extract circular region with mask"""
@@ -305,25 +311,30 @@ class SliceManager:
         cy = slice_def.y + slice_def.height // 2
         radius = min(slice_def.width, slice_def.height) // 2
         
-        # Create circular mask
-        mask = np.zeros((h, w), dtype=np.uint8)
-        cv2.circle(mask, (cx, cy), radius, 255, -1)
-        
-        # Apply mask
-        masked = cv2.bitwise_and(frame, frame, mask=mask)
-        
-        # Extract bounding box
-        x1 = max(0, cx - radius)
-        y1 = max(0, cy - radius)
-        x2 = min(w, cx + radius)
-        y2 = min(h, cy + radius)
-        cropped = masked[y1:y2, x1:x2].copy()
-        
-        # Resize to target dimensions
-        if cropped.shape[1] != slice_def.width or cropped.shape[0] != slice_def.height:
-            cropped = cv2.resize(cropped, (slice_def.width, slice_def.height))
-        
-        return cropped
+        # Create circular mask (pooled full-frame temporaries, released below)
+        pool = get_buffer_pool()
+        mask = pool.acquire((h, w), np.uint8, zero=True)
+        masked = pool.acquire(frame.shape, frame.dtype, zero=True)
+        try:
+            cv2.circle(mask, (cx, cy), radius, 255, -1)
+            
+            # Apply mask
+            cv2.bitwise_and(frame, frame, dst=masked, mask=mask)
+            
+            # Extract bounding box
+            x1 = max(0, cx - radius)
+            y1 = max(0, cy - radius)
+            x2 = min(w, cx + radius)
+            y2 = min(h, cy + radius)
+            region = masked[y1:y2, x1:x2]
+            
+            # Resize to target dimensions
+            if region.shape[1] != slice_def.width or region.shape[0] != slice_def.height:
+                return cv2.resize(region, (slice_def.width, slice_def.height))
+            return region.copy()
+        finally:
+            pool.release(masked)
+            pool.release(mask)
     
     def _apply_rotation(self, frame: np.ndarray, angle: float) -> np.ndarray:
         """Rotate frame by angle (degrees)"""
@@ -0,0 +1,276 @@
+"""
+Frame Pipeline - overlaps the CPU output stages of the play loop with rendering.
+
+Without a pipeline, ``Player._play_loop`` runs decode → effects → composite →
+output delivery → Art-Net routing strictly in sequence, so the frame time is
+the sum of all stages.  With the pipeline enabled the render thread only
+decodes and composites; the downloaded frame is handed to worker threads that
+run the CPU post-composite stages (output delivery, Art-Net sampling/sending)
+while the render thread already works on the next frame.
+
+Hand-offs are bounded single-slot mailboxes: a producer blocks while the slot
+is still occupied, so at most one frame waits in front of each worker and a
+slow output stage applies back-pressure instead of growing a queue.
+
+``depth`` is the number of worker threads the post stages are spread across:
+
+    depth=1   render │ [delivery + routing]                  (2 frames in flight)
+    depth=2   render │ [delivery] │ [routing]                (3 frames in flight)
+
+The time each frame spends waiting in a hand-off slot is reported to the
+profiler as ``pipeline_wait_<worker>``; the total latency the pipeline adds
+between submit and the last stage finishing is reported as
+``pipeline_latency``.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Callable, List, Optional, Tuple
+
+from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Stage callables receive the CPU frame (BGR uint8 ndarray).
+StageFn = Callable[[object], None]
+
+
+class FrameHandoff:
+    """Bounded single-slot mailbox between two pipeline stages."""
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._item = None
+        self._full = False
+        self._closed = False
+
+    def put(self, item, timeout: Optional[float] = None) -> bool:
+        """
+        Place *item* in the slot, blocking while the previous item is unread.
+
+        Returns:
+            False if the hand-off was closed or the timeout expired.
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: not self._full or self._closed, timeout):
+                return False
+            if self._closed:
+                return False
+            self._item = item
+            self._full = True
+            self._cond.notify_all()
+            return True
+
+    def get(self, timeout: Optional[float] = None):
+        """Take the item out of the slot; returns None on close/timeout."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._full or self._closed, timeout):
+                return None
+            if not self._full:
+                return None
+            item = self._item
+            self._item = None
+            self._full = False
+            self._cond.notify_all()
+            return item
+
+    def wait_empty(self, timeout: Optional[float] = None) -> bool:
+        """Block until the slot has been drained by the consumer."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._full or self._closed, timeout)
+
+    def close(self):
+        """Wake all waiters; subsequent put() calls are rejected."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class _PipelineItem:
+    __slots__ = ('frame', 'submitted', 'handed_off')
+
+    def __init__(self, frame):
+        self.frame = frame
+        self.submitted = time.perf_counter()
+        self.handed_off = self.submitted
+
+
+class FramePipeline:
+    """Runs the CPU post-composite stages of a player on worker threads."""
+
+    MAX_DEPTH = 4
+
+    def __init__(
+        self,
+        stages: List[Tuple[str, StageFn]],
+        depth: int = 1,
+        player_name: str = "Player",
+        profiler=None,
+    ):
+        """
+        Build the pipeline (threads are started by start()).
+
+        Args:
+            stages: Ordered (name, callable) list of post-composite stages
+            depth: Number of worker threads the stages are split across
+                   (clamped to 1..len(stages))
+            player_name: Player name for thread names and logging
+            profiler: PerformanceProfiler receiving wait/latency timings
+        """
+        if not stages:
+            raise ValueError("FramePipeline needs at least one stage")
+
+        self.player_name = player_name
+        self.profiler = profiler
+        self.depth = max(1, min(int(depth), len(stages), self.MAX_DEPTH))
+
+        # Split stages into `depth` contiguous groups, one worker per group.
+        self._groups: List[List[Tuple[str, StageFn]]] = [[] for _ in range(self.depth)]
+        per_group = -(-len(stages) // self.depth)  # ceil
+        for i, stage in enumerate(stages):
+            self._groups[min(i // per_group, self.depth - 1)].append(stage)
+        self._groups = [g for g in self._groups if g]
+        self.depth = len(self._groups)
+
+        self._handoffs = [FrameHandoff() for _ in self._groups]
+        self._threads: List[threading.Thread] = []
+        self._running = False
+
+        # Stats (GIL-atomic deque appends; read by get_stats())
+        self._wait_ms = [deque(maxlen=100) for _ in self._groups]
+        self._latency_ms: deque = deque(maxlen=100)
+        self.frames_submitted = 0
+        self.frames_completed = 0
+        self.producer_stall_ms = 0.0
+
+    @property
+    def worker_names(self) -> List[str]:
+        """Names of the worker groups (stage names joined with '+')."""
+        return ['+'.join(name for name, _ in group) for group in self._groups]
+
+    def start(self):
+        """Start one worker thread per stage group."""
+        if self._running:
+            return
+        self._running = True
+        self._handoffs = [FrameHandoff() for _ in self._groups]
+        self._threads = []
+        for idx in range(len(self._groups)):
+            t = threading.Thread(
+                target=self._worker,
+                args=(idx,),
+                name=f"{self.player_name}-pipeline-{idx}",
+                daemon=True,
+            )
+            t.start()
+            self._threads.append(t)
+        logger.debug(
+            f"[{self.player_name}] Frame pipeline started: depth={self.depth}, "
+            f"workers={self.worker_names}"
+        )
+
+    def submit(self, frame, timeout: Optional[float] = 1.0) -> bool:
+        """
+        Hand a composited frame to the first worker.
+
+        Blocks while the first hand-off slot is still occupied, i.e. while the
+        slowest post stage is behind the render thread.
+
+        Returns:
+            False if the pipeline is stopped or the worker did not free the
+            slot within *timeout* (the frame is dropped).
+        """
+        if not self._running:
+            return False
+        item = _PipelineItem(frame)
+        ok = self._handoffs[0].put(item, timeout)
+        stall = (time.perf_counter() - item.submitted) * 1000
+        self.producer_stall_ms = stall
+        if self.profiler is not None:
+            self.profiler.record_stage('pipeline_submit_stall', stall)
+        if ok:
+            self.frames_submitted += 1
+            # Wait starts when the slot accepted the frame, not when we blocked.
+            item.handed_off = time.perf_counter()
+        return ok
+
+    def _worker(self, idx: int):
+        inbox = self._handoffs[idx]
+        outbox = self._handoffs[idx + 1] if idx + 1 < len(self._handoffs) else None
+        stages = self._groups[idx]
+        wait_stage = f"pipeline_wait_{self.worker_names[idx]}"
+
+        while self._running:
+            item = inbox.get(timeout=0.1)
+            if item is None:
+                continue
+
+            wait_ms = (time.perf_counter() - item.handed_off) * 1000
+            self._wait_ms[idx].append(wait_ms)
+            if self.profiler is not None:
+                self.profiler.record_stage(wait_stage, wait_ms)
+
+            for name, fn in stages:
+                try:
+                    fn(item.frame)
+                except Exception as e:
+                    logger.error(f"[{self.player_name}] Pipeline stage '{name}' error: {e}", exc_info=True)
+
+            if outbox is not None:
+                item.handed_off = time.perf_counter()
+                # Block until downstream is free — never drop mid-pipeline.
+                while self._running and not outbox.put(item, timeout=0.1):
+                    pass
+            else:
+                latency = (time.perf_counter() - item.submitted) * 1000
+                self._latency_ms.append(latency)
+                self.frames_completed += 1
+                if self.profiler is not None:
+                    self.profiler.record_stage('pipeline_latency', latency)
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """Wait until every submitted frame has left the pipeline."""
+        deadline = time.perf_counter() + timeout
+        while self.frames_completed < self.frames_submitted:
+            if not self._running or time.perf_counter() >= deadline:
+                return False
+            time.sleep(0.001)
+        return True
+
+    def stop(self, timeout: float = 1.0):
+        """Drain in-flight frames, then stop and join the worker threads."""
+        if not self._running:
+            return
+        self.flush(timeout)
+        self._running = False
+        for handoff in self._handoffs:
+            handoff.close()
+        for t in self._threads:
+            if t is not threading.current_thread():
+                t.join(timeout=timeout)
+        self._threads = []
+        logger.debug(f"[{self.player_name}] Frame pipeline stopped")
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def get_stats(self) -> dict:
+        """Per-worker hand-off wait and end-to-end added latency (ms)."""
+        def _avg(values):
+            values = list(values)
+            return round(sum(values) / len(values), 3) if values else 0.0
+
+        return {
+            'depth': self.depth,
+            'frames_submitted': self.frames_submitted,
+            'frames_completed': self.frames_completed,
+            'producer_stall_ms': round(self.producer_stall_ms, 3),
+            'avg_latency_ms': _avg(self._latency_ms),
+            'workers': [
+                {'stages': name, 'avg_wait_ms': _avg(waits)}
+                for name, waits in zip(self.worker_names, self._wait_ms)
+            ],
+        }
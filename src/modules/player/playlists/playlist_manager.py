@@ -386,6 +386,7 @@ class MultiPlaylistSystem:
                                 effect=tc.get('effect', 'fade'),
                                 duration=tc.get('duration', 1.0),
                                 easing=tc.get('easing', 'ease_in_out'),
+                                params=tc.get('params'),
                             )
                     
                     # Apply clip parameters (includes per-clip effects)
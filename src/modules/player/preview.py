@@ -0,0 +1,323 @@
+"""
+Preview Sessions - lightweight live preview of non-active playlists.
+
+The old preview mode spun up two complete extra Player instances (own play
+loop, layer stack, effect chains, output manager) just to show a thumbnail
+of a playlist that is not on air.  A PreviewSession is the minimal subset:
+
+    source.get_next_frame()
+        → HAP: DXT upload + BC decode straight into a preview-sized GPUFrame
+        → generator: shader rendered at preview resolution
+    → PreviewDownscaler → JPEG → last_preview_jpeg
+
+No layers, effects, transitions or outputs.  All sessions are driven by ONE
+shared PreviewRenderWorker thread at a reduced frame rate, and only while a
+client is subscribed to the session's MJPEG stream — with no subscribers the
+worker blocks on its condition and sources are not advanced at all.
+
+Clip data is shared with the live players: VideoSource reuses the heap /
+memmap buffer of a clip that is already loaded (see sources/video.py), so
+previewing a clip that is on air costs no extra RAM.
+
+PreviewSession mirrors the Player attributes used by the playlist preview
+API (playlist, playlist_ids, autoplay, loop_playlist, load_clip_by_index,
+play/stop, is_running) so it can stand in for a preview Player.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import List, Optional
+
+import numpy as np
+
+from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class PreviewSession:
+    """On-demand preview of one playlist, rendered by the shared worker."""
+
+    def __init__(self, player_name: str, width: int, height: int, fps: float,
+                 config: dict = None, clip_registry=None, quality: int = 75):
+        self.player_name = player_name
+        self.canvas_width = width
+        self.canvas_height = height
+        self.fps = max(1.0, float(fps))
+        self.config = config or {}
+        self.clip_registry = clip_registry
+        self.quality = quality
+
+        # Playlist state (assigned by the preview API like on a Player)
+        self.playlist: List[str] = []
+        self.playlist_ids: List[str] = []
+        self.autoplay = False
+        self.loop_playlist = True
+        self.current_clip_index = 0
+
+        # Preview stream state (same names as Player so stream code is shared)
+        self.last_preview_jpeg: Optional[bytes] = None
+        self._preview_frame_cond = threading.Condition()
+        self._mjpeg_subscriber_count = 0
+
+        self.source = None
+        self._downscaler = None
+        self._lock = threading.RLock()
+        self._running = False
+        self._next_due = 0.0
+        self.frames_rendered = 0
+
+    # ── Player-compatible API ────────────────────────────────────────────────
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def is_playing(self) -> bool:
+        return self._running
+
+    def load_clip_by_index(self, index: int, notify_manager: bool = False) -> bool:
+        """Load the playlist item at *index* (notify_manager is ignored)."""
+        if index < 0 or index >= len(self.playlist):
+            logger.warning(f"[{self.player_name}] Invalid preview clip index: {index}")
+            return False
+        item = self.playlist[index]
+        clip_id = self.playlist_ids[index] if index < len(self.playlist_ids) else None
+        new_source = self._create_source(item, clip_id)
+        if new_source is None or not new_source.initialize():
+            logger.error(f"❌ [{self.player_name}] Failed to load preview clip: {item}")
+            return False
+        with self._lock:
+            old, self.source = self.source, new_source
+            self.current_clip_index = index
+            self._next_due = 0.0
+        if old is not None:
+            old.cleanup()
+        return True
+
+    def play(self):
+        """Register with the shared render worker (renders only while watched)."""
+        self._running = True
+        get_preview_worker().add(self)
+
+    def start(self):
+        self.play()
+
+    def stop(self):
+        """Unregister from the worker and release the source and downscaler."""
+        self._running = False
+        get_preview_worker().remove(self)
+        with self._lock:
+            if self.source is not None:
+                self.source.cleanup()
+                self.source = None
+            if self._downscaler is not None:
+                try:
+                    self._downscaler.release()
+                except Exception:
+                    pass
+                self._downscaler = None
+
+    # ── subscribers ──────────────────────────────────────────────────────────
+
+    def add_subscriber(self):
+        self._mjpeg_subscriber_count += 1
+        get_preview_worker().wake()
+
+    def remove_subscriber(self):
+        self._mjpeg_subscriber_count = max(0, self._mjpeg_subscriber_count - 1)
+
+    @property
+    def watched(self) -> bool:
+        return self._running and self._mjpeg_subscriber_count > 0
+
+    # ── rendering (worker thread) ────────────────────────────────────────────
+
+    def render_frame(self) -> None:
+        """Advance the source one frame and encode it; called by the worker."""
+        with self._lock:
+            source = self.source
+            if source is None:
+                return
+            frame, _ = source.get_next_frame()
+            if frame is None:
+                self._on_clip_end()
+                source = self.source
+                if source is None:
+                    return
+                frame, _ = source.get_next_frame()
+                if frame is None:
+                    return
+            jpeg = self._encode(frame, source)
+        if jpeg is not None:
+            self.last_preview_jpeg = jpeg
+            self.frames_rendered += 1
+            with self._preview_frame_cond:
+                self._preview_frame_cond.notify_all()
+
+    def _on_clip_end(self):
+        """Autoplay advances through the playlist, otherwise the clip loops."""
+        if self.autoplay and len(self.playlist) > 1:
+            nxt = self.current_clip_index + 1
+            if nxt >= len(self.playlist):
+                if not self.loop_playlist:
+                    self.source.reset()
+                    return
+                nxt = 0
+            if self.load_clip_by_index(nxt):
+                return
+        self.source.reset()
+
+    def _encode(self, frame, source) -> Optional[bytes]:
+        if self._downscaler is None:
+            from ..gpu.preview_downscaler import PreviewDownscaler
+            self._downscaler = PreviewDownscaler(self.canvas_width, self.canvas_height, self.quality)
+
+        if isinstance(frame, np.ndarray):
+            return self._downscaler.encode_numpy(frame)
+
+        from ..gpu.texture_pool import get_texture_pool
+        pool = get_texture_pool()
+        if isinstance(frame, memoryview):
+            # HAP: decode the BC texture straight into a preview-sized frame —
+            # the passthrough sample does the downscale, no full-res texture.
+            from ..gpu.hap_texture import get_hap_texture_pool
+            from ..gpu.renderer import get_renderer
+            hap_pool = get_hap_texture_pool()
+            hap_tex = hap_pool.acquire(source.width, source.height, source.dxt_variant)
+            gpu_frame = pool.acquire(self.canvas_width, self.canvas_height)
+            try:
+                hap_tex.upload(frame)
+                hap_tex.decode_to(gpu_frame, get_renderer())
+            finally:
+                hap_pool.release(hap_tex)
+        else:
+            gpu_frame = frame  # GPUFrame from GeneratorSource
+        try:
+            return self._downscaler.encode(gpu_frame)
+        finally:
+            pool.release(gpu_frame)
+
+    def _create_source(self, item: str, clip_id: Optional[str]):
+        from .sources import VideoSource, GeneratorSource
+        if item.startswith('generator:'):
+            generator_id = item[len('generator:'):]
+            parameters = {}
+            registry = self.clip_registry
+            if registry is not None and clip_id and clip_id in registry.clips:
+                parameters = dict(registry.clips[clip_id].get('metadata', {}).get('parameters') or {})
+            if 'playback_mode' not in parameters:
+                parameters['playback_mode'] = 'play_once' if self.autoplay else 'repeat'
+            # Rendered directly at preview resolution.
+            return GeneratorSource(generator_id, parameters, self.canvas_width,
+                                   self.canvas_height, self.config)
+        return VideoSource(item, self.canvas_width, self.canvas_height, self.config,
+                           clip_id=clip_id, player_name=self.player_name)
+
+    def get_status(self) -> dict:
+        return {
+            'player_name': self.player_name,
+            'running': self._running,
+            'subscribers': self._mjpeg_subscriber_count,
+            'clip_index': self.current_clip_index,
+            'fps': self.fps,
+            'resolution': [self.canvas_width, self.canvas_height],
+            'frames_rendered': self.frames_rendered,
+        }
+
+
+class PreviewRenderWorker:
+    """Single daemon thread rendering every watched PreviewSession on schedule."""
+
+    def __init__(self):
+        self._sessions: List[PreviewSession] = []
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def add(self, session: PreviewSession):
+        with self._cond:
+            if session not in self._sessions:
+                self._sessions.append(session)
+            self._ensure_thread()
+            self._cond.notify_all()
+
+    def remove(self, session: PreviewSession):
+        with self._cond:
+            if session in self._sessions:
+                self._sessions.remove(session)
+            self._cond.notify_all()
+
+    def wake(self):
+        """Re-evaluate sessions (e.g. a client subscribed to a preview stream)."""
+        with self._cond:
+            self._cond.notify_all()
+
+    @property
+    def sessions(self) -> List[PreviewSession]:
+        with self._cond:
+            return list(self._sessions)
+
+    def shutdown(self, timeout: float = 1.0):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._running = True
+            self._thread = threading.Thread(target=self._loop, name="PreviewRender", daemon=True)
+            self._thread.start()
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                if not self._running:
+                    return
+                watched = [s for s in self._sessions if s.watched]
+                if not watched:
+                    # Nobody is watching: suspend entirely until add()/wake().
+                    # The timeout only catches subscriber counts changed
+                    # without wake() (legacy stream code).
+                    self._cond.wait(timeout=1.0)
+                    continue
+                now = time.perf_counter()
+                next_due = min(s._next_due for s in watched)
+                if next_due > now:
+                    self._cond.wait(timeout=next_due - now)
+                    continue
+
+            for session in watched:
+                now = time.perf_counter()
+                if session._next_due > now:
+                    continue
+                # Fixed cadence without drift; skip ahead if we fell behind.
+                period = 1.0 / session.fps
+                next_due = session._next_due + period
+                session._next_due = next_due if next_due > now else now + period
+                try:
+                    session.render_frame()
+                except Exception as e:
+                    logger.error(f"[{session.player_name}] Preview render error: {e}", exc_info=True)
+
+
+# ---------------------------------------------------------------------------
+# Module-level singleton
+# ---------------------------------------------------------------------------
+
+_worker: PreviewRenderWorker | None = None
+_worker_lock = threading.Lock()
+
+
+def get_preview_worker() -> PreviewRenderWorker:
+    global _worker
+    if _worker is None:
+        with _worker_lock:
+            if _worker is None:
+                _worker = PreviewRenderWorker()
+    return _worker
@@ -1,3 +1,3 @@
 """Recording and replay"""
 
-__all__ = ['manager', 'replay']
+__all__ = ['manager', 'replay', 'recorder', 'dmx_file']
@@ -0,0 +1,301 @@
+"""
+DMX Recording File - chunked binary format for DMX recordings (.fxrec).
+
+Recordings used to be one JSON document holding every frame as a Python
+list, built in memory and dumped on stop.  A .fxrec file is written as it
+is recorded instead:
+
+    header      b'FXDMX', version, JSON metadata (name, created, ...)
+    chunk*      b'FXCK', codec, frame count, raw/payload length, first/last
+                timestamp, then the (optionally zlib compressed) records:
+                  'S' stream declaration   index → name (e.g. an output id)
+                  'F' frame                timestamp + (stream, DMX bytes)*
+    index       b'FXIX' + one entry per chunk (offset, frames, timestamps)
+    footer      JSON summary (frame count, duration, streams, ...)
+    tail        index/footer offsets + b'FXND'
+
+Index, footer and tail are written on close.  A file without them (crash,
+power loss) is still readable: DMXRecording rebuilds the chunk index by
+scanning the chunk headers.  Chunks are self-contained apart from stream
+declarations, so a reader can seek by timestamp and decode just one chunk.
+
+DMXRecording memory-maps the file: chunks are decompressed straight from
+the mapping and only the chunk index lives in process memory.
+"""
+
+import bisect
+import json
+import mmap
+import os
+import struct
+import zlib
+from typing import BinaryIO, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from ...core.logger import get_logger
+
+logger = get_logger(__name__)
+
+FILE_EXTENSION = '.fxrec'
+VERSION = 1
+
+CODEC_RAW = 0
+CODEC_ZLIB = 1
+
+_HEADER = struct.Struct('<5sBxxI')          # magic, version, metadata length
+_CHUNK = struct.Struct('<4sBxxxIIIdd')      # magic, codec, frames, raw len, payload len, t_first, t_last
+_INDEX_HEAD = struct.Struct('<4sI')         # magic, chunk count
+_INDEX_ENTRY = struct.Struct('<QIQdd')      # offset, frames, first frame, t_first, t_last
+_TAIL = struct.Struct('<QQI4s')             # index offset, footer offset, footer length, magic
+
+_MAGIC_FILE = b'FXDMX'
+_MAGIC_CHUNK = b'FXCK'
+_MAGIC_INDEX = b'FXIX'
+_MAGIC_TAIL = b'FXND'
+
+_REC_STREAM = struct.Struct('<cHH')         # b'S', stream index, name length
+_REC_FRAME = struct.Struct('<cdH')          # b'F', timestamp, entry count
+_REC_ENTRY = struct.Struct('<HI')           # stream index, data length
+
+
+class ChunkInfo(NamedTuple):
+    """Chunk index entry."""
+    offset: int         # file offset of the chunk header
+    frames: int
+    first_frame: int    # number of frames in all earlier chunks
+    t_first: float
+    t_last: float
+
+
+class DMXFileError(Exception):
+    """Raised for files that are not (readable) DMX recordings."""
+
+
+def encode_stream(index: int, name: str) -> bytes:
+    """Stream declaration record."""
+    raw = name.encode('utf-8')
+    return _REC_STREAM.pack(b'S', index, len(raw)) + raw
+
+
+def encode_frame(timestamp: float, entries: List[Tuple[int, bytes]]) -> List[bytes]:
+    """Frame record as a list of parts (joined into the chunk buffer by the caller)."""
+    parts = [_REC_FRAME.pack(b'F', timestamp, len(entries))]
+    for index, data in entries:
+        parts.append(_REC_ENTRY.pack(index, len(data)))
+        parts.append(data)
+    return parts
+
+
+def write_header(f: BinaryIO, metadata: dict) -> None:
+    meta = json.dumps(metadata).encode('utf-8')
+    f.write(_HEADER.pack(_MAGIC_FILE, VERSION, len(meta)))
+    f.write(meta)
+
+
+def write_chunk(f: BinaryIO, raw: bytes, frames: int, t_first: float, t_last: float,
+                compress: bool = True) -> int:
+    """
+    Append one chunk of encoded records.
+
+    Returns:
+        File offset of the chunk
+    """
+    codec, payload = CODEC_RAW, raw
+    if compress:
+        packed = zlib.compress(raw, 1)
+        if len(packed) < len(raw):
+            codec, payload = CODEC_ZLIB, packed
+    offset = f.tell()
+    f.write(_CHUNK.pack(_MAGIC_CHUNK, codec, frames, len(raw), len(payload), t_first, t_last))
+    f.write(payload)
+    return offset
+
+
+def write_trailer(f: BinaryIO, chunks: List[ChunkInfo], footer: dict) -> None:
+    """Chunk index, footer and tail (makes the file seekable without a scan)."""
+    index_offset = f.tell()
+    f.write(_INDEX_HEAD.pack(_MAGIC_INDEX, len(chunks)))
+    for chunk in chunks:
+        f.write(_INDEX_ENTRY.pack(*chunk))
+    footer_offset = f.tell()
+    raw = json.dumps(footer).encode('utf-8')
+    f.write(raw)
+    f.write(_TAIL.pack(index_offset, footer_offset, len(raw), _MAGIC_TAIL))
+
+
+def _read_header(f: BinaryIO) -> Tuple[dict, int]:
+    head = f.read(_HEADER.size)
+    if len(head) < _HEADER.size:
+        raise DMXFileError("File too short")
+    magic, version, meta_len = _HEADER.unpack(head)
+    if magic != _MAGIC_FILE:
+        raise DMXFileError("Not a DMX recording")
+    if version > VERSION:
+        raise DMXFileError(f"Unsupported recording version {version}")
+    return json.loads(f.read(meta_len).decode('utf-8')), _HEADER.size + meta_len
+
+
+def _read_tail(f: BinaryIO, size: int) -> Optional[Tuple[int, int, int]]:
+    """(index offset, footer offset, footer length), or None for unfinished files."""
+    if size < _TAIL.size:
+        return None
+    f.seek(size - _TAIL.size)
+    index_offset, footer_offset, footer_len, magic = _TAIL.unpack(f.read(_TAIL.size))
+    if magic != _MAGIC_TAIL or not index_offset <= footer_offset <= size - _TAIL.size:
+        return None
+    return index_offset, footer_offset, footer_len
+
+
+def read_info(path: str) -> dict:
+    """
+    Metadata and footer of a recording without touching the chunks.
+
+    Returns:
+        Header metadata updated with the footer ('complete' False when the
+        file has no footer, i.e. the recording was not closed)
+    """
+    with open(path, 'rb') as f:
+        info, _ = _read_header(f)
+        tail = _read_tail(f, os.fstat(f.fileno()).st_size)
+        if tail is None:
+            info['complete'] = False
+            return info
+        f.seek(tail[1])
+        info.update(json.loads(f.read(tail[2]).decode('utf-8')))
+        info['complete'] = True
+        return info
+
+
+class DMXRecording:
+    """Read access to a .fxrec file (index in memory, chunks decoded on demand)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._map = None
+        try:
+            self.metadata, self._data_offset = _read_header(self._file)
+            self.size = os.fstat(self._file.fileno()).st_size
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.streams: List[str] = []
+            self.chunks: List[ChunkInfo] = []
+            self.complete = self._load_index()
+        except Exception:
+            self.close()
+            raise
+        self._t_first = [chunk.t_first for chunk in self.chunks]
+
+    def _load_index(self) -> bool:
+        tail = _read_tail(self._file, self.size)
+        if tail is not None:
+            index_offset, footer_offset, footer_len = tail
+            magic, count = _INDEX_HEAD.unpack_from(self._map, index_offset)
+            if magic == _MAGIC_INDEX:
+                entries = _INDEX_ENTRY.iter_unpack(
+                    self._map[index_offset + _INDEX_HEAD.size:
+                              index_offset + _INDEX_HEAD.size + count * _INDEX_ENTRY.size])
+                self.chunks = [ChunkInfo(*entry) for entry in entries]
+                footer = json.loads(self._map[footer_offset:footer_offset + footer_len].decode('utf-8'))
+                self.metadata.update(footer)
+                self.streams = list(footer.get('streams', []))
+                return True
+        self._scan()
+        return False
+
+    def _scan(self) -> None:
+        """Rebuild the chunk index (and stream table) of an unfinished file."""
+        offset, first_frame = self._data_offset, 0
+        streams: Dict[int, str] = {}
+        while offset + _CHUNK.size <= self.size:
+            magic, codec, frames, raw_len, payload_len, t_first, t_last = _CHUNK.unpack_from(self._map, offset)
+            end = offset + _CHUNK.size + payload_len
+            if magic != _MAGIC_CHUNK or end > self.size:
+                break   # truncated last chunk
+            for index, name in self._declarations(self._payload(offset)):
+                streams[index] = name
+            self.chunks.append(ChunkInfo(offset, frames, first_frame, t_first, t_last))
+            first_frame += frames
+            offset = end
+        self.streams = [streams.get(i, f'stream-{i}') for i in range(max(streams, default=-1) + 1)]
+        logger.warning(f"⚠️ Recording {os.path.basename(self.path)} was not closed; "
+                       f"recovered {first_frame} frames")
+
+    @property
+    def frame_count(self) -> int:
+        last = self.chunks[-1] if self.chunks else None
+        return last.first_frame + last.frames if last else 0
+
+    @property
+    def duration(self) -> float:
+        return self.chunks[-1].t_last if self.chunks else 0.0
+
+    def _payload(self, offset: int) -> bytes:
+        magic, codec, frames, raw_len, payload_len, _, _ = _CHUNK.unpack_from(self._map, offset)
+        start = offset + _CHUNK.size
+        payload = memoryview(self._map)[start:start + payload_len]
+        try:
+            return zlib.decompress(payload) if codec == CODEC_ZLIB else payload.tobytes()
+        finally:
+            payload.release()
+
+    @staticmethod
+    def _declarations(raw: bytes) -> Iterator[Tuple[int, str]]:
+        for record in _records(raw):
+            if record[0] == 'S':
+                yield record[1], record[2]
+
+    def chunk_for_time(self, t: float) -> int:
+        """Index of the chunk holding the last frame at or before *t* (0 if none), O(log n)."""
+        return max(0, bisect.bisect_right(self._t_first, t) - 1)
+
+    def read_chunk(self, i: int) -> List[Tuple[float, Dict[str, bytes]]]:
+        """Decoded frames of chunk *i*: [(timestamp, {stream: DMX bytes})]."""
+        frames = []
+        streams = self.streams
+        for record in _records(self._payload(self.chunks[i].offset)):
+            if record[0] == 'F':
+                frames.append((record[1], {streams[index]: data for index, data in record[2]}))
+        return frames
+
+    def frames(self, start: float = 0.0) -> Iterator[Tuple[float, Dict[str, bytes]]]:
+        """All frames from timestamp *start* on, in order."""
+        for i in range(self.chunk_for_time(start), len(self.chunks)):
+            for frame in self.read_chunk(i):
+                if frame[0] >= start:
+                    yield frame
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _records(raw: bytes) -> Iterator[tuple]:
+    """('S', index, name) and ('F', timestamp, [(index, data)]) records of a chunk."""
+    view = memoryview(raw)
+    pos, end = 0, len(raw)
+    while pos < end:
+        kind = raw[pos:pos + 1]
+        if kind == b'F':
+            _, timestamp, count = _REC_FRAME.unpack_from(raw, pos)
+            pos += _REC_FRAME.size
+            entries = []
+            for _ in range(count):
+                index, length = _REC_ENTRY.unpack_from(raw, pos)
+                pos += _REC_ENTRY.size
+                entries.append((index, bytes(view[pos:pos + length])))
+                pos += length
+            yield ('F', timestamp, entries)
+        elif kind == b'S':
+            _, index, length = _REC_STREAM.unpack_from(raw, pos)
+            pos += _REC_STREAM.size
+            yield ('S', index, bytes(view[pos:pos + length]).decode('utf-8'))
+            pos += length
+        else:
+            raise DMXFileError(f"Corrupt chunk record at {pos}")
@@ -1,28 +1,47 @@
 """
 Recording Manager - Handles frame recording and playback
+
+Frames are streamed to a chunked binary .fxrec file by a DMXRecorder while
+recording (see recorder.py), so memory use does not grow with the length
+of the recording and stopping only has to flush the last chunk.
 """
 import os
-import json
 from datetime import datetime
-from collections import deque
+from .recorder import DMXRecorder
+from .dmx_file import FILE_EXTENSION
 from ...core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Stream name of frames added through add_frame() (single DMX buffer)
+DEFAULT_STREAM = 'dmx'
+
+
+def default_records_dir():
+    """Directory recordings are written to and replayed from (src/records)."""
+    base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+    return os.path.join(base_path, 'records')
+
 
 class RecordingManager:
-    """Manages frame recording and saving to JSON files."""
+    """Manages frame recording to .fxrec files."""
     
-    def __init__(self, max_frames=36000):
+    def __init__(self, records_dir=None, compress=True):
         """
         Initialize RecordingManager.
         
         Args:
-            max_frames: Maximum frames to record (default: 36000 = ~20min @ 30fps)
+            records_dir: Target directory (default: <project>/records)
+            compress: zlib-compress recording chunks
         """
-        self.is_recording = False
-        self.recorded_data = deque(maxlen=max_frames)
+        self.records_dir = records_dir or default_records_dir()
+        self.recorder = DMXRecorder(compress=compress)
         self.recording_name = None
+        self._filename = None
+    
+    @property
+    def is_recording(self):
+        return self.recorder.is_recording
         
     def start_recording(self, name=None):
         """
@@ -37,16 +56,24 @@ class RecordingManager:
         if self.is_recording:
             logger.warning("Recording already active!")
             return False
-            
-        self.is_recording = True
-        self.recorded_data.clear()
+        
+        # Generate filename with timestamp
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.recording_name = name or "Unnamed"
+        safe_name = "".join(c for c in (name or "recording")
+                           if c.isalnum() or c in (' ', '_', '-')).strip()
+        filename = f"{safe_name}_{timestamp}{FILE_EXTENSION}"
+        
+        if not self.recorder.start(os.path.join(self.records_dir, filename),
+                                   {'name': self.recording_name, 'timestamp': timestamp}):
+            return False
+        self._filename = filename
         logger.debug(f"Recording started: {self.recording_name}")
         return True
     
     def stop_recording(self, canvas_width=None, canvas_height=None, total_points=None):
         """
-        Stop recording and save to file.
+        Stop recording and finish the file.
         
         Args:
             canvas_width: Canvas width for metadata
@@ -60,58 +87,51 @@ class RecordingManager:
             logger.debug("No recording active!")
             return None
         
-        self.is_recording = False
-        frame_count = len(self.recorded_data)
-        
-        if frame_count == 0:
-            logger.debug("No frames recorded")
-            return None
-        
-        # Create records directory if not exists
-        base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-        records_dir = os.path.join(base_path, 'records')
-        os.makedirs(records_dir, exist_ok=True)
-        
-        # Generate filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_name = "".join(c for c in (self.recording_name or "recording") 
-                           if c.isalnum() or c in (' ', '_', '-')).strip()
-        filename = f"{safe_name}_{timestamp}.json"
-        filepath = os.path.join(records_dir, filename)
-        
-        # Build recording data
-        recording_data = {
-            'name': self.recording_name or "Unnamed Recording",
-            'timestamp': timestamp,
-            'frame_count': frame_count,
-            'total_duration': self.recorded_data[-1]['timestamp'] if self.recorded_data else 0,
+        summary = self.recorder.stop({
             'canvas_width': canvas_width,
             'canvas_height': canvas_height,
-            'total_points': total_points,
-            'frames': list(self.recorded_data)
-        }
+            'total_points': total_points
+        })
         
-        try:
-            with open(filepath, 'w') as f:
-                json.dump(recording_data, f)
-            logger.debug(f"✅ Recording saved: {filename} ({frame_count} frames)")
-            return filename
-        except Exception as e:
-            logger.error(f"❌ Error saving recording: {e}")
+        if summary['error']:
+            logger.error(f"❌ Error saving recording: {summary['error']}")
+            return None
+        if summary['frame_count'] == 0:
+            logger.debug("No frames recorded")
+            os.remove(summary['path'])
             return None
+        
+        logger.debug(f"✅ Recording saved: {self._filename} ({summary['frame_count']} frames)")
+        return self._filename
     
     def add_frame(self, frame_data):
         """
         Add frame to recording.
         
         Args:
-            frame_data: Frame data dict with timestamp and data
+            frame_data: Frame data dict with timestamp and dmx_data
         """
         if self.is_recording:
-            self.recorded_data.append(frame_data)
+            self.recorder.record({DEFAULT_STREAM: bytes(frame_data['dmx_data'])},
+                                 frame_data.get('timestamp'))
+    
+    def add_output_frames(self, frames):
+        """
+        Add one frame of several outputs to the recording.
+        
+        Args:
+            frames: Dictionary of output_id → DMX bytes
+        """
+        if self.is_recording:
+            self.recorder.record(frames)
+    
+    def get_stats(self):
+        """Recorder statistics (frames, bytes, drops)."""
+        return self.recorder.get_stats()
     
     def clear(self):
-        """Clear recorded data."""
-        self.recorded_data.clear()
+        """Stop an active recording and reset."""
+        if self.is_recording:
+            self.recorder.stop()
         self.recording_name = None
-        self.is_recording = False
+        self._filename = None
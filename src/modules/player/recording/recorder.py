@@ -0,0 +1,233 @@
+"""
+DMX Recorder - streams DMX frames to a .fxrec file on a writer thread.
+
+record() is called from the render/output thread and only queues the
+frame (bytes objects are not copied).  The DMXRecWriter thread encodes the
+frames into the current chunk and writes the chunk, zlib compressed, once
+it reaches chunk_bytes or chunk_seconds.  Memory use is bounded by the
+queue length and one chunk, however long the recording runs; the only
+thing that grows is the chunk index (one 36-byte entry per chunk).
+
+When the writer falls behind (slow disk) the queue fills up and record()
+drops the frame instead of blocking the caller; drops are counted in the
+footer and in get_stats().
+"""
+
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from . import dmx_file
+from .dmx_file import ChunkInfo
+from ...core.logger import get_logger
+
+logger = get_logger(__name__)
+
+_STOP = object()
+
+
+class DMXRecorder:
+    """Constant-memory streaming recorder for {stream: DMX bytes} frames."""
+
+    def __init__(self, chunk_bytes: int = 1 << 20, chunk_seconds: float = 1.0,
+                 compress: bool = True, queue_frames: int = 512):
+        """
+        Args:
+            chunk_bytes: Uncompressed chunk size that triggers a write
+            chunk_seconds: Maximum time span of one chunk (seek granularity)
+            compress: zlib-compress chunks (kept raw when that does not help)
+            queue_frames: Frames buffered for the writer before record() drops
+        """
+        self.chunk_bytes = chunk_bytes
+        self.chunk_seconds = chunk_seconds
+        self.compress = compress
+        self.queue_frames = queue_frames
+
+        self.path: Optional[str] = None
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        self._recording = False
+        self._start_time = 0.0
+        self._footer_extra: dict = {}
+        self._lock = threading.Lock()
+        self._reset_counters()
+
+    def _reset_counters(self) -> None:
+        self.frame_count = 0
+        self.dropped = 0
+        self.bytes_written = 0
+        self.duration = 0.0
+        self.error: Optional[str] = None
+
+    @property
+    def is_recording(self) -> bool:
+        return self._recording
+
+    def start(self, path: str, metadata: Optional[dict] = None) -> bool:
+        """
+        Open *path* and start the writer thread.
+
+        Args:
+            path: Target file (parent directory is created)
+            metadata: JSON-serializable header metadata (name, canvas, ...)
+
+        Returns:
+            False if already recording or the file cannot be created
+        """
+        with self._lock:
+            if self._recording:
+                logger.warning("Recording already active!")
+                return False
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+                f = open(path, 'wb')
+                header = {'created': datetime.now().isoformat(timespec='seconds')}
+                header.update(metadata or {})
+                dmx_file.write_header(f, header)
+            except Exception as e:
+                logger.error(f"❌ Cannot create recording {path}: {e}")
+                return False
+
+            self._reset_counters()
+            self.path = path
+            self._queue = queue.Queue(maxsize=self.queue_frames)
+            self._start_time = time.monotonic()
+            self._recording = True
+            self._thread = threading.Thread(target=self._writer_loop, args=(f, self._queue),
+                                            name='DMXRecWriter', daemon=True)
+            self._thread.start()
+        logger.debug(f"⏺️ Recording started: {path}")
+        return True
+
+    def record(self, frames: Dict[str, bytes], timestamp: Optional[float] = None) -> bool:
+        """
+        Queue one frame (never blocks).
+
+        Args:
+            frames: stream name (e.g. output id) → DMX bytes
+            timestamp: Seconds since start (default: monotonic clock)
+
+        Returns:
+            False if not recording or the frame was dropped
+        """
+        q = self._queue
+        if not self._recording or q is None:
+            return False
+        if timestamp is None:
+            timestamp = time.monotonic() - self._start_time
+        frames = {name: data if isinstance(data, bytes) else bytes(data) for name, data in frames.items()}
+        try:
+            q.put_nowait((timestamp, frames))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def stop(self, footer: Optional[dict] = None) -> Optional[dict]:
+        """
+        Flush, write index and footer, and close the file.
+
+        Args:
+            footer: Extra summary fields stored in the footer
+
+        Returns:
+            Summary dict (path, frame_count, duration, bytes, dropped) or None
+            if no recording was active
+        """
+        with self._lock:
+            if not self._recording:
+                return None
+            self._recording = False
+            self._footer_extra = footer or {}
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+            self._queue = None
+        summary = self.get_stats()
+        logger.debug(f"✅ Recording saved: {self.path} ({self.frame_count} frames, "
+                     f"{self.bytes_written / 1e6:.1f} MB, {self.dropped} dropped)")
+        return summary
+
+    def get_stats(self) -> dict:
+        return {
+            'recording': self._recording,
+            'path': self.path,
+            'frame_count': self.frame_count,
+            'duration': self.duration,
+            'bytes': self.bytes_written,
+            'dropped': self.dropped,
+            'error': self.error,
+        }
+
+    # -------------------------------------------------------------------------
+    # Writer thread
+    # -------------------------------------------------------------------------
+
+    def _writer_loop(self, f, q: queue.Queue) -> None:
+        streams: Dict[str, int] = {}
+        chunks: List[ChunkInfo] = []
+        parts: List[bytes] = []
+        size = 0
+        chunk_frames = 0
+        t_first = t_last = 0.0
+
+        def flush():
+            nonlocal parts, size, chunk_frames
+            offset = dmx_file.write_chunk(f, b''.join(parts), chunk_frames, t_first, t_last, self.compress)
+            chunks.append(ChunkInfo(offset, chunk_frames, self.frame_count - chunk_frames, t_first, t_last))
+            self.bytes_written = f.tell()
+            parts, size, chunk_frames = [], 0, 0
+
+        def fail(e):
+            self.error = str(e)
+            logger.error(f"❌ Recording write failed: {e}")
+
+        try:
+            while True:
+                item = q.get()
+                if item is _STOP:
+                    break
+                if self.error is not None:
+                    continue   # keep draining after a write error
+                timestamp, frames = item
+                try:
+                    if chunk_frames and (size >= self.chunk_bytes or timestamp - t_first >= self.chunk_seconds):
+                        flush()
+                    entries = []
+                    for name, data in frames.items():
+                        index = streams.get(name)
+                        if index is None:
+                            index = streams[name] = len(streams)
+                            parts.append(dmx_file.encode_stream(index, name))
+                        entries.append((index, data))
+                    record = dmx_file.encode_frame(timestamp, entries)
+                    parts.extend(record)
+                    size += sum(len(p) for p in record)
+                    if chunk_frames == 0:
+                        t_first = timestamp
+                    t_last = timestamp
+                    chunk_frames += 1
+                    self.frame_count += 1
+                    self.duration = timestamp
+                except Exception as e:
+                    fail(e)
+
+            if self.error is None:
+                if chunk_frames:
+                    flush()
+                footer = dict(self._footer_extra)
+                footer.update({
+                    'frame_count': self.frame_count,
+                    'duration': self.duration,
+                    'streams': sorted(streams, key=streams.get),
+                    'dropped': self.dropped,
+                })
+                dmx_file.write_trailer(f, chunks, footer)
+                self.bytes_written = f.tell()
+        except Exception as e:
+            fail(e)
+        finally:
+            f.close()
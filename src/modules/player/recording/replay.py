@@ -1,77 +1,156 @@
 ﻿"""
 Replay Manager - Spielt aufgezeichnete DMX-Daten ab
-Independent of player, directly via Art-Net
+Independent of player, output through RoutingBridge (OutputManager/ArtNetSender)
+
+Recordings (.fxrec, see dmx_file.py) are memory-mapped and decoded one
+chunk at a time; seeking is a binary search over the chunk index and then
+over the frames of one chunk.  Frames are scheduled against
+time.monotonic() from a fixed anchor (position = anchor_pos +
+(now - anchor_wall) × speed), so sleep jitter never accumulates: a late
+wake-up sends the newest due frame and skips the ones it missed.
+Brightness is applied with a 256-entry lookup table on the raw bytes.
 """
+import bisect
 import os
-import json
 import time
 import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from . import dmx_file
+from .dmx_file import DMXRecording, FILE_EXTENSION
+from .manager import default_records_dir
+from ...core.catalogue import FileCatalogue
 from ...core.logger import get_logger
 
 logger = get_logger(__name__)
 
+Frame = Tuple[float, Dict[str, bytes]]
+
+
+class ReplayCursor:
+    """Playback position in a DMXRecording (O(log n) seek, sequential advance)."""
+
+    def __init__(self, recording: DMXRecording):
+        self.recording = recording
+        self._chunk = -1
+        self._frames: List[Frame] = []
+        self._times: List[float] = []
+        self._index = -1   # last returned frame in the loaded chunk
+
+    def _load(self, chunk: int) -> None:
+        if chunk != self._chunk:
+            self._frames = self.recording.read_chunk(chunk)
+            self._times = [frame[0] for frame in self._frames]
+            self._chunk = chunk
+
+    @property
+    def frame_number(self) -> int:
+        """Global number of the last returned frame (-1 before the first)."""
+        if self._chunk < 0:
+            return -1
+        return self.recording.chunks[self._chunk].first_frame + self._index
+
+    def seek(self, t: float) -> Optional[Frame]:
+        """Move to the last frame at or before *t* and return it (None if before the first)."""
+        if not self.recording.chunks:
+            return None
+        self._load(self.recording.chunk_for_time(t))
+        self._index = bisect.bisect_right(self._times, t) - 1
+        return self._frames[self._index] if self._index >= 0 else None
+
+    def advance(self, t: float) -> Tuple[Optional[Frame], int]:
+        """
+        Newest frame after the current one with timestamp ≤ *t*.
+
+        Returns:
+            (frame or None if nothing new is due, number of frames skipped)
+        """
+        if not self.recording.chunks:
+            return None, 0
+        before = self.frame_number
+        chunk = self.recording.chunk_for_time(t)
+        if chunk > self._chunk:
+            # t is past the loaded chunk: jump straight to the chunk holding t
+            self._load(chunk)
+            self._index = -1
+        index = bisect.bisect_right(self._times, t, lo=self._index + 1) - 1
+        if index <= self._index:
+            return None, 0
+        self._index = index
+        return self._frames[index], self.frame_number - before - 1
+
+    def next_timestamp(self) -> Optional[float]:
+        """Timestamp of the frame after the current one (None at the end)."""
+        if self._index + 1 < len(self._frames):
+            return self._times[self._index + 1]
+        if self._chunk + 1 < len(self.recording.chunks):
+            return self.recording.chunks[self._chunk + 1].t_first
+        return None
+
+
+def _recording_info(path: str) -> dict:
+    """Catalogue entry of a recording (header and footer only)."""
+    info = dmx_file.read_info(path)
+    return {
+        'name': info.get('name', os.path.basename(path)),
+        'frame_count': info.get('frame_count', 0),
+        'duration': info.get('duration', 0)
+    }
+
 
 class ReplayManager:
     """Verwaltet Wiedergabe von aufgezeichneten DMX-Sequenzen."""
     
-    def __init__(self, artnet_manager, config=None, player=None):
+    def __init__(self, routing_bridge=None, config=None, player=None, records_dir=None):
         """
         Initialisiert Replay Manager.
         
         Args:
-            artnet_manager: ArtNetManager instance for output
+            routing_bridge: RoutingBridge used for output (send_replay_frame)
             config: Konfigurations-Dict
             player: Player-Instanz (optional, wird beim Start gestoppt)
+            records_dir: Recordings directory (default: RecordingManager's)
         """
-        self.artnet_manager = artnet_manager
+        self.routing_bridge = routing_bridge
         self.config = config or {}
         self.player = player
         
         # Replay State
         self.is_playing = False
         self.replay_thread = None
-        self.current_recording = None
+        self.current_recording: Optional[DMXRecording] = None
+        self._cursor: Optional[ReplayCursor] = None
         
         # Steuerung
         self.brightness = 1.0  # 0.0 - 1.0
         self.speed_factor = 1.0
         self.loop_enabled = True
+        self._lut: Optional[np.ndarray] = None   # brightness lookup (None = 100%)
+        
+        # Clock anchor: position = anchor_pos + (monotonic - anchor_wall) * speed
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._anchor_wall = 0.0
+        self._anchor_pos = 0.0
+        self._seek_to: Optional[float] = None
+        self.frames_sent = 0
+        self.frames_skipped = 0
         
         # Records Ordner
-        base_path = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-        self.records_dir = os.path.join(base_path, 'records')
+        self.records_dir = records_dir or default_records_dir()
         os.makedirs(self.records_dir, exist_ok=True)
+        self.catalogue = FileCatalogue(self.records_dir, FILE_EXTENSION, _recording_info)
     
     def list_recordings(self):
-        """Returns list of all recordings."""
-        if not os.path.exists(self.records_dir):
-            return []
-        
-        recordings = []
-        for filename in sorted(os.listdir(self.records_dir), reverse=True):
-            if filename.endswith('.json'):
-                filepath = os.path.join(self.records_dir, filename)
-                try:
-                    stat = os.stat(filepath)
-                    # Lade Metadaten aus Datei
-                    with open(filepath, 'r') as f:
-                        data = json.load(f)
-                    
-                    recordings.append({
-                        'filename': filename,
-                        'name': data.get('name', filename),
-                        'frame_count': data.get('frame_count', 0),
-                        'duration': data.get('total_duration', 0),
-                        'size': stat.st_size,
-                        'modified': stat.st_mtime
-                    })
-                except Exception as e:
-                    logger.warning(f"Fehler beim Lesen von {filename}: {e}")
-        
+        """Returns list of all recordings (newest filename first)."""
+        recordings = self.catalogue.list()
+        recordings.sort(key=lambda r: r['filename'], reverse=True)
         return recordings
     
     def load_recording(self, filename):
-        """Loads a recording."""
+        """Loads (memory-maps) a recording."""
         filepath = os.path.join(self.records_dir, filename)
         
         if not os.path.exists(filepath):
@@ -79,15 +158,32 @@ class ReplayManager:
             return False
         
         try:
-            with open(filepath, 'r') as f:
-                self.current_recording = json.load(f)
-            
-            logger.debug(f"✅ Aufzeichnung geladen: {self.current_recording.get('name', filename)} "
-                       f"({self.current_recording.get('frame_count', 0)} Frames)")
-            return True
+            recording = DMXRecording(filepath)
         except Exception as e:
             logger.error(f"❌ Fehler beim Laden: {e}")
             return False
+        
+        self.stop()
+        self._close_recording()
+        self.current_recording = recording
+        self._cursor = ReplayCursor(recording)
+        with self._lock:
+            # A new recording starts from its beginning, not from the old position
+            self._anchor_pos = 0.0
+            self._seek_to = None
+        logger.debug(f"✅ Aufzeichnung geladen: {recording.metadata.get('name', filename)} "
+                     f"({recording.frame_count} Frames)")
+        return True
+    
+    def _close_recording(self):
+        if self.current_recording is not None:
+            self.current_recording.close()
+        self.current_recording = None
+        self._cursor = None
+    
+    @property
+    def duration(self) -> float:
+        return self.current_recording.duration if self.current_recording else 0.0
     
     def start(self):
         """Startet Replay-Wiedergabe."""
@@ -105,14 +201,24 @@ class ReplayManager:
             logger.debug("Video stopped for replay")
         
         # Aktiviere Replay-Modus (blockiert Video-Ausgabe)
-        # Note: artnet_manager removed - replay needs reimplementation with routing_bridge
-        if self.artnet_manager:
-            logger.warning("Replay: artnet_manager deprecated, output disabled")
+        if self.routing_bridge is not None:
+            self.routing_bridge.replay_active = True
+        else:
+            logger.warning("Replay: no routing bridge, output disabled")
         
+        with self._lock:
+            # Resume where the last replay stopped (from the start once finished)
+            if self._anchor_pos >= self.duration:
+                self._anchor_pos = 0.0
+            self._seek_to = self._anchor_pos
+            self._anchor_wall = time.monotonic()
+        self.frames_sent = 0
+        self.frames_skipped = 0
+        self._wake.clear()
         self.is_playing = True
-        self.replay_thread = threading.Thread(target=self._replay_loop, daemon=True)
+        self.replay_thread = threading.Thread(target=self._replay_loop, name='DMXReplay', daemon=True)
         self.replay_thread.start()
-        logger.debug(f"▶️ Replay gestartet: {self.current_recording.get('name', 'Unknown')}")
+        logger.debug(f"▶️ Replay gestartet: {self.current_recording.metadata.get('name', 'Unknown')}")
         return True
     
     def stop(self):
@@ -120,61 +226,141 @@ class ReplayManager:
         if not self.is_playing:
             return False
         
+        with self._lock:
+            self._anchor_pos = self._position(time.monotonic())
         self.is_playing = False
+        self._wake.set()
         if self.replay_thread:
             self.replay_thread.join(timeout=2)
         
         # Deaktiviere Replay-Modus (erlaubt Video-Ausgabe)
-        # Note: artnet_manager removed
+        if self.routing_bridge is not None:
+            self.routing_bridge.replay_active = False
         
         logger.debug("⏹️ Replay gestoppt")
         return True
     
+    def seek(self, timestamp):
+        """Jumps to *timestamp* (seconds, recording time)."""
+        if not self.current_recording:
+            return False
+        t = min(max(0.0, float(timestamp)), self.duration)
+        with self._lock:
+            self._anchor_pos = t
+            self._anchor_wall = time.monotonic()
+            self._seek_to = t
+        self._wake.set()
+        if not self.is_playing:
+            # Send the frame at the new position right away
+            frame = self._cursor.seek(t)
+            self._seek_to = None
+            if frame is not None:
+                self._output(frame[1])
+        return True
+    
+    def get_position(self) -> float:
+        """Current replay position in seconds."""
+        with self._lock:
+            return self._position(time.monotonic())
+    
+    def _position(self, now: float) -> float:
+        if not self.is_playing:
+            return self._anchor_pos
+        return self._anchor_pos + (now - self._anchor_wall) * self.speed_factor
+    
+    def _rebase(self, now: float) -> None:
+        """Move the clock anchor to *now* (before changing the speed)."""
+        self._anchor_pos = self._position(now)
+        self._anchor_wall = now
+    
+    def _loop_length(self) -> float:
+        """Recording length incl. one average frame interval (gap before frame 0 repeats).
+
+        Never shorter than one output frame (artnet.fps): a single-frame
+        recording has no duration and would otherwise loop without sleeping.
+        """
+        rec = self.current_recording
+        min_interval = 1.0 / (self.config.get('artnet', {}).get('fps') or 30)
+        return max(rec.duration + rec.duration / max(rec.frame_count - 1, 1), min_interval)
+    
+    def _output(self, frames: Dict[str, bytes]) -> None:
+        lut = self._lut
+        if lut is not None:
+            frames = {output_id: lut[np.frombuffer(data, dtype=np.uint8)].tobytes()
+                      for output_id, data in frames.items()}
+        if self.routing_bridge is not None:
+            self.routing_bridge.send_replay_frame(frames)
+        self.frames_sent += 1
+    
     def _replay_loop(self):
-        """Replay-Loop - spielt Frames mit Timing, Brightness und Speed ab."""
-        if not self.current_recording or not self.current_recording.get('frames'):
+        """Replay-Loop - sends due frames against the monotonic clock."""
+        rec = self.current_recording
+        cursor = self._cursor
+        if not rec or rec.frame_count == 0:
             logger.error("Keine Replay-Daten vorhanden!")
             self.is_playing = False
             return
         
-        frames = self.current_recording['frames']
-        logger.debug(f"Replay-Loop: {len(frames)} Frames, Speed: {self.speed_factor}x")
+        logger.debug(f"Replay-Loop: {rec.frame_count} Frames, Speed: {self.speed_factor}x")
         
         while self.is_playing:
-            start_time = time.time()
+            self._wake.clear()
+            with self._lock:
+                now = time.monotonic()
+                seek_to, self._seek_to = self._seek_to, None
+                position = self._position(now)
+                if seek_to is None and cursor.next_timestamp() is None:
+                    # End of recording
+                    loop_length = self._loop_length()
+                    if position >= loop_length:
+                        if not self.loop_enabled:
+                            break
+                        # Keep the schedule: loop start is where loop_length fell due
+                        self._anchor_wall += (loop_length - self._anchor_pos) / self.speed_factor
+                        self._anchor_pos = 0.0
+                        position = self._position(now)
+                        seek_to = position
             
-            for i, frame_data in enumerate(frames):
-                if not self.is_playing:
-                    break
-                
-                # Berechne Ziel-Zeit mit Speed-Faktor
-                target_timestamp = frame_data['timestamp'] / self.speed_factor
-                target_time = start_time + target_timestamp
-                current_time = time.time()
-                
-                # Warte bis korrekter Zeitpunkt
-                if current_time < target_time:
-                    time.sleep(target_time - current_time)
-                
-                # Hole DMX-Daten und wende Helligkeit an
-                dmx_data = frame_data['dmx_data'].copy()
-                
-                if self.brightness < 1.0:
-                    # Apply brightness to all channels
-                    dmx_data = [int(val * self.brightness) for val in dmx_data]
-                
-                # Send via Art-Net with replay priority
-                # Note: artnet_manager removed - replay needs reimplementation with routing_bridge
-                if self.artnet_manager:
-                    logger.warning("Replay: Cannot send frame - artnet_manager deprecated")
+            if seek_to is not None:
+                frame, skipped = cursor.seek(seek_to), 0
+            else:
+                frame, skipped = cursor.advance(position)
+            if frame is not None:
+                self._output(frame[1])
+                self.frames_skipped += skipped
             
-            # Loop beenden wenn nicht aktiviert
-            if not self.loop_enabled:
-                break
+            # Sleep until the next frame is due (or until woken by seek/speed/stop)
+            next_t = cursor.next_timestamp()
+            if next_t is None:
+                next_t = self._loop_length()
+            with self._lock:
+                wake_at = self._anchor_wall + (next_t - self._anchor_pos) / self.speed_factor
+            delay = wake_at - time.monotonic()
+            if delay > 0:
+                self._wake.wait(delay)
         
+        with self._lock:
+            self._anchor_pos = min(self._position(time.monotonic()), rec.duration)
         self.is_playing = False
+        if self.routing_bridge is not None:
+            self.routing_bridge.replay_active = False
         logger.debug("Replay-Loop beendet")
     
+    def get_status(self) -> dict:
+        """Replay state for the UI."""
+        rec = self.current_recording
+        return {
+            'playing': self.is_playing,
+            'recording': rec.metadata.get('name') if rec else None,
+            'position': self.get_position(),
+            'duration': self.duration,
+            'speed': self.speed_factor,
+            'brightness': self.brightness,
+            'loop': self.loop_enabled,
+            'frames_sent': self.frames_sent,
+            'frames_skipped': self.frames_skipped
+        }
+    
     def set_brightness(self, value):
         """Setzt Helligkeit (0-100)."""
         try:
@@ -182,6 +368,8 @@ class ReplayManager:
             if val < 0 or val > 100:
                 return
             self.brightness = val / 100.0
+            self._lut = None if val >= 100 else \
+                (np.arange(256) * self.brightness).astype(np.uint8)
             logger.debug(f"Replay Helligkeit: {val}%")
         except ValueError:
             pass
@@ -192,7 +380,10 @@ class ReplayManager:
             val = float(value)
             if val <= 0:
                 return
-            self.speed_factor = val
+            with self._lock:
+                self._rebase(time.monotonic())
+                self.speed_factor = val
+            self._wake.set()
             logger.debug(f"Replay Geschwindigkeit: {val}x")
         except ValueError:
             pass
@@ -205,3 +396,8 @@ class ReplayManager:
     def set_player(self, player):
         """Sets player reference (for later initialization)."""
         self.player = player
+    
+    def cleanup(self):
+        """Stops replay and unmaps the recording."""
+        self.stop()
+        self._close_recording()
@@ -7,7 +7,9 @@ so they can be called as standalone functions or as thin method delegates.
 Entry points (called from PlayerManager):
     init_sequencer(mgr)
     set_sequencer_mode(mgr, enabled)
-    sequencer_advance_slaves(mgr, slot_index, force_reload=False)
+    sequencer_advance_slaves(mgr, slot_index, force_reload=False, skip=None)
+    sequencer_prearm_slot(mgr, slot_index)
+    sequencer_schedule_slot(mgr, slot_index, at, on_commit=None)
     update_all_slave_caches(mgr)
     update_sequences(mgr, dt)
 
@@ -79,11 +81,13 @@ def set_sequencer_mode(mgr, enabled: bool) -> None:
 
 # ─── Slot advance ─────────────────────────────────────────────────────────────
 
-def sequencer_advance_slaves(mgr, slot_index: int, force_reload: bool = False) -> None:
+def sequencer_advance_slaves(mgr, slot_index: int, force_reload: bool = False,
+                             skip=None) -> None:
     """Advance every player to the clip that matches *slot_index*.
 
     Called when the sequencer crosses a slot boundary.  Slot index maps
     directly to clip index (slot 0 → clip 0, slot 1 → clip 1, …).
+    Players in *skip* were already handed the clip by sequencer_schedule_slot().
     """
     logger.debug(f"🎯 Sequencer slot {slot_index}: loading clip index in all playlists")
 
@@ -92,10 +96,15 @@ def sequencer_advance_slaves(mgr, slot_index: int, force_reload: bool = False) -
         return
 
     for player_id, player in mgr.players.items():
-        if not player or not player.playlist_manager.playlist:
+        # Lightweight PreviewSessions have no playlist manager and follow the
+        # viewed playlist, not the sequencer.
+        playlist_manager = getattr(player, 'playlist_manager', None)
+        if not player or playlist_manager is None or not playlist_manager.playlist:
+            continue
+        if skip and player_id in skip:
             continue
 
-        playlist_length = len(player.playlist_manager.playlist)
+        playlist_length = len(playlist_manager.playlist)
 
         # Slot beyond playlist length → stop + black screen
         if slot_index >= playlist_length:
@@ -147,6 +156,37 @@ def sequencer_advance_slaves(mgr, slot_index: int, force_reload: bool = False) -
             logger.error(f"❌ Error emitting sequencer_slot_advance: {e}")
 
 
+def sequencer_prearm_slot(mgr, slot_index: int) -> None:
+    """Prepare every player's clip for *slot_index* ahead of its split."""
+    if not mgr.sequencer_mode_active:
+        return
+    mgr.slave_switch.prearm(slot_index)
+
+
+def sequencer_schedule_slot(mgr, slot_index: int, at: float, on_commit=None) -> set:
+    """Hand the (pre-armed) clips for *slot_index* to the players, to be swapped
+    in on the render frame nearest to *at* (perf_counter time of the split).
+
+    Players that cannot take a prepared clip (stopped, slot beyond their
+    playlist) are left to sequencer_advance_slaves() at the split.  A player
+    whose prepare fails drops out of the returned set, so the split loads it
+    too; if it fails only after the split, it is loaded right away.
+
+    Returns:
+        Ids of the players that will switch by themselves (shrinks when a
+        prepare fails)
+    """
+    if not mgr.sequencer_mode_active:
+        return set()
+
+    def _load_if_split_passed(player, index):
+        if time.perf_counter() >= at:
+            player.load_clip_by_index(index, notify_manager=False)
+
+    return mgr.slave_switch.switch(slot_index, lambda player, index: None, at=at, on_commit=on_commit,
+                                   on_prepare_failed=_load_if_split_passed)
+
+
 # ─── Slave cache ──────────────────────────────────────────────────────────────
 
 def update_all_slave_caches(mgr) -> None:
@@ -142,7 +142,12 @@ class GeneratorSource(FrameSource):
 
         delay = 1.0 / self.fps
         self.current_frame += 1
-        return np.zeros((self.canvas_height, self.canvas_width, 3), dtype=np.uint8), delay
+        # Reuse one black frame instead of allocating a canvas-sized array per tick
+        black = getattr(self, '_black_frame', None)
+        if black is None or black.shape[:2] != (self.canvas_height, self.canvas_width):
+            black = np.zeros((self.canvas_height, self.canvas_width, 3), dtype=np.uint8)
+            self._black_frame = black
+        return black, delay
 
     def update_parameter(self, param_name, value):
         """Aktualisiert Generator-Parameter zur Laufzeit."""
@@ -17,6 +17,9 @@ NOTE: .npy clips are no longer supported. Re-convert with the Video Converter.
 """
 import os
 import json
+import threading
+import weakref
+from concurrent.futures import Future
 import numpy as np
 from ...core.logger import get_logger
 from ...core.constants import DEFAULT_FPS
@@ -25,6 +28,52 @@ from .base import FrameSource
 logger = get_logger(__name__)
 
 
+class _ClipBuffers:
+    """Loaded data of one .hap file, shared by every source playing it."""
+    __slots__ = ('mmap', 'heap', '__weakref__')
+
+    def __init__(self, mmap, heap):
+        self.mmap = mmap   # full-file memmap (always set)
+        self.heap = heap   # eager heap copy, or None for large (mmap-only) clips
+
+
+# (path, size, mtime) → _ClipBuffers.  Weak values: the buffers live exactly as
+# long as some VideoSource (live player, layer, preview session) holds them.
+_loaded_clips: 'weakref.WeakValueDictionary' = weakref.WeakValueDictionary()
+# key → Future of a load in progress.  The lock only guards the two dicts: the
+# load itself (an eager copy of up to VideoSource._EAGER_LOAD_THRESHOLD_BYTES)
+# runs outside it, so different files load in parallel and further sources of
+# the same file wait for the first one's result.
+_loading_clips: 'dict[tuple, Future]' = {}
+_loaded_clips_lock = threading.Lock()
+
+
+def _get_clip_buffers(key: tuple, load) -> '_ClipBuffers':
+    """Loaded buffers for *key*, calling *load()* only if nobody has them yet."""
+    with _loaded_clips_lock:
+        shared = _loaded_clips.get(key)
+        pending = _loading_clips.get(key)
+        owner = shared is None and pending is None
+        if owner:
+            pending = _loading_clips[key] = Future()
+    if not owner:
+        logger.debug(f"[HapSource] {os.path.basename(key[0])} reusing loaded clip buffer")
+        return shared if shared is not None else pending.result()
+
+    try:
+        shared = load()
+    except BaseException as e:
+        with _loaded_clips_lock:
+            del _loading_clips[key]
+        pending.set_exception(e)
+        raise
+    with _loaded_clips_lock:
+        _loaded_clips[key] = shared
+        del _loading_clips[key]
+    pending.set_result(shared)
+    return shared
+
+
 class VideoSource(FrameSource):
     """Video source backed by DXT-compressed .hap flat binary.
 
@@ -52,6 +101,7 @@ class VideoSource(FrameSource):
         self.buffer = None       # contiguous heap or memmap uint8 flat array
         self._mmap_ref = None    # always the full memmap — kept alive for retrim()
         self._trim_start = 0     # frame index offset into the full file
+        self._clip_buffers = None  # shared _ClipBuffers (keeps the registry entry alive)
 
         # HAP metadata (set in initialize()):
         self.width = 0
@@ -123,37 +173,49 @@ class VideoSource(FrameSource):
                 if clip:
                     clip['total_frames'] = self.total_frames
 
-            # Memory-map the flat binary (all frames concatenated end-to-end)
-            mmap_flat = np.memmap(self.video_path, dtype=np.uint8, mode='r')
-            self._mmap_ref = mmap_flat
             self._trim_start = 0
 
-            file_bytes = mmap_flat.nbytes
-            if file_bytes <= self._EAGER_LOAD_THRESHOLD_BYTES:
-                # Eager-copy into contiguous heap RAM.  Avoids OS page-fault
-                # stalls (~25 ms on Windows) when reading memmap pages that
-                # were evicted between frames.  One-time cost at load time.
-                self.buffer = np.ascontiguousarray(mmap_flat)
-                logger.debug(
-                    f"[HapSource] {os.path.basename(self.video_path)} "
-                    f"{self.total_frames}fr @ {self.fps:.1f}fps "
-                    f"{self.width}x{self.height} {self.dxt_variant.upper()} "
-                    f"(eager {file_bytes // (1024*1024)} MB)"
-                )
-            else:
-                self.buffer = mmap_flat
-                logger.debug(
-                    f"[HapSource] {os.path.basename(self.video_path)} "
-                    f"{self.total_frames}fr @ {self.fps:.1f}fps "
-                    f"{self.width}x{self.height} {self.dxt_variant.upper()} "
-                    f"(mmap {file_bytes // (1024*1024)} MB, "
-                    f">{self._EAGER_LOAD_THRESHOLD_BYTES // (1024*1024)} MB threshold)"
-                )
+            # Reuse the buffers of a source that already loaded this file
+            # (e.g. the live player while a preview session shows the same clip).
+            st = os.stat(self.video_path)
+            key = (os.path.abspath(self.video_path), st.st_size, st.st_mtime_ns)
+            shared = _get_clip_buffers(key, self._load_clip_buffers)
+            self._clip_buffers = shared
+            self._mmap_ref = shared.mmap
+            self.buffer = shared.heap if shared.heap is not None else shared.mmap
             return True
         except Exception as e:
             logger.error(f"[HapSource] Failed to load {self.video_path}: {e}")
             return False
 
+    def _load_clip_buffers(self) -> '_ClipBuffers':
+        """Memory-map the file and eager-copy it to heap when below the threshold."""
+        # Memory-map the flat binary (all frames concatenated end-to-end)
+        mmap_flat = np.memmap(self.video_path, dtype=np.uint8, mode='r')
+
+        file_bytes = mmap_flat.nbytes
+        if file_bytes <= self._EAGER_LOAD_THRESHOLD_BYTES:
+            # Eager-copy into contiguous heap RAM.  Avoids OS page-fault
+            # stalls (~25 ms on Windows) when reading memmap pages that
+            # were evicted between frames.  One-time cost at load time.
+            heap = np.ascontiguousarray(mmap_flat)
+            logger.debug(
+                f"[HapSource] {os.path.basename(self.video_path)} "
+                f"{self.total_frames}fr @ {self.fps:.1f}fps "
+                f"{self.width}x{self.height} {self.dxt_variant.upper()} "
+                f"(eager {file_bytes // (1024*1024)} MB)"
+            )
+            return _ClipBuffers(mmap_flat, heap)
+
+        logger.debug(
+            f"[HapSource] {os.path.basename(self.video_path)} "
+            f"{self.total_frames}fr @ {self.fps:.1f}fps "
+            f"{self.width}x{self.height} {self.dxt_variant.upper()} "
+            f"(mmap {file_bytes // (1024*1024)} MB, "
+            f">{self._EAGER_LOAD_THRESHOLD_BYTES // (1024*1024)} MB threshold)"
+        )
+        return _ClipBuffers(mmap_flat, None)
+
     def get_next_frame(self):
         """Return (memoryview, frame_duration) — zero-copy DXT slice."""
         if self.buffer is None or self.current_frame >= self.total_frames:
@@ -211,6 +273,7 @@ class VideoSource(FrameSource):
     def cleanup(self):
         self.buffer = None
         self._mmap_ref = None
+        self._clip_buffers = None
         self._trim_start = 0
 
     def get_source_name(self):
@@ -0,0 +1,488 @@
+"""
+CPU Transition Renderer - clip transitions for players without a GPU renderer.
+
+Only used when GPUTransitionRenderer cannot be created (no wgpu device) and
+the play loop already holds CPU frames — it never forces a GPU→CPU download.
+
+Every mask-based transition (wipes) is described by a *progress map*: a
+uint16 image storing, per pixel, the progress level (0..LEVELS-1) at which
+that pixel switches from clip A to clip B.  The map is built once per
+(effect, canvas size, parameters) and cached; per frame the blend is a single
+threshold/lerp pass:
+
+    level <  full   → pixel is B           (masked copy, cv2.copyTo)
+    level >= empty  → pixel is A           (already in the output)
+    otherwise       → lerp(A, B, lut[level]) — the feather band
+
+The map also keeps the pixel indices sorted by level, so the feather band
+of any progress is one contiguous slice of that order: the lerp gathers the
+band pixels, blends each level's run with one cv2.addWeighted and scatters
+them back, without scanning the frame.  The masked B copy is limited to the
+bounding box of the levels already switched to B.
+
+Fade uses cv2.addWeighted; slide wipes are plain slice copies.  Punch zoom
+and RGB split move pixels instead of switching them, so they have no
+progress map: per frame they are one nearest-neighbour resize and/or one
+blend restricted to the region that changes.
+
+All results are written into a FrameRing, so steady-state rendering does not
+allocate, and a wipe or zoom-in only copies A into a ring frame that does not
+already hold it.  Measured at 1080p on one core (best of several sweeps),
+against 2.3 ms for a full-frame cv2.addWeighted (one normal-mode layer blend):
+
+    fade 2.4 ms, slide wipes 1.4-1.7 ms
+    feathered wipes (default feather) 2.2-2.6 ms; radial 3.7 ms — its 20°
+        band is ~100k pixels, and gathering/scattering them costs ~13 ns each
+    punch zoom in 4.7 ms, punch zoom out 5.3 ms, RGB split 6.1 ms — each
+        needs a full-frame resize or channel shift on top of the blend, and
+        all of these passes are memory bound (cv2.remap/warpAffine are slower)
+"""
+import math
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from ...core.buffer_pool import FrameRing, get_buffer_pool
+from ...core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Progress map resolution (levels per full transition).  1024 keeps hard
+# wipes visually continuous up to 4K without stepping.
+LEVELS = 1024
+
+# Progress maps kept per renderer (least recently used ones are dropped).
+# A 1080p map holds ~25 MB of level/order arrays.
+MAX_CACHED_MAPS = 4
+
+# effect id → default parameters (mirrors the old wipe/slide/zoom plugins)
+CPU_TRANSITION_EFFECTS: Dict[str, dict] = {
+    'fade': {},
+    'linear_wipe': {'angle': 0.0, 'feather': 50.0},
+    'radial_wipe': {'start_angle': 90.0, 'clockwise': True, 'feather': 20.0},
+    'round_wipe': {'center_x': 0.5, 'center_y': 0.5, 'reverse': False, 'feather': 30.0},
+    'slide_wipe_up': {},
+    'slide_wipe_down': {},
+    'slide_wipe_left': {},
+    'slide_wipe_right': {},
+    'punch_zoom_in': {'zoom_amount': 1.5, 'center_x': 0.5, 'center_y': 0.5},
+    'punch_zoom_out': {'zoom_amount': 1.5, 'center_x': 0.5, 'center_y': 0.5},
+    'rgb_split': {'intensity': 30.0},
+}
+
+
+class ProgressMap:
+    """Precomputed per-pixel switch levels plus the pixel order by level."""
+
+    __slots__ = ('levels', 'feather', 'width', 'height', 'order', 'sorted_levels', 'starts', 'boxes')
+
+    def __init__(self, progress: np.ndarray, feather: float):
+        """
+        Args:
+            progress: float32 HxW, 0..1 — progress at which each pixel flips to B
+            feather: Edge softness as a fraction of the full transition (0 = hard)
+        """
+        self.height, self.width = progress.shape
+        self.levels = np.clip(progress * (LEVELS - 1) + 0.5, 0, LEVELS - 1).astype(np.uint16)
+        self.feather = max(0.0, float(feather)) * (LEVELS - 1)
+
+        # Flat pixel indices sorted by level: the pixels with levels in
+        # [lo, hi) are order[starts[lo]:starts[hi]].
+        flat = self.levels.ravel()
+        self.order = np.argsort(flat, kind='stable').astype(np.intp)
+        self.sorted_levels = flat[self.order]
+        self.starts = np.searchsorted(self.sorted_levels, np.arange(LEVELS + 1))
+
+        # boxes[l] = (y0, y1, x0, x1): bounding box of the levels < l, so
+        # masked copies only touch the part of the frame that already is B.
+        ys, xs = np.divmod(self.order, self.width)
+        used = np.flatnonzero(np.diff(self.starts))
+        first = self.starts[used]
+        lo = np.full((4, LEVELS), [[self.height], [-1], [self.width], [-1]], dtype=np.intp)
+        lo[0, used] = np.minimum.reduceat(ys, first)
+        lo[1, used] = np.maximum.reduceat(ys, first)
+        lo[2, used] = np.minimum.reduceat(xs, first)
+        lo[3, used] = np.maximum.reduceat(xs, first)
+        boxes = np.empty((LEVELS + 1, 4), dtype=np.intp)
+        boxes[0] = (0, 0, 0, 0)
+        boxes[1:, 0] = np.minimum.accumulate(lo[0])
+        boxes[1:, 1] = np.maximum.accumulate(lo[1]) + 1
+        boxes[1:, 2] = np.minimum.accumulate(lo[2])
+        boxes[1:, 3] = np.maximum.accumulate(lo[3]) + 1
+        self.boxes = boxes
+
+    def weights(self, progress: float) -> Tuple[np.ndarray, int, int]:
+        """
+        B-weight lookup table for *progress* and the fully-B / fully-A bounds.
+
+        Returns:
+            (lut float32[LEVELS], full, empty): levels < full are pure B,
+            levels >= empty are pure A.
+        """
+        f = self.feather
+        # Threshold sweeps from 0 to LEVELS + feather so progress 0 is pure A
+        # and progress 1 is pure B regardless of feather width.
+        c = progress * (LEVELS + f)
+        lv = np.arange(LEVELS, dtype=np.float32)
+        if f > 0:
+            lut = np.clip((c - lv) / f, 0.0, 1.0)
+        else:
+            lut = (lv < c).astype(np.float32)
+        full = int(np.count_nonzero(lut >= 1.0))   # lut is non-increasing
+        empty = LEVELS - int(np.count_nonzero(lut <= 0.0))
+        return lut, full, empty
+
+    def band(self, lo: int, hi: int) -> slice:
+        """Slice of order/sorted_levels covering the levels in [lo, hi)."""
+        return slice(int(self.starts[lo]), int(self.starts[max(lo, hi)]))
+
+
+class CPUTransitionRenderer:
+    """Blends the stored A frame with the incoming B frame on the CPU."""
+
+    def __init__(self):
+        self._frame_a: Optional[np.ndarray] = None
+        self._a_buf: Optional[np.ndarray] = None   # owned copy made by detach_frame()
+        self._maps: 'OrderedDict[tuple, ProgressMap]' = OrderedDict()
+        self._out = FrameRing()
+        self._mask: Optional[np.ndarray] = None    # see _b_mask()
+        self._mask_map: Optional[ProgressMap] = None
+        self._mask_full = 0
+        self._written: Dict[int, tuple] = {}       # id(ring frame) → what its last wipe/zoom left in it
+        self._a_sorted: Optional[np.ndarray] = None   # see _a_band()
+        self._a_sorted_key: tuple = (None, None)
+        self._a_sorted_lo = self._a_sorted_hi = 0
+        self._b_sorted: Optional[np.ndarray] = None   # B band gather buffer
+
+    # ── A buffer ──────────────────────────────────────────────────────────────
+
+    @property
+    def has_a(self) -> bool:
+        return self._frame_a is not None
+
+    def store_frame(self, frame: np.ndarray) -> None:
+        """
+        Keep *frame* as the outgoing (A) frame.
+
+        Stores a reference, not a copy — it is called for every frame while no
+        transition runs.  detach_frame() copies it once a transition starts,
+        because play-loop frames may come from a FrameRing that is reused a
+        few frames later.
+        """
+        self._frame_a = frame
+
+    def detach_frame(self) -> None:
+        """Copy the stored A frame into the renderer's own buffer."""
+        frame = self._frame_a
+        if frame is None or frame is self._a_buf:
+            return
+        if self._a_buf is None or self._a_buf.shape != frame.shape or self._a_buf.dtype != frame.dtype:
+            self._a_buf = np.empty_like(frame)
+        np.copyto(self._a_buf, frame)
+        self._frame_a = self._a_buf
+
+    # ── blending ─────────────────────────────────────────────────────────────
+
+    def render(self, effect: str, frame_b: np.ndarray, progress: float,
+               params: Optional[dict] = None) -> Optional[np.ndarray]:
+        """
+        Blend A → *frame_b* at eased *progress* (0..1).
+
+        Returns:
+            BGR frame from the renderer's FrameRing, or None if no A frame is
+            stored or *effect* has no CPU implementation.
+        """
+        frame_a = self._frame_a
+        if frame_a is None or effect not in CPU_TRANSITION_EFFECTS:
+            return None
+
+        if frame_b.ndim == 3 and frame_b.shape[2] == 4:
+            frame_b = frame_b[:, :, :3]
+        if frame_a.shape != frame_b.shape:
+            # Resize A once and keep the resized copy for the rest of the transition.
+            frame_a = cv2.resize(frame_a[:, :, :3], (frame_b.shape[1], frame_b.shape[0]))
+            self._frame_a = self._a_buf = frame_a
+
+        progress = min(1.0, max(0.0, float(progress)))
+        out = self._out.next(frame_b.shape, frame_b.dtype)
+        written = self._written.pop(id(out), None)
+
+        if effect == 'fade':
+            return cv2.addWeighted(frame_a, 1.0 - progress, frame_b, progress, 0, dst=out)
+        if effect.startswith('slide_wipe_'):
+            return self._slide(effect[len('slide_wipe_'):], frame_a, frame_b, progress, out)
+
+        p = self._params(effect, params)
+        if effect == 'punch_zoom_in':
+            return self._zoom_in(p, frame_a, frame_b, progress, out, written)
+        if effect == 'punch_zoom_out':
+            return self._zoom_out(p, frame_a, frame_b, progress, out)
+        if effect == 'rgb_split':
+            return self._rgb_split(p, frame_a, frame_b, progress, out)
+
+        pmap = self.get_progress_map(effect, frame_b.shape[1], frame_b.shape[0], params)
+        return self._blend_masked(pmap, frame_a, frame_b, progress, out, written)
+
+    def get_progress_map(self, effect: str, width: int, height: int,
+                         params: Optional[dict] = None) -> ProgressMap:
+        """Cached progress map for *effect* at *width* x *height*."""
+        p = self._params(effect, params)
+        key = (effect, width, height, tuple(sorted(p.items())))
+        pmap = self._maps.get(key)
+        if pmap is not None:
+            self._maps.move_to_end(key)
+            return pmap
+        pmap = _build_progress_map(effect, width, height, p)
+        self._maps[key] = pmap
+        while len(self._maps) > MAX_CACHED_MAPS:
+            self._maps.popitem(last=False)
+        logger.debug(f"CPU transition progress map built: {effect} {width}×{height} {p}")
+        return pmap
+
+    def release(self) -> None:
+        self._frame_a = None
+        self._a_buf = None
+        self._mask = None
+        self._mask_map = None
+        self._written.clear()
+        self._a_sorted = None
+        self._a_sorted_key = (None, None)
+        self._b_sorted = None
+        self._maps.clear()
+        self._out = FrameRing()
+
+    # ── private helpers ───────────────────────────────────────────────────────
+
+    @staticmethod
+    def _params(effect: str, params: Optional[dict]) -> dict:
+        p = dict(CPU_TRANSITION_EFFECTS.get(effect, {}))
+        if params:
+            p.update({k: v for k, v in params.items() if k in p})
+        return p
+
+    def _blend_masked(self, pmap: ProgressMap, frame_a: np.ndarray, frame_b: np.ndarray,
+                      progress: float, out: np.ndarray, written: Optional[tuple]) -> np.ndarray:
+        lut, full, empty = pmap.weights(progress)
+        if full >= LEVELS:
+            np.copyto(out, frame_b)
+            return out
+        # A ring frame last written from the same A and map at a lower
+        # progress still holds A wherever A is needed now (levels >= empty).
+        if written is None or written[0] is not frame_a or written[1] is not pmap or written[2] > empty:
+            np.copyto(out, frame_a)
+        self._written[id(out)] = (frame_a, pmap, empty)
+        if full > 0:
+            y0, y1, x0, x1 = pmap.boxes[full]
+            cv2.copyTo(frame_b[y0:y1, x0:x1], self._b_mask(pmap, full)[y0:y1, x0:x1], out[y0:y1, x0:x1])
+        if empty <= full:
+            return out
+
+        # Feather band: one contiguous slice of the level-sorted pixel order.
+        # Pixels are gathered/scattered as 3-byte items (one index per pixel);
+        # in level order every level is a run of rows with a single weight,
+        # so the lerp is one cv2.addWeighted per level, in place on B.
+        band = pmap.band(full, empty)
+        n = band.stop - band.start
+        if n > 0:
+            pix = pmap.order[band]
+            a = self._a_band(pmap, frame_a, full, empty).view(np.uint8).reshape(n, -1)
+            if self._b_sorted is None or self._b_sorted.shape != pmap.order.shape:
+                self._b_sorted = np.empty(pmap.order.shape, dtype=_pixels(frame_b).dtype)
+            b_items = np.take(_pixels(frame_b), pix, out=self._b_sorted[:n], mode='clip')
+            b = b_items.view(np.uint8).reshape(n, -1)
+            starts = pmap.starts[full:empty + 1] - band.start
+            for lv in range(full, empty):
+                i, j = starts[lv - full], starts[lv - full + 1]
+                if j > i:
+                    wb = float(lut[lv])
+                    cv2.addWeighted(a[i:j], 1.0 - wb, b[i:j], wb, 0, dst=b[i:j])
+            np.put(_pixels(out), pix, b_items, mode='clip')
+        return out
+
+    def _a_band(self, pmap: ProgressMap, frame_a: np.ndarray, full: int, empty: int) -> np.ndarray:
+        """
+        A pixels of the levels [full, empty) in level order.
+
+        A is usually fixed for a whole transition and the band only moves
+        forward, so A is gathered into level order once per level as the
+        band reaches it, instead of twice per frame.
+        """
+        if (self._a_sorted is None or self._a_sorted_key[0] is not frame_a
+                or self._a_sorted_key[1] is not pmap or full < self._a_sorted_lo):
+            if self._a_sorted is None or self._a_sorted.shape != pmap.order.shape:
+                self._a_sorted = np.empty(pmap.order.shape, dtype=_pixels(frame_a).dtype)
+            self._a_sorted_key = (frame_a, pmap)
+            self._a_sorted_lo = self._a_sorted_hi = full
+        if empty > self._a_sorted_hi:
+            missing = pmap.band(max(full, self._a_sorted_hi), empty)
+            self._a_sorted[missing] = np.take(_pixels(frame_a), pmap.order[missing])
+            if full > self._a_sorted_hi:
+                self._a_sorted_lo = full
+            self._a_sorted_hi = empty
+        return self._a_sorted[pmap.band(full, empty)]
+
+    def _b_mask(self, pmap: ProgressMap, full: int) -> np.ndarray:
+        """
+        Mask of the pixels with level < *full*, kept across frames.
+
+        Progress only grows during a transition, so each frame adds the
+        pixels whose levels were crossed since the last one instead of
+        thresholding the whole map again.
+        """
+        if self._mask is None or self._mask_map is not pmap or full < self._mask_full:
+            self._mask = np.zeros(pmap.levels.shape, dtype=np.uint8)
+            self._mask_map = pmap
+            self._mask_full = 0
+        if full > self._mask_full:
+            np.put(self._mask, pmap.order[pmap.band(self._mask_full, full)], 255)
+            self._mask_full = full
+        return self._mask
+
+    @staticmethod
+    def _slide(direction: str, frame_a: np.ndarray, frame_b: np.ndarray,
+               progress: float, out: np.ndarray) -> np.ndarray:
+        """B slides in over A from the edge opposite to *direction*."""
+        h, w = frame_a.shape[:2]
+        np.copyto(out, frame_a)
+        if direction in ('up', 'down'):
+            n = int(round(h * progress))
+            if n <= 0:
+                return out
+            if direction == 'up':
+                out[h - n:] = frame_b[:n]
+            else:
+                out[:n] = frame_b[h - n:]
+        else:
+            n = int(round(w * progress))
+            if n <= 0:
+                return out
+            if direction == 'left':
+                out[:, w - n:] = frame_b[:, :n]
+            else:
+                out[:, :n] = frame_b[:, w - n:]
+        return out
+
+    def _zoom_in(self, p: dict, frame_a: np.ndarray, frame_b: np.ndarray,
+                 progress: float, out: np.ndarray, written: Optional[tuple]) -> np.ndarray:
+        """B grows from a 1/zoom_amount rectangle to full frame, fading in over A."""
+        h, w = frame_a.shape[:2]
+        scale = 1.0 / (1.0 + (float(p['zoom_amount']) - 1.0) * (1.0 - progress))
+        new_w, new_h = int(w * scale), int(h * scale)
+        cx, cy = int(w * float(p['center_x'])), int(h * float(p['center_y']))
+        x0, y0 = max(0, cx - new_w // 2), max(0, cy - new_h // 2)
+        x1, y1 = min(w, x0 + new_w), min(h, y0 + new_h)
+        sx, sy = max(0, new_w // 2 - cx), max(0, new_h // 2 - cy)
+        if new_w <= 0 or new_h <= 0 or progress <= 0.0 or x1 <= x0 or y1 <= y0:
+            np.copyto(out, frame_a)
+            return out
+
+        # The rectangle only grows, so a ring frame written from the same A
+        # with a rectangle inside this one already holds A around it.
+        box = (x0, y0, x1, y1)
+        key = (frame_a, tuple(sorted(p.items())))
+        if (written is None or written[0] is not key[0] or written[1] != key[1]
+                or not _box_inside(written[2], box)):
+            np.copyto(out, frame_a)
+        self._written[id(out)] = key + (box,)
+
+        # Nearest-neighbour: the punch is over within a few frames, and
+        # INTER_LINEAR doubles the cost of the whole transition.
+        region = out[y0:y1, x0:x1]
+        if (x1 - x0, y1 - y0) == (new_w, new_h):
+            # Unclipped: scale B straight into the output and blend in place.
+            cv2.resize(frame_b, (new_w, new_h), dst=region, interpolation=cv2.INTER_NEAREST)
+            cv2.addWeighted(frame_a[y0:y1, x0:x1], 1.0 - progress, region, progress, 0, dst=region)
+            return out
+        pool = get_buffer_pool()
+        zoomed = pool.acquire((new_h, new_w) + frame_b.shape[2:], frame_b.dtype)
+        try:
+            cv2.resize(frame_b, (new_w, new_h), dst=zoomed, interpolation=cv2.INTER_NEAREST)
+            cv2.addWeighted(frame_a[y0:y1, x0:x1], 1.0 - progress,
+                            zoomed[sy:sy + (y1 - y0), sx:sx + (x1 - x0)], progress, 0, dst=region)
+        finally:
+            pool.release(zoomed)
+        return out
+
+    @staticmethod
+    def _zoom_out(p: dict, frame_a: np.ndarray, frame_b: np.ndarray,
+                  progress: float, out: np.ndarray) -> np.ndarray:
+        """A zooms up to zoom_amount around the centre while B fades in."""
+        h, w = frame_a.shape[:2]
+        scale = 1.0 + (float(p['zoom_amount']) - 1.0) * progress
+        crop_w, crop_h = max(1, int(round(w / scale))), max(1, int(round(h / scale)))
+        cx, cy = w * float(p['center_x']), h * float(p['center_y'])
+        x0 = min(max(0, int(round(cx - cx / scale))), w - crop_w)
+        y0 = min(max(0, int(round(cy - cy / scale))), h - crop_h)
+
+        # The zoomed A goes straight into the output and is blended in place.
+        cv2.resize(frame_a[y0:y0 + crop_h, x0:x0 + crop_w], (w, h), dst=out,
+                   interpolation=cv2.INTER_NEAREST)
+        return cv2.addWeighted(out, 1.0 - progress, frame_b, progress, 0, dst=out)
+
+    @staticmethod
+    def _rgb_split(p: dict, frame_a: np.ndarray, frame_b: np.ndarray,
+                   progress: float, out: np.ndarray) -> np.ndarray:
+        """Cross-fade with red shifted right and blue shifted left, peaking mid-way."""
+        w = frame_a.shape[1]
+        shift = min(w - 1, int(float(p['intensity']) * (1.0 - abs(2.0 * progress - 1.0))))
+        if shift <= 0:
+            return cv2.addWeighted(frame_a, 1.0 - progress, frame_b, progress, 0, dst=out)
+
+        pool = get_buffer_pool()
+        blended = pool.acquire(frame_a.shape, frame_a.dtype)
+        try:
+            cv2.addWeighted(frame_a, 1.0 - progress, frame_b, progress, 0, dst=blended)
+            np.copyto(out, blended)   # green, and the red/blue edge columns
+            cv2.mixChannels([blended[:, :w - shift]], [out[:, shift:]], [2, 2])
+            cv2.mixChannels([blended[:, shift:]], [out[:, :w - shift]], [0, 0])
+        finally:
+            pool.release(blended)
+        return out
+
+
+def _box_inside(inner: tuple, outer: tuple) -> bool:
+    """True if the (x0, y0, x1, y1) box *inner* lies within *outer*."""
+    return (inner[0] >= outer[0] and inner[1] >= outer[1]
+            and inner[2] <= outer[2] and inner[3] <= outer[3])
+
+
+def _pixels(frame: np.ndarray) -> np.ndarray:
+    """Flat view of *frame* with one void item per pixel (copies if not contiguous)."""
+    frame = np.ascontiguousarray(frame)
+    return frame.reshape(-1).view(f'V{frame.shape[2]}')
+
+
+def _build_progress_map(effect: str, width: int, height: int, p: dict) -> ProgressMap:
+    """Per-pixel switch progress for the mask-based wipes (0 = first, 1 = last)."""
+    y, x = np.mgrid[0:height, 0:width].astype(np.float32)
+
+    if effect == 'linear_wipe':
+        a = math.radians(float(p['angle']))
+        proj = (x - width / 2) * math.cos(a) + (y - height / 2) * math.sin(a)
+        half = abs(width / 2 * math.cos(a)) + abs(height / 2 * math.sin(a))
+        progress = (proj + half) / max(2 * half, 1.0)
+        feather = float(p['feather']) / max(2 * half, 1.0)
+
+    elif effect == 'radial_wipe':
+        angles = np.degrees(np.arctan2(y - height / 2, x - width / 2))
+        angles = (angles - float(p['start_angle'])) % 360.0
+        if not p['clockwise']:
+            angles = (360.0 - angles) % 360.0
+        progress = angles / 360.0
+        feather = float(p['feather']) / 360.0
+
+    elif effect == 'round_wipe':
+        cx, cy = width * float(p['center_x']), height * float(p['center_y'])
+        dist = np.sqrt((x - cx) ** 2 + (y - cy) ** 2)
+        max_dist = math.hypot(max(cx, width - cx), max(cy, height - cy)) or 1.0
+        progress = dist / max_dist
+        if p['reverse']:
+            progress = 1.0 - progress
+        feather = float(p['feather']) / max_dist
+
+    else:
+        raise ValueError(f"No progress map for transition '{effect}'")
+
+    return ProgressMap(progress.astype(np.float32), feather)
@@ -1,8 +1,10 @@
 """
-Transition Manager - GPU-only clip transitions.
+Transition Manager - clip transitions.
 
-All blending happens on the GPU via apply_gpu() + GPUTransitionRenderer.
-No CPU fallbacks, no numpy pixel manipulation.
+Blending happens on the GPU via apply_gpu() + GPUTransitionRenderer.  Only
+when no GPU transition renderer can be created (no wgpu device) does the
+play loop use apply_cpu() + CPUTransitionRenderer on the CPU frames it
+already has — the CPU path never causes an extra GPU→CPU download.
 """
 import time
 from typing import Optional
@@ -31,15 +33,24 @@ class TransitionManager:
         self.frames = 0
         self._gpu_renderer = None    # GPUTransitionRenderer, lazily created
         self._gpu_shaders: dict = {} # effect → loaded WGSL source string
+        self._cpu_renderer = None    # CPUTransitionRenderer, lazily created (no-GPU machines)
 
     # ── configuration ─────────────────────────────────────────────────────────
 
-    def configure(self, enabled=None, effect=None, duration=None, easing=None, **_ignored):
-        """Update transition config. Unknown kwargs (e.g. legacy 'plugin=') are silently dropped."""
+    def configure(self, enabled=None, effect=None, duration=None, easing=None, params=None, **_ignored):
+        """Update transition config. Unknown kwargs (e.g. legacy 'plugin=') are silently dropped.
+
+        params: optional effect parameters for the CPU transitions (angle, feather, zoom_amount, ...).
+        """
         if enabled is not None:  self.config["enabled"] = enabled
         if effect is not None:   self.config["effect"] = effect
         if duration is not None: self.config["duration"] = duration
         if easing is not None:   self.config["easing"] = easing
+        if params is not None:   self.config["params"] = dict(params)
+
+    @property
+    def has_gpu_renderer(self) -> bool:
+        return self._gpu_renderer is not None
 
     # ── lifecycle ──────────────────────────────────────────────────────────────
 
@@ -48,7 +59,10 @@ class TransitionManager:
         if not self.config.get("enabled"):
             logger.debug(f"⏭️ [{player_name}] Transition skipped: enabled=False")
             return False
-        has_frame = self._gpu_renderer is not None and self._gpu_renderer._has_a
+        if self._gpu_renderer is not None:
+            has_frame = self._gpu_renderer._has_a
+        else:
+            has_frame = self._cpu_renderer is not None and self._cpu_renderer.has_a
         if not has_frame:
             logger.debug(
                 f"⏭️ [{player_name}] Transition skipped: no A-buffer "
@@ -56,6 +70,8 @@ class TransitionManager:
                 f"_has_a={getattr(self._gpu_renderer, '_has_a', '?')})"
             )
             return False
+        if self._gpu_renderer is None:
+            self._cpu_renderer.detach_frame()
         self.active = True
         self.start_time = time.time()
         self.frames = 0
@@ -73,22 +89,9 @@ class TransitionManager:
         if not self.active:
             return False
 
-        # Reset timer on first frame — guards against thread-stop gap.
-        if self.frames == 0:
-            self.start_time = time.time()
-
-        elapsed = time.time() - self.start_time
-        duration = self.config.get("duration", 1.0)
-
-        if elapsed >= duration:
-            self.active = False
-            logger.debug(f"✅ GPU transition complete ({self.frames} frames blended)")
+        eased = self._next_progress("GPU")
+        if eased is None:
             return False
-
-        progress = min(1.0, elapsed / duration)
-        eased = max(0.0, min(1.0, self._apply_easing(
-            progress, self.config.get("easing", "linear")
-        )))
         frag_src = self._get_gpu_shader(self.config.get("effect", "fade"))
 
         if frag_src is None:
@@ -114,6 +117,42 @@ class TransitionManager:
 
         return False
 
+    def apply_cpu(self, frame_b):
+        """CPU transition: blend the stored A frame with *frame_b* (numpy BGR).
+
+        Called every frame by the play loop while active, only when no GPU
+        renderer exists.  Returns the blended frame, or None when the
+        transition has finished (or the effect has no CPU implementation).
+        """
+        if not self.active or self._cpu_renderer is None:
+            return None
+        eased = self._next_progress("CPU")
+        if eased is None:
+            return None
+        effect = self.config.get("effect", "fade")
+        result = self._cpu_renderer.render(effect, frame_b, eased, self.config.get("params"))
+        if result is None:
+            logger.warning(f"⚠️ CPU transition not available for effect='{effect}' — hard cut")
+            self.active = False
+            return None
+        self.frames += 1
+        return result
+
+    def store_cpu_frame(self, frame) -> None:
+        """Store a CPU frame as the transition A-buffer (no-GPU path).
+
+        Called by the play loop every frame while NOT active (outgoing
+        composite) and while active with live frames of the outgoing clip.
+        No-op when a GPU renderer exists or transitions are disabled.
+        """
+        if not self.config.get("enabled") or self._gpu_renderer is not None:
+            return
+        if self._cpu_renderer is None:
+            from .cpu_renderer import CPUTransitionRenderer
+            self._cpu_renderer = CPUTransitionRenderer()
+            logger.info("🎬 CPU transition renderer created (no GPU transition renderer)")
+        self._cpu_renderer.store_frame(frame)
+
     def store_gpu_frame(self, gpu_frame) -> None:
         """Store the outgoing composite as the transition A-buffer (GPU→GPU copy).
 
@@ -145,9 +184,31 @@ class TransitionManager:
                 pass
             self._gpu_renderer = None
         self._gpu_shaders.clear()
+        if self._cpu_renderer is not None:
+            self._cpu_renderer.release()
+            self._cpu_renderer = None
 
     # ── private helpers ────────────────────────────────────────────────────────
 
+    def _next_progress(self, backend: str) -> Optional[float]:
+        """Eased progress for this frame, or None (and deactivate) when done."""
+        # Reset timer on first frame — guards against thread-stop gap.
+        if self.frames == 0:
+            self.start_time = time.time()
+
+        elapsed = time.time() - self.start_time
+        duration = self.config.get("duration", 1.0)
+
+        if elapsed >= duration:
+            self.active = False
+            logger.debug(f"✅ {backend} transition complete ({self.frames} frames blended)")
+            return None
+
+        progress = min(1.0, elapsed / duration)
+        return max(0.0, min(1.0, self._apply_easing(
+            progress, self.config.get("easing", "linear")
+        )))
+
     def _try_init_gpu(self, width: int, height: int) -> None:
         try:
             from ...gpu.transition_renderer import GPUTransitionRenderer
@@ -0,0 +1,122 @@
+"""
+Tests for area-averaged LED sampling (src/modules/artnet/pixel_sampler.py).
+
+Verifies:
+  - Footprint averages from the integral image match a brute-force mean,
+    including footprints clipped at the frame edges
+  - sample_size 0 (and footprints below one frame pixel) equal point sampling
+  - Channel-reversed frame views (BGR → RGB) are averaged correctly
+  - Output plans with area-sampled objects match the per-object path
+  - sample_size round-trips through ArtNetObject.to_dict/from_dict
+  - Cost does not grow with the footprint size
+"""
+
+import os
+import sys
+import time
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from modules.artnet.object import ArtNetObject, ArtNetPoint
+from modules.artnet.output import ArtNetOutput
+from modules.artnet.output_manager import OutputManager
+from modules.artnet.pixel_sampler import PixelSampler
+
+CANVAS = (200, 100)
+
+
+def _object(oid, points, sample_size=0.0, **kwargs):
+    pts = [ArtNetPoint(i, float(x), float(y)) for i, (x, y) in enumerate(points)]
+    return ArtNetObject(id=oid, name=oid, source_shape_id=oid, type='line', points=pts,
+                        sample_size=sample_size, **kwargs)
+
+
+def _brute_force(frame, x, y, size):
+    fh, fw = frame.shape[:2]
+    cx = min(max(int(x / CANVAS[0] * fw), 0), fw - 1)
+    cy = min(max(int(y / CANVAS[1] * fh), 0), fh - 1)
+    rx = int(np.floor(size / 2 * fw / CANVAS[0] + 0.5))
+    ry = int(np.floor(size / 2 * fh / CANVAS[1] + 0.5))
+    patch = frame[max(cy - ry, 0):cy + ry + 1, max(cx - rx, 0):cx + rx + 1].reshape(-1, 3)
+    return np.floor(patch.astype(np.float64).mean(axis=0) + 0.5).astype(np.uint8)
+
+
+class TestAreaSampling(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(11)
+        self.frame = self.rng.integers(0, 256, (90, 160, 3), dtype=np.uint8)
+        self.points = self.rng.uniform(-5, [CANVAS[0] + 5, CANVAS[1] + 5], (60, 2))
+        self.sampler = PixelSampler(*CANVAS)
+
+    def test_matches_brute_force_mean(self):
+        for size in (1.5, 4, 9, 37):
+            obj = _object('a', self.points, sample_size=size)
+            colors = self.sampler.sample_object(obj, self.frame)
+            expected = np.array([_brute_force(self.frame, x, y, size) for x, y in self.points])
+            np.testing.assert_array_equal(colors, expected)
+
+    def test_zero_size_is_point_sampling(self):
+        point = self.sampler.sample_object(_object('a', self.points), self.frame)
+        np.testing.assert_array_equal(point, self.sampler.sample_points(
+            _object('a', self.points).points, self.frame))
+        tiny = self.sampler.sample_object(_object('b', self.points, sample_size=0.5), self.frame)
+        np.testing.assert_array_equal(tiny, point)
+
+    def test_reversed_channel_view(self):
+        obj = _object('a', self.points, sample_size=8)
+        view = self.frame[:, :, ::-1]
+        np.testing.assert_array_equal(self.sampler.sample_object(obj, view),
+                                      self.sampler.sample_object(obj, self.frame)[:, ::-1])
+
+    def test_integral_image_cached_per_frame(self):
+        first = self.sampler.integral_image(self.frame)
+        self.assertIs(self.sampler.integral_image(self.frame), first)
+        self.assertIsNot(self.sampler.integral_image(self.frame.copy()), first)
+
+    def test_serialization_round_trip(self):
+        obj = _object('a', self.points[:3], sample_size=6.5)
+        data = obj.to_dict()
+        self.assertEqual(data['sampleSize'], 6.5)
+        self.assertEqual(ArtNetObject.from_dict(data).sample_size, 6.5)
+        data.pop('sampleSize')
+        self.assertEqual(ArtNetObject.from_dict(data).sample_size, 0.0)
+
+    def test_plan_matches_reference(self):
+        objects = {}
+        for i in range(12):
+            pts = self.points[i * 5:(i + 1) * 5]
+            objects[f'o{i}'] = _object(f'o{i}', pts, sample_size=[0, 3, 12][i % 3],
+                                       led_type=['RGB', 'RGBW'][i % 2], brightness=(i % 4) * 10)
+        output = ArtNetOutput(id='out-1', name='o', target_ip='127.0.0.1', subnet='255.255.255.0',
+                              start_universe=0, fps=0, assigned_objects=list(objects), contrast=20)
+        manager = OutputManager(*CANVAS)
+        for frame in (self.frame, self.frame[:, :, ::-1]):
+            fast = bytes(manager._render_output(frame, output, objects, None, routing_version=1))
+            ref = manager._render_output_objects(frame, output, objects, None)
+            self.assertEqual(fast, ref)
+
+    def test_cost_independent_of_footprint(self):
+        frame = self.rng.integers(0, 256, (1080, 1920, 3), dtype=np.uint8)
+        points = self.rng.uniform(0, [CANVAS[0], CANVAS[1]], (5000, 2))
+
+        def best(size):
+            obj = _object('a', points, sample_size=size)
+            sampler = PixelSampler(*CANVAS)
+            sampler.integral_image(frame)   # integral is per frame, not per footprint
+            times = []
+            for _ in range(5):
+                t0 = time.perf_counter()
+                sampler.sample_object(obj, frame)
+                times.append(time.perf_counter() - t0)
+            return min(times)
+
+        small, large = best(1), best(60)
+        self.assertLess(large, small * 3 + 0.002)
+
+
+if __name__ == '__main__':
+    unittest.main()
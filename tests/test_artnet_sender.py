@@ -0,0 +1,183 @@
+"""
+Tests for the native Art-Net sender (src/modules/artnet/sender.py,
+src/modules/artnet/packet_builder.py) against a loopback receiver.
+
+Verifies:
+  - ArtDmx headers (Port-Address, length, sequence) and zero-padded payloads
+  - One ArtSync per target after all universes of a frame
+  - sendmmsg and sendto paths produce the same packets
+  - Blackout and universe-count changes
+  - Delta encoding: per-universe suppression, threshold, full frames, keepalive
+"""
+
+import os
+import socket
+import struct
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from modules.artnet.output import ArtNetOutput
+from modules.artnet.packet_builder import (
+    ARTDMX_HEADER_SIZE, ARTSYNC_PACKET, CHANNELS_PER_UNIVERSE, HAVE_SENDMMSG, artdmx_header
+)
+from modules.artnet.sender import ArtNetSender
+
+
+class _Receiver:
+    def __init__(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 8 * 1024 * 1024)
+        self.sock.bind(('127.0.0.1', 0))
+        self.sock.settimeout(1.0)
+        self.port = self.sock.getsockname()[1]
+
+    def receive(self, count):
+        return [self.sock.recv(2048) for _ in range(count)]
+
+    def close(self):
+        self.sock.close()
+
+
+def _output(universe=3, artsync=True, oid='out-1'):
+    return ArtNetOutput(id=oid, name=oid, target_ip='127.0.0.1', subnet='255.255.255.0',
+                        start_universe=universe, artsync=artsync)
+
+
+class TestArtNetSender(unittest.TestCase):
+
+    def setUp(self):
+        self.receiver = _Receiver()
+
+    def tearDown(self):
+        self.receiver.close()
+
+    def _sender(self, use_sendmmsg=True):
+        sender = ArtNetSender(source_address=('127.0.0.1', 0), port=self.receiver.port,
+                              use_sendmmsg=use_sendmmsg)
+        self.addCleanup(sender.socket.close)
+        return sender
+
+    def _check_frame(self, use_sendmmsg):
+        sender = self._sender(use_sendmmsg)
+        sender.configure_output(_output())
+        data = bytes(i % 251 for i in range(1200))   # 3 universes, last one partial
+        sender.send('out-1', data)
+        packets = self.receiver.receive(4)
+
+        for i, packet in enumerate(packets[:3]):
+            self.assertEqual(len(packet), ARTDMX_HEADER_SIZE + CHANNELS_PER_UNIVERSE)
+            header = bytearray(artdmx_header(3 + i))
+            header[12] = 1   # first frame
+            self.assertEqual(packet[:ARTDMX_HEADER_SIZE], bytes(header))
+            chunk = data[i * 510:(i + 1) * 510]
+            self.assertEqual(packet[ARTDMX_HEADER_SIZE:], chunk + bytes(510 - len(chunk)))
+        self.assertEqual(packets[3], ARTSYNC_PACKET)
+        return packets
+
+    def test_sendto_path(self):
+        self._check_frame(use_sendmmsg=False)
+
+    @unittest.skipUnless(HAVE_SENDMMSG, "sendmmsg not available")
+    def test_sendmmsg_path(self):
+        self._check_frame(use_sendmmsg=True)
+
+    def test_sequence_and_single_sync_per_target(self):
+        sender = self._sender()
+        sender.configure_output(_output(0))
+        sender.configure_output(_output(10, oid='out-2'))
+        sender.send_frame({'out-1': bytes(600), 'out-2': bytes(100)})
+        sender.send_frame({'out-1': bytes(600), 'out-2': bytes(100)})
+        frame1 = self.receiver.receive(4)
+        frame2 = self.receiver.receive(4)
+        self.assertEqual(frame1[-1], ARTSYNC_PACKET)
+        self.assertNotIn(ARTSYNC_PACKET, frame1[:-1])
+        universes = [struct.unpack('<H', p[14:16])[0] for p in frame2[:-1]]
+        self.assertEqual(universes, [0, 1, 10])
+        self.assertEqual({p[12] for p in frame2[:-1]}, {2})
+
+    def test_no_artsync_when_disabled(self):
+        sender = self._sender()
+        sender.configure_output(_output(artsync=False))
+        sender.send('out-1', bytes([9]) * 20)
+        sender.send('out-1', bytes([8]) * 20)
+        packets = self.receiver.receive(2)
+        self.assertEqual([p[ARTDMX_HEADER_SIZE] for p in packets], [9, 8])
+
+    def test_blackout_and_resize(self):
+        sender = self._sender()
+        sender.configure_output(_output(artsync=False))
+        sender.send('out-1', bytes([255]) * 1020)
+        sender.blackout_output('out-1')
+        packets = self.receiver.receive(4)
+        self.assertTrue(all(b == 0 for p in packets[2:] for b in p[ARTDMX_HEADER_SIZE:]))
+        sender.send('out-1', bytes([1]) * 10)
+        self.assertEqual(sender.get_stats('out-1')['universes'], 1)
+        self.receiver.receive(1)
+
+
+class TestDeltaEncoding(unittest.TestCase):
+
+    def setUp(self):
+        self.receiver = _Receiver()
+        self.sender = ArtNetSender(source_address=('127.0.0.1', 0), port=self.receiver.port)
+        output = _output(artsync=False)
+        output.delta_enabled = True
+        output.delta_threshold = 8
+        output.full_frame_interval = 5
+        self.sender.configure_output(output)
+
+    def tearDown(self):
+        self.sender.socket.close()
+        self.receiver.close()
+
+    def _universes_sent(self, data):
+        before = self.sender.get_stats('out-1')['packets_sent']
+        self.sender.send('out-1', bytes(data))
+        count = self.sender.get_stats('out-1')['packets_sent'] - before
+        packets = self.receiver.receive(count)
+        return [struct.unpack('<H', p[14:16])[0] - 3 for p in packets]
+
+    def test_only_changed_universes_sent(self):
+        data = bytearray(510 * 4)
+        self.assertEqual(self._universes_sent(data), [0, 1, 2, 3])   # first frame in full
+        data[600] = 100
+        self.assertEqual(self._universes_sent(data), [1])
+        self.assertEqual(self._universes_sent(data), [])
+        stats = self.sender.get_stats('out-1')
+        self.assertEqual(stats['packets_saved'], 7)
+        self.assertEqual(stats['bytes_saved'], 7 * (ARTDMX_HEADER_SIZE + CHANNELS_PER_UNIVERSE))
+
+    def test_threshold_against_last_sent_value(self):
+        data = bytearray(510 * 2)
+        self._universes_sent(data)
+        data[10] = 8                                   # at threshold: suppressed
+        self.assertEqual(self._universes_sent(data), [])
+        data[10] = 9                                   # drift adds up past threshold
+        self.assertEqual(self._universes_sent(data), [0])
+
+    def test_full_frame_interval(self):
+        data = bytes(510 * 3)
+        sent = [self._universes_sent(data) for _ in range(10)]
+        self.assertEqual([len(s) for s in sent], [3, 0, 0, 0, 3, 0, 0, 0, 0, 3])
+
+    def test_keepalive(self):
+        self.sender.keepalive_seconds = 0.05
+        data = bytes(510 * 2)
+        self._universes_sent(data)
+        self.assertEqual(self._universes_sent(data), [])
+        time.sleep(0.06)
+        self.assertEqual(self._universes_sent(data), [0, 1])
+
+    def test_blackout_resets_history(self):
+        data = bytes([50]) * 510
+        self._universes_sent(data)
+        self.sender.blackout_output('out-1')
+        self.receiver.receive(1)
+        self.assertEqual(self._universes_sent(data), [0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+"""
+Tests for Art-Net output sharding (src/modules/artnet/shards.py).
+
+Verifies:
+  - Outputs are balanced by channel count and keep their shard
+  - Worker processes render the same DMX data as the in-process path and
+    send it; the sync targets are reported back instead of synced
+  - Frames alternate between two shared buffers and never overwrite the
+    one a late worker is still reading
+  - RoutingBridge in sharded mode sends ArtSync once, after the data
+"""
+
+import os
+import socket
+import sys
+import time
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from modules.artnet.object import ArtNetObject, PointArray
+from modules.artnet.output import ArtNetOutput
+from modules.artnet.output_manager import OutputManager
+from modules.artnet.routing_bridge import RoutingBridge
+from modules.artnet.routing_manager import ArtNetRoutingManager
+from modules.artnet.sender import ArtNetSender
+from modules.artnet.shards import ShardPool, assign_shards
+
+OP_DMX = 0x5000
+OP_SYNC = 0x5200
+
+
+def _object(obj_id, leds, x=0):
+    return ArtNetObject(id=obj_id, name=obj_id, source_shape_id=None, type='line',
+                        points=PointArray(np.arange(leds) % 64 + x, np.arange(leds) // 64))
+
+
+def _output(out_id, objects, universe, artsync=True):
+    return ArtNetOutput(id=out_id, name=out_id, target_ip='127.0.0.1', subnet='255.0.0.0',
+                        start_universe=universe, fps=0, artsync=artsync, assigned_objects=objects)
+
+
+def _routing(outputs=3, leds=300):
+    rm = ArtNetRoutingManager(session_state_manager=None)
+    for i in range(outputs):
+        rm.create_object(_object(f'obj-{i}', leds, x=i))
+        rm.create_output(_output(f'out-{i}', [f'obj-{i}'], universe=1 + 2 * i))
+    return rm
+
+
+def _frame():
+    rng = np.random.default_rng(3)
+    return rng.integers(0, 256, (64, 96, 3), dtype=np.uint8)
+
+
+class _Receiver:
+    """UDP socket on an ephemeral port collecting Art-Net opcodes."""
+
+    def __init__(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(('127.0.0.1', 0))
+        self.sock.settimeout(0.2)
+        self.port = self.sock.getsockname()[1]
+
+    def opcodes(self, wait=1.0):
+        codes = []
+        deadline = time.time() + wait
+        while time.time() < deadline:
+            try:
+                data = self.sock.recv(2048)
+            except socket.timeout:
+                if codes:
+                    break
+                continue
+            codes.append(int.from_bytes(data[8:10], 'little'))
+        return codes
+
+    def close(self):
+        self.sock.close()
+
+
+class TestAssignShards(unittest.TestCase):
+
+    def test_balanced_by_channels(self):
+        objects = {'big': _object('big', 900), 'a': _object('a', 400), 'b': _object('b', 500)}
+        outputs = {oid: _output(oid, [oid], 1) for oid in objects}
+        assignment = assign_shards(outputs, objects, 2)
+        self.assertNotEqual(assignment['big'], assignment['a'])
+        self.assertEqual(assignment['a'], assignment['b'])
+
+    def test_outputs_keep_their_shard(self):
+        objects = {f'o{i}': _object(f'o{i}', 100 * (i + 1)) for i in range(4)}
+        outputs = {oid: _output(oid, [oid], 1) for oid in objects}
+        previous = {oid: 0 for oid in outputs}
+        outputs['new'] = _output('new', [], 1)
+        assignment = assign_shards(outputs, objects, 2, previous)
+        self.assertTrue(all(assignment[oid] == 0 for oid in previous))
+        self.assertEqual(assignment['new'], 1)
+
+
+class TestShardPool(unittest.TestCase):
+
+    def setUp(self):
+        self.rx = _Receiver()
+        self.addCleanup(self.rx.close)
+
+    def test_workers_render_like_output_manager(self):
+        rm = _routing()
+        topology = rm.topology()
+        frame = _frame()
+        expected = OutputManager(96, 64).render_frame(frame, topology.objects, topology.outputs)
+
+        pool = ShardPool(2, 96, 64, sender_options={'port': self.rx.port}, timeout=10.0)
+        pool.start()
+        self.addCleanup(pool.stop)
+        frames, sync_ids = pool.process(frame, topology)
+
+        self.assertEqual(frames, expected)
+        self.assertEqual(len(sync_ids), 2)   # one shared target per worker
+        self.assertEqual(pool.get_stats()['outputs_per_worker'], [2, 1])
+        codes = self.rx.opcodes()
+        self.assertEqual(codes.count(OP_DMX), 3 * 2)
+        self.assertNotIn(OP_SYNC, codes)   # left to the pool's owner
+
+    def test_publish_skips_buffer_of_late_worker(self):
+        pool = ShardPool(2, 96, 64)
+        self.addCleanup(pool.stop)
+        frame = _frame()
+
+        def read(index):
+            return np.ndarray(frame.shape, dtype=np.uint8, buffer=pool._shms[index].buf)
+
+        self.assertEqual(pool._publish(frame), 0)
+        self.assertEqual(pool._publish(frame), 1)
+        pool._busy[0], pool._reading[0] = 7, 0   # worker 0 still reads buffer 0
+        late = read(0).copy()
+        self.assertEqual(pool._publish(frame[::-1]), 1)
+        self.assertEqual(pool._publish(frame[::-1]), 1)
+        np.testing.assert_array_equal(read(0), late)
+        np.testing.assert_array_equal(read(1), frame[::-1])
+
+        pool._busy[1], pool._reading[1] = 8, 1   # both buffers in use: frame dropped
+        self.assertIsNone(pool._publish(frame))
+        np.testing.assert_array_equal(read(0), late)
+
+
+class TestShardedRoutingBridge(unittest.TestCase):
+
+    def test_sync_after_all_workers(self):
+        rx = _Receiver()
+        self.addCleanup(rx.close)
+        bridge = RoutingBridge(_routing(), 96, 64, threaded_send=False, shard_workers=2)
+        bridge.sender = ArtNetSender(source_address=None, port=rx.port)
+        bridge.shards.sender_options['port'] = rx.port
+        bridge.shards.timeout = 10.0
+        self.assertTrue(bridge.needs_cpu_frame)
+        bridge.start()
+        self.addCleanup(bridge.cleanup)
+
+        bridge.process_frame(_frame())
+        codes = rx.opcodes()
+        self.assertEqual(codes.count(OP_DMX), 6)
+        self.assertEqual(codes[-1:], [OP_SYNC])
+        self.assertEqual(codes.count(OP_SYNC), 1)   # one target for all outputs
+        self.assertEqual(set(bridge.get_last_frames()), {'out-0', 'out-1', 'out-2'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Tests for the Art-Net transmit thread (src/modules/artnet/transmitter.py).
+
+Verifies:
+  - The mailbox keeps only the newest frame per output and counts drops
+  - Publishing never blocks on a slow sender; the newest frame goes out
+  - Latency / drop metrics and RoutingBridge integration
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from modules.artnet.object import ArtNetObject, ArtNetPoint
+from modules.artnet.output import ArtNetOutput
+from modules.artnet.routing_bridge import RoutingBridge
+from modules.artnet.routing_manager import ArtNetRoutingManager
+from modules.artnet.transmitter import ArtNetTransmitter, LatestFrameMailbox
+
+
+class _SlowSender:
+    """Records frames; blocks each send until released."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.frames = []
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def send_frame(self, frames):
+        self.gate.wait(2.0)
+        time.sleep(self.delay)
+        self.frames.append(dict(frames))
+
+
+class TestLatestFrameMailbox(unittest.TestCase):
+
+    def test_latest_wins_per_output(self):
+        box = LatestFrameMailbox()
+        box.put({'a': b'1', 'b': b'x'})
+        box.put({'a': b'2'})
+        pending = box.take(timeout=0.1)
+        self.assertEqual({k: v[0] for k, v in pending.items()}, {'a': b'2', 'b': b'x'})
+        self.assertEqual(box.dropped, {'a': 1})
+        self.assertEqual(box.take(timeout=0.01), {})
+
+    def test_close_wakes_taker(self):
+        box = LatestFrameMailbox()
+        threading.Timer(0.05, box.close).start()
+        t0 = time.perf_counter()
+        self.assertEqual(box.take(timeout=2.0), {})
+        self.assertLess(time.perf_counter() - t0, 1.0)
+
+
+class TestArtNetTransmitter(unittest.TestCase):
+
+    def test_publish_does_not_block_and_newest_is_sent(self):
+        sender = _SlowSender()
+        tx = ArtNetTransmitter(sender)
+        tx.start()
+        self.addCleanup(tx.stop)
+
+        sender.gate.clear()                      # wire is stuck
+        tx.publish({'out': b'0'})
+        time.sleep(0.05)                         # frame 0 is in flight
+        t0 = time.perf_counter()
+        for i in range(1, 50):
+            tx.publish({'out': bytes([i])})
+        self.assertLess(time.perf_counter() - t0, 0.05)
+        sender.gate.set()
+
+        deadline = time.time() + 2.0
+        while len(sender.frames) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual([f['out'] for f in sender.frames], [b'0', bytes([49])])
+
+        stats = tx.get_stats()
+        self.assertEqual(stats['outputs']['out'], {'sent': 2, 'dropped': 48})
+        self.assertIsNotNone(stats['latency_ms']['max'])
+        self.assertGreaterEqual(stats['latency_ms']['max'], stats['send_ms']['max'])
+
+    def test_stop_discards_pending(self):
+        sender = _SlowSender()
+        tx = ArtNetTransmitter(sender)
+        tx.start()
+        tx.stop()
+        tx.publish({'out': b'1'})
+        time.sleep(0.05)
+        self.assertEqual(sender.frames, [])
+        self.assertFalse(tx.is_running)
+
+
+class TestRoutingBridgeThreaded(unittest.TestCase):
+
+    def test_process_frame_publishes(self):
+        rm = ArtNetRoutingManager(session_state_manager=None)
+        obj = ArtNetObject(id='obj-1', name='o', source_shape_id='s', type='line',
+                           points=[ArtNetPoint(i, float(i), 5.0) for i in range(10)])
+        rm.create_object(obj)
+        rm.create_output(ArtNetOutput(id='out-1', name='o', target_ip='127.0.0.1',
+                                      subnet='255.255.255.0', start_universe=0, fps=0,
+                                      assigned_objects=['obj-1']))
+        bridge = RoutingBridge(rm, canvas_width=10, canvas_height=10)
+        sender = _SlowSender(delay=0.2)
+        bridge.sender.socket.close()
+        bridge.sender.send_frame = sender.send_frame
+        bridge.start()
+        self.addCleanup(bridge.transmitter.stop)
+
+        frame = np.full((10, 10, 3), 77, dtype=np.uint8)
+        t0 = time.perf_counter()
+        bridge.process_frame(frame)
+        bridge.process_frame(frame)
+        self.assertLess(time.perf_counter() - t0, 0.15)   # did not wait for the wire
+
+        deadline = time.time() + 2.0
+        while not sender.frames and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(sender.frames[0]['out-1'], bytes([77]) * 30)
+        self.assertTrue(bridge.get_transmit_stats()['threaded'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+"""
+Tests for the CPU buffer pool (src/modules/core/buffer_pool.py).
+
+Verifies:
+  - Released buffers are reused for the next acquire of a similar size
+  - Size bucketing (power of two, 4 KiB minimum) and idle-list cap
+  - Leak detection reports buffers that were never released
+  - Allocation counters feed get_stats()
+  - FrameRing reuses its destinations once per wrap-around and grows with
+    the frames declared in flight, without reusing a handed-out frame early
+  - The no-op colour correction does not alias the caller's buffer
+"""
+
+import os
+import sys
+import time
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from modules.artnet.color_correction import ColorCorrector
+from modules.core.buffer_pool import BufferPool, FrameRing, _bucket_size, set_frames_in_flight
+
+
+class TestBucketSize(unittest.TestCase):
+
+    def test_minimum_bucket(self):
+        self.assertEqual(_bucket_size(1), 4096)
+        self.assertEqual(_bucket_size(4096), 4096)
+
+    def test_power_of_two_rounding(self):
+        self.assertEqual(_bucket_size(4097), 8192)
+        self.assertEqual(_bucket_size(1920 * 1080 * 3), 8 * 1024 * 1024)
+
+
+class TestBufferPool(unittest.TestCase):
+
+    def test_acquire_shape_and_dtype(self):
+        pool = BufferPool()
+        arr = pool.acquire((4, 5, 3), np.uint16)
+        self.assertEqual(arr.shape, (4, 5, 3))
+        self.assertEqual(arr.dtype, np.uint16)
+        self.assertTrue(arr.flags['C_CONTIGUOUS'])
+
+    def test_zero_fill(self):
+        pool = BufferPool()
+        arr = pool.acquire((8, 8), np.uint8)
+        arr.fill(7)
+        pool.release(arr)
+        arr = pool.acquire((8, 8), np.uint8, zero=True)
+        self.assertEqual(int(arr.sum()), 0)
+
+    def test_release_then_reuse(self):
+        pool = BufferPool()
+        a = pool.acquire((100, 100, 3))
+        pool.release(a)
+        b = pool.acquire((90, 110, 3))  # same bucket
+        self.assertEqual(pool.allocations, 1)
+        self.assertEqual(pool.reuses, 1)
+        self.assertTrue(np.shares_memory(a, b))
+
+    def test_steady_state_no_allocations(self):
+        pool = BufferPool()
+        for _ in range(50):
+            tmp = pool.acquire((720, 1280, 3), np.uint16)
+            pool.release(tmp)
+        self.assertEqual(pool.allocations, 1)
+
+    def test_idle_list_is_capped(self):
+        pool = BufferPool()
+        bufs = [pool.acquire((16,)) for _ in range(BufferPool.MAX_IDLE_PER_BUCKET + 4)]
+        for b in bufs:
+            pool.release(b)
+        self.assertEqual(len(pool._idle[4096]), BufferPool.MAX_IDLE_PER_BUCKET)
+
+    def test_double_release_is_ignored(self):
+        pool = BufferPool()
+        a = pool.acquire((16,))
+        pool.release(a)
+        pool.release(a)
+        pool.release(None)
+        self.assertEqual(pool.releases, 1)
+
+    def test_leak_detection(self):
+        pool = BufferPool(debug=True)
+        leaked = pool.acquire((32, 32))
+        time.sleep(0.02)
+        leaks = pool.check_leaks(max_age_s=0.01)
+        self.assertEqual(len(leaks), 1)
+        self.assertIn('test_leak_detection', leaks[0]['site'])
+        pool.release(leaked)
+        self.assertEqual(pool.check_leaks(max_age_s=0.0), [])
+
+    def test_stats(self):
+        pool = BufferPool()
+        a = pool.acquire((1024, 1024))
+        stats = pool.get_stats()
+        self.assertEqual(stats['allocations'], 1)
+        self.assertEqual(stats['in_use'], 1)
+        self.assertGreater(stats['allocs_per_s'], 0)
+        self.assertIsNone(stats['leaks'])
+        pool.release(a)
+        self.assertEqual(pool.get_stats()['in_use'], 0)
+
+
+class TestFrameRing(unittest.TestCase):
+
+    def test_wraps_around(self):
+        ring = FrameRing(size=3)
+        frames = [ring.next((4, 4, 3)) for _ in range(3)]
+        self.assertFalse(any(np.shares_memory(a, b) for a in frames for b in frames if a is not b))
+        self.assertIs(ring.next((4, 4, 3)), frames[0])
+        self.assertEqual(ring.allocations, 3)
+
+    def test_reallocates_on_shape_change(self):
+        ring = FrameRing(size=1)
+        first = ring.next((4, 4, 3))
+        second = ring.next((8, 4, 3))
+        self.assertEqual(second.shape, (8, 4, 3))
+        self.assertIsNot(first, second)
+        self.assertEqual(ring.allocations, 2)
+
+    def test_grows_with_frames_in_flight(self):
+        ring = FrameRing()
+        self.assertEqual(ring.size, 4)
+        held = [ring.next((2, 2)) for _ in range(3)]
+        self.addCleanup(set_frames_in_flight, 'test', 0)
+        set_frames_in_flight('test', 7)        # e.g. pipeline depth 2 + a zero-copy output
+        for _ in range(4):
+            frame = ring.next((2, 2))
+            self.assertFalse(any(frame is h for h in held))
+            held.append(frame)
+        self.assertEqual(ring.size, 8)
+        ring.next((2, 2))
+        self.assertIs(ring.next((2, 2)), held[0])   # oldest frame, 8 calls later
+
+    def test_fixed_size_ignores_frames_in_flight(self):
+        self.addCleanup(set_frames_in_flight, 'test', 0)
+        set_frames_in_flight('test', 10)
+        ring = FrameRing(size=2)
+        first = ring.next((2, 2))
+        ring.next((2, 2))
+        self.assertIs(ring.next((2, 2)), first)
+
+
+class TestColorCorrectionCopy(unittest.TestCase):
+
+    def test_noop_returns_a_copy(self):
+        shared = np.arange(12, dtype=np.uint8).reshape(4, 3)
+        out = ColorCorrector.apply(shared[1:3])
+        out[:] = 0
+        self.assertEqual(int(shared[1, 0]), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
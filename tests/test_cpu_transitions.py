@@ -0,0 +1,211 @@
+"""
+Tests for the CPU transition renderer (src/modules/player/transitions/cpu_renderer.py)
+and the TransitionManager CPU path.
+
+Verifies:
+  - Wipes start as pure A and end as pure B
+  - The threshold/lerp matches a straightforward per-pixel blend, also over
+    a whole transition (reused ring frames, incremental mask, cached A band)
+  - Progress maps are built once per (effect, size, params), and only the
+    most recently used few are kept
+  - Punch zoom and RGB split follow the archived plugins; a zoom-in sweep
+    over reused ring frames matches fresh renders
+  - A stored frame is copied when the transition starts
+  - TransitionManager runs CPU transitions when no GPU renderer exists
+"""
+
+import os
+import sys
+import time
+import unittest
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from modules.player.transitions.cpu_renderer import (
+    CPUTransitionRenderer, CPU_TRANSITION_EFFECTS, MAX_CACHED_MAPS,
+)
+from modules.player.transitions.manager import TransitionManager
+
+
+def _frames(h=67, w=131):
+    rng = np.random.default_rng(0)
+    a = rng.integers(0, 256, (h, w, 3), dtype=np.uint8)
+    b = rng.integers(0, 256, (h, w, 3), dtype=np.uint8)
+    return a, b
+
+
+class TestCPUTransitionRenderer(unittest.TestCase):
+
+    def test_no_a_frame_returns_none(self):
+        _, b = _frames()
+        self.assertIsNone(CPUTransitionRenderer().render('fade', b, 0.5))
+
+    def test_unknown_effect_returns_none(self):
+        a, b = _frames()
+        r = CPUTransitionRenderer()
+        r.store_frame(a)
+        self.assertIsNone(r.render('lens_blur', b, 0.5))
+
+    def test_endpoints_are_pure_a_and_b(self):
+        a, b = _frames()
+        r = CPUTransitionRenderer()
+        r.store_frame(a)
+        for effect in CPU_TRANSITION_EFFECTS:
+            np.testing.assert_array_equal(r.render(effect, b, 0.0), a, err_msg=effect)
+            np.testing.assert_array_equal(r.render(effect, b, 1.0), b, err_msg=effect)
+
+    def test_masked_blend_matches_reference(self):
+        a, b = _frames()
+        r = CPUTransitionRenderer()
+        r.store_frame(a)
+        for effect in ('linear_wipe', 'radial_wipe', 'round_wipe'):
+            pmap = r.get_progress_map(effect, a.shape[1], a.shape[0])
+            for progress in (0.2, 0.5, 0.8):
+                out = r.render(effect, b, progress)
+                lut, _, _ = pmap.weights(progress)
+                w = lut[pmap.levels][:, :, None]
+                ref = a * (1.0 - w) + b * w
+                self.assertLessEqual(np.abs(out - ref).max(), 1.0, f"{effect} @ {progress}")
+
+    def test_sweep_matches_reference(self):
+        a, b = _frames()
+        r = CPUTransitionRenderer()
+        r.store_frame(a)
+        r.detach_frame()
+        for effect in ('linear_wipe', 'round_wipe'):
+            pmap = r.get_progress_map(effect, a.shape[1], a.shape[0])
+            for progress in np.linspace(0.0, 1.0, 23):
+                b = np.roll(b, 1, axis=1)          # live B changes every frame
+                out = r.render(effect, b, progress)
+                lut, _, _ = pmap.weights(progress)
+                w = lut[pmap.levels][:, :, None]
+                ref = a * (1.0 - w) + b * w
+                self.assertLessEqual(np.abs(out - ref).max(), 1.0, f"{effect} @ {progress}")
+
+    def test_hard_wipe_is_binary(self):
+        a, b = _frames()
+        r = CPUTransitionRenderer()
+        r.store_frame(a)
+        out = r.render('linear_wipe', b, 0.5, {'feather': 0.0})
+        from_a = (out == a).all(axis=2)
+        from_b = (out == b).all(axis=2)
+        self.assertTrue((from_a | from_b).all())
+        # angle 0: left half switched to B
+        self.assertTrue(from_b[:, :60].all())
+        self.assertTrue(from_a[:, 72:].all())
+
+    def test_progress_map_cached(self):
+        r = CPUTransitionRenderer()
+        m1 = r.get_progress_map('round_wipe', 64, 48)
+        self.assertIs(r.get_progress_map('round_wipe', 64, 48), m1)
+        self.assertIsNot(r.get_progress_map('round_wipe', 64, 48, {'reverse': True}), m1)
+        self.assertIsNot(r.get_progress_map('round_wipe', 32, 48), m1)
+
+    def test_progress_map_cache_is_bounded(self):
+        r = CPUTransitionRenderer()
+        first = r.get_progress_map('round_wipe', 16, 16)
+        for w in range(17, 17 + MAX_CACHED_MAPS):
+            r.get_progress_map('round_wipe', w, 16)
+        self.assertEqual(len(r._maps), MAX_CACHED_MAPS)
+        self.assertIsNot(r.get_progress_map('round_wipe', 16, 16), first)   # evicted, rebuilt
+
+        # A map in use stays cached while others come and go.
+        kept = r.get_progress_map('linear_wipe', 16, 16)
+        for w in range(40, 40 + 2 * MAX_CACHED_MAPS):
+            r.get_progress_map('linear_wipe', 16, 16)
+            r.get_progress_map('round_wipe', w, 16)
+        self.assertIs(r.get_progress_map('linear_wipe', 16, 16), kept)
+
+    def test_slide_moves_b_in(self):
+        a, b = _frames()
+        r = CPUTransitionRenderer()
+        r.store_frame(a)
+        out = r.render('slide_wipe_left', b, 0.5)
+        n = int(round(a.shape[1] * 0.5))
+        np.testing.assert_array_equal(out[:, -n:], b[:, :n])
+        np.testing.assert_array_equal(out[:, :-n], a[:, :-n])
+
+    def test_punch_zoom_in(self):
+        a, b = _frames()
+        r = CPUTransitionRenderer()
+        r.store_frame(a)
+        out = r.render('punch_zoom_in', b, 0.5)
+        np.testing.assert_array_equal(out[:5, :5], a[:5, :5])   # outside the growing B rectangle
+        self.assertFalse(np.array_equal(out[30:37, 60:70], a[30:37, 60:70]))
+
+    def test_punch_zoom_in_sweep_matches_fresh_render(self):
+        a, b = _frames()
+        r = CPUTransitionRenderer()
+        r.store_frame(a)
+        r.detach_frame()
+        for progress in np.r_[np.linspace(0.0, 1.0, 17), np.linspace(1.0, 0.0, 9)]:
+            b = np.roll(b, 1, axis=1)
+            out = r.render('punch_zoom_in', b, progress).copy()
+            fresh = CPUTransitionRenderer()
+            fresh.store_frame(a)
+            np.testing.assert_array_equal(out, fresh.render('punch_zoom_in', b, progress),
+                                          err_msg=f"progress {progress}")
+
+    def test_rgb_split_shifts_red_and_blue(self):
+        a, b = _frames()
+        r = CPUTransitionRenderer()
+        r.store_frame(a)
+        out = r.render('rgb_split', b, 0.5, {'intensity': 10})
+        blend = cv2.addWeighted(a, 0.5, b, 0.5, 0)
+        np.testing.assert_array_equal(out[:, :, 1], blend[:, :, 1])
+        np.testing.assert_array_equal(out[:, 10:, 2], blend[:, :-10, 2])
+        np.testing.assert_array_equal(out[:, :-10, 0], blend[:, 10:, 0])
+
+    def test_detach_copies_a(self):
+        a, b = _frames()
+        r = CPUTransitionRenderer()
+        frame = a.copy()
+        r.store_frame(frame)
+        r.detach_frame()
+        frame[:] = 0                          # ring frame reused by the play loop
+        np.testing.assert_array_equal(r.render('fade', b, 0.0), a)
+
+    def test_size_mismatch_resizes_a(self):
+        a, b = _frames()
+        r = CPUTransitionRenderer()
+        r.store_frame(a[:32, :40])
+        self.assertEqual(r.render('fade', b, 0.5).shape, b.shape)
+
+
+class TestTransitionManagerCPU(unittest.TestCase):
+
+    def test_cpu_transition_lifecycle(self):
+        a, b = _frames()
+        tm = TransitionManager()
+        tm.configure(enabled=True, effect='linear_wipe', duration=0.2, easing='linear')
+        self.assertFalse(tm.start())          # no A-buffer yet
+        tm.store_cpu_frame(a)
+        self.assertTrue(tm.start())
+        out = tm.apply_cpu(b)
+        self.assertIsNotNone(out)
+        self.assertEqual(tm.frames, 1)
+        time.sleep(0.25)
+        self.assertIsNone(tm.apply_cpu(b))    # duration expired
+        self.assertFalse(tm.active)
+
+    def test_disabled_does_not_store(self):
+        a, _ = _frames()
+        tm = TransitionManager()
+        tm.store_cpu_frame(a)
+        self.assertIsNone(tm._cpu_renderer)
+
+    def test_gpu_renderer_takes_precedence(self):
+        a, _ = _frames()
+        tm = TransitionManager()
+        tm.configure(enabled=True)
+        tm._gpu_renderer = object()
+        tm.store_cpu_frame(a)
+        self.assertIsNone(tm._cpu_renderer)
+        self.assertTrue(tm.has_gpu_renderer)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Tests for the time-based Art-Net output delay (src/modules/artnet/delay_ring.py).
+
+Verifies:
+  - Delay is measured in milliseconds, independent of the frame rate
+  - Black is returned until a frame is old enough
+  - Interpolation blends the two frames around the delayed timestamp
+  - The ring grows when it cannot reach back by the delay, keeping order
+  - OutputManager._apply_delay uses one preallocated ring per output, returns
+    views into it, and handles delay changes, frame size changes and delay 0
+"""
+
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from modules.artnet.delay_ring import DelayRing
+from modules.artnet.output import ArtNetOutput
+from modules.artnet.output_manager import OutputManager
+
+
+def _frame(value, channels=6):
+    return bytes([value % 256]) * channels
+
+
+class TestDelayRing(unittest.TestCase):
+
+    def test_delay_in_milliseconds_at_any_rate(self):
+        for fps in (25, 60, 144):
+            ring = DelayRing(6, 0.1, rate_hint=30)
+            outputs = []
+            for i in range(60):
+                t = i / fps
+                ring.push(_frame(i), t)
+                frame = ring.read(t)
+                outputs.append(None if frame is None else int(frame[0]))
+            # At t = 59/fps the output is the newest frame at or before t - 100 ms
+            expected = int(np.floor((59 / fps - 0.1) * fps + 1e-9))
+            self.assertEqual(outputs[-1], expected, fps)
+
+    def test_black_until_old_enough(self):
+        ring = DelayRing(3, 0.05)
+        ring.push(_frame(9, 3), 10.0)
+        self.assertIsNone(ring.read(10.0))
+        self.assertIsNone(ring.read(10.049))
+        self.assertEqual(bytes(ring.read(10.05)), _frame(9, 3))
+
+    def test_interpolation(self):
+        ring = DelayRing(2, 0.1)
+        ring.push(bytes([0, 200]), 1.0)
+        ring.push(bytes([100, 0]), 1.1)
+        np.testing.assert_array_equal(ring.read(1.15, interpolate=True), [50, 100])
+        np.testing.assert_array_equal(ring.read(1.125, interpolate=True), [25, 150])
+        np.testing.assert_array_equal(ring.read(1.15), [0, 200])
+        np.testing.assert_array_equal(ring.read(1.2, interpolate=True), [100, 0])
+
+    def test_grows_and_keeps_order(self):
+        ring = DelayRing(1, 0.5, rate_hint=10)
+        initial = ring.capacity
+        for i in range(200):
+            ring.push(bytes([i % 256]), i / 100.0)
+        self.assertGreater(ring.capacity, initial)
+        self.assertEqual(int(ring.read(1.99)[0]), 149)
+
+    def test_wraps_without_growing(self):
+        ring = DelayRing(1, 0.1, rate_hint=20)
+        capacity = ring.capacity
+        for i in range(100):
+            ring.push(bytes([i]), i / 20.0)
+        self.assertEqual(ring.capacity, capacity)
+        self.assertEqual(int(ring.read(99 / 20.0)[0]), 97)
+
+
+class TestOutputDelay(unittest.TestCase):
+
+    def test_apply_delay(self):
+        manager = OutputManager(10, 10)
+        results = [bytes(manager._apply_delay('out', 125, 16, _frame(i), now=i * 0.0625)) for i in range(6)]
+        self.assertEqual(results[:2], [bytes(6)] * 2)
+        self.assertEqual(results[2:], [_frame(i) for i in range(4)])
+        ring = manager.delay_buffers['out']
+        delayed = manager._apply_delay('out', 125, 16, _frame(6), now=0.375)
+        self.assertTrue(np.shares_memory(delayed, ring.frames))   # no copy per frame
+
+        # Delay change reuses the ring; frame size change replaces it
+        manager._apply_delay('out', 50, 16, _frame(6), now=0.375)
+        self.assertIs(manager.delay_buffers['out'], ring)
+        manager._apply_delay('out', 50, 16, _frame(7, 9), now=0.4375)
+        self.assertIsNot(manager.delay_buffers['out'], ring)
+
+        self.assertEqual(manager._apply_delay('out', 0, 16, _frame(8)), _frame(8))
+        self.assertNotIn('out', manager.delay_buffers)
+
+    def test_output_serialization(self):
+        output = ArtNetOutput(id='o', name='o', target_ip='127.0.0.1', subnet='255.255.255.0',
+                              start_universe=0, delay=40, delay_interpolation=True)
+        self.assertTrue(ArtNetOutput.from_dict(output.to_dict()).delay_interpolation)
+
+
+if __name__ == '__main__':
+    unittest.main()
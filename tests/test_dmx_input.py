@@ -0,0 +1,246 @@
+"""
+Tests for lighting-console DMX input (src/modules/artnet/receiver.py,
+src/modules/artnet/dmx_input.py).
+
+Verifies:
+  - ArtDmx and E1.31 data packets are parsed; sync/terminated packets ignored
+  - Packets arriving out of sequence are dropped
+  - The receiver thread picks up Art-Net and sACN sent over localhost
+  - Unicast Art-Net on port 6454 still reaches DMX input while a
+    RoutingBridge is sending
+  - Mapped channels (8 and 16 bit) reach player setters, layer opacity and
+    effect parameters once per apply(), only when their value changed
+  - Effect parameters are resolved again when a layer's effects change or
+    a setter fails
+"""
+
+import os
+import socket
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from modules.artnet import sacn
+from modules.artnet.dmx_input import DMXInput, DMXInputMapping
+from modules.artnet.packet_builder import artdmx_header
+from modules.artnet.receiver import DMXReceiver, parse_artdmx, parse_e131
+from modules.artnet.routing_bridge import RoutingBridge
+from modules.artnet.routing_manager import ArtNetRoutingManager
+
+CID = bytes(range(16))
+
+
+def _artdmx(universe, data, sequence=0):
+    return artdmx_header(universe, len(data), sequence) + bytes(data)
+
+
+def _e131(universe, data, sequence=0, options=0):
+    packet = bytearray(sacn.e131_data_header(universe, CID, slots=len(data)) + bytes(data))
+    packet[sacn.E131_SEQUENCE_OFFSET] = sequence
+    packet[sacn.E131_OPTIONS_OFFSET] = options
+    return bytes(packet)
+
+
+class _Player:
+    def __init__(self, layers=0):
+        self.calls = []
+        self.current_clip_id = 'clip'
+        self.layers = [type('Layer', (), {'opacity': 100.0})() for _ in range(layers)]
+
+    def set_brightness(self, value):
+        self.calls.append(('brightness', value))
+
+    def set_hue_shift(self, value):
+        self.calls.append(('hue_shift', value))
+
+
+class _Effect:
+    PARAMETERS = [
+        {'name': 'strength', 'type': 'float', 'min': 0.0, 'max': 10.0},
+        {'name': 'invert', 'type': 'bool'},
+        {'name': 'mode', 'type': 'select', 'options': ['a', 'b', 'c']},
+    ]
+
+    def __init__(self):
+        self.values = {}
+
+    def update_parameter(self, name, value):
+        self.values[name] = value
+        return True
+
+
+class _Sequences:
+    def __init__(self, effect):
+        self.effect = effect
+
+    def resolve_parameter(self, uid, player_manager):
+        name = uid.rsplit('_', 1)[1]
+        return None, self.effect, name
+
+
+class _PlayerManager:
+    def __init__(self):
+        self.players = {'video': _Player(layers=2)}
+        self.effect = _Effect()
+        self.sequence_manager = _Sequences(self.effect)
+
+
+class TestParsing(unittest.TestCase):
+
+    def test_artdmx(self):
+        self.assertEqual(parse_artdmx(_artdmx(0x1234, [1, 2, 3], sequence=7)), (0x1234, 7, bytes([1, 2, 3])))
+        self.assertIsNone(parse_artdmx(b'Art-Net\x00\x00\x52' + bytes(12)))   # ArtSync
+
+    def test_e131(self):
+        self.assertEqual(parse_e131(_e131(42, [9, 8], sequence=3)), (42, 3, bytes([9, 8])))
+        self.assertIsNone(parse_e131(_e131(42, [9], options=sacn.OPTION_STREAM_TERMINATED)))
+        self.assertIsNone(parse_e131(sacn.e131_sync_packet(1, 0, CID)))
+
+    def test_out_of_order_dropped(self):
+        receiver = DMXReceiver()
+        receiver.feed('sacn', _e131(1, [10], sequence=5))
+        receiver.feed('sacn', _e131(1, [20], sequence=4))
+        self.assertEqual(receiver.get_universe('sacn', 1)[0], 10)
+        receiver.feed('sacn', _e131(1, [30], sequence=6))
+        self.assertEqual(receiver.get_universe('sacn', 1)[0], 30)
+        self.assertEqual(receiver.packets_out_of_order, 1)
+
+    def test_changes_taken_once(self):
+        receiver = DMXReceiver()
+        receiver.feed('artnet', _artdmx(0, [5]))
+        receiver.feed('artnet', _artdmx(0, [6]))
+        changes = receiver.take_changes()
+        self.assertEqual(list(changes), [('artnet', 0)])
+        self.assertEqual(len(changes[('artnet', 0)][0]), 512)
+        self.assertEqual(changes[('artnet', 0)][0][0], 6)
+        receiver.feed('artnet', _artdmx(0, [6]))   # unchanged data
+        self.assertEqual(receiver.take_changes(), {})
+
+
+class TestReceiverLoopback(unittest.TestCase):
+
+    def test_receives_over_localhost(self):
+        receiver = DMXReceiver('127.0.0.1', artnet_port=0, sacn_port=0)
+        self.assertTrue(receiver.start())
+        self.addCleanup(receiver.stop)
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.addCleanup(sock.close)
+        sock.sendto(_artdmx(3, [1, 2]), ('127.0.0.1', receiver.ports['artnet']))
+        sock.sendto(_e131(7, [4]), ('127.0.0.1', receiver.ports['sacn']))
+
+        changes = {}
+        deadline = time.time() + 2.0
+        while len(changes) < 2 and time.time() < deadline:
+            changes.update(receiver.take_changes())
+            time.sleep(0.005)
+        self.assertEqual(changes[('artnet', 3)][0][:2], bytes([1, 2]))
+        self.assertEqual(changes[('sacn', 7)][0][0], 4)
+
+    def test_unicast_reaches_input_next_to_the_output(self):
+        receiver = DMXReceiver('0.0.0.0', sacn_port=None)
+        if not receiver.start():
+            self.skipTest('Art-Net port 6454 not available')
+        self.addCleanup(receiver.stop)
+        pm = _PlayerManager()
+        dmx = DMXInput(pm, receiver, [DMXInputMapping('player.video.brightness', channel=1)])
+        bridge = RoutingBridge(ArtNetRoutingManager(session_state_manager=None), 10, 10,
+                               threaded_send=False, dmx_input=dmx)
+        self.addCleanup(bridge.cleanup)
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.addCleanup(sock.close)
+        deadline = time.time() + 2.0
+        while not pm.players['video'].calls and time.time() < deadline:
+            sock.sendto(_artdmx(0, [255]), ('127.0.0.1', 6454))
+            time.sleep(0.01)
+            dmx.apply()
+        self.assertEqual(pm.players['video'].calls, [('brightness', 100.0)])
+
+
+class TestDMXInput(unittest.TestCase):
+
+    def setUp(self):
+        self.pm = _PlayerManager()
+        self.receiver = DMXReceiver()
+        self.dmx = DMXInput(self.pm, self.receiver, [
+            DMXInputMapping('player.video.brightness', channel=1),
+            DMXInputMapping('player.video.hue_shift', channel=2, fine=True),
+            DMXInputMapping('player.video.layers[1].opacity', protocol='sacn', universe=2, channel=5),
+            DMXInputMapping('param_fx_strength', channel=10, max=5.0),
+            DMXInputMapping('param_fx_invert', channel=11),
+            DMXInputMapping('param_fx_mode', channel=12),
+        ])
+        self.player = self.pm.players['video']
+
+    def test_channels_applied(self):
+        data = bytearray(12)
+        data[0] = 255
+        data[1:3] = (0x80, 0x00)      # 16-bit 0x8000
+        data[9] = 255
+        data[10] = 200
+        data[11] = 255
+        self.receiver.feed('artnet', _artdmx(0, data))
+        self.receiver.feed('sacn', _e131(2, [0, 0, 0, 0, 51]))
+
+        self.assertEqual(self.dmx.apply(), 6)
+        self.assertEqual(self.player.calls[0], ('brightness', 100.0))
+        self.assertAlmostEqual(self.player.calls[1][1], 360.0 * 0x8000 / 0xFFFF)
+        self.assertAlmostEqual(self.player.layers[1].opacity, 20.0)
+        self.assertEqual(self.pm.effect.values, {'strength': 5.0, 'invert': True, 'mode': 'c'})
+
+    def test_only_changed_values(self):
+        self.receiver.feed('artnet', _artdmx(0, [255, 0, 0]))
+        self.dmx.apply()
+        self.player.calls.clear()
+        self.receiver.feed('artnet', _artdmx(0, [255, 0, 0, 0, 0, 0, 0, 0, 0, 51]))
+        self.assertEqual(self.dmx.apply(), 1)
+        self.assertEqual(self.player.calls, [])
+        self.assertEqual(self.dmx.apply(), 0)   # nothing new since the last frame
+
+    def test_latency_stats(self):
+        self.receiver.feed('artnet', _artdmx(0, [1]))
+        self.dmx.apply()
+        stats = self.dmx.get_stats()
+        self.assertEqual(stats['resolved'], 6)
+        self.assertEqual(stats['frames_applied'], 1)
+        self.assertGreaterEqual(stats['latency_ms']['max'], 0.0)
+
+    def test_missing_target_is_skipped(self):
+        self.dmx.set_mappings([DMXInputMapping('player.gone.brightness', channel=1),
+                               DMXInputMapping('player.video.brightness', channel=2)])
+        self.receiver.feed('artnet', _artdmx(0, [255, 255]))
+        self.assertEqual(self.dmx.apply(), 1)
+
+    def test_effect_list_change_resolves_again(self):
+        self.receiver.feed('artnet', _artdmx(0, [0] * 9 + [255]))
+        self.dmx.apply()
+        replacement = _Effect()
+        self.pm.sequence_manager.effect = replacement
+        self.player.layers[0].effects = [{'instance': replacement}]
+        self.receiver.feed('artnet', _artdmx(0, [0] * 9 + [51]))
+        self.dmx.apply()
+        self.assertEqual(replacement.values['strength'], 1.0)
+        self.assertEqual(self.pm.effect.values['strength'], 5.0)
+
+    def test_failed_setter_resolves_again(self):
+        failures = []
+
+        def flaky(value):
+            if not failures:
+                failures.append(value)
+                raise RuntimeError('effect gone')
+            self.player.calls.append(('brightness', value))
+        self.player.set_brightness = flaky
+        self.receiver.feed('artnet', _artdmx(0, [255]))
+        self.dmx.apply()
+        self.assertNotIn('brightness', dict(self.player.calls))
+        self.receiver.feed('artnet', _artdmx(0, [51]))
+        self.dmx.apply()
+        self.assertEqual(dict(self.player.calls)['brightness'], 20.0)
+        self.assertEqual(self.dmx.get_stats()['resolved'], 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
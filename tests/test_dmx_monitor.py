@@ -0,0 +1,70 @@
+"""
+Tests for the binary DMX monitor stream (src/modules/api/output/dmx_monitor.py).
+
+Verifies:
+  - Only subscribed universes are sent, split like the output packets and
+    padded to 512-byte binary slots
+  - Unchanged universes are not resent; a resubscription sends them again
+  - Each client is rate limited to its requested fps
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from modules.api.output.dmx_monitor import DMXMonitor
+from modules.artnet.packet_builder import CHANNELS_PER_UNIVERSE as U
+
+
+class TestDMXMonitor(unittest.TestCase):
+
+    def setUp(self):
+        # 2.5 universes: the last one is short
+        self.frames = {'out': bytes([1]) * U + bytes([2]) * U + bytes([3]) * 256}
+        self.monitor = DMXMonitor(lambda: self.frames)
+
+    def test_subscribed_universes_only(self):
+        self.monitor.subscribe('a', 'out', universes=[1, 2, 7])
+        [(sid, msg)] = self.monitor.poll(now=0.0)
+        self.assertEqual(sid, 'a')
+        self.assertEqual(msg['outputId'], 'out')
+        self.assertEqual(msg['universeCount'], 3)
+        self.assertEqual(msg['universes'], [1, 2])
+        self.assertEqual(msg['data'], bytes([2]) * U + bytes(512 - U) + bytes([3]) * 256 + bytes(256))
+
+    def test_only_changes_are_resent(self):
+        self.monitor.subscribe('a', 'out')
+        self.assertEqual(self.monitor.poll(now=0.0)[0][1]['universes'], [0, 1, 2])
+        self.assertEqual(self.monitor.poll(now=1.0), [])
+
+        data = bytearray(self.frames['out'])
+        data[U + 88] = 99
+        self.frames['out'] = bytes(data)
+        [(_, msg)] = self.monitor.poll(now=2.0)
+        self.assertEqual(msg['universes'], [1])
+        self.assertEqual(msg['data'][88], 99)
+
+        self.monitor.subscribe('a', 'out', universes=[0])
+        self.assertEqual(self.monitor.poll(now=2.01)[0][1]['universes'], [0])
+
+    def test_rate_limit_per_client(self):
+        self.monitor.subscribe('slow', 'out', fps=2)
+        self.monitor.subscribe('fast', 'out', fps=20)
+        self.monitor.poll(now=0.0)
+        self.frames['out'] = bytes(2 * U + 256)
+        self.assertEqual([sid for sid, _ in self.monitor.poll(now=0.1)], ['fast'])
+        self.assertEqual([sid for sid, _ in self.monitor.poll(now=0.5)], ['slow'])
+        self.assertAlmostEqual(self.monitor.next_wait(now=0.5), 0.05)
+
+    def test_unsubscribe(self):
+        self.monitor.subscribe('a', 'out')
+        self.monitor.unsubscribe('a', 'out')
+        self.assertEqual(self.monitor.poll(now=0.0), [])
+        self.monitor.unsubscribe('a')
+        self.assertEqual(self.monitor.client_count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+"""
+Tests for the streaming DMX recorder (.fxrec files).
+
+Verifies:
+  - Frames of several streams round-trip through chunked, compressed files
+  - Chunks are cut by size and time span; the chunk index maps timestamps
+    to chunks and frames(start) resumes mid-recording
+  - Files that were never closed are recovered by scanning the chunks
+  - record() drops instead of blocking when the writer queue is full
+  - RecordingManager writes .fxrec files and keeps the legacy add_frame API
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from modules.player.recording import dmx_file
+from modules.player.recording.dmx_file import DMXRecording
+from modules.player.recording.manager import RecordingManager
+from modules.player.recording.recorder import DMXRecorder
+
+
+def _frame(i, channels=1530):
+    return {
+        'out-a': ((np.arange(channels, dtype=np.uint16) + i) % 256).astype(np.uint8).tobytes(),
+        'out-b': bytes([i % 256]) * 512,
+    }
+
+
+class TestDMXRecorder(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, 'rec', 'take.fxrec')
+
+    def _record(self, recorder, count, step=1 / 40):
+        self.assertTrue(recorder.start(self.path, {'name': 'take'}))
+        for i in range(count):
+            self.assertTrue(recorder.record(_frame(i), timestamp=i * step))
+        return recorder.stop({'canvas_width': 64})
+
+    def test_round_trip(self):
+        summary = self._record(DMXRecorder(chunk_bytes=16 * 1024, chunk_seconds=10), 200)
+        self.assertEqual((summary['frame_count'], summary['dropped'], summary['error']), (200, 0, None))
+        self.assertLess(summary['bytes'], 200 * 2042)   # compressed
+
+        with DMXRecording(self.path) as rec:
+            self.assertTrue(rec.complete)
+            self.assertEqual(rec.streams, ['out-a', 'out-b'])
+            self.assertEqual(rec.frame_count, 200)
+            self.assertGreater(len(rec.chunks), 10)
+            self.assertEqual(rec.metadata['name'], 'take')
+            self.assertEqual(rec.metadata['canvas_width'], 64)
+            frames = list(rec.frames())
+        self.assertEqual(len(frames), 200)
+        for i, (t, data) in enumerate(frames):
+            self.assertAlmostEqual(t, i / 40)
+            self.assertEqual(data, _frame(i))
+
+        info = dmx_file.read_info(self.path)
+        self.assertEqual((info['name'], info['frame_count'], info['complete']), ('take', 200, True))
+
+    def test_chunk_index_and_seek(self):
+        self._record(DMXRecorder(chunk_seconds=0.5), 100, step=0.1)
+        with DMXRecording(self.path) as rec:
+            self.assertEqual([c.frames for c in rec.chunks], [5] * 20)
+            self.assertEqual(rec.chunks[3].first_frame, 15)
+            self.assertEqual(rec.chunk_for_time(1.75), 3)
+            self.assertEqual(rec.chunk_for_time(-1.0), 0)
+            t, data = next(rec.frames(start=4.25))
+        self.assertAlmostEqual(t, 4.3)
+        self.assertEqual(data, _frame(43))
+
+    def test_recovers_unfinished_file(self):
+        self._record(DMXRecorder(chunk_seconds=0.25, compress=False), 40, step=0.05)
+        with DMXRecording(self.path) as rec:
+            cut = rec.chunks[-1].offset + 10   # last chunk truncated, no index/footer
+        with open(self.path, 'r+b') as f:
+            f.truncate(cut)
+
+        self.assertFalse(dmx_file.read_info(self.path)['complete'])
+        with DMXRecording(self.path) as rec:
+            self.assertFalse(rec.complete)
+            self.assertEqual(rec.streams, ['out-a', 'out-b'])
+            frames = list(rec.frames())
+        self.assertEqual(len(frames), 35)
+        self.assertEqual(frames[-1][1], _frame(34))
+
+    def test_drops_when_writer_is_behind(self):
+        recorder = DMXRecorder(queue_frames=4)
+        gate = threading.Event()
+        original = dmx_file.encode_frame
+
+        def slow_encode(*args):
+            gate.wait(2)
+            return original(*args)
+
+        dmx_file.encode_frame = slow_encode
+        try:
+            recorder.start(self.path)
+            results = [recorder.record(_frame(i), timestamp=i) for i in range(20)]
+            gate.set()
+            summary = recorder.stop()
+        finally:
+            dmx_file.encode_frame = original
+        self.assertIn(False, results)
+        self.assertEqual(summary['dropped'], results.count(False))
+        self.assertEqual(summary['frame_count'], results.count(True))
+
+
+class TestRecordingManager(unittest.TestCase):
+
+    def test_writes_fxrec(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = RecordingManager(records_dir=tmp)
+            self.assertIsNone(manager.stop_recording())
+            self.assertTrue(manager.start_recording('Show 1'))
+            self.assertFalse(manager.start_recording('again'))
+            for i in range(10):
+                manager.add_frame({'timestamp': i / 30, 'dmx_data': [i] * 12})
+            filename = manager.stop_recording(canvas_width=320, canvas_height=240, total_points=4)
+
+            self.assertTrue(filename.startswith('Show 1_') and filename.endswith('.fxrec'))
+            with DMXRecording(os.path.join(tmp, filename)) as rec:
+                self.assertEqual(rec.metadata['canvas_height'], 240)
+                frames = list(rec.frames())
+            self.assertEqual(frames[9][1], {'dmx': bytes([9]) * 12})
+
+            # Empty recordings leave no file behind
+            manager.start_recording('empty')
+            self.assertIsNone(manager.stop_recording())
+            self.assertEqual(os.listdir(tmp), [filename])
+
+
+if __name__ == '__main__':
+    unittest.main()
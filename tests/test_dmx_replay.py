@@ -0,0 +1,182 @@
+"""
+Tests for the memory-mapped DMX replay engine.
+
+Verifies:
+  - ReplayCursor seeks to the last frame at or before a timestamp and
+    advances to the newest due frame, counting skipped frames
+  - ReplayManager replays frames in order on the monotonic clock, applies
+    brightness and speed, and leaves the position at the end without loop
+  - A single-frame recording loops at the output frame rate, not in a spin
+  - Loading a recording resets the position to its start
+  - RoutingBridge.send_replay_frame only sends to active outputs and mutes
+    video output while replay is active
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from modules.artnet.object import ArtNetObject, ArtNetPoint
+from modules.artnet.output import ArtNetOutput
+from modules.artnet.routing_bridge import RoutingBridge
+from modules.artnet.routing_manager import ArtNetRoutingManager
+from modules.player.recording.dmx_file import DMXRecording
+from modules.player.recording.recorder import DMXRecorder
+from modules.player.recording.replay import ReplayCursor, ReplayManager
+
+
+def _write(path, count, step, chunk_seconds=0.05):
+    recorder = DMXRecorder(chunk_seconds=chunk_seconds)
+    recorder.start(path, {'name': 'take'})
+    for i in range(count):
+        recorder.record({'out-1': bytes([i * 2]) * 6}, timestamp=i * step)
+    recorder.stop()
+
+
+class _FakeBridge:
+
+    def __init__(self):
+        self.replay_active = False
+        self.sent = []
+
+    def send_replay_frame(self, frames):
+        self.sent.append((time.monotonic(), frames))
+        return frames
+
+
+class TestReplayCursor(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, 'take.fxrec')
+        _write(path, 50, 0.01)
+        self.rec = DMXRecording(path)
+        self.addCleanup(self.rec.close)
+        self.assertGreater(len(self.rec.chunks), 5)
+
+    def _value(self, frame):
+        return frame[1]['out-1'][0] // 2
+
+    def test_seek(self):
+        cursor = ReplayCursor(self.rec)
+        self.assertEqual(self._value(cursor.seek(0.255)), 25)
+        self.assertEqual(cursor.frame_number, 25)
+        self.assertIsNone(cursor.seek(-1.0))
+        self.assertEqual(self._value(cursor.seek(99.0)), 49)
+        self.assertIsNone(cursor.next_timestamp())
+
+    def test_advance_skips_missed_frames(self):
+        cursor = ReplayCursor(self.rec)
+        frame, skipped = cursor.advance(0.0)
+        self.assertEqual((self._value(frame), skipped), (0, 0))
+        self.assertEqual(cursor.advance(0.005), (None, 0))
+        frame, skipped = cursor.advance(0.01)
+        self.assertEqual((self._value(frame), skipped), (1, 0))
+        # Late wake-up across several chunks
+        frame, skipped = cursor.advance(0.3351)
+        self.assertEqual((self._value(frame), skipped), (33, 31))
+        self.assertAlmostEqual(cursor.next_timestamp(), 0.34)
+
+
+class TestReplayManager(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        _write(os.path.join(tmp.name, 'take.fxrec'), 20, 0.01)
+        self.bridge = _FakeBridge()
+        self.replay = ReplayManager(self.bridge, records_dir=tmp.name)
+        self.addCleanup(self.replay.cleanup)
+
+    def _play_to_end(self):
+        self.assertTrue(self.replay.start())
+        self.assertTrue(self.bridge.replay_active)
+        deadline = time.time() + 3
+        while self.replay.is_playing and time.time() < deadline:
+            time.sleep(0.005)
+        self.assertFalse(self.replay.is_playing)
+        self.assertFalse(self.bridge.replay_active)
+
+    def test_list_and_play(self):
+        listing = self.replay.list_recordings()
+        self.assertEqual([(r['filename'], r['frame_count']) for r in listing], [('take.fxrec', 20)])
+        self.assertTrue(self.replay.load_recording('take.fxrec'))
+        self.replay.set_loop(False)
+        self.replay.set_speed(2.0)
+        self.replay.set_brightness(50)
+
+        t0 = time.monotonic()
+        self._play_to_end()
+        values = [frames['out-1'][0] for _, frames in self.bridge.sent]
+        self.assertEqual(values, sorted(values))
+        self.assertEqual(values[-1], 38 // 2)            # last frame at 50 %
+        self.assertEqual(len(values) + self.replay.frames_skipped, 20)
+        self.assertLess(self.bridge.sent[-1][0] - t0, 0.19 / 2 + 0.1)
+        self.assertAlmostEqual(self.replay.get_position(), self.replay.duration)
+
+    def test_seek_while_stopped(self):
+        self.replay.load_recording('take.fxrec')
+        self.replay.seek(0.125)
+        self.assertEqual(self.bridge.sent[-1][1]['out-1'], bytes([24]) * 6)
+        self.assertAlmostEqual(self.replay.get_status()['position'], 0.125)
+
+    def test_load_resets_position(self):
+        _write(os.path.join(self.replay.records_dir, 'other.fxrec'), 20, 0.01)
+        self.replay.load_recording('take.fxrec')
+        self.replay.seek(0.125)
+        self.replay._seek_to = 0.125    # as if a seek were still pending for the loop
+        self.assertTrue(self.replay.load_recording('other.fxrec'))
+        self.assertEqual(self.replay.get_position(), 0.0)
+        self.assertIsNone(self.replay._seek_to)
+
+    def test_single_frame_loop_does_not_spin(self):
+        _write(os.path.join(self.replay.records_dir, 'still.fxrec'), 1, 0.01)
+        replay = ReplayManager(self.bridge, config={'artnet': {'fps': 50}},
+                               records_dir=self.replay.records_dir)
+        self.addCleanup(replay.cleanup)
+        self.assertTrue(replay.load_recording('still.fxrec'))
+        self.assertEqual(replay.duration, 0.0)
+
+        self.assertTrue(replay.start())
+        time.sleep(0.2)
+        replay.stop()
+        self.assertGreaterEqual(len(self.bridge.sent), 5)
+        self.assertLessEqual(len(self.bridge.sent), 0.2 * 50 + 2)   # one frame per 20 ms
+
+
+class TestRoutingBridgeReplay(unittest.TestCase):
+
+    def test_send_replay_frame(self):
+        rm = ArtNetRoutingManager(session_state_manager=None)
+        rm.create_object(ArtNetObject(id='o', name='o', source_shape_id='s', type='line',
+                                      points=[ArtNetPoint(i, float(i), 1.0) for i in range(2)]))
+        for out_id, active in (('out-1', True), ('out-2', False)):
+            rm.create_output(ArtNetOutput(id=out_id, name=out_id, target_ip='127.0.0.1',
+                                          subnet='255.255.255.0', start_universe=0, fps=0,
+                                          active=active, assigned_objects=['o']))
+        bridge = RoutingBridge(rm, canvas_width=4, canvas_height=4, threaded_send=False)
+        self.addCleanup(bridge.sender.socket.close)
+        sent = []
+        bridge.sender.send_frame = sent.append
+        bridge.enabled = True
+        bridge.initialize()
+
+        bridge.replay_active = True
+        bridge.process_frame(np.full((4, 4, 3), 9, dtype=np.uint8))
+        self.assertEqual(sent, [])
+
+        frames = bridge.send_replay_frame({'out-1': b'\x01' * 6, 'out-2': b'\x02' * 6, 'x': b'\x03'})
+        self.assertEqual(frames, {'out-1': b'\x01' * 6})
+        self.assertEqual(sent, [{'out-1': b'\x01' * 6}])
+        self.assertEqual(bridge.get_last_frames()['out-1'], b'\x01' * 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
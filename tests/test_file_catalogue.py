@@ -0,0 +1,117 @@
+"""
+Tests for FileCatalogue (cached recording and project listings).
+
+Verifies:
+  - Files are read once; later listings only stat them until mtime/size change
+  - Deleted files drop out, unreadable files are skipped
+  - The cache file survives a new catalogue instance (no re-reads)
+  - ReplayManager.list_recordings and the project list read header/summary data
+"""
+
+import json
+import logging
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from modules.api.content.projects import _read_project_summary
+from modules.core.catalogue import FileCatalogue
+from modules.player.recording.recorder import DMXRecorder
+from modules.player.recording.replay import ReplayManager
+
+
+def _read_json(path):
+    with open(path, encoding='utf-8') as f:
+        return {'title': json.load(f)['title']}
+
+
+class TestFileCatalogue(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+
+    def _write(self, name, title, mtime=None):
+        path = os.path.join(self.dir, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'title': title, 'payload': [0] * 100}, f)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+
+    def _titles(self, catalogue):
+        return sorted(entry['title'] for entry in catalogue.list())
+
+    def test_reads_only_changed_files(self):
+        self._write('a.json', 'A', 1000)
+        self._write('b.json', 'B', 1000)
+        self._write('notes.txt', 'ignored')
+        catalogue = FileCatalogue(self.dir, '.json', _read_json)
+        self.assertEqual(self._titles(catalogue), ['A', 'B'])
+        self.assertEqual(catalogue.reads, 2)
+
+        self.assertEqual(self._titles(catalogue), ['A', 'B'])
+        self.assertEqual(catalogue.reads, 2)
+
+        self._write('b.json', 'B2', 2000)
+        os.remove(os.path.join(self.dir, 'a.json'))
+        entries = catalogue.list()
+        self.assertEqual([(e['filename'], e['title']) for e in entries], [('b.json', 'B2')])
+        self.assertEqual(entries[0]['modified'], 2000)
+        self.assertEqual(catalogue.reads, 3)
+
+    def test_unreadable_files_are_skipped(self):
+        self._write('a.json', 'A')
+        with open(os.path.join(self.dir, 'broken.json'), 'w') as f:
+            f.write('{')
+        catalogue = FileCatalogue(self.dir, '.json', _read_json)
+        logging.disable(logging.WARNING)
+        try:
+            self.assertEqual(self._titles(catalogue), ['A'])
+            self.assertEqual(self._titles(catalogue), ['A'])
+        finally:
+            logging.disable(logging.NOTSET)
+        self.assertEqual(catalogue.reads, 2)
+
+    def test_cache_file_persists(self):
+        self._write('a.json', 'A')
+        FileCatalogue(self.dir, '.json', _read_json).list()
+        fresh = FileCatalogue(self.dir, '.json', _read_json)
+        self.assertEqual(self._titles(fresh), ['A'])
+        self.assertEqual(fresh.reads, 0)
+
+        fresh.put('a.json', {'title': 'known'})
+        self.assertEqual(self._titles(FileCatalogue(self.dir, '.json', _read_json)), ['known'])
+
+
+class TestCatalogueListings(unittest.TestCase):
+
+    def test_list_recordings(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            recorder = DMXRecorder()
+            recorder.start(os.path.join(tmp, 'show.fxrec'), {'name': 'Show'})
+            for i in range(3):
+                recorder.record({'out-1': bytes(3)}, timestamp=i * 0.5)
+            recorder.stop()
+
+            replay = ReplayManager(records_dir=tmp)
+            listing = replay.list_recordings()
+            self.assertEqual([(r['filename'], r['name'], r['frame_count'], r['duration']) for r in listing],
+                             [('show.fxrec', 'Show', 3, 1.0)])
+            replay.list_recordings()
+            self.assertEqual(replay.catalogue.reads, 1)
+
+    def test_project_summary(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'Show_20250101_120000.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'savedAt': '2025-01-01T12:00:00', 'shapes': [{}, {}]}, f)
+            entries = FileCatalogue(tmp, '.json', _read_project_summary).list()
+        self.assertEqual(entries[0]['projectName'], 'Show_20250101_120000')
+        self.assertEqual((entries[0]['savedAt'], entries[0]['shapeCount']), ('2025-01-01T12:00:00', 2))
+
+if __name__ == '__main__':
+    unittest.main()
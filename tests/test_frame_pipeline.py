@@ -0,0 +1,159 @@
+"""
+Tests for the pipelined play loop (src/modules/player/pipeline.py).
+
+Pure-Python tests, no GPU or video source required.  They verify:
+  - FrameHandoff is a bounded single-slot mailbox (put blocks while full)
+  - FramePipeline runs every stage for every frame, in order
+  - Stages are split across `depth` worker threads
+  - Throughput approaches the slowest stage instead of the sum
+  - Wait / latency timings are reported to the profiler
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from modules.player.pipeline import FrameHandoff, FramePipeline
+from modules.performance.profiler import PerformanceProfiler
+
+
+class TestFrameHandoff(unittest.TestCase):
+
+    def test_put_get_roundtrip(self):
+        slot = FrameHandoff()
+        self.assertTrue(slot.put('a'))
+        self.assertEqual(slot.get(timeout=0.1), 'a')
+
+    def test_put_blocks_while_full(self):
+        slot = FrameHandoff()
+        slot.put(1)
+        self.assertFalse(slot.put(2, timeout=0.05))
+        self.assertEqual(slot.get(timeout=0.1), 1)
+        self.assertTrue(slot.put(2, timeout=0.05))
+
+    def test_get_times_out_when_empty(self):
+        self.assertIsNone(FrameHandoff().get(timeout=0.01))
+
+    def test_close_wakes_blocked_put(self):
+        slot = FrameHandoff()
+        slot.put(1)
+        result = {}
+        t = threading.Thread(target=lambda: result.setdefault('ok', slot.put(2)))
+        t.start()
+        time.sleep(0.02)
+        slot.close()
+        t.join(timeout=1.0)
+        self.assertFalse(result['ok'])
+
+
+class TestFramePipeline(unittest.TestCase):
+
+    def _run(self, depth, n=20, delay=0.0):
+        seen = {'a': [], 'b': []}
+        threads = {'a': set(), 'b': set()}
+
+        def stage(name):
+            def fn(frame):
+                if delay:
+                    time.sleep(delay)
+                seen[name].append(frame)
+                threads[name].add(threading.current_thread().name)
+            return fn
+
+        pipeline = FramePipeline([('a', stage('a')), ('b', stage('b'))], depth=depth)
+        pipeline.start()
+        for i in range(n):
+            self.assertTrue(pipeline.submit(i))
+        self.assertTrue(pipeline.flush(timeout=5.0))
+        pipeline.stop()
+        return seen, threads, pipeline
+
+    def test_all_frames_pass_all_stages_in_order(self):
+        seen, _, pipeline = self._run(depth=1)
+        self.assertEqual(seen['a'], list(range(20)))
+        self.assertEqual(seen['b'], list(range(20)))
+        self.assertEqual(pipeline.frames_completed, 20)
+
+    def test_depth_one_shares_worker(self):
+        _, threads, pipeline = self._run(depth=1)
+        self.assertEqual(pipeline.depth, 1)
+        self.assertEqual(threads['a'], threads['b'])
+
+    def test_depth_two_uses_separate_workers(self):
+        seen, threads, pipeline = self._run(depth=2)
+        self.assertEqual(pipeline.depth, 2)
+        self.assertNotEqual(threads['a'], threads['b'])
+        self.assertEqual(seen['b'], list(range(20)))
+
+    def test_depth_is_clamped_to_stage_count(self):
+        pipeline = FramePipeline([('a', lambda f: None)], depth=8)
+        self.assertEqual(pipeline.depth, 1)
+
+    def test_empty_stage_list_rejected(self):
+        with self.assertRaises(ValueError):
+            FramePipeline([])
+
+    def test_stage_exception_does_not_stop_pipeline(self):
+        out = []
+
+        def boom(frame):
+            raise RuntimeError('boom')
+
+        pipeline = FramePipeline([('boom', boom), ('ok', out.append)])
+        pipeline.start()
+        for i in range(3):
+            pipeline.submit(i)
+        pipeline.flush(timeout=2.0)
+        pipeline.stop()
+        self.assertEqual(out, [0, 1, 2])
+
+    def test_throughput_approaches_slowest_stage(self):
+        """Producer stage 10 ms, two post stages 10 ms each: ~10 ms/frame at depth 2."""
+        n = 20
+        stage_s = 0.01
+        pipeline = FramePipeline(
+            [('a', lambda f: time.sleep(stage_s)), ('b', lambda f: time.sleep(stage_s))],
+            depth=2,
+        )
+        pipeline.start()
+        start = time.perf_counter()
+        for i in range(n):
+            time.sleep(stage_s)  # render stage
+            pipeline.submit(i)
+        pipeline.flush(timeout=5.0)
+        elapsed = time.perf_counter() - start
+        pipeline.stop()
+        sequential = n * 3 * stage_s
+        self.assertLess(elapsed, sequential * 0.75)
+
+    def test_latency_reported_to_profiler(self):
+        profiler = PerformanceProfiler(player_name='pipeline-test')
+        pipeline = FramePipeline(
+            [('a', lambda f: None), ('b', lambda f: None)], depth=2, profiler=profiler)
+        pipeline.start()
+        for i in range(5):
+            pipeline.submit(i)
+        pipeline.flush(timeout=2.0)
+        pipeline.stop()
+
+        stages = {s['name']: s for s in profiler.get_metrics()['stages']}
+        self.assertEqual(stages['pipeline_latency']['samples'], 5)
+        self.assertIn('pipeline_wait_a', stages)
+        self.assertIn('pipeline_wait_b', stages)
+        stats = pipeline.get_stats()
+        self.assertEqual(stats['frames_completed'], 5)
+        self.assertEqual([w['stages'] for w in stats['workers']], ['a', 'b'])
+
+    def test_submit_after_stop_is_rejected(self):
+        pipeline = FramePipeline([('a', lambda f: None)])
+        pipeline.start()
+        pipeline.stop()
+        self.assertFalse(pipeline.submit(0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,217 @@
+"""
+Tests for per-input-layer Art-Net sampling (ArtNetObject.input_layer).
+
+Verifies:
+  - Output plans sample each input layer group from its own frame and match
+    the per-object reference path
+  - Layers without a frame this tick render black (channel layout unchanged)
+  - Outputs that only sample isolated layers need no composite frame
+  - RoutingBridge keeps one LayerProcessed tap per sampled layer only, and
+    drops taps when no object samples the layer any more
+  - GPU sampling runs once per layer group on that layer's texture; without
+    compute support each sampled layer is downloaded once per tick
+  - Area-sampled objects bypass the GPU point sampler and are averaged on the
+    CPU (their layer is downloaded, the composite requested via needs_cpu_frame)
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from modules.artnet import routing_bridge as routing_bridge_module
+from modules.artnet.object import ArtNetObject, ArtNetPoint
+from modules.artnet.output import ArtNetOutput
+from modules.artnet.output_manager import OutputManager
+from modules.artnet.routing_bridge import RoutingBridge
+from modules.artnet.routing_manager import ArtNetRoutingManager
+from modules.player.taps import TapStage
+
+CANVAS = (100, 50)
+
+
+def _objects(rng, layers, per_object=6):
+    objects = {}
+    for i, layer in enumerate(layers):
+        pts = [ArtNetPoint(j, float(rng.uniform(0, CANVAS[0])), float(rng.uniform(0, CANVAS[1])))
+               for j in range(per_object)]
+        objects[f'o{i}'] = ArtNetObject(id=f'o{i}', name=f'o{i}', source_shape_id=f's{i}', type='line',
+                                        points=pts, input_layer=layer,
+                                        led_type=['RGB', 'RGBW'][i % 2],
+                                        sample_size=[0, 4][i % 2 if i > 2 else 0], red=i * 5)
+    return objects
+
+
+def _output(objects, active=True):
+    return ArtNetOutput(id='out-1', name='o', target_ip='127.0.0.1', subnet='255.255.255.0',
+                        start_universe=0, fps=0, assigned_objects=list(objects), active=active)
+
+
+class TestLayerInputPlan(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(4)
+        self.frame = self.rng.integers(0, 256, (40, 80, 3), dtype=np.uint8)
+        self.layer_frames = {
+            'layer1': self.rng.integers(0, 256, (40, 80, 3), dtype=np.uint8),
+            'layer2': self.rng.integers(0, 256, (20, 40, 3), dtype=np.uint8)[:, :, ::-1],
+        }
+        self.manager = OutputManager(*CANVAS)
+
+    def _render(self, objects, frame, layer_frames):
+        output = _output(objects)
+        fast = bytes(self.manager._render_output(frame, output, objects, None, 1, layer_frames))
+        ref = self.manager._render_output_objects(frame, output, objects, None, layer_frames)
+        self.assertEqual(fast, ref)
+        return fast
+
+    def test_mixed_layers_match_reference(self):
+        objects = _objects(self.rng, ['player', 'layer1', 'layer2', 'layer1', 'player', 'layer2'])
+        dmx = self._render(objects, self.frame, self.layer_frames)
+        plan = self.manager.get_plan(_output(objects), objects, 1)
+        self.assertEqual(plan.input_layers, ['player', 'layer1', 'layer2'])
+        # The layer1 object really reads the layer1 frame
+        sampled = plan.sample(self.frame, None, self.manager.sampler, self.layer_frames)
+        obj = objects['o1']
+        np.testing.assert_array_equal(sampled[6:12],
+                                      self.manager.sampler.sample_object(obj, self.layer_frames['layer1']))
+        self.assertGreater(len(dmx), 0)
+
+    def test_missing_layer_is_black(self):
+        objects = _objects(self.rng, ['player', 'layer3'])
+        objects['o1'].red = 0
+        dmx = self._render(objects, self.frame, {'layer1': self.layer_frames['layer1']})
+        self.assertEqual(len(dmx), 6 * 3 + 6 * 4)
+        self.assertEqual(dmx[18:], bytes(24))
+
+    def test_layer_only_output_needs_no_composite(self):
+        objects = _objects(self.rng, ['layer1', 'layer2'])
+        self.assertGreater(len(self._render(objects, None, self.layer_frames)), 0)
+
+
+class _FakeLayerManager:
+    def __init__(self):
+        self.taps = {}
+        self.frames = {}
+        self.tap_registry = self
+
+    def register_tap(self, config):
+        self.taps[config.tap_id] = config
+
+    def unregister_tap(self, tap_id):
+        self.taps.pop(tap_id, None)
+
+    def get(self, tap_id):
+        return self.frames.get(tap_id)
+
+
+class _FakeTexture:
+    def __init__(self, value, shape=(50, 100, 3)):
+        self.value = value
+        self.downloads = 0
+        self.shape = shape
+
+    def download(self):
+        self.downloads += 1
+        return np.full(self.shape, self.value, dtype=np.uint8)
+
+
+class _FakeGPUSampler:
+    instances = []
+
+    def __init__(self, ctx=None):
+        self.samples = 0
+        _FakeGPUSampler.instances.append(self)
+
+    def build_positions(self, objects, canvas_w, canvas_h):
+        self.objects = dict(objects)
+
+    def sample(self, texture):
+        self.samples += 1
+        self.value = texture.value
+
+    def get_pixel_buffer(self):
+        return {oid: np.full((len(o.points), 3), self.value, np.uint8) for oid, o in self.objects.items()}
+
+    def release(self):
+        pass
+
+
+class TestRoutingBridgeLayers(unittest.TestCase):
+
+    def setUp(self):
+        self.rm = ArtNetRoutingManager(session_state_manager=None)
+        objects = _objects(np.random.default_rng(1), ['player', 'layer1', 'layer2'])
+        for obj in objects.values():
+            self.rm.create_object(obj)
+        # layer2's object is not assigned to any output
+        self.rm.create_output(_output({k: v for k, v in objects.items() if k != 'o2'}))
+        self.bridge = RoutingBridge(self.rm, *CANVAS, threaded_send=False)
+        self.bridge.enabled = True
+        self.layers = _FakeLayerManager()
+        self.bridge.set_layer_manager(self.layers)
+
+    def test_taps_only_for_sampled_layers(self):
+        self.bridge._sampling_groups(self.rm.get_all_objects())
+        self.assertEqual(set(self.layers.taps), {'artnet:layer1'})
+        config = self.layers.taps['artnet:layer1']
+        self.assertEqual((config.stage, config.layer_selector), (TapStage.LAYER_PROCESSED, 1))
+
+        self.rm.update_object('o1', {'inputLayer': 'player'})
+        self.rm.assign_object_to_output('o2', 'out-1')
+        self.bridge._sampling_groups(self.rm.get_all_objects())
+        self.assertEqual(set(self.layers.taps), {'artnet:layer2'})
+
+        self.bridge.set_layer_manager(None)
+        self.assertEqual(self.layers.taps, {})
+
+    def test_gpu_sampling_per_layer_texture(self):
+        _FakeGPUSampler.instances = []
+        self.layers.frames['artnet:layer1'] = _FakeTexture(40)
+        with mock.patch.object(routing_bridge_module, '_get_gpu_sampler_class', return_value=_FakeGPUSampler), \
+                mock.patch('modules.gpu.get_context', return_value=None):
+            self.bridge.on_gpu_composite(_FakeTexture(200))
+        buffer = self.bridge._gpu_pixel_buffer
+        self.assertEqual(sorted(buffer), ['o0', 'o1'])
+        self.assertEqual((buffer['o0'][0, 0], buffer['o1'][0, 0]), (200, 40))
+        self.assertEqual(len(_FakeGPUSampler.instances), 2)
+
+    def test_area_objects_skip_gpu_sampler(self):
+        _FakeGPUSampler.instances = []
+        layer1 = _FakeTexture(40)
+        self.layers.frames['artnet:layer1'] = layer1
+        self.rm.update_object('o1', {'sampleSize': 4})
+        self.assertFalse(self.bridge.needs_cpu_frame)
+        with mock.patch.object(routing_bridge_module, '_get_gpu_sampler_class', return_value=_FakeGPUSampler), \
+                mock.patch('modules.gpu.get_context', return_value=None):
+            self.bridge.on_gpu_composite(_FakeTexture(200))
+        # o1 is averaged on the CPU from its downloaded layer frame
+        self.assertEqual(list(self.bridge._gpu_pixel_buffer), ['o0'])
+        self.assertEqual(list(self.bridge._layer_frames), ['layer1'])
+        self.assertEqual(layer1.downloads, 1)
+        self.assertFalse(self.bridge.needs_cpu_frame)
+
+        # An area-sampled composite object needs the CPU composite
+        self.rm.update_object('o0', {'sampleSize': 4})
+        with mock.patch.object(routing_bridge_module, '_get_gpu_sampler_class', return_value=_FakeGPUSampler), \
+                mock.patch('modules.gpu.get_context', return_value=None):
+            self.bridge.on_gpu_composite(_FakeTexture(200))
+        self.assertEqual(self.bridge._gpu_pixel_buffer, {})
+        self.assertEqual(self.bridge._gpu_samplers, {})
+        self.assertTrue(self.bridge.needs_cpu_frame)
+
+    def test_cpu_fallback_downloads_sampled_layers_once(self):
+        layer1, unused = _FakeTexture(40), _FakeTexture(90)
+        self.layers.frames.update({'artnet:layer1': layer1, 'artnet:layer5': unused})
+        with mock.patch.object(routing_bridge_module, '_get_gpu_sampler_class', return_value=None):
+            self.bridge.on_gpu_composite(_FakeTexture(200))
+        self.assertEqual((layer1.downloads, unused.downloads), (1, 0))
+        self.assertEqual(list(self.bridge._layer_frames), ['layer1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Tests for Gray-code LED mapping (src/modules/api/mapper/gray_code.py).
+
+Verifies:
+  - Every LED gets a distinct code; each bit frame has an inverse frame
+  - Pattern frames become DMX data in the mapper's universe layout
+  - Synthetic camera captures decode to the LEDs' positions, independent
+    of LED brightness and ambient light; unlit LEDs are reported missing
+"""
+
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from modules.api.mapper import gray_code
+
+
+def _capture(frames, positions, brightness, ambient, rng, size=(120, 160)):
+    """Render every pattern frame as a camera image: 3x3 LED blobs plus noise."""
+    captures = []
+    for lit in frames:
+        image = np.full(size, ambient, dtype=np.float32)
+        for (x, y), level, on in zip(positions, brightness, lit):
+            if on:
+                image[y - 1:y + 2, x - 1:x + 2] += level
+        image += rng.normal(0, 3, size)
+        captures.append(np.clip(image, 0, 255).astype(np.uint8))
+    return captures
+
+
+class TestPatterns(unittest.TestCase):
+
+    def test_codes_are_unique(self):
+        frames = gray_code.pattern_frames(1000)
+        self.assertEqual(len(frames), gray_code.frame_count(1000))
+        self.assertEqual(len(frames), 22)                 # 10 bits
+        self.assertTrue(frames[0].all() and not frames[1].any())
+        bits = frames[2::2]
+        np.testing.assert_array_equal(frames[3::2], ~bits)
+        self.assertEqual(len({tuple(col) for col in bits.T}), 1000)
+
+    def test_gray_roundtrip(self):
+        values = np.arange(70000, dtype=np.int64)
+        codes = gray_code.gray_encode(values)
+        steps = codes[1:] ^ codes[:-1]
+        self.assertTrue(((steps & (steps - 1)) == 0).all())   # neighbours differ in one bit
+        np.testing.assert_array_equal(gray_code.gray_decode(codes, 17), values)
+
+    def test_ten_thousand_leds_in_thirty_frames(self):
+        self.assertEqual(gray_code.frame_count(10000), 30)
+
+    def test_dmx_universes(self):
+        lit = np.array([True, False, True])
+        universes = np.array([0, 0, 1])
+        offsets = np.array([0, 3, 510])
+        data = gray_code.dmx_universes(lit, universes, offsets, 3)
+        self.assertEqual(set(data), {0, 1})
+        self.assertEqual(data[0][:6], bytes([255, 255, 255, 0, 0, 0]))
+        self.assertEqual(data[1][510:], bytes([255, 255]))   # clipped at the universe end
+
+
+class TestDecode(unittest.TestCase):
+
+    def test_synthetic_captures(self):
+        rng = np.random.default_rng(7)
+        count = 200
+        grid = [(8 + 8 * (i % 18), 8 + 10 * (i // 18)) for i in range(count)]
+        brightness = rng.uniform(60, 180, count)
+        brightness[13] = 0                                  # dead LED
+        frames = gray_code.pattern_frames(count)
+        captures = _capture(frames, grid, brightness, ambient=40, rng=rng)
+
+        found = gray_code.decode_captures(captures, count)
+
+        self.assertNotIn(13, found)
+        self.assertEqual(len(found), count - 1)
+        for index, (x, y, pixels) in found.items():
+            self.assertAlmostEqual(x, grid[index][0], delta=0.5)
+            self.assertAlmostEqual(y, grid[index][1], delta=0.5)
+            self.assertEqual(pixels, 9)
+
+    def test_colour_captures(self):
+        rng = np.random.default_rng(1)
+        frames = gray_code.pattern_frames(5)
+        captures = _capture(frames, [(20, 20), (40, 20), (60, 20), (80, 20), (100, 20)],
+                            [150] * 5, ambient=10, rng=rng)
+        captures = [np.dstack([c] * 3) for c in captures]
+        self.assertEqual(sorted(gray_code.decode_captures(captures, 5)), [0, 1, 2, 3, 4])
+
+    def test_wrong_capture_count(self):
+        with self.assertRaises(ValueError):
+            gray_code.decode_captures([np.zeros((4, 4))] * 3, 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
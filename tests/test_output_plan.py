@@ -0,0 +1,173 @@
+"""
+Tests for precompiled output plans (src/modules/artnet/output_plan.py).
+
+Verifies:
+  - Plan rendering is byte-identical to the per-object reference path for
+    mixed LED types, channel orders and colour corrections
+  - GPU pre-sampled rows are used when they cover the whole output
+  - Mixed GPU/CPU sources fall back to the per-object path
+  - Plans are reused while the routing version is unchanged
+  - render_frame copies each output into two alternating preallocated
+    buffers instead of allocating bytes per frame
+  - Colour-correction lookup tables reproduce ColorCorrector.apply exactly
+"""
+
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from modules.artnet.color_correction import ColorCorrector
+from modules.artnet.object import ArtNetObject, ArtNetPoint
+from modules.artnet.output import ArtNetOutput
+from modules.artnet.output_manager import OutputManager
+from modules.artnet.routing_manager import ArtNetRoutingManager
+
+LED_TYPES = [('RGB', 'GRB'), ('RGBW', 'WRGB'), ('RGBAW', 'RGBWA'), ('RGBWW', 'RGBWW'),
+             ('RGBCW', 'RGBCW'), ('RGBCWW', 'RGBWWC'), ('RGB', 'RGBW'), ('RGBW', 'BOGUS')]
+
+
+def _objects(rng, n=40, canvas=(200, 100)):
+    objects = {}
+    for i in range(n):
+        led_type, order = LED_TYPES[i % len(LED_TYPES)]
+        count = int(rng.integers(0 if i == 3 else 1, 30))
+        pts = [ArtNetPoint(j, float(rng.uniform(-5, canvas[0] + 5)), float(rng.uniform(-5, canvas[1] + 5)))
+               for j in range(count)]
+        corr = rng.integers(-80, 80, 5) if i % 3 else np.zeros(5, int)
+        objects[f'obj-{i}'] = ArtNetObject(
+            id=f'obj-{i}', name=f'o{i}', source_shape_id=f's{i}', type='line', points=pts,
+            led_type=led_type, channel_order=order,
+            white_mode=['luminance', 'average', 'minimum'][i % 3],
+            white_threshold=int(rng.integers(0, 255)),
+            white_behavior=['replace', 'additive', 'hybrid'][i % 3],
+            color_temp=int(rng.integers(2700, 6500)),
+            brightness=int(corr[0]), contrast=int(corr[1]),
+            red=int(corr[2]), green=int(corr[3]), blue=int(corr[4]),
+        )
+    return objects
+
+
+def _output(objects, **cc):
+    ids = list(objects)
+    return ArtNetOutput(id='out-1', name='o', target_ip='127.0.0.1', subnet='255.255.255.0',
+                        start_universe=0, fps=0, assigned_objects=ids[::-1][:-2], **cc)
+
+
+class TestOutputPlan(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(7)
+        self.objects = _objects(self.rng)
+        self.frame = self.rng.integers(0, 256, (90, 160, 3), dtype=np.uint8)
+        self.manager = OutputManager(200, 100)
+
+    def _check(self, output, frame, gpu=None):
+        fast = bytes(self.manager._render_output(frame, output, self.objects, gpu, routing_version=1))
+        ref = self.manager._render_output_objects(frame, output, self.objects, gpu)
+        self.assertGreater(len(ref), 0)
+        self.assertEqual(fast, ref)
+
+    def test_matches_reference_without_output_correction(self):
+        self._check(_output(self.objects), self.frame)
+
+    def test_matches_reference_with_output_correction(self):
+        self._check(_output(self.objects, brightness=-20, contrast=60, red=15, green=-30, blue=5), self.frame)
+
+    def test_matches_reference_on_rgb_view(self):
+        # RoutingBridge passes frame[:, :, ::-1] (BGR → RGB view)
+        self._check(_output(self.objects, contrast=-40), self.frame[:, :, ::-1])
+
+    def test_gpu_rows_cover_output(self):
+        output = _output(self.objects, red=20)
+        gpu = {oid: self.rng.integers(0, 256, (len(o.points), 3), dtype=np.uint8)
+               for oid, o in self.objects.items() if o.points}
+        self._check(output, None, gpu)
+
+    def test_mixed_sources_use_reference_path(self):
+        output = _output(self.objects)
+        oid = next(oid for oid in output.assigned_objects if self.objects[oid].points)
+        gpu = {oid: np.full((len(self.objects[oid].points), 3), 200, np.uint8)}
+        plan = self.manager.get_plan(output, self.objects, 1)
+        self.assertIsNone(plan.sample(self.frame, gpu))
+        self._check(output, self.frame, gpu)
+
+    def test_plan_reused_until_version_changes(self):
+        output = _output(self.objects)
+        self.manager._render_output(self.frame, output, self.objects, None, routing_version=5)
+        self.manager._render_output(self.frame, output, self.objects, None, routing_version=5)
+        self.assertEqual(self.manager.plan_compiles, 1)
+        self.manager._render_output(self.frame, output, self.objects, None, routing_version=6)
+        self.assertEqual(self.manager.plan_compiles, 2)
+
+    def test_signature_detects_changes_without_version(self):
+        output = _output(self.objects)
+        first = bytes(self.manager._render_output(self.frame, output, self.objects))
+        self.manager._render_output(self.frame, output, self.objects)
+        self.assertEqual(self.manager.plan_compiles, 1)
+        self.objects[output.assigned_objects[0]].brightness += 50
+        second = bytes(self.manager._render_output(self.frame, output, self.objects))
+        self.assertEqual(self.manager.plan_compiles, 2)
+        self.assertNotEqual(first, second)
+
+    def test_render_frame_end_to_end(self):
+        output = _output(self.objects)
+        result = self.manager.render_frame(self.frame, self.objects, {'out-1': output}, routing_version=1)
+        self.assertEqual(result['out-1'],
+                         self.manager._render_output_objects(self.frame, output, self.objects))
+
+    def test_render_frame_reuses_frame_buffers(self):
+        output = _output(self.objects)
+        outputs = {'out-1': output}
+        plan = self.manager.get_plan(output, self.objects, 1)
+        self.assertIs(self.manager._render_output(self.frame, output, self.objects, None, 1), plan.dmx)
+
+        first = self.manager.render_frame(self.frame, self.objects, outputs, routing_version=1)['out-1']
+        kept = bytes(first)
+        second = self.manager.render_frame(self.frame[::-1], self.objects, outputs, routing_version=1)['out-1']
+        self.assertIsNot(second, first)
+        self.assertEqual(bytes(first), kept)      # intact while the next frame renders
+        self.assertNotEqual(second, first)
+        third = self.manager.render_frame(self.frame, self.objects, outputs, routing_version=1)['out-1']
+        self.assertIs(third, first)
+        self.assertIs(self.manager.get_last_frame('out-1'), third)
+
+    def test_routing_manager_version(self):
+        rm = ArtNetRoutingManager(session_state_manager=None)
+        v = rm.version
+        obj = next(iter(self.objects.values()))
+        rm.create_object(obj)
+        rm.create_output(_output({obj.id: obj}))
+        rm.assign_object_to_output(obj.id, 'out-1')
+        rm.update_object(obj.id, {'brightness': 10})
+        rm.update_output('out-1', {'red': 5})
+        self.assertEqual(rm.version, v + 5)
+        rm.assign_object_to_output(obj.id, 'out-1')   # already assigned: no change
+        self.assertEqual(rm.version, v + 5)
+
+
+class TestCorrectionLUT(unittest.TestCase):
+
+    def test_lut_matches_apply(self):
+        rng = np.random.default_rng(3)
+        pixels = rng.integers(0, 256, (500, 6), dtype=np.uint8)
+        for params in [(0, 0, 0, 0, 0), (-30, 90, 10, -200, 40), (255, -255, 0, 0, 0), (7, 33, -7, 3, 1)]:
+            lut = ColorCorrector.build_lut(*params, channels=6)
+            looked_up = np.stack([lut[c][pixels[:, c]] for c in range(6)], axis=1)
+            np.testing.assert_array_equal(looked_up, ColorCorrector.apply(pixels, *params))
+
+    def test_tables_deduplicated(self):
+        rng = np.random.default_rng(5)
+        objects = _objects(rng, n=20)
+        for obj in objects.values():
+            obj.led_type, obj.channel_order = 'RGB', 'RGB'
+            obj.brightness, obj.contrast, obj.red, obj.green, obj.blue = 10, 20, 0, 0, 0
+        plan = OutputManager(200, 100).get_plan(_output(objects, red=4), objects, 1)
+        self.assertEqual(len(plan._luts), 3 * 256)   # one composed table per channel
+
+
+if __name__ == '__main__':
+    unittest.main()
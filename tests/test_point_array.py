@@ -0,0 +1,128 @@
+"""
+Tests for array-backed LED points (PointArray) and the vectorized PointGenerator.
+
+Verifies:
+  - Matrix wiring order for every zigzag pattern and raster
+  - Shapes place LEDs where the editor does (endpoints, even spacing, rotation)
+  - ArtNetObject stores any point list as PointArray and still iterates ArtNetPoint
+  - JSON and compact binary serialization round-trip
+  - Whole-array transforms
+  - Large mappings generate and serialize quickly
+"""
+
+import math
+import os
+import sys
+import time
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from modules.artnet.object import ArtNetObject, ArtNetPoint, PointArray
+from modules.artnet.point_generator import PointGenerator
+from modules.artnet.routing_manager import ArtNetRoutingManager
+
+
+def _object(points):
+    return ArtNetObject(id='o', name='o', source_shape_id='s', type='matrix', points=points)
+
+
+class TestPointGenerator(unittest.TestCase):
+
+    def test_matrix_patterns(self):
+        expected = {
+            'zigzag-left': [0, 1, 2, 5, 4, 3],
+            'zigzag-right': [2, 1, 0, 3, 4, 5],
+            'zigzag-top': [0, 3, 4, 1, 2, 5],
+            'zigzag-bottom': [3, 0, 1, 4, 5, 2],
+            'raster': [0, 1, 2, 3, 4, 5],
+        }
+        for pattern, order in expected.items():
+            self.assertEqual(PointGenerator.matrix_order(2, 3, pattern).tolist(), order, pattern)
+
+    def test_matrix_coordinates(self):
+        pts = PointGenerator.generate_points({'type': 'matrix', 'rows': 2, 'cols': 3, 'size': 100,
+                                              'x': 10, 'y': 20, 'pattern': 'zigzag-left'})
+        self.assertIsInstance(pts, PointArray)
+        np.testing.assert_allclose(pts.xy, [[-40, -30], [10, -30], [60, -30],
+                                            [60, 70], [10, 70], [-40, 70]])
+        self.assertEqual(pts.ids.tolist(), [1, 2, 3, 4, 5, 6])
+
+    def test_line_and_rotation(self):
+        pts = PointGenerator.generate_points({'type': 'line', 'pointCount': 5, 'size': 100,
+                                              'x': 0, 'y': 0, 'rotation': 90})
+        np.testing.assert_allclose(pts.xs, 0, atol=1e-9)
+        np.testing.assert_allclose(pts.ys, [-50, -25, 0, 25, 50])
+
+    def test_edges_evenly_spaced(self):
+        pts = PointGenerator.generate_points({'type': 'rect', 'pointCount': 8, 'size': 100})
+        np.testing.assert_allclose(pts.xy, [[-50, -50], [0, -50], [50, -50], [50, 0],
+                                            [50, 50], [0, 50], [-50, 50], [-50, 0]], atol=1e-9)
+        circle = PointGenerator.generate_points({'type': 'circle', 'pointCount': 36, 'size': 200})
+        np.testing.assert_allclose(np.hypot(circle.xs, circle.ys), 100, rtol=1e-3)
+        for shape in ('star', 'triangle', 'polygon', 'arc'):
+            self.assertEqual(len(PointGenerator.generate_points({'type': shape, 'pointCount': 17})), 17)
+
+    def test_degenerate_scale(self):
+        pts = PointGenerator.generate_points({'type': 'polygon', 'pointCount': 4, 'size': 100,
+                                              'scaleX': 0, 'scaleY': 0, 'x': 5, 'y': 6})
+        np.testing.assert_allclose(pts.xy, [[5, -44]] * 4)
+
+    def test_large_mapping_is_fast(self):
+        t0 = time.perf_counter()
+        pts = PointGenerator.generate_points({'type': 'matrix', 'rows': 400, 'cols': 250,
+                                              'pattern': 'zigzag-top', 'rotation': 12})
+        obj = _object(pts)
+        restored = ArtNetObject.from_dict(obj.to_dict())
+        binary = ArtNetObject.from_dict(obj.to_dict(binary_points=True))
+        self.assertLess(time.perf_counter() - t0, 2.0)
+        self.assertEqual(len(restored.points), 100000)
+        self.assertEqual(restored.points, pts)
+        np.testing.assert_allclose(binary.points.xs, pts.xs, atol=1e-4)
+
+
+class TestPointArray(unittest.TestCase):
+
+    def test_object_coerces_lists(self):
+        obj = _object([ArtNetPoint(1, 1.5, 2.5), ArtNetPoint(2, 3.0, 4.0)])
+        self.assertIsInstance(obj.points, PointArray)
+        self.assertEqual([(p.id, p.x, p.y) for p in obj.points], [(1, 1.5, 2.5), (2, 3.0, 4.0)])
+        self.assertEqual(obj.points[1], ArtNetPoint(2, 3.0, 4.0))
+        obj.points = [{'id': 7, 'x': 0.0, 'y': 1.0}]
+        self.assertEqual(obj.points.ids.tolist(), [7])
+        self.assertFalse(_object([]).points)
+
+    def test_update_object_points(self):
+        rm = ArtNetRoutingManager(session_state_manager=None)
+        rm.create_object(_object([]))
+        rm.update_object('o', {'points': [{'id': i + 1, 'x': float(i), 'y': 0.0} for i in range(600)]})
+        obj = rm.get_object('o')
+        self.assertEqual(len(obj.points), 600)
+        self.assertEqual(obj.universe_end - obj.universe_start, 3)
+
+    def test_binary_round_trip(self):
+        pts = PointArray([0.25, -3.5, 1e4], [7.0, 8.125, -2.0], [3, 1, 2])
+        data = pts.to_bytes()
+        self.assertEqual(len(data), 12 + 12 * 3)
+        self.assertEqual(PointArray.from_bytes(data), pts)
+        with self.assertRaises(ValueError):
+            PointArray.from_bytes(data[:-1])
+        with self.assertRaises(ValueError):
+            PointArray.from_bytes(b'XXXX' + data[4:])
+
+    def test_transformed(self):
+        pts = PointArray([1.0, 2.0], [0.0, 0.0])
+        out = pts.transformed(dx=10, rotation=90, scale_x=2, origin=(1.0, 0.0))
+        np.testing.assert_allclose(out.xy, [[11, 0], [11, 2]], atol=1e-12)
+        self.assertEqual(out.ids.tolist(), pts.ids.tolist())
+        self.assertEqual(pts.bounds(), (1.0, 0.0, 2.0, 0.0))
+
+    def test_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            PointArray([1.0], [1.0, 2.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,238 @@
+"""
+Tests for lightweight preview sessions (src/modules/player/preview.py) and
+clip buffer sharing in VideoSource.
+
+Verifies:
+  - The shared worker renders only while a session has subscribers
+  - Rendering follows the session's reduced frame rate
+  - Autoplay advances through the playlist, otherwise the clip loops
+  - Two VideoSources of the same .hap file share one loaded buffer, loaded
+    once even when they initialize concurrently
+  - A slow load does not block loading a different file
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from modules.player.preview import PreviewSession, get_preview_worker
+from modules.player.sources.video import VideoSource
+
+
+class _FakeSource:
+    """Minimal numpy frame source: N frames, then None."""
+
+    def __init__(self, n=1000, name='a'):
+        self.n = n
+        self.name = name
+        self.current_frame = 0
+        self.cleaned = False
+
+    def initialize(self):
+        return True
+
+    def get_next_frame(self):
+        if self.current_frame >= self.n:
+            return None, 0
+        self.current_frame += 1
+        return np.zeros((36, 64, 3), np.uint8), 0.04
+
+    def reset(self):
+        self.current_frame = 0
+
+    def cleanup(self):
+        self.cleaned = True
+
+
+class _Session(PreviewSession):
+    """Session with fake sources and a stand-in encoder."""
+
+    def __init__(self, **kw):
+        super().__init__('TestPreview', 64, 36, kw.pop('fps', 50))
+        self.frames_per_clip = kw.pop('frames_per_clip', 1000)
+
+    def _create_source(self, item, clip_id):
+        return _FakeSource(self.frames_per_clip, item)
+
+    def _encode(self, frame, source):
+        # JPEG encoding is covered by the downscaler tests (needs simplejpeg)
+        return b'\xff\xd8' + frame.tobytes()[:16]
+
+
+class TestPreviewSession(unittest.TestCase):
+
+    def tearDown(self):
+        for s in get_preview_worker().sessions:
+            s.stop()
+
+    def test_suspended_without_subscribers(self):
+        session = _Session()
+        session.playlist = ['a']
+        self.assertTrue(session.load_clip_by_index(0))
+        session.play()
+        time.sleep(0.15)
+        self.assertEqual(session.source.current_frame, 0)
+        self.assertIsNone(session.last_preview_jpeg)
+
+    def test_renders_while_subscribed_at_reduced_fps(self):
+        session = _Session(fps=20)
+        session.playlist = ['a']
+        session.load_clip_by_index(0)
+        session.play()
+        session.add_subscriber()
+        time.sleep(0.5)
+        session.remove_subscriber()
+        rendered = session.source.current_frame
+        self.assertGreaterEqual(rendered, 6)
+        self.assertLessEqual(rendered, 13)
+        time.sleep(0.15)
+        self.assertEqual(session.source.current_frame, rendered)   # suspended again
+
+    def test_jpeg_published(self):
+        session = _Session()
+        session.playlist = ['a']
+        session.load_clip_by_index(0)
+        session.render_frame()
+        self.assertTrue(session.last_preview_jpeg.startswith(b'\xff\xd8'))
+        self.assertEqual(session.frames_rendered, 1)
+
+    def test_autoplay_advances_playlist(self):
+        session = _Session(frames_per_clip=2)
+        session.playlist = ['a', 'b']
+        session.autoplay = True
+        session.load_clip_by_index(0)
+        for _ in range(3):
+            session.render_frame()
+        self.assertEqual(session.current_clip_index, 1)
+        self.assertEqual(session.source.name, 'b')
+
+    def test_without_autoplay_clip_loops(self):
+        session = _Session(frames_per_clip=2)
+        session.playlist = ['a', 'b']
+        session.load_clip_by_index(0)
+        for _ in range(5):
+            session.render_frame()
+        self.assertEqual(session.current_clip_index, 0)
+
+    def test_stop_releases_source(self):
+        session = _Session()
+        session.playlist = ['a']
+        session.load_clip_by_index(0)
+        source = session.source
+        session.play()
+        session.stop()
+        self.assertTrue(source.cleaned)
+        self.assertFalse(session.is_running)
+        self.assertNotIn(session, get_preview_worker().sessions)
+
+    def test_invalid_index(self):
+        session = _Session()
+        self.assertFalse(session.load_clip_by_index(3))
+
+
+class TestSharedClipBuffers(unittest.TestCase):
+
+    def _write_hap(self, directory, frames=4, frame_bytes=512, name='clip'):
+        path = os.path.join(directory, name + '.hap')
+        np.arange(frames * frame_bytes, dtype=np.uint32).astype(np.uint8).tofile(path)
+        with open(path[:-4] + '.json', 'w') as f:
+            json.dump({'fps': 25, 'frame_count': frames, 'width': 32, 'height': 32,
+                       'dxt_variant': 'bc1', 'frame_bytes': frame_bytes}, f)
+        return path
+
+    def test_sources_share_loaded_buffer(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = self._write_hap(d)
+            a = VideoSource(path, 64, 64)
+            b = VideoSource(path, 32, 32)
+            self.assertTrue(a.initialize())
+            self.assertTrue(b.initialize())
+            self.assertIs(a.buffer, b.buffer)
+            self.assertEqual(bytes(a.get_next_frame()[0]), bytes(b.get_next_frame()[0]))
+            a.cleanup()
+            b.cleanup()
+
+    def _gated_loads(self, gated_path):
+        """Patch the buffer load so loads of *gated_path* wait for the returned event."""
+        from unittest import mock
+        gate, started, calls = threading.Event(), threading.Event(), []
+        real = VideoSource._load_clip_buffers
+
+        def load(source):
+            calls.append(source.video_path)
+            if source.video_path == gated_path:
+                started.set()
+                gate.wait(5)
+            return real(source)
+
+        patcher = mock.patch.object(VideoSource, '_load_clip_buffers', load)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(gate.set)
+        return gate, started, calls
+
+    def test_slow_load_does_not_block_other_files(self):
+        with tempfile.TemporaryDirectory() as d:
+            slow_path = self._write_hap(d, name='slow')
+            fast_path = self._write_hap(d, name='fast')
+            gate, started, _ = self._gated_loads(slow_path)
+            slow = VideoSource(slow_path, 32, 32)
+            t = threading.Thread(target=slow.initialize)
+            t.start()
+            self.assertTrue(started.wait(2))
+
+            fast = VideoSource(fast_path, 32, 32)
+            done = threading.Thread(target=fast.initialize)
+            done.start()
+            done.join(2)
+            self.assertFalse(done.is_alive())     # finished while the slow load holds on
+            self.assertIsNotNone(fast.buffer)
+
+            gate.set()
+            t.join(2)
+            self.assertIsNotNone(slow.buffer)
+            slow.cleanup()
+            fast.cleanup()
+
+    def test_concurrent_sources_load_file_once(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = self._write_hap(d)
+            gate, started, calls = self._gated_loads(path)
+            sources = [VideoSource(path, 32, 32) for _ in range(3)]
+            threads = [threading.Thread(target=s.initialize) for s in sources]
+            threads[0].start()
+            self.assertTrue(started.wait(2))
+            for t in threads[1:]:
+                t.start()
+            time.sleep(0.05)
+            gate.set()
+            for t in threads:
+                t.join(2)
+            self.assertEqual(calls, [path])
+            self.assertTrue(all(s.buffer is sources[0].buffer for s in sources))
+            for s in sources:
+                s.cleanup()
+
+    def test_buffer_released_with_last_source(self):
+        import gc
+        from modules.player.sources import video as video_mod
+        with tempfile.TemporaryDirectory() as d:
+            path = self._write_hap(d)
+            a = VideoSource(path, 64, 64)
+            a.initialize()
+            self.assertEqual(len(video_mod._loaded_clips), 1)
+            a.cleanup()
+            gc.collect()
+            self.assertEqual(len(video_mod._loaded_clips), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
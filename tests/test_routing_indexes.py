@@ -0,0 +1,140 @@
+"""
+Tests for ArtNetRoutingManager assignment indexes and topology snapshots.
+
+Verifies:
+  - Forward/reverse assignment lookups stay in step with assign/remove,
+    object/output deletion, update_output(assignedObjects) and set_state
+  - sync_from_editor_shapes finds existing objects by shape id and removes
+    orphaned objects (and their assignments) incrementally
+  - topology() is reused while the routing version is unchanged and rebuilt
+    (with active outputs only) after every change
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from modules.artnet.object import ArtNetObject, ArtNetPoint
+from modules.artnet.output import ArtNetOutput
+from modules.artnet.routing_manager import ArtNetRoutingManager
+
+
+def _object(obj_id, shape_id=None):
+    return ArtNetObject(id=obj_id, name=obj_id, source_shape_id=shape_id or f's-{obj_id}', type='line',
+                        points=[ArtNetPoint(i, float(i), 0.0) for i in range(4)])
+
+
+def _output(out_id, assigned=(), active=True):
+    return ArtNetOutput(id=out_id, name=out_id, target_ip='127.0.0.1', subnet='255.255.255.0',
+                        start_universe=0, active=active, assigned_objects=list(assigned))
+
+
+def _shape(shape_id):
+    return {'id': shape_id, 'type': 'line', 'x': 10, 'y': 10, 'size': 20, 'pointCount': 5}
+
+
+class TestAssignmentIndexes(unittest.TestCase):
+
+    def setUp(self):
+        self.rm = ArtNetRoutingManager(session_state_manager=None)
+        for obj_id in ('a', 'b', 'c'):
+            self.rm.create_object(_object(obj_id))
+        self.rm.create_output(_output('out-1', ['a', 'b']))
+        self.rm.create_output(_output('out-2'))
+
+    def _output_ids(self, obj_id):
+        return [out.id for out in self.rm.get_outputs_for_object(obj_id)]
+
+    def test_assign_and_remove(self):
+        self.assertEqual(self._output_ids('a'), ['out-1'])
+        self.rm.assign_object_to_output('a', 'out-2')
+        self.rm.assign_object_to_output('a', 'out-2')   # no duplicate
+        self.assertEqual(self._output_ids('a'), ['out-1', 'out-2'])
+        self.assertEqual(self.rm.outputs['out-2'].assigned_objects, ['a'])
+
+        self.rm.remove_object_from_output('a', 'out-1')
+        self.assertEqual(self._output_ids('a'), ['out-2'])
+        self.assertEqual([o.id for o in self.rm.get_objects_for_output('out-1')], ['b'])
+
+    def test_delete_object_and_output(self):
+        self.rm.assign_object_to_output('b', 'out-2')
+        self.rm.delete_object('b')
+        self.assertEqual(self.rm.outputs['out-1'].assigned_objects, ['a'])
+        self.assertEqual(self.rm.outputs['out-2'].assigned_objects, [])
+        self.assertEqual(self._output_ids('b'), [])
+
+        self.rm.delete_output('out-1')
+        self.assertEqual(self._output_ids('a'), [])
+
+    def test_update_output_assignments(self):
+        self.rm.update_output('out-1', {'assignedObjects': ['c']})
+        self.assertEqual(self._output_ids('a'), [])
+        self.assertEqual(self._output_ids('c'), ['out-1'])
+
+    def test_set_state_rebuilds(self):
+        state = self.rm.get_state()
+        restored = ArtNetRoutingManager(session_state_manager=None)
+        restored.set_state(state)
+        self.assertEqual([o.id for o in restored.get_outputs_for_object('b')], ['out-1'])
+        self.assertEqual(restored.get_state_with_assignments()['objects']['b']['outputIds'], ['out-1'])
+        self.assertIs(restored._find_object_by_shape_id('s-c'), restored.objects['c'])
+
+
+class TestEditorSync(unittest.TestCase):
+
+    def setUp(self):
+        self.session = mock.Mock()
+        self.session._state = {'editor': {'shapes': [_shape('s1'), _shape('s2')]}}
+        self.rm = ArtNetRoutingManager(self.session)
+
+    def test_sync_is_incremental(self):
+        created = self.rm.sync_from_editor_shapes()['created']
+        self.assertEqual(len(created), 2)
+        by_shape = {obj.source_shape_id: obj.id for obj in created}
+        self.rm.create_output(_output('out-1', [by_shape['s1'], by_shape['s2']]))
+
+        version = self.rm.version
+        result = self.rm.sync_from_editor_shapes()
+        self.assertEqual(result['created'], [])
+        self.assertEqual(self.rm.version, version)   # nothing changed
+
+        self.session._state['editor']['shapes'] = [_shape('s2'), _shape('s3')]
+        result = self.rm.sync_from_editor_shapes(remove_orphaned=True)
+        self.assertEqual(result['removed'], [by_shape['s1']])
+        self.assertEqual(len(result['created']), 1)
+        self.assertEqual(self.rm.outputs['out-1'].assigned_objects, [by_shape['s2']])
+        self.assertIsNone(self.rm._find_object_by_shape_id('s1'))
+        self.assertIs(self.rm._find_object_by_shape_id('s3'), result['created'][0])
+
+
+class TestTopology(unittest.TestCase):
+
+    def test_cached_per_version(self):
+        rm = ArtNetRoutingManager(session_state_manager=None)
+        rm.create_object(_object('a'))
+        rm.create_output(_output('out-1', ['a']))
+        rm.create_output(_output('out-2', active=False))
+
+        topo = rm.topology()
+        self.assertIs(rm.topology(), topo)
+        self.assertEqual(topo.version, rm.version)
+        self.assertEqual(set(topo.outputs), {'out-1', 'out-2'})
+        self.assertEqual(set(topo.active_outputs), {'out-1'})
+
+        rm.update_output('out-2', {'active': True})
+        fresh = rm.topology()
+        self.assertIsNot(fresh, topo)
+        self.assertEqual(set(fresh.active_outputs), {'out-1', 'out-2'})
+        # Earlier snapshots are not modified by later changes
+        self.assertEqual(set(topo.active_outputs), {'out-1'})
+
+        rm.create_object(_object('b'))
+        self.assertIn('b', rm.topology().objects)
+        self.assertNotIn('b', fresh.objects)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+Tests for sACN (E1.31) outputs (src/modules/artnet/sacn.py) against a
+loopback receiver.
+
+Verifies:
+  - E1.31 data packet layout: lengths, vectors, priority, universe, sequence
+  - Universe synchronization packets and sync address
+  - Stream termination when an output is removed
+  - Multicast group per universe
+"""
+
+import os
+import socket
+import struct
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from modules.artnet import sacn
+from modules.artnet.output import ArtNetOutput
+from modules.artnet.sender import ArtNetSender
+
+
+def _parse(packet):
+    """Decode the fields of an E1.31 data packet."""
+    return {
+        'root_vector': struct.unpack('>I', packet[18:22])[0],
+        'root_length': struct.unpack('>H', packet[16:18])[0] & 0x0FFF,
+        'cid': packet[22:38],
+        'framing_vector': struct.unpack('>I', packet[40:44])[0],
+        'source': packet[44:108].rstrip(b'\x00'),
+        'priority': packet[108],
+        'sync': struct.unpack('>H', packet[109:111])[0],
+        'sequence': packet[111],
+        'options': packet[112],
+        'universe': struct.unpack('>H', packet[113:115])[0],
+        'count': struct.unpack('>H', packet[123:125])[0],
+        'start_code': packet[125],
+        'data': packet[126:],
+    }
+
+
+class TestSACNSender(unittest.TestCase):
+
+    def setUp(self):
+        self.receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.receiver.bind(('127.0.0.1', 0))
+        self.receiver.settimeout(1.0)
+        self.sender = ArtNetSender(source_address=('127.0.0.1', 0),
+                                   sacn_port=self.receiver.getsockname()[1])
+
+    def tearDown(self):
+        self.sender.socket.close()
+        self.receiver.close()
+
+    def _output(self, artsync=True, **kwargs):
+        return ArtNetOutput(id='out-1', name='o', target_ip='127.0.0.1', subnet='255.255.255.0',
+                            start_universe=7, protocol='sacn', sacn_multicast=False,
+                            artsync=artsync, **kwargs)
+
+    def _recv(self, n):
+        return [self.receiver.recv(2048) for _ in range(n)]
+
+    def test_data_packets(self):
+        self.sender.configure_output(self._output(artsync=False, sacn_priority=150))
+        data = bytes(i % 256 for i in range(700))
+        self.sender.send('out-1', data)
+        self.sender.send('out-1', data)
+        first = [_parse(p) for p in self._recv(2)]
+        second = [_parse(p) for p in self._recv(2)]
+
+        for i, p in enumerate(first):
+            self.assertEqual(p['root_vector'], 0x00000004)
+            self.assertEqual(p['root_length'], sacn.E131_HEADER_SIZE + 510 - 16)
+            self.assertEqual(p['framing_vector'], 0x00000002)
+            self.assertEqual(p['source'], sacn.SOURCE_NAME.encode())
+            self.assertEqual(p['cid'], self.sender.cid)
+            self.assertEqual(p['priority'], 150)
+            self.assertEqual(p['sync'], 0)
+            self.assertEqual(p['universe'], 7 + i)
+            self.assertEqual(p['count'], 511)
+            self.assertEqual(p['start_code'], 0)
+        self.assertEqual(first[0]['data'], data[:510])
+        self.assertEqual(first[1]['data'], data[510:] + bytes(320))
+        self.assertEqual(second[0]['sequence'], (first[0]['sequence'] + 1) & 0xFF)
+
+    def test_universe_sync(self):
+        self.sender.configure_output(self._output(sacn_sync_universe=500))
+        self.sender.send('out-1', bytes(10))
+        self.sender.send('out-1', bytes(10))
+        data1, sync1, data2, sync2 = self._recv(4)
+        self.assertEqual(_parse(data1)['sync'], 500)
+        self.assertEqual(len(sync1), sacn.E131_SYNC_PACKET_SIZE)
+        self.assertEqual(struct.unpack('>I', sync1[18:22])[0], 0x00000008)
+        self.assertEqual(struct.unpack('>I', sync1[40:44])[0], 0x00000001)
+        self.assertEqual(struct.unpack('>H', sync1[45:47])[0], 500)
+        self.assertEqual(sync2[44], (sync1[44] + 1) & 0xFF)
+
+    def test_stream_terminated_on_remove(self):
+        self.sender.configure_output(self._output(artsync=False))
+        self.sender.send('out-1', bytes([5]) * 10)
+        self._recv(1)
+        self.sender.remove_output('out-1')
+        blackout, *terminated = [_parse(p) for p in self._recv(4)]
+        self.assertEqual(blackout['data'], bytes(510))
+        self.assertEqual([p['options'] & sacn.OPTION_STREAM_TERMINATED for p in terminated], [0x40] * 3)
+
+    def test_multicast_addresses(self):
+        self.assertEqual(sacn.multicast_address(1), '239.255.0.1')
+        self.assertEqual(sacn.multicast_address(1000), '239.255.3.232')
+        self.assertEqual(sacn.multicast_address(0), '239.255.0.1')
+        out = self._output()
+        out.sacn_multicast = True
+        self.sender.configure_output(out)
+        info = self.sender.senders['out-1']
+        self.sender._ensure_packets(info, 3)
+        self.assertEqual([a[0] for a in info['addresses']],
+                         ['239.255.0.7', '239.255.0.8', '239.255.0.9'])
+
+    def test_round_trip_dict(self):
+        out = self._output(sacn_priority=42, sacn_sync_universe=9)
+        restored = ArtNetOutput.from_dict(out.to_dict())
+        self.assertEqual((restored.protocol, restored.sacn_priority, restored.sacn_multicast,
+                          restored.sacn_sync_universe), ('sacn', 42, False, 9))
+
+
+if __name__ == '__main__':
+    unittest.main()
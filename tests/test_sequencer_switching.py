@@ -0,0 +1,199 @@
+"""
+Tests for predictive audio-sequencer slot switching (src/modules/audio/sequencer.py).
+
+Verifies:
+  - The next slot is pre-armed PREARM_SECONDS and scheduled SCHEDULE_SECONDS
+    before its split, once, with the split's perf_counter timestamp
+  - The monitor wakes up in time to schedule a split
+  - Players that took a scheduled clip are skipped at the crossing
+  - Scheduled switches reach the players with the timestamp and their
+    swap time is reported as the audio-to-video switch error
+  - A player whose scheduled prepare fails is loaded at the crossing
+  - A slot advance skips registered preview sessions and still announces
+    the slot
+"""
+
+import os
+import sys
+import time
+import unittest
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from modules.audio.sequencer import AudioSequencer
+from modules.player.clip_switch import PreparedClip
+from modules.player.manager import PlayerManager
+from modules.player.preview import PreviewSession
+
+
+class _FakePlayer:
+    """Player stand-in that prepares instantly and adopts switches at once."""
+
+    def __init__(self, player_id, playing=True):
+        self.playlist = [f'clip{i}.mp4' for i in range(4)]
+        self.playlist_manager = SimpleNamespace(playlist=self.playlist)
+        self.current_clip_index = 0
+        self.is_playing = playing
+        self.committed = []
+        self.commit_at = None
+        self.loaded = []
+
+    def prepare_clip(self, index):
+        return PreparedClip(index, self.playlist[index], None, None)
+
+    def request_clip_switch(self, prepared, on_commit=None, at=None):
+        self.committed.append(prepared.index)
+        self.commit_at = at
+        if on_commit:
+            on_commit()
+
+    def load_clip_by_index(self, index, notify_manager=True):
+        self.loaded.append(index)
+        return True
+
+
+class _FakeSocketIO:
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event, data=None, namespace=None):
+        self.events.append(event)
+
+
+class _FakeEngine:
+    def __init__(self):
+        self.position = 0.0
+        self.is_playing = True
+
+    def get_audible_position(self):
+        return self.position
+
+
+class _RecordingManager:
+    def __init__(self):
+        self.prearmed = []
+        self.scheduled = []
+        self.advanced = []
+
+    def sequencer_prearm_slot(self, slot):
+        self.prearmed.append(slot)
+
+    def sequencer_schedule_slot(self, slot, at, on_commit=None):
+        self.scheduled.append((slot, at, on_commit))
+        return {'video'}
+
+    def sequencer_advance_slaves(self, slot, force_reload=False, skip=None):
+        self.advanced.append((slot, skip))
+
+
+class TestScheduling(unittest.TestCase):
+
+    def setUp(self):
+        self.pm = _RecordingManager()
+        self.seq = AudioSequencer(player_manager=self.pm)
+        self.seq.engine = _FakeEngine()
+        self.seq.timeline.duration = 60.0
+        self.seq.timeline.splits = [10.0, 20.0]
+
+    def test_prearm_then_schedule_once(self):
+        wait = self.seq._schedule_next_split(5.0, now=100.0)
+        self.assertEqual(wait, AudioSequencer.MONITOR_INTERVAL)
+        self.assertEqual(self.pm.prearmed, [])
+
+        self.seq._schedule_next_split(8.5, now=103.5)
+        self.seq._schedule_next_split(8.6, now=103.6)
+        self.assertEqual(self.pm.prearmed, [1])
+        self.assertEqual(self.pm.scheduled, [])
+
+        wait = self.seq._schedule_next_split(9.8, now=104.8)
+        self.seq._schedule_next_split(9.85, now=104.85)
+        [(slot, at, _)] = self.pm.scheduled
+        self.assertEqual(slot, 1)
+        self.assertAlmostEqual(at, 105.0)
+        self.assertEqual(wait, AudioSequencer.MONITOR_INTERVAL)
+
+    def test_wakes_up_for_the_schedule_point(self):
+        self.seq._armed_slot = 1
+        wait = self.seq._schedule_next_split(9.7, now=0.0)
+        self.assertAlmostEqual(wait, 0.3 - AudioSequencer.SCHEDULE_SECONDS)
+
+    def test_crossing_skips_scheduled_players(self):
+        self.seq._schedule_next_split(9.9, now=0.0)
+        self.seq._handle_slot_change(1)
+        self.assertEqual(self.pm.advanced, [(1, {'video'})])
+        self.seq._handle_slot_change(2)   # never scheduled: everyone reloads
+        self.assertEqual(self.pm.advanced[-1], (2, None))
+        self.assertEqual(self.seq.get_switch_stats()['unscheduled_switches'], 1)
+
+    def test_switch_error(self):
+        self.seq._schedule_next_split(9.9, now=50.0)
+        _, at, on_commit = self.pm.scheduled[0]
+        on_commit('video', at + 0.012)
+        on_commit('artnet', at - 0.004)
+        stats = self.seq.get_switch_stats()
+        self.assertEqual(stats['scheduled_switches'], 1)
+        self.assertAlmostEqual(stats['last_error_ms'], -4.0, places=3)
+        self.assertAlmostEqual(stats['max_abs_error_ms'], 12.0, places=3)
+
+
+class TestScheduledSlaveSwitch(unittest.TestCase):
+
+    def test_players_get_the_split_timestamp(self):
+        pm = PlayerManager()
+        pm.sequencer_mode_active = True
+        pm.players['video'] = _FakePlayer('video')
+        pm.players['stopped'] = _FakePlayer('stopped', playing=False)
+        committed = []
+
+        players = pm.sequencer_schedule_slot(2, at=123.0, on_commit=lambda pid, t: committed.append(pid))
+
+        self.assertEqual(players, {'video'})
+        self.assertEqual(pm.players['video'].committed, [2])
+        self.assertEqual(pm.players['video'].commit_at, 123.0)
+        self.assertEqual(committed, ['video'])
+        self.assertEqual(pm.players['stopped'].loaded, [])   # left to the crossing
+
+    def test_failed_prepare_is_loaded_at_the_crossing(self):
+        pm = PlayerManager()
+        pm.sequencer_mode_active = True
+        pm.players['video'] = _FakePlayer('video')
+        pm.players['artnet'] = _FakePlayer('artnet')
+        pm.players['artnet'].prepare_clip = lambda index: 1 / 0
+
+        players = pm.sequencer_schedule_slot(2, at=1e12)
+        end = time.time() + 2.0
+        while 'artnet' in players and time.time() < end:
+            time.sleep(0.005)
+        self.assertEqual(players, {'video'})
+        self.assertEqual(pm.players['artnet'].loaded, [])    # split not reached yet
+
+        pm.sequencer_advance_slaves(2, skip=players)
+        self.assertEqual(pm.players['artnet'].loaded, [2])
+        self.assertEqual(pm.players['video'].loaded, [])
+
+    def test_inactive_sequencer_schedules_nothing(self):
+        pm = PlayerManager()
+        pm.players['video'] = _FakePlayer('video')
+        self.assertEqual(pm.sequencer_schedule_slot(1, at=0.0), set())
+        self.assertEqual(pm.players['video'].committed, [])
+
+
+class TestSlotAdvance(unittest.TestCase):
+
+    def test_preview_sessions_are_skipped(self):
+        pm = PlayerManager()
+        pm.sequencer_mode_active = True
+        pm.socketio = _FakeSocketIO()
+        pm.players['video'] = _FakePlayer('video')
+        pm.players['video_preview'] = PreviewSession('video_preview', 64, 36, 10)
+        pm.players['artnet_preview'] = PreviewSession('artnet_preview', 64, 36, 10)
+
+        pm.sequencer_advance_slaves(2)
+
+        self.assertEqual(pm.players['video'].loaded, [2])
+        self.assertIn('sequencer_slot_advance', pm.socketio.events)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,242 @@
+"""
+Tests for pre-armed master/slave clip switching (src/modules/player/clip_switch.py).
+
+Verifies:
+  - prearm() prepares every slave once per clip index
+  - A pre-armed switch hands the prepared clips over without waiting
+  - Un-armed slaves are prepared in parallel, not one after another
+  - Stopped / out-of-range slaves use the old sync path
+  - All slaves commit against one shared target time
+  - The play loop never commits a request before its target time, even one
+    that replaced a due request while the loop was checking
+  - A slave whose prepare fails is loaded through the sync path
+  - Inter-player skew is recorded once every slave has committed
+"""
+
+import os
+import sys
+import threading
+import time
+import types
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from modules.player.clip_switch import PreparedClip
+from modules.player.core import Player
+from modules.player.manager import PlayerManager
+
+
+class _FakeSource:
+    def __init__(self):
+        self.cleaned = False
+
+    def cleanup(self):
+        self.cleaned = True
+
+
+class _FakePlayer:
+    """Player stand-in: prepare_clip() takes *load_time*, the play loop adopts at once."""
+
+    def __init__(self, player_id, n_clips=4, load_time=0.0, playing=True):
+        self.player_id = player_id
+        self.player_name = player_id
+        self.playlist = [f'clip{i}.mp4' for i in range(n_clips)]
+        self.is_playing = playing
+        self.load_time = load_time
+        self.canvas_width, self.canvas_height = 8, 4
+        self.enable_artnet = False
+        self.prepared = []
+        self.committed = []
+        self.loaded = []       # old sync path (load_clip_by_index)
+        self.prepare_threads = set()
+
+    def load_clip_by_index(self, index, notify_manager=True):
+        self.loaded.append(index)
+        return True
+
+    def stop(self):
+        self.is_playing = False
+
+    def start(self):
+        self.is_playing = True
+
+    def prepare_clip(self, index):
+        self.prepare_threads.add(threading.current_thread().name)
+        time.sleep(self.load_time)
+        clip = PreparedClip(index, self.playlist[index], None, _FakeSource())
+        self.prepared.append(clip)
+        return clip
+
+    def request_clip_switch(self, prepared, on_commit=None, at=None):
+        self.committed.append(prepared.index)
+        self.commit_at = at
+        if on_commit:
+            on_commit()
+
+    def get_current_clip_index(self):
+        return 0
+
+
+class _ReplacingLock:
+    """Lock stand-in: another request replaces the pending switch as it is taken."""
+
+    def __init__(self, player, replacement):
+        self.player = player
+        self.replacement = replacement
+
+    def __enter__(self):
+        if self.replacement is not None:
+            self.player._pending_clip_switch, self.replacement = self.replacement, None
+
+    def __exit__(self, *exc):
+        return False
+
+
+class TestSlaveSwitch(unittest.TestCase):
+
+    def _manager(self, **slaves):
+        pm = PlayerManager()
+        pm.master_playlist = 'video'
+        pm.players['video'] = _FakePlayer('video')
+        for pid, player in slaves.items():
+            pm.players[pid] = player
+        return pm
+
+    def _wait(self, pred, timeout=2.0):
+        end = time.time() + timeout
+        while time.time() < end and not pred():
+            time.sleep(0.005)
+        return pred()
+
+    def test_prearm_is_idempotent(self):
+        slave = _FakePlayer('artnet')
+        pm = self._manager(artnet=slave)
+        for _ in range(5):
+            pm.prearm_slaves(2)
+        self.assertTrue(self._wait(lambda: len(slave.prepared) == 1))
+        time.sleep(0.05)
+        self.assertEqual(len(slave.prepared), 1)
+
+    def test_prearmed_switch_commits_without_waiting(self):
+        slaves = {f's{i}': _FakePlayer(f's{i}', load_time=0.1) for i in range(3)}
+        pm = self._manager(**slaves)
+        pm.prearm_slaves(1)
+        self.assertTrue(self._wait(lambda: all(s.prepared for s in slaves.values())))
+
+        t0 = time.perf_counter()
+        pm.on_clip_changed('video', 1)
+        self.assertLess(time.perf_counter() - t0, 0.05)
+        for s in slaves.values():
+            self.assertEqual(s.committed, [1])
+        stats = pm.slave_switch.get_stats()
+        self.assertEqual(stats['prearm_hits'], 3)
+        self.assertEqual(stats['prearm_misses'], 0)
+        self.assertIsNotNone(stats['last_skew_ms'])
+        self.assertLess(stats['last_skew_ms'], 50.0)
+
+    def test_unarmed_slaves_load_in_parallel(self):
+        slaves = {f's{i}': _FakePlayer(f's{i}', load_time=0.2) for i in range(3)}
+        pm = self._manager(**slaves)
+        t0 = time.perf_counter()
+        pm.on_clip_changed('video', 2)
+        self.assertLess(time.perf_counter() - t0, 0.1)   # master thread not blocked
+        self.assertTrue(self._wait(lambda: all(s.committed == [2] for s in slaves.values())))
+        self.assertLess(time.perf_counter() - t0, 0.45)  # not 3 x 0.2 s
+        self.assertEqual(pm.slave_switch.get_stats()['prearm_misses'], 3)
+
+    def test_prearm_for_other_index_is_released(self):
+        slave = _FakePlayer('artnet')
+        pm = self._manager(artnet=slave)
+        pm.prearm_slaves(1)
+        self.assertTrue(self._wait(lambda: len(slave.prepared) == 1))
+        pm.on_clip_changed('video', 3)
+        self.assertTrue(self._wait(lambda: slave.committed == [3]))
+        self.assertTrue(self._wait(lambda: slave.prepared[0].source is None))
+
+    def test_stopped_or_out_of_range_slaves_use_sync_fallback(self):
+        stopped = _FakePlayer('stopped', playing=False)
+        short = _FakePlayer('short', n_clips=1)
+        pm = self._manager(stopped=stopped, short=short)
+        pm.on_clip_changed('video', 2)
+        self.assertEqual(stopped.loaded, [2])
+        self.assertEqual(stopped.committed, [])
+        self.assertEqual(short.loaded, [])
+        self.assertFalse(short.is_playing)              # out of range → stopped, black
+        self.assertTrue(short._auto_stopped_by_master)
+
+    def test_preview_players_are_not_switched(self):
+        preview = _FakePlayer('video_preview')
+        pm = self._manager(video_preview=preview)
+        pm.prearm_slaves(1)
+        pm.on_clip_changed('video', 1)
+        time.sleep(0.05)
+        self.assertEqual(preview.prepared, [])
+        self.assertEqual(preview.loaded, [])
+
+    def test_master_change_cancels_armed_clips(self):
+        slave = _FakePlayer('artnet')
+        pm = self._manager(artnet=slave)
+        pm.prearm_slaves(1)
+        self.assertTrue(self._wait(lambda: len(slave.prepared) == 1))
+        pm.slave_switch.cancel()
+        self.assertTrue(self._wait(lambda: slave.prepared[0].source is None))
+        self.assertEqual(pm.slave_switch.get_stats()['armed'], [])
+
+    def test_slaves_share_one_commit_time(self):
+        slaves = {f's{i}': _FakePlayer(f's{i}') for i in range(3)}
+        for i, s in enumerate(slaves.values()):
+            s.get_frame_interval = lambda i=i: (1.0 / 60, 1.0 / 30, 0.0)[i]
+        pm = self._manager(**slaves)
+        pm.prearm_slaves(1)
+        self.assertTrue(self._wait(lambda: all(s.prepared for s in slaves.values())))
+        t0 = time.perf_counter()
+        pm.on_clip_changed('video', 1)
+        targets = {s.commit_at for s in slaves.values()}
+        self.assertEqual(len(targets), 1)
+        at = targets.pop()
+        self.assertGreaterEqual(at, t0 + 1.0 / 30)       # one frame of the slowest slave
+        self.assertLess(at, time.perf_counter() + 1.0 / 30)
+
+    def test_play_loop_takes_switch_only_when_due(self):
+        now = time.perf_counter()
+        later = ('later', None, now + 10.0)
+        player = types.SimpleNamespace(_pending_clip_switch=('due', None, now - 1.0))
+        player._clip_switch_lock = _ReplacingLock(player, later)
+        self.assertIsNone(Player._take_due_clip_switch(player, 1.0 / 30))
+        self.assertIs(player._pending_clip_switch, later)     # kept for its own frame
+
+        player._pending_clip_switch = ('next', None, None)
+        self.assertEqual(Player._take_due_clip_switch(player, 1.0 / 30)[0], 'next')
+        self.assertIsNone(player._pending_clip_switch)
+        self.assertIsNone(Player._take_due_clip_switch(player, 1.0 / 30))
+
+    def test_failed_prepare_falls_back_to_sync_load(self):
+        broken = _FakePlayer('broken')
+        broken.prepare_clip = lambda index: 1 / 0
+        ok = _FakePlayer('ok')
+        pm = self._manager(broken=broken, ok=ok)
+
+        switched = pm.slave_switch.switch(1, pm._sync_slave_to_index)
+
+        self.assertTrue(self._wait(lambda: broken.loaded == [1]))
+        self.assertEqual(switched, {'ok'})
+        self.assertEqual(ok.committed, [1])
+        self.assertEqual(broken.committed, [])
+
+    def test_skew_waits_for_every_slave(self):
+        late = _FakePlayer('late')
+        pending = []
+        late.request_clip_switch = lambda prepared, on_commit=None, at=None: pending.append(on_commit)
+        pm = self._manager(fast=_FakePlayer('fast'), late=late)
+        pm.prearm_slaves(1)
+        self.assertTrue(self._wait(lambda: len(late.prepared) == 1))
+        pm.on_clip_changed('video', 1)
+        self.assertIsNone(pm.slave_switch.get_stats()['last_skew_ms'])
+        time.sleep(0.03)
+        pending[0]()
+        self.assertGreaterEqual(pm.slave_switch.get_stats()['last_skew_ms'], 25.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
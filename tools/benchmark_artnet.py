@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Art-Net Pipeline Benchmark - frame → RoutingBridge → OutputManager → ArtNetSender → wire
+
+Synthesises LED mappings (objects, outputs, universes), drives the real
+routing pipeline with synthetic frames and counts the packets arriving on
+a loopback UDP receiver (separate process, so receiving does not compete
+with the sender for the GIL).
+
+Per case it measures:
+  stages      render (OutputManager.render_frame) and send
+              (ArtNetSender.send_frame) per frame, and process_frame overall
+  throughput  frames as fast as possible for --seconds: frames/s, packets/s
+              received, packet loss
+  latency     closed loop: process_frame() until the last packet of that
+              frame has been received (end-to-end, monotonic clock)
+
+Run from workspace root:
+    python tools/benchmark_artnet.py                       # all preset cases
+    python tools/benchmark_artnet.py --case s,xl --json results.json
+    python tools/benchmark_artnet.py --leds 30000 --outputs 8 --led-type RGBW
+    python tools/benchmark_artnet.py --protocol sacn --seconds 5
+
+The JSON report (--json, or stdout with --json -) is meant to be kept per
+release and compared: every value is a plain number, keyed by case name.
+"""
+import argparse
+import json
+import math
+import multiprocessing as mp
+import os
+import platform
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+
+from modules.artnet.object import ArtNetObject, PointArray
+from modules.artnet.output import ArtNetOutput
+from modules.artnet.output_plan import _WHITE_CHANNELS
+from modules.artnet.packet_builder import CHANNELS_PER_UNIVERSE
+from modules.artnet.routing_bridge import RoutingBridge
+from modules.artnet.routing_manager import ArtNetRoutingManager
+from modules.artnet.sender import ArtNetSender
+from modules.artnet.transmitter import ArtNetTransmitter
+from modules.artnet import sacn
+
+CANVAS = (1920, 1080)
+LEDS_PER_OBJECT = 1000
+
+# name → (LEDs, outputs, LED type); universes follow from the channel count
+CASES = {
+    'xs':  (1_000,   10, 'RGB'),     #   10 universes
+    's':   (10_000,  10, 'RGB'),     #   60 universes
+    'm':   (50_000,  20, 'RGB'),     #  300 universes
+    'l':   (100_000, 20, 'RGB'),     #  600 universes
+    'xl':  (200_000, 40, 'RGB'),     # 1200 universes
+    'xxl': (200_000, 50, 'RGBAW'),   # 2000 universes
+}
+
+
+# -----------------------------------------------------------------------------
+# Loopback receiver (child process)
+# -----------------------------------------------------------------------------
+
+def _receiver(port, ready, stop, dmx_count, sync_count, last_arrival, protocol):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 16 * 1024 * 1024)
+    sock.bind(('127.0.0.1', port))
+    sock.settimeout(0.05)
+    ready.set()
+    buf = bytearray(1024)
+    dmx = sync = 0
+    while not stop.is_set():
+        try:
+            n = sock.recv_into(buf)
+        except socket.timeout:
+            continue
+        if protocol == 'sacn':
+            is_sync = n <= sacn.E131_SYNC_PACKET_SIZE
+        else:
+            is_sync = buf[8:10] != b'\x00\x50'   # OpDmx (little-endian 0x5000)
+        if is_sync:
+            sync += 1
+            sync_count.value = sync
+        else:
+            dmx += 1
+            last_arrival.value = time.monotonic()
+            dmx_count.value = dmx
+    sock.close()
+
+
+class LoopbackReceiver:
+    """UDP receiver process counting DMX and sync packets on 127.0.0.1."""
+
+    def __init__(self, protocol):
+        probe = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        probe.bind(('127.0.0.1', 0))
+        self.port = probe.getsockname()[1]
+        probe.close()
+        ctx = mp.get_context('spawn')
+        self._ready = ctx.Event()
+        self._stop = ctx.Event()
+        self.dmx = ctx.Value('q', 0, lock=False)
+        self.sync = ctx.Value('q', 0, lock=False)
+        self.last_arrival = ctx.Value('d', 0.0, lock=False)
+        self._proc = ctx.Process(target=_receiver, daemon=True,
+                                 args=(self.port, self._ready, self._stop, self.dmx,
+                                       self.sync, self.last_arrival, protocol))
+
+    def __enter__(self):
+        self._proc.start()
+        if not self._ready.wait(10):
+            raise RuntimeError("Loopback receiver did not start")
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._proc.join(2)
+
+    def wait_for(self, count, timeout):
+        """Wait until *count* DMX packets arrived; returns the arrival time or None."""
+        deadline = time.monotonic() + timeout
+        while self.dmx.value < count:
+            if time.monotonic() > deadline:
+                return None
+            time.sleep(0)
+        return self.last_arrival.value
+
+
+# -----------------------------------------------------------------------------
+# Mapping synthesis
+# -----------------------------------------------------------------------------
+
+def build_mapping(leds, outputs, led_type, protocol, port, seed=1):
+    """
+    Routing manager with *leds* LEDs in objects of LEDS_PER_OBJECT, spread
+    evenly over *outputs* outputs (all unicast to 127.0.0.1:*port*).
+
+    Returns:
+        (routing_manager, {output_id: universes})
+    """
+    rng = np.random.default_rng(seed)
+    rm = ArtNetRoutingManager(session_state_manager=None)
+    channels = _WHITE_CHANNELS.get(led_type, 3)
+    per_output = np.diff(np.linspace(0, leds, outputs + 1).astype(int))
+    out_universes = {}
+    universe = 1
+    obj_n = 0
+    for out_n, out_leds in enumerate(per_output):
+        assigned = []
+        remaining = int(out_leds)
+        while remaining > 0:
+            n = min(LEDS_PER_OBJECT, remaining)
+            remaining -= n
+            obj_id = f'obj-{obj_n}'
+            obj_n += 1
+            xs = rng.uniform(0, CANVAS[0] - 1, n)
+            ys = rng.uniform(0, CANVAS[1] - 1, n)
+            rm.create_object(ArtNetObject(id=obj_id, name=obj_id, source_shape_id=None, type='matrix',
+                                          points=PointArray(xs, ys), led_type=led_type,
+                                          channels_per_pixel=channels, channel_order=led_type))
+            assigned.append(obj_id)
+        out_id = f'out-{out_n}'
+        count = math.ceil(int(out_leds) * channels / CHANNELS_PER_UNIVERSE)
+        rm.create_output(ArtNetOutput(
+            id=out_id, name=out_id, target_ip='127.0.0.1', subnet='255.0.0.0',
+            start_universe=universe, fps=0, protocol=protocol, sacn_multicast=False,
+            assigned_objects=assigned))
+        out_universes[out_id] = count
+        universe += count
+    return rm, out_universes
+
+
+def build_bridge(rm, protocol, port, threaded):
+    """RoutingBridge whose sender targets the loopback receiver (ephemeral source port)."""
+    bridge = RoutingBridge(rm, *CANVAS, threaded_send=False)
+    bridge.sender.socket.sock.close()
+    bridge.sender = ArtNetSender(source_address=None, port=port, sacn_port=port)
+    if threaded:
+        bridge.transmitter = ArtNetTransmitter(bridge.sender)
+    bridge.enabled = True
+    bridge.initialize()
+    return bridge
+
+
+def _drain(transmitter, settle=0.05, timeout=2.0):
+    """Wait until the ArtNetTx thread has sent everything published so far."""
+    def total_sent():
+        return sum(o['sent'] for o in transmitter.get_stats()['outputs'].values())
+    deadline = time.monotonic() + timeout
+    last = total_sent()
+    while time.monotonic() < deadline:
+        time.sleep(settle)
+        now = total_sent()
+        if now == last:
+            return
+        last = now
+
+
+class StageTimer:
+    """Wraps a bound method and records its wall time per call (ms)."""
+
+    def __init__(self, obj, name):
+        self.samples = []
+        fn = getattr(obj, name)
+
+        def timed(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.samples.append((time.perf_counter() - t0) * 1000)
+
+        setattr(obj, name, timed)
+
+
+def summarize(samples):
+    if not samples:
+        return None
+    a = np.asarray(samples, dtype=np.float64)
+    return {
+        'mean': round(float(a.mean()), 4),
+        'p50': round(float(np.percentile(a, 50)), 4),
+        'p95': round(float(np.percentile(a, 95)), 4),
+        'max': round(float(a.max()), 4),
+        'n': int(a.size),
+    }
+
+
+# -----------------------------------------------------------------------------
+# Benchmark
+# -----------------------------------------------------------------------------
+
+def run_case(name, leds, outputs, led_type, args):
+    with LoopbackReceiver(args.protocol) as rx:
+        rm, out_universes = build_mapping(leds, outputs, led_type, args.protocol, rx.port)
+        universes = sum(out_universes.values())
+        bridge = build_bridge(rm, args.protocol, rx.port, args.threaded)
+        render = StageTimer(bridge.output_manager, 'render_frame')
+        send = StageTimer(bridge.sender, 'send_frame')
+        rng = np.random.default_rng(2)
+        frames = [rng.integers(0, 256, (CANVAS[1], CANVAS[0], 3), dtype=np.uint8) for _ in range(4)]
+        if bridge.transmitter is not None:
+            bridge.start()
+
+        # Warmup (plan compilation, packet allocation)
+        for i in range(args.warmup):
+            bridge.process_frame(frames[i % len(frames)])
+        rx.wait_for(universes * args.warmup, timeout=5)
+        render.samples.clear()
+        send.samples.clear()
+
+        # Latency: one frame at a time, wait for its last packet
+        latency, process = [], []
+        base = rx.dmx.value
+        for i in range(args.latency_frames):
+            t0 = time.monotonic()
+            bridge.process_frame(frames[i % len(frames)])
+            process.append((time.monotonic() - t0) * 1000)
+            arrival = rx.wait_for(base + universes * (i + 1), timeout=2)
+            if arrival is None:
+                base = rx.dmx.value - universes * (i + 1)   # lost packets: resync
+                continue
+            latency.append((arrival - t0) * 1000)
+
+        # Throughput: open loop for --seconds
+        start_packets = rx.dmx.value
+        if bridge.transmitter is not None:
+            _drain(bridge.transmitter)
+            bridge.transmitter.reset_stats()
+        sent_frames = 0
+        t0 = time.monotonic()
+        while time.monotonic() - t0 < args.seconds:
+            bridge.process_frame(frames[sent_frames % len(frames)])
+            sent_frames += 1
+        elapsed = time.monotonic() - t0
+        if bridge.transmitter is not None:
+            # Frames replaced in the mailbox never reach the wire
+            _drain(bridge.transmitter)
+            sent = bridge.transmitter.get_stats()['outputs']
+            expected = sum(out_universes[oid] * stats['sent'] for oid, stats in sent.items())
+        else:
+            expected = sent_frames * universes
+        rx.wait_for(start_packets + expected, timeout=2)
+        received = rx.dmx.value - start_packets
+
+        if bridge.transmitter is not None:
+            bridge.transmitter.stop()
+        bridge.sender.cleanup()
+
+    return {
+        'leds': leds,
+        'outputs': outputs,
+        'led_type': led_type,
+        'universes': universes,
+        'protocol': args.protocol,
+        'threaded_send': args.threaded,
+        'stages_ms': {
+            'render': summarize(render.samples),
+            'send': summarize(send.samples),
+            'process_frame': summarize(process),
+        },
+        'throughput': {
+            'seconds': round(elapsed, 3),
+            'frames': sent_frames,
+            'fps': round(sent_frames / elapsed, 2),
+            'packets_expected': expected,
+            'packets_received': received,
+            'packets_per_s': round(received / elapsed, 1),
+            'loss': round(1 - received / expected, 5) if expected else 0.0,
+        },
+        'latency_ms': summarize(latency),
+    }
+
+
+def environment():
+    try:
+        rev = subprocess.run(['git', 'describe', '--always', '--dirty'], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)), timeout=5).stdout.strip()
+    except Exception:
+        rev = ''
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'revision': rev,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def print_table(report):
+    print(f"{'case':<6} {'LEDs':>8} {'univ':>5} {'render ms':>10} {'send ms':>8} "
+          f"{'fps':>8} {'pkt/s':>10} {'loss':>7} {'lat p50':>8} {'lat p95':>8}", file=sys.stderr)
+    print("-" * 88, file=sys.stderr)
+    for name, case in report['cases'].items():
+        stages, tp, lat = case['stages_ms'], case['throughput'], case['latency_ms'] or {}
+        print(f"{name:<6} {case['leds']:>8} {case['universes']:>5} "
+              f"{(stages['render'] or {}).get('p50', 0):>10.2f} {(stages['send'] or {}).get('p50', 0):>8.2f} "
+              f"{tp['fps']:>8.1f} {tp['packets_per_s']:>10.0f} {tp['loss']:>7.2%} "
+              f"{lat.get('p50', 0):>8.2f} {lat.get('p95', 0):>8.2f}", file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Art-Net pipeline benchmark (loopback)")
+    parser.add_argument('--case', default=','.join(CASES),
+                        help=f"Comma-separated preset cases ({', '.join(CASES)})")
+    parser.add_argument('--leds', type=int, help="Custom case: LED count (overrides --case)")
+    parser.add_argument('--outputs', type=int, default=10, help="Custom case: output count")
+    parser.add_argument('--led-type', default='RGB', help="Custom case: LED type (RGB, RGBW, RGBAW, ...)")
+    parser.add_argument('--protocol', choices=('artnet', 'sacn'), default='artnet')
+    parser.add_argument('--threaded', action='store_true', help="Send on the ArtNetTx thread")
+    parser.add_argument('--seconds', type=float, default=3.0, help="Throughput phase duration")
+    parser.add_argument('--latency-frames', type=int, default=100)
+    parser.add_argument('--warmup', type=int, default=10)
+    parser.add_argument('--json', metavar='FILE', help="Write the JSON report ('-' = stdout)")
+    args = parser.parse_args(argv)
+
+    if args.leds:
+        cases = {'custom': (args.leds, args.outputs, args.led_type)}
+    else:
+        names = [n.strip() for n in args.case.split(',') if n.strip()]
+        unknown = [n for n in names if n not in CASES]
+        if unknown:
+            parser.error(f"unknown case(s): {', '.join(unknown)}")
+        cases = {n: CASES[n] for n in names}
+
+    report = {'environment': environment(), 'cases': {}}
+    for name, (leds, outputs, led_type) in cases.items():
+        print(f"▶ {name}: {leds} LEDs, {outputs} outputs, {led_type} ...", file=sys.stderr)
+        report['cases'][name] = run_case(name, leds, outputs, led_type, args)
+
+    print_table(report)
+    if args.json == '-':
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    elif args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.json}", file=sys.stderr)
+    return report
+
+
+if __name__ == "__main__":
+    main()